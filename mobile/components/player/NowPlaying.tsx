@@ -12,7 +12,7 @@ import { SeekSlider } from './SeekSlider';
 
 /** Backend artwork URL — baseUrl already includes the `/api` prefix. */
 function getArtworkUrl(trackId: number): string {
-  return `${getDefaultApiClient().getBaseUrl()}/tracks/${trackId}/artwork`;
+  return `${getDefaultApiClient().getBaseUrl()}/tracks/${trackId}/artwork?size=640`;
 }
 
 interface NowPlayingProps {
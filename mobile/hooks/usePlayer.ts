@@ -16,7 +16,7 @@ let isSetup = false;
  * includes the `/api` prefix. Used for lockscreen art via setMediaItem.
  */
 function getArtworkUrl(trackId: number): string {
-  return `${getDefaultApiClient().getBaseUrl()}/tracks/${trackId}/artwork`;
+  return `${getDefaultApiClient().getBaseUrl()}/tracks/${trackId}/artwork?size=640`;
 }
 
 function setupPlayer(): void {
@@ -65,7 +65,8 @@ export function usePlayer() {
       try {
         TrackPlayer.setMediaItem({
           mediaId: track.id.toString(),
-          url: getStreamUrl(track.id),
+          // Opus variant instead of full-bitrate lossless over mobile links
+          url: getStreamUrl(track.id, 'medium'),
           title: track.title,
           artist: track.artist ?? 'Unknown Artist',
           duration: track.duration,
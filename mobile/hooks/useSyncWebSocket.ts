@@ -6,10 +6,13 @@
 import { useEffect, useRef, useCallback, useState } from 'react';
 import { AppState, type AppStateStatus } from 'react-native';
 import { usePlayerStore } from '../stores/playerStore';
+import type { PlayerStore } from '../stores/playerStore';
 
 const MIN_BACKOFF = 1000;
 const MAX_BACKOFF = 30000;
 
+type SyncedPlayback = Parameters<PlayerStore['syncState']>[0];
+
 export type ConnectionStatus = 'connected' | 'connecting' | 'offline';
 
 interface UseSyncWebSocketOptions {
@@ -31,6 +34,8 @@ export const useSyncWebSocket = (
   const wsRef = useRef<WebSocket | null>(null);
   const backoffRef = useRef(MIN_BACKOFF);
   const reconnectTimerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+  // Last full playback state; playback:delta messages are merged onto it
+  const playbackRef = useRef<SyncedPlayback | null>(null);
 
   const handleMessage = useCallback((event: MessageEvent) => {
     try {
@@ -39,6 +44,7 @@ export const useSyncWebSocket = (
       switch (type) {
         case 'sync:full':
           if (data.playback) {
+            playbackRef.current = data.playback;
             usePlayerStore.getState().syncState(data.playback);
           }
           if (data.devices) {
@@ -47,9 +53,18 @@ export const useSyncWebSocket = (
           break;
 
         case 'playback:state':
+          playbackRef.current = data;
           usePlayerStore.getState().syncState(data);
           break;
 
+        case 'playback:delta':
+          // Server only sends a delta against the state this connection last received
+          if (playbackRef.current) {
+            playbackRef.current = { ...playbackRef.current, ...data };
+            usePlayerStore.getState().syncState(playbackRef.current);
+          }
+          break;
+
         case 'devices:updated':
           usePlayerStore.getState().syncDevices(data);
           break;
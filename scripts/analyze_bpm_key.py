@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Analyze BPM and key for audio files missing metadata using Essentia."""
+"""Analyze BPM and key for audio files missing metadata using Essentia.
+
+Writes the results into the files' tags. To analyze the library into the
+database instead (plus loudness and energy), use `music-minion analyze-audio`.
+"""
 
 import argparse
 import os
@@ -14,6 +18,7 @@ from tqdm import tqdm
 
 import essentia.standard as es
 
+from music_minion.domain.analysis.keys import to_camelot
 from music_minion.domain.library.metadata import write_metadata_to_file
 
 SUPPORTED_FORMATS = {'.mp3', '.m4a', '.opus', '.ogg', '.flac'}  # No .wav - no tag support
@@ -22,23 +27,6 @@ KEY_CONFIDENCE_THRESHOLD = 0.5
 LOW_CONFIDENCE_FILE = Path("low_confidence_keys.txt")
 MAX_DURATION_SECONDS = 600  # 10 minutes - skip DJ mixes, podcasts, etc.
 
-# Camelot wheel mapping (musical key → Camelot code)
-# Includes both sharp and flat enharmonic equivalents
-CAMELOT_MAP = {
-    "C": "8B", "Am": "8A",
-    "G": "9B", "Em": "9A",
-    "D": "10B", "Bm": "10A",
-    "A": "11B", "F#m": "11A", "Gbm": "11A",
-    "E": "12B", "C#m": "12A", "Dbm": "12A",
-    "B": "1B", "Cb": "1B", "G#m": "1A", "Abm": "1A",
-    "F#": "2B", "Gb": "2B", "D#m": "2A", "Ebm": "2A",
-    "Db": "3B", "C#": "3B", "Bbm": "3A", "A#m": "3A",
-    "Ab": "4B", "G#": "4B", "Fm": "4A",
-    "Eb": "5B", "D#": "5B", "Cm": "5A",
-    "Bb": "6B", "A#": "6B", "Gm": "6A",
-    "F": "7B", "Dm": "7A",
-}
-
 
 def parse_args():
     """Parse command-line arguments."""
@@ -199,31 +187,6 @@ def decode_with_ffmpeg(file_path: Path, temp_dir: Path) -> Path | None:
 NEEDS_FFMPEG_DECODE = {'.opus'}
 
 
-def to_camelot(key: str, scale: str) -> str | None:
-    """Convert musical key to Camelot notation.
-
-    Args:
-        key: Musical key (e.g., "C", "F#")
-        scale: Scale type ("major" or "minor")
-
-    Returns:
-        Camelot code (e.g., "8A", "11B") or None if not found
-    """
-    # Try full format first (e.g., "Cmajor")
-    musical_key = f"{key}{scale}"
-    camelot = CAMELOT_MAP.get(musical_key)
-
-    # If not found, try short format (e.g., "C" or "Am")
-    if camelot is None:
-        if scale == "minor":
-            musical_key = f"{key}m"
-        else:
-            musical_key = key
-        camelot = CAMELOT_MAP.get(musical_key)
-
-    return camelot
-
-
 def analyze_audio(file_path: Path) -> tuple[float | None, str | None, float]:
     """Run Essentia analysis on audio file.
 
@@ -27,6 +27,7 @@ from loguru import logger
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from music_minion.domain.library.artwork import download_artwork, has_embedded_art
 from music_minion.domain.library.providers.soundcloud import auth as sc_auth
 
 # ---------------------------------------------------------------------------
@@ -129,76 +130,6 @@ def fetch_artwork_url(soundcloud_id: str, access_token: str) -> Optional[str]:
         return None
 
 
-def upgrade_artwork_url(url: str) -> str:
-    """Replace -large suffix with -t500x500 for full-resolution art."""
-    return url.replace("-large.", "-t500x500.")
-
-
-def download_image(url: str) -> Optional[bytes]:
-    """Download image bytes from a URL."""
-    try:
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
-        content_type = resp.headers.get("Content-Type", "")
-        if "image" not in content_type:
-            logger.warning(f"Unexpected content-type '{content_type}' for {url}")
-        return resp.content
-    except Exception as exc:
-        logger.warning(f"Image download failed for {url}: {exc}")
-        return None
-
-
-# ---------------------------------------------------------------------------
-# Cover art detection
-# ---------------------------------------------------------------------------
-
-
-def has_embedded_art(file_path: str) -> bool:
-    """Return True if the audio file already has embedded cover art."""
-    suffix = Path(file_path).suffix.lower()
-
-    try:
-        if suffix == ".mp3":
-            from mutagen.id3 import ID3, ID3NoHeaderError
-
-            try:
-                tags = ID3(file_path)
-            except ID3NoHeaderError:
-                return False
-            return bool(tags.getall("APIC"))
-
-        elif suffix in (".ogg", ".opus"):
-            from mutagen.oggopus import OggOpus
-            from mutagen.oggvorbis import OggVorbis
-
-            loader = OggOpus if suffix == ".opus" else OggVorbis
-            audio = loader(file_path)
-            return "metadata_block_picture" in (audio.tags or {})
-
-        elif suffix in (".m4a", ".aac", ".mp4"):
-            from mutagen.mp4 import MP4
-
-            audio = MP4(file_path)
-            return bool(audio.tags and audio.tags.get("covr"))
-
-        elif suffix == ".flac":
-            from mutagen.flac import FLAC
-
-            audio = FLAC(file_path)
-            return bool(audio.pictures)
-
-        elif suffix == ".wav":
-            return False  # WAV not supported
-
-        else:
-            # Unknown format: assume no art
-            return False
-
-    except Exception as exc:
-        logger.warning(f"Could not check cover art for {file_path}: {exc}")
-        return False
-
-
 # ---------------------------------------------------------------------------
 # Embedding logic (per format)
 # ---------------------------------------------------------------------------
@@ -391,19 +322,12 @@ def process_tracks(
 
             fetched_from_api = True
 
-        # --- Upgrade resolution ---
-        hq_url = upgrade_artwork_url(artwork_url)
-
-        # --- Download image ---
-        img_bytes = download_image(hq_url)
+        # --- Download image (500x500 when available) ---
+        img_bytes = download_artwork(artwork_url)
         if not img_bytes:
-            # Fall back to original URL in case -large isn't in it
-            if hq_url != artwork_url:
-                img_bytes = download_image(artwork_url)
-            if not img_bytes:
-                logger.warning(f"Could not download artwork for {local_path}")
-                counters["errors"] += 1
-                continue
+            logger.warning(f"Could not download artwork for {local_path}")
+            counters["errors"] += 1
+            continue
 
         # --- Embed ---
         success = embed_artwork(local_path, img_bytes, dry_run)
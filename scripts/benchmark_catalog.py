@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark the file catalog against filesystem-wide move detection.
+
+Builds a synthetic library (MP3s with ID3 tags, spread over artist/album
+directories, plus some opus twins and duplicate copies) in a temp dir with
+its own database, then times:
+
+- catalog build: fingerprinting every file once (first scan only)
+- catalog refresh: later scans, stat only
+- move detection after renaming/moving a share of the files, the previous
+  way (rglob per extension, filename + path-similarity matching) vs. the
+  catalog (fingerprint only the untracked files, look up by hash)
+- duplicate and twin queries
+
+Usage:
+    uv run scripts/benchmark_catalog.py
+    uv run scripts/benchmark_catalog.py --files 50000 --moved 500
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import music_minion.core.database as db_module
+from music_minion.core.database import get_db_connection, migrate_database
+from music_minion.domain.library import catalog
+from music_minion.domain.sync.engine import path_similarity
+
+FORMATS = [".mp3", ".opus"]
+
+
+def mp3_bytes(rng: random.Random, audio_size: int) -> bytes:
+    tags = rng.randbytes(rng.randint(200, 2000))
+    size = len(tags)
+    header = b"ID3\x04\x00\x00" + bytes(
+        [(size >> 21) & 0x7F, (size >> 14) & 0x7F, (size >> 7) & 0x7F, size & 0x7F]
+    )
+    return header + tags + rng.randbytes(audio_size)
+
+
+def build_library(root: Path, files: int, audio_size: int, rng: random.Random) -> list[str]:
+    paths = []
+    for n in range(files):
+        album = root / f"Artist {n % 997:03d}" / f"Album {n % 53:02d}"
+        album.mkdir(parents=True, exist_ok=True)
+        path = album / f"{n:06d} Track.mp3"
+        path.write_bytes(mp3_bytes(rng, audio_size))
+        paths.append(str(path))
+        if n % 50 == 0:  # Transcoded twin
+            path.with_suffix(".opus").write_bytes(rng.randbytes(audio_size // 2))
+        if n % 200 == 0:  # Duplicate copy
+            copies = root / "Copies"
+            copies.mkdir(exist_ok=True)
+            shutil.copyfile(path, copies / path.name)
+    return paths
+
+
+def legacy_move_detection(root: Path, missing: list[str], tracked: set[str]) -> dict[str, str]:
+    """The previous approach: glob everything, match by filename, then path similarity."""
+    on_disk = set()
+    for ext in FORMATS:
+        on_disk.update(str(p) for p in root.rglob(f"*{ext}"))
+    index: dict[str, list[str]] = {}
+    for path in on_disk - tracked:
+        index.setdefault(Path(path).name, []).append(path)
+
+    result = {}
+    for old in missing:
+        candidates = index.get(Path(old).name, [])
+        if len(candidates) == 1:
+            result[old] = candidates[0]
+        elif candidates:
+            old_dir = str(Path(old).parent)
+            best = max(candidates, key=lambda p: path_similarity(old_dir, str(Path(p).parent)))
+            if path_similarity(old_dir, str(Path(best).parent)) >= 0.8:
+                result[old] = best
+    return result
+
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label:<38} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--files", type=int, default=50000, help="MP3 files to generate")
+    parser.add_argument("--moved", type=int, default=500, help="Files to rename/move")
+    parser.add_argument("--audio-kb", type=int, default=64, help="Audio payload per file")
+    args = parser.parse_args()
+
+    rng = random.Random(44)
+    workdir = Path(tempfile.mkdtemp(prefix="catalog_bench_"))
+    root = workdir / "Music"
+    db_path = workdir / "bench.db"
+    db_module.get_database_path = lambda: db_path
+
+    try:
+        print(f"Generating {args.files} files in {root} ...")
+        paths = timed("generate", lambda: build_library(root, args.files, args.audio_kb * 1024, rng))
+        all_files = [str(p) for ext in FORMATS for p in root.rglob(f"*{ext}")]
+        with get_db_connection() as conn:
+            conn.execute(
+                "CREATE TABLE tracks (id INTEGER PRIMARY KEY, local_path TEXT, source TEXT DEFAULT 'local')"
+            )
+            conn.executemany("INSERT INTO tracks (local_path) VALUES (?)", [(p,) for p in paths])
+            migrate_database(conn, 63)
+            conn.commit()
+
+        print(f"\nCatalog ({len(all_files)} files):")
+        stats = timed("build (fingerprint all)", lambda: catalog.refresh_catalog(all_files))
+        print(f"    {stats}")
+        timed("refresh (unchanged, stat only)", lambda: catalog.refresh_catalog(all_files))
+
+        # Move a sample: a third moved as-is, a third renamed in place, a
+        # third moved and renamed
+        moved = rng.sample(paths, args.moved)
+        new_paths = []
+        for i, old in enumerate(moved):
+            target = root / "Reorganised" / f"Artist {i % 17}"
+            target.mkdir(parents=True, exist_ok=True)
+            if i % 3 == 0:
+                new = str(target / Path(old).name)
+            elif i % 3 == 1:
+                new = str(Path(old).with_name(f"Renamed {i}.mp3"))
+            else:
+                new = str(target / f"{i} - {Path(old).name}")
+            os.rename(old, new)
+            new_paths.append(new)
+        tracked = set(paths) - set(moved)
+
+        print(f"\nMove detection ({args.moved} files renamed/moved):")
+        legacy = timed("rglob + filename/similarity", lambda: legacy_move_detection(root, moved, tracked))
+        timed("catalog: fingerprint untracked", lambda: catalog.refresh_catalog(new_paths))
+        matched = timed("catalog: lookup by hash", lambda: catalog.match_moved_files(moved, new_paths))
+        print(f"    previous approach found {len(legacy)}/{len(moved)}, catalog found {len(matched)}/{len(moved)}")
+        catalog.forget_paths(moved)  # As detect_missing_and_moved_files does once relocated
+
+        print("\nQueries:")
+        groups = timed("duplicate groups", catalog.find_duplicate_files)
+        opus = [p for p in all_files if p.endswith(".opus")]
+        twins = timed("opus -> mp3 twins", lambda: catalog.find_twins(opus, ".mp3"))
+        print(f"    {len(groups)} duplicate groups, {len(twins)}/{len(opus)} twins")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Load-test the IPC server of a running Music Minion instance.
+
+Sends "ping" commands (a no-op answered by the main loop, so each one makes
+the full socket -> command queue -> main thread -> response trip) and
+reports client-side latency percentiles for three patterns:
+
+- oneshot:    a new connection per command (what hotkeys do)
+- persistent: one connection, one command at a time
+- pipelined:  one connection, commands sent in batches before reading
+
+Concurrent clients run each pattern in parallel threads. The server's own
+view (the "status" command) is printed at the end.
+
+Usage:
+    uv run scripts/benchmark_ipc.py
+    uv run scripts/benchmark_ipc.py --requests 500 --clients 4 --batch 20
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from music_minion.ipc.client import IPCClient, get_socket_path
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def run_oneshot(requests: int, latencies: list[float]) -> None:
+    for _ in range(requests):
+        start = time.perf_counter()
+        with IPCClient() as client:
+            client.request("ping")
+        latencies.append(time.perf_counter() - start)
+
+
+def run_persistent(requests: int, latencies: list[float]) -> None:
+    with IPCClient() as client:
+        for _ in range(requests):
+            start = time.perf_counter()
+            client.request("ping")
+            latencies.append(time.perf_counter() - start)
+
+
+def run_pipelined(requests: int, latencies: list[float], batch: int) -> None:
+    with IPCClient() as client:
+        sent = 0
+        while sent < requests:
+            size = min(batch, requests - sent)
+            start = time.perf_counter()
+            client.pipeline([("ping", [])] * size)
+            elapsed = time.perf_counter() - start
+            # Every command in the batch waited for the whole batch
+            latencies.extend([elapsed] * size)
+            sent += size
+
+
+def run_pattern(name: str, clients: int, requests: int, batch: int) -> None:
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def worker() -> None:
+        local: list[float] = []
+        if name == "oneshot":
+            run_oneshot(requests, local)
+        elif name == "persistent":
+            run_persistent(requests, local)
+        else:
+            run_pipelined(requests, local, batch)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - start
+
+    values = sorted(latencies)
+    total = clients * requests
+    print(
+        f"{name:<11} {total:>6} req  {total / wall:>8.0f} req/s  "
+        f"mean {statistics.mean(values) * 1000:7.2f}ms  "
+        f"p50 {percentile(values, 50) * 1000:7.2f}ms  "
+        f"p95 {percentile(values, 95) * 1000:7.2f}ms  "
+        f"p99 {percentile(values, 99) * 1000:7.2f}ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="IPC latency load test")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per client")
+    parser.add_argument("--clients", type=int, default=1, help="Concurrent clients")
+    parser.add_argument("--batch", type=int, default=10, help="Pipelined batch size")
+    parser.add_argument(
+        "--patterns",
+        default="oneshot,persistent,pipelined",
+        help="Comma-separated patterns to run",
+    )
+    args = parser.parse_args()
+
+    if not get_socket_path().exists():
+        print("Music Minion is not running (no control socket)", file=sys.stderr)
+        return 1
+
+    print(f"{args.clients} client(s) x {args.requests} requests, batch {args.batch}\n")
+    for name in args.patterns.split(","):
+        run_pattern(name.strip(), args.clients, args.requests, args.batch)
+
+    with IPCClient() as client:
+        print(f"\n{client.call('status')['message']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
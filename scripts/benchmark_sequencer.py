@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark the harmonic-mixing sequencer.
+
+Orders a synthetic playlist (random Camelot keys, tempos around a few
+genre centres, random loudness) with each energy arc and reports the
+time taken and the path cost of the input order vs. the sequenced one.
+
+Usage:
+    uv run scripts/benchmark_sequencer.py
+    uv run scripts/benchmark_sequencer.py --tracks 2000 --arcs none peak
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from music_minion.domain.playlists import sequencer
+
+CAMELOT_KEYS = [f"{number}{letter}" for number in range(1, 13) for letter in "AB"]
+
+
+def make_tracks(n: int, rng: np.random.Generator) -> list[dict]:
+    centres = rng.choice([90.0, 122.0, 128.0, 140.0, 174.0], n)
+    return [
+        {
+            "id": track_id,
+            "bpm": round(float(centres[track_id - 1] * rng.normal(1, 0.02)), 1),
+            "key_signature": CAMELOT_KEYS[rng.integers(len(CAMELOT_KEYS))],
+            "lufs": float(rng.uniform(-16, -5)),
+            "rms_db": float(rng.uniform(-20, -8)),
+        }
+        for track_id in range(1, n + 1)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tracks", type=int, default=2000, help="Playlist size")
+    parser.add_argument(
+        "--arcs", nargs="+", default=list(sequencer.ENERGY_ARCS), help="Energy arcs to run"
+    )
+    parser.add_argument(
+        "--time-limit", type=float, default=sequencer.TIME_LIMIT_SECONDS, help="2-opt budget (s)"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(47)
+    tracks = make_tracks(args.tracks, rng)
+    energy = sequencer.energy_levels(tracks)
+    costs = sequencer.transition_costs(tracks, energy)
+    index = {t["id"]: i for i, t in enumerate(tracks)}
+    print(f"{args.tracks} tracks")
+
+    for arc in args.arcs:
+        start = time.perf_counter()
+        order = sequencer.sequence_tracks(tracks, arc=arc, time_limit=args.time_limit)
+        elapsed = time.perf_counter() - start
+        given = sequencer.path_cost(range(len(tracks)), costs, energy, arc)
+        final = sequencer.path_cost([index[i] for i in order], costs, energy, arc)
+        print(f"  arc {arc:<6} {elapsed:7.2f}s  cost {given:9.1f} input -> {final:8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
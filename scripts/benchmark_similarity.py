@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Benchmark the similar-track index.
+
+Fills a temp database with synthetic tracks drawn from a few hundred
+"styles" (tempo, key, loudness, spectral balance, MFCCs and tags vary
+around a per-style centre, as they do across a real library), then times:
+
+- index build: reading features, vectors, k-means partitions, writing
+- query latency (p50/p99) of the IVF search vs. a full scan
+- recall@k of the IVF search against the full scan
+
+The IVF partitions are always built here, whatever EXACT_SEARCH_MAX says,
+so the two can be compared at any size.
+
+Usage:
+    uv run scripts/benchmark_similarity.py
+    uv run scripts/benchmark_similarity.py --tracks 50000 --queries 1000
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import music_minion.core.database as db_module
+from music_minion.core.database import get_db_connection, migrate_database
+from music_minion.domain.analysis import similarity
+from music_minion.domain.analysis.keys import CAMELOT_MAP
+
+CAMELOT_KEYS = sorted(set(CAMELOT_MAP.values()))
+TAGS = [f"tag{i}" for i in range(300)]
+
+
+def fill_library(tracks: int, styles: int, rng: np.random.Generator) -> None:
+    style = rng.integers(styles, size=tracks)
+    centre_bpm = rng.uniform(70, 175, styles)
+    centre_key = rng.integers(len(CAMELOT_KEYS), size=styles)
+    centre_energy = rng.normal(0, 1, (styles, 6))
+    centre_mfcc = rng.normal(0, 10, (styles, 26))
+    style_tags = [rng.choice(len(TAGS), 6, replace=False) for _ in range(styles)]
+
+    track_rows, analysis_rows, tag_rows = [], [], []
+    for track_id in range(1, tracks + 1):
+        s = style[track_id - 1]
+        bpm = round(float(centre_bpm[s] * rng.normal(1, 0.03)), 1)
+        key = CAMELOT_KEYS[(centre_key[s] + rng.choice([0, 0, 0, 1, -1, 7])) % len(CAMELOT_KEYS)]
+        track_rows.append((track_id, bpm, key))
+
+        e = centre_energy[s] + rng.normal(0, 0.4, 6)
+        analysis_rows.append((track_id, "loudness", json.dumps({"lufs": -9 + 2 * e[0], "lra": 6 + e[1]})))
+        analysis_rows.append((track_id, "energy", json.dumps({
+            "rms_db": -12 + 2 * e[2], "crest_db": 12 + e[3],
+            "spectral_centroid": float(2000 * np.exp(0.3 * e[4])), "bass_ratio": float(0.3 + 0.05 * e[5]),
+        })))
+        mfcc = centre_mfcc[s] + rng.normal(0, 3, 26)
+        analysis_rows.append((track_id, "timbre", json.dumps(
+            {"mfcc_mean": mfcc[:13].tolist(), "mfcc_std": np.abs(mfcc[13:]).tolist()}
+        )))
+        if rng.random() < 0.6:  # Not every track is tagged
+            for tag in rng.choice(style_tags[s], rng.integers(1, 4), replace=False):
+                tag_rows.append((track_id, TAGS[tag]))
+
+    with get_db_connection() as conn:
+        conn.executemany("INSERT INTO tracks (id, bpm, key_signature) VALUES (?, ?, ?)", track_rows)
+        conn.executemany(
+            "INSERT INTO track_analysis (track_id, analyzer, version, features) VALUES (?, ?, 1, ?)",
+            analysis_rows,
+        )
+        conn.executemany("INSERT INTO tags (track_id, tag_name, source) VALUES (?, ?, 'user')", tag_rows)
+        conn.commit()
+
+
+def exact_search(index: similarity.SimilarityIndex, seed_id: int, k: int) -> list[int]:
+    """Full scan: score every vector."""
+    seed = index.positions([seed_id])[0]
+    scores = index.vectors @ index.vectors[seed]
+    scores[seed] = -np.inf
+    top = np.argpartition(-scores, k)[:k]
+    return index.ids[top[np.argsort(-scores[top])]].tolist()
+
+
+def timed(label: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"  {label:<38} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def latency(label: str, fn, seeds) -> list:
+    results, times = [], []
+    for seed in seeds:
+        start = time.perf_counter()
+        results.append(fn(seed))
+        times.append((time.perf_counter() - start) * 1000)
+    p50, p99 = np.percentile(times, [50, 99])
+    print(f"  {label:<38} p50 {p50:6.2f}ms  p99 {p99:6.2f}ms")
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tracks", type=int, default=50000, help="Tracks to generate")
+    parser.add_argument("--styles", type=int, default=400, help="Clusters the tracks are drawn from")
+    parser.add_argument("--queries", type=int, default=1000, help="Seeds to query")
+    parser.add_argument("-k", type=int, default=10, help="Neighbours per query")
+    parser.add_argument("--nprobe", type=int, default=similarity.NPROBE, help="IVF lists probed")
+    args = parser.parse_args()
+    similarity.EXACT_SEARCH_MAX = 0
+    similarity.NPROBE = args.nprobe
+
+    rng = np.random.default_rng(46)
+    workdir = Path(tempfile.mkdtemp(prefix="similarity_bench_"))
+    db_path = workdir / "bench.db"
+    db_module.get_database_path = lambda: db_path
+
+    try:
+        with get_db_connection() as conn:
+            conn.execute("CREATE TABLE tracks (id INTEGER PRIMARY KEY, bpm REAL, key_signature TEXT)")
+            conn.execute(
+                "CREATE TABLE tags (id INTEGER PRIMARY KEY, track_id INTEGER, tag_name TEXT,"
+                " source TEXT, blacklisted BOOLEAN DEFAULT FALSE)"
+            )
+            migrate_database(conn, 63)
+            conn.commit()
+        print(f"Generating {args.tracks} tracks ...")
+        timed("generate", lambda: fill_library(args.tracks, args.styles, rng))
+
+        print("\nIndex:")
+        meta = timed("build", similarity.build_similarity_index)
+        print(f"    {meta['count']} vectors x {meta['dimensions']} dims, {meta['lists']} lists")
+        index = timed("load (mmap)", similarity.get_similarity_index)
+
+        seeds = rng.choice(index.ids, min(args.queries, len(index)), replace=False).tolist()
+        print(f"\nQueries (k={args.k}, {len(seeds)} seeds):")
+        approximate = latency(f"IVF (nprobe {similarity.NPROBE})", lambda s: index.search(s, args.k), seeds)
+        exact = latency("full scan", lambda s: exact_search(index, s, args.k), seeds)
+
+        hits = sum(
+            len({t for t, _ in found} & set(truth)) for found, truth in zip(approximate, exact)
+        )
+        print(f"    recall@{args.k}: {hits / (args.k * len(seeds)):.3f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
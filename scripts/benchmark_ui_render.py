@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Compare terminal output of the blessed UI with and without the diff renderer.
+
+Replays a recorded session (captured with MUSIC_MINION_UI_RECORD=path) or,
+without --record, synthesizes one by rendering the real dashboard, history and
+input components during simulated playback. Each frame is written both raw
+(what the UI used to emit) and through ScreenBuffer, and the bytes written and
+per-frame redraw time are reported.
+
+Usage:
+    MUSIC_MINION_UI_RECORD=/tmp/ui.jsonl uv run music-minion   # record a session
+    uv run scripts/benchmark_ui_render.py --record /tmp/ui.jsonl
+    uv run scripts/benchmark_ui_render.py --seconds 120 --width 160 --height 50
+"""
+
+import argparse
+import io
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from blessed import Terminal
+
+from music_minion.domain.playback.player import PlayerState
+from music_minion.ui.blessed.components.dashboard import render_dashboard
+from music_minion.ui.blessed.components.history import render_history
+from music_minion.ui.blessed.components.input import render_input
+from music_minion.ui.blessed.helpers.screen import ScreenBuffer
+from music_minion.ui.blessed.state import UIState, add_history_line, update_track_info
+
+
+def load_recording(path: Path) -> list[dict]:
+    """Load frames written by ScreenBuffer(record_path=...)."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def synthesize_session(seconds: int, width: int, height: int, fps: int) -> list[dict]:
+    """Render real components for simulated playback (progress ticks + log lines)."""
+    stream = io.StringIO()
+    term = Terminal(kind="xterm-256color", stream=stream, force_styling=True)
+    term_size = SimpleNamespace(width=width, height=height)
+    # blessed reads the size from the tty; pin it for reproducible output
+    type(term).width = property(lambda self: term_size.width)
+    type(term).height = property(lambda self: term_size.height)
+
+    ui_state = update_track_info(
+        UIState(),
+        {
+            "title": "Windowlicker",
+            "artist": "Aphex Twin",
+            "album": "Windowlicker",
+            "year": 1999,
+            "genre": "IDM",
+            "bpm": 128.0,
+            "key": "8A",
+            "tags": ["weird", "classic"],
+            "rating": 80,
+            "play_count": 12,
+        },
+    )
+    duration = float(max(seconds, 1))
+
+    frames = []
+    for i in range(seconds * fps):
+        t = i / fps
+        if i % (fps * 2) == 0:
+            ui_state = add_history_line(ui_state, f"✅ Background job step {i // fps}", "green")
+        player_state = PlayerState(
+            current_track="/music/windowlicker.mp3",
+            current_track_id=1,
+            is_playing=True,
+            current_position=t,
+            duration=duration,
+        )
+
+        stream.seek(0)
+        stream.truncate()
+        real_stdout = sys.stdout
+        sys.stdout = stream
+        try:
+            dashboard_height, _ = render_dashboard(term, player_state, ui_state, 0)
+            history_height = max(0, height - dashboard_height - 4)
+            render_history(term, ui_state, dashboard_height, history_height)
+            render_input(term, ui_state, height - 3)
+        finally:
+            sys.stdout = real_stdout
+        frames.append({"t": t, "width": width, "height": height, "raw": stream.getvalue()})
+    return frames
+
+
+def run(frames: list[dict]) -> None:
+    """Replay frames raw and through ScreenBuffer, then print the comparison."""
+    term = SimpleNamespace(
+        width=frames[0]["width"],
+        height=frames[0]["height"],
+        home="\x1b[H",
+        clear="\x1b[2J",
+        clear_eol="\x1b[K",
+        move_xy=lambda x, y: f"\x1b[{y + 1};{x + 1}H",
+    )
+    screen = ScreenBuffer(term)
+
+    raw_bytes = 0
+    diff_bytes = 0
+    diff_times = []
+    for frame in frames:
+        term.width, term.height = frame["width"], frame["height"]
+        raw_bytes += len(frame["raw"].encode("utf-8"))
+
+        sink = io.StringIO()
+        start = time.perf_counter()
+        screen.apply(frame["raw"])
+        diff_bytes += screen.flush(sink)
+        diff_times.append(time.perf_counter() - start)
+
+    duration = max(frames[-1]["t"] - frames[0]["t"], 1e-9)
+    diff_ms = sorted(t * 1000 for t in diff_times)
+    p95 = diff_ms[min(len(diff_ms) - 1, int(len(diff_ms) * 0.95))]
+
+    print(f"Frames:          {len(frames)} over {duration:.1f}s")
+    print(f"Raw output:      {raw_bytes:>10,} bytes  ({raw_bytes / duration:,.0f} B/s)")
+    print(f"Diffed output:   {diff_bytes:>10,} bytes  ({diff_bytes / duration:,.0f} B/s)")
+    if raw_bytes:
+        print(f"Reduction:       {100 * (1 - diff_bytes / raw_bytes):.1f}%")
+    print(
+        f"Diff time/frame: mean {statistics.mean(diff_ms):.3f}ms  "
+        f"p95 {p95:.3f}ms  max {diff_ms[-1]:.3f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the blessed UI diff renderer")
+    parser.add_argument("--record", type=Path, help="JSON-lines recording to replay")
+    parser.add_argument("--seconds", type=int, default=60, help="Synthetic session length")
+    parser.add_argument("--fps", type=int, default=10, help="Synthetic frames per second")
+    parser.add_argument("--width", type=int, default=120)
+    parser.add_argument("--height", type=int, default=40)
+    args = parser.parse_args()
+
+    if args.record:
+        frames = load_recording(args.record)
+    else:
+        frames = synthesize_session(args.seconds, args.width, args.height, args.fps)
+
+    if not frames:
+        print("No frames to replay")
+        sys.exit(1)
+    run(frames)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark WebSocket fan-out of playback updates to simulated clients.
+
+Simulates N clients (a few of them slow, like a phone on a bad Tailscale
+link) receiving playback:state updates, and compares the previous broadcast
+(await send_json on each connection in turn) with SyncManager's per-client
+queues: delivery latency for the fast clients, serializations and bytes sent.
+
+Usage:
+    uv run scripts/benchmark_ws_fanout.py
+    uv run scripts/benchmark_ws_fanout.py --clients 50 --slow 2 --slow-latency 0.3 --updates 100
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web.backend.sync_manager import SyncManager
+
+
+class SimulatedClient:
+    """Fake WebSocket with fixed per-message send latency."""
+
+    def __init__(self, latency: float, slow: bool):
+        self.latency = latency
+        self.slow = slow
+        self.bytes = 0
+        self.messages = 0
+        self.delivery_latencies: list[float] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+    async def _deliver(self, text: str) -> None:
+        await asyncio.sleep(self.latency)
+        self.bytes += len(text.encode("utf-8"))
+        self.messages += 1
+        sent_at = json.loads(text).get("ts")
+        if sent_at is not None:
+            self.delivery_latencies.append(time.time() - sent_at)
+
+    async def send_text(self, text: str) -> None:
+        await self._deliver(text)
+
+    async def send_json(self, message: dict) -> None:
+        await self._deliver(json.dumps(message))
+
+
+def playback_state(i: int) -> dict:
+    """A realistic get_state_dict() payload; only position/time change per tick."""
+    queue = [{"id": n, "title": f"Track {n}", "artist": "Artist", "duration": 240.0} for n in range(50)]
+    return {
+        "currentTrack": queue[0],
+        "queue": queue,
+        "queueIndex": 0,
+        "positionMs": i * 1000,
+        "trackStartedAt": 1_700_000_000_000 + i * 1000,
+        "isPlaying": True,
+        "activeDeviceId": "desktop",
+        "shuffleEnabled": True,
+        "sortSpec": None,
+        "currentContext": None,
+        "positionInPlaylist": 0,
+        "serverTime": 1_700_000_000_000 + i * 1000,
+        "currentHistoryId": 1,
+        "durationMs": 240_000,
+    }
+
+
+def make_clients(args: argparse.Namespace) -> list[SimulatedClient]:
+    return [
+        SimulatedClient(args.slow_latency if i < args.slow else args.fast_latency, i < args.slow)
+        for i in range(args.clients)
+    ]
+
+
+async def run_legacy(args: argparse.Namespace) -> tuple[list[SimulatedClient], int, float]:
+    """Previous behaviour: sequential await of send_json per connection."""
+    clients = make_clients(args)
+    start = time.perf_counter()
+    for i in range(args.updates):
+        message = {"type": "playback:state", "data": playback_state(i), "ts": time.time()}
+        for client in clients:
+            await client.send_json(message)
+        await asyncio.sleep(args.interval)
+    return clients, args.updates * args.clients, time.perf_counter() - start
+
+
+async def run_queued(args: argparse.Namespace) -> tuple[list[SimulatedClient], int, float, dict]:
+    manager = SyncManager()
+    clients = make_clients(args)
+    for client in clients:
+        await manager.connect(client)
+    start = time.perf_counter()
+    for i in range(args.updates):
+        await manager.broadcast("playback:state", playback_state(i))
+        await asyncio.sleep(args.interval)
+    await manager.flush(timeout=60)
+    elapsed = time.perf_counter() - start
+    for client in clients:
+        manager.disconnect(client)
+    return clients, manager.stats["serializations"], elapsed, manager.stats
+
+
+def report(label: str, clients: list[SimulatedClient], serializations: int, elapsed: float) -> None:
+    fast = [c for c in clients if not c.slow]
+    latencies = sorted(l * 1000 for c in fast for l in c.delivery_latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0
+    total_bytes = sum(c.bytes for c in clients)
+    print(f"{label}")
+    print(f"  wall time:            {elapsed:.2f}s")
+    print(f"  serializations:       {serializations}")
+    print(f"  messages / bytes:     {sum(c.messages for c in clients)} / {total_bytes:,}")
+    if latencies:
+        print(
+            f"  fast-client latency:  p50 {statistics.median(latencies):.1f}ms  "
+            f"p95 {p95:.1f}ms  max {latencies[-1]:.1f}ms"
+        )
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    print(
+        f"{args.clients} clients ({args.slow} slow @ {args.slow_latency * 1000:.0f}ms), "
+        f"{args.updates} updates every {args.interval * 1000:.0f}ms\n"
+    )
+    clients, serializations, elapsed = await run_legacy(args)
+    report("Sequential send_json (previous)", clients, serializations, elapsed)
+    clients, serializations, elapsed, stats = await run_queued(args)
+    report("Per-client queues + deltas", clients, serializations, elapsed)
+    print(
+        f"  deltas/full states:   {stats['deltas_sent']} / {stats['full_states_sent']}  "
+        f"(compacted {stats['compacted']})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark WebSocket fan-out")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--slow", type=int, default=2, help="Number of slow clients")
+    parser.add_argument("--slow-latency", type=float, default=0.3, help="Seconds per send")
+    parser.add_argument("--fast-latency", type=float, default=0.001, help="Seconds per send")
+    parser.add_argument("--updates", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.1, help="Seconds between updates")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
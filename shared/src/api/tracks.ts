@@ -5,8 +5,12 @@
 import { getDefaultApiClient } from './client';
 import type { WaveformData, FoldersResponse } from '../types/index';
 
-export function getStreamUrl(trackId: number): string {
-  return `${getDefaultApiClient().getBaseUrl()}/tracks/${trackId}/stream`;
+/** 'original' serves the stored file; the others are server-side Opus transcodes. */
+export type StreamQuality = 'original' | 'high' | 'medium' | 'low';
+
+export function getStreamUrl(trackId: number, quality: StreamQuality = 'original'): string {
+  const url = `${getDefaultApiClient().getBaseUrl()}/tracks/${trackId}/stream`;
+  return quality === 'original' ? url : `${url}?quality=${quality}`;
 }
 
 export async function getWaveformData(trackId: number): Promise<WaveformData> {
@@ -25,6 +25,7 @@ export {
   getStreamUrl, getWaveformData, checkStreamAvailable, archiveTrack,
   refreshWaveform, purgeSoundcloudWaveforms, getFolders,
 } from './api/tracks';
+export type { StreamQuality } from './api/tracks';
 export { getHistory, getStats, getTopTracks } from './api/history';
 export type { HistoryEntry, TopTrack, Stats, SourceFilter } from './api/history';
 export type { TrackInfo as HistoryTrackInfo } from './api/history';
@@ -13,7 +13,7 @@ export interface Device {
 }
 
 export interface PlayContext {
-  type: 'playlist' | 'track' | 'builder' | 'search' | 'comparison' | 'organizer';
+  type: 'playlist' | 'track' | 'builder' | 'search' | 'comparison' | 'organizer' | 'similar';
   track_ids?: number[];
   playlist_id?: number;
   builder_id?: number;
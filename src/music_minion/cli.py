@@ -186,6 +186,165 @@ def run_locate_opus(folder: str, apply: bool = False) -> int:
         return 1
 
 
+def run_find_duplicates() -> int:
+    """List library files with identical audio content, from the file catalog.
+
+    Returns:
+        Exit code (0 for success)
+    """
+    from music_minion.core.config import load_config
+    from music_minion.core.database import get_track_path_to_id_map, init_database
+    from music_minion.domain.library.catalog import find_duplicate_files
+
+    init_database()
+    groups = find_duplicate_files(load_config().music.library_paths)
+    if not groups:
+        print("No duplicate files in the catalog.")
+        return 0
+
+    track_ids = get_track_path_to_id_map()
+    for paths in groups:
+        print(f"{len(paths)} copies:")
+        for path in paths:
+            track_id = track_ids.get(path)
+            print(f"  {'#' + str(track_id) if track_id else 'untracked':>9}  {path}")
+    print()
+    print(f"{len(groups)} group(s), {sum(len(p) - 1 for p in groups)} redundant file(s)")
+    return 0
+
+
+def run_analyze_audio(
+    limit: int | None = None,
+    workers: int | None = None,
+    analyzers: list[str] | None = None,
+    force: bool = False,
+) -> int:
+    """Analyze BPM, key, loudness and energy for tracks that need it.
+
+    Args:
+        limit: Optional maximum number of tracks
+        workers: Worker processes (default: one per core)
+        analyzers: Analyzer names to run (default: all available)
+        force: Re-analyze tracks whose results are current
+
+    Returns:
+        Exit code (0 for success)
+    """
+    from tqdm import tqdm
+
+    from music_minion.core.database import init_database
+    from music_minion.domain.analysis import DecodeError, analyze_library
+
+    init_database()
+    with tqdm(desc="Analyzing", unit="track") as bar:
+
+        def on_progress(done: int, total: int) -> None:
+            bar.total = total
+            bar.update(done - bar.n)
+
+        try:
+            summary = analyze_library(
+                limit=limit,
+                workers=workers,
+                analyzers=analyzers,
+                force=force,
+                progress_callback=on_progress,
+            )
+        except (ValueError, DecodeError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    if not summary["analyzers"]:
+        print("No audio analyzers available.", file=sys.stderr)
+        return 1
+    if summary["total"] == 0:
+        print("All tracks are analyzed.")
+        return 0
+
+    print(
+        f"Analyzed {summary['analyzed']} tracks ({summary['failed']} failed, "
+        f"{summary['missing']} missing files)"
+    )
+    print(f"  BPM filled: {summary['bpm_filled']}, keys filled: {summary['keys_filled']}")
+    return 0
+
+
+def run_replicate(args: argparse.Namespace) -> int:
+    """Run a database replication subcommand (init/status/export/import).
+
+    Changesets are JSON; export writes to stdout by default so two devices
+    can be synced over ssh, e.g.:
+        music-minion replicate export --peer PI_ORIGIN |
+            ssh pi docker exec -i music-minion-web uv run music-minion replicate import -
+
+    Returns:
+        Exit code (0 for success, 1 for failure)
+    """
+    import json
+
+    from music_minion.core.database import init_database
+    from music_minion.core.replication import (
+        ReplicationError,
+        enable_replication,
+        export_changeset,
+        get_replication_status,
+        import_changeset,
+    )
+
+    try:
+        init_database()
+
+        if args.replicate_command == "init":
+            origin = enable_replication()
+            print(f"Replication enabled. Origin: {origin}")
+            return 0
+
+        if args.replicate_command == "status":
+            status = get_replication_status()
+            if not status["enabled"]:
+                print("Replication is not enabled (run: music-minion replicate init)")
+                return 0
+            print(f"Origin:     {status['origin']}")
+            print(f"Change log: {status['log_rows']} rows (head seq {status['head_seq']})")
+            for peer in status["peers"]:
+                print(
+                    f"Peer {peer['peer_origin']}: applied their seq {peer['last_applied']}, "
+                    f"acked our seq {peer['last_acked']}, {peer['pending']} changes pending"
+                )
+            return 0
+
+        if args.replicate_command == "export":
+            changeset = export_changeset(args.peer, since=args.since)
+            text = json.dumps(changeset, separators=(",", ":"), ensure_ascii=False)
+            if args.output and args.output != "-":
+                with open(args.output, "w", encoding="utf-8") as f:
+                    f.write(text)
+            else:
+                sys.stdout.write(text)
+            print(
+                f"{len(changeset['changes'])} row changes "
+                f"({changeset['logged_changes']} logged, {len(text):,} bytes)",
+                file=sys.stderr,
+            )
+            return 0
+
+        if args.replicate_command == "import":
+            if args.file == "-":
+                changeset = json.load(sys.stdin)
+            else:
+                with open(args.file, encoding="utf-8") as f:
+                    changeset = json.load(f)
+            stats = import_changeset(changeset)
+            print(", ".join(f"{key}: {value}" for key, value in stats.items()))
+            return 0 if not stats["failed"] else 1
+
+    except (ReplicationError, OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    return 1
+
+
 def send_web_broadcast_command(command: str) -> int:
     """Send a command via the web backend broadcast endpoint.
 
@@ -291,6 +450,9 @@ def main() -> None:
     )
     subparsers.add_parser("nq", help='Add to "Not Quite" playlist')
     subparsers.add_parser("ni", help='Add to "Not Interested" playlist and skip')
+    subparsers.add_parser(
+        "ipc-status", help="Show IPC request counts and latency percentiles"
+    )
 
     # Utility commands (run directly, not via IPC)
     locate_parser = subparsers.add_parser(
@@ -303,6 +465,27 @@ def main() -> None:
         help="Actually update database (default: dry run)",
     )
 
+    subparsers.add_parser(
+        "find-duplicates", help="List library files with identical audio content"
+    )
+
+    analyze_parser = subparsers.add_parser(
+        "analyze-audio", help="Detect BPM, key, loudness and energy of library tracks"
+    )
+    analyze_parser.add_argument("--limit", type=int, help="Analyze at most N tracks")
+    analyze_parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: one per core)"
+    )
+    analyze_parser.add_argument(
+        "--analyzer",
+        action="append",
+        dest="analyzers",
+        help="Run only this analyzer (repeatable): bpm_key, loudness, energy, timbre",
+    )
+    analyze_parser.add_argument(
+        "--force", action="store_true", help="Re-analyze tracks with current results"
+    )
+
     # Radio server sync
     sync_radio_parser = subparsers.add_parser(
         "sync-radio", help="Sync music files and database to radio server"
@@ -319,6 +502,26 @@ def main() -> None:
         help="Sync tracks modified since DATE (YYYY-MM-DD or 'today')",
     )
 
+    # Database replication between devices (laptop <-> Pi)
+    replicate_parser = subparsers.add_parser(
+        "replicate", help="Exchange database changes with another device"
+    )
+    replicate_sub = replicate_parser.add_subparsers(
+        dest="replicate_command", required=True
+    )
+    replicate_sub.add_parser("init", help="Start recording changes on this database")
+    replicate_sub.add_parser("status", help="Show origin, change log and peer watermarks")
+    export_parser = replicate_sub.add_parser(
+        "export", help="Write changes a peer has not acknowledged yet"
+    )
+    export_parser.add_argument("--peer", required=True, help="Origin ID of the receiving device")
+    export_parser.add_argument("--output", "-o", help="Output file (default: stdout)")
+    export_parser.add_argument(
+        "--since", type=int, help="Export from this change-log seq instead of the peer's ack"
+    )
+    import_parser = replicate_sub.add_parser("import", help="Apply a peer's changeset")
+    import_parser.add_argument("file", help="Changeset file, or - for stdin")
+
     # Parse arguments
     args, unknown = parser.parse_known_args()
 
@@ -372,14 +575,33 @@ def main() -> None:
             # Composite: add_not_interested_and_skip
             sys.exit(send_ipc_command("composite", ["add_not_interested_and_skip"]))
 
+        elif args.subcommand == "ipc-status":
+            sys.exit(send_ipc_command("status", []))
+
         elif args.subcommand == "locate-opus":
             # Run locate-opus utility directly
             sys.exit(run_locate_opus(args.folder, apply=args.apply))
 
+        elif args.subcommand == "find-duplicates":
+            sys.exit(run_find_duplicates())
+
+        elif args.subcommand == "analyze-audio":
+            sys.exit(
+                run_analyze_audio(
+                    limit=args.limit,
+                    workers=args.workers,
+                    analyzers=args.analyzers,
+                    force=args.force,
+                )
+            )
+
         elif args.subcommand == "sync-radio":
             # Sync to radio server
             sys.exit(run_sync_radio(force=args.force, since=args.since))
 
+        elif args.subcommand == "replicate":
+            sys.exit(run_replicate(args))
+
     # No subcommand - start interactive mode
     if args.dev:
         os.environ["MUSIC_MINION_DEV_MODE"] = "1"
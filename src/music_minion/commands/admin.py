@@ -1,7 +1,7 @@
 """
 Admin command handlers for Music Minion CLI.
 
-Handles: init, scan, migrate, killall, stats, tag (remove/list)
+Handles: init, scan, analyze, migrate, killall, stats, tag (remove/list)
 """
 
 import glob
@@ -13,7 +13,7 @@ from typing import Any, Optional
 
 from music_minion.context import AppContext
 from music_minion.core import config, database
-from music_minion.core.output import log
+from music_minion.core.output import log, notify_ui
 from music_minion.domain import library
 
 # Global scan state (thread-safe)
@@ -34,6 +34,7 @@ def _update_scan_state(updates: dict[str, Any]) -> None:
         if _scan_state is None:
             _scan_state = {}
         _scan_state.update(updates)
+    notify_ui()
 
 
 def _clear_scan_state() -> None:
@@ -41,6 +42,7 @@ def _clear_scan_state() -> None:
     global _scan_state
     with _scan_state_lock:
         _scan_state = None
+    notify_ui()
 
 
 def _count_music_files(cfg: config.Config) -> int:
@@ -373,6 +375,76 @@ def handle_scan_command(ctx: AppContext) -> tuple[AppContext, bool]:
         return ctx, False
 
 
+def handle_analyze_command(
+    ctx: AppContext, args: list[str]
+) -> tuple[AppContext, bool]:
+    """Handle analyze command - background BPM/key/loudness/energy analysis.
+
+    Usage: analyze [limit] | analyze status | analyze stop
+
+    Args:
+        ctx: Application context
+        args: Optional [limit], or 'status' / 'stop'
+
+    Returns:
+        (updated_context, should_continue)
+    """
+    from music_minion.domain import analysis
+
+    if args and args[0] == "status":
+        status = analysis.get_analysis_job_status()
+        if status is None:
+            log("No audio analysis has run yet", level="info")
+        elif status["running"]:
+            log(f"🎚️ Audio analysis: {status['done']}/{status['total']} tracks", level="info")
+        elif status["error"]:
+            log(f"❌ Last audio analysis failed: {status['error']}", level="error")
+        else:
+            summary = status["summary"]
+            log(
+                f"✅ Last audio analysis: {summary['analyzed']} analyzed, "
+                f"{summary['failed']} failed, {summary['skipped']} skipped",
+                level="info",
+            )
+        return ctx, True
+
+    if args and args[0] == "stop":
+        if analysis.stop_analysis_job():
+            log("⏹️ Stopping audio analysis after the files in progress", level="info")
+        else:
+            log("No audio analysis is running", level="info")
+        return ctx, True
+
+    limit = None
+    if args:
+        try:
+            limit = int(args[0])
+        except ValueError:
+            log("❌ Usage: analyze [limit] | analyze status | analyze stop", level="error")
+            return ctx, True
+
+    def announce(status: dict[str, Any]) -> None:
+        if status["error"]:
+            message = (f"⚠ Audio analysis failed: {status['error']}", "yellow")
+        else:
+            summary = status["summary"]
+            text = (
+                f"✅ Audio analysis complete: {summary['analyzed']} analyzed, "
+                f"{summary['failed']} failed, {summary['bpm_filled']} BPM and "
+                f"{summary['keys_filled']} keys filled"
+            )
+            message = (text, "green")
+        if ctx.update_ui_state:
+            ctx.update_ui_state({"history_messages": [message]})
+        notify_ui()
+
+    if analysis.start_analysis_job(on_complete=announce, limit=limit):
+        log("🎚️ Audio analysis started in the background ('analyze status' for progress)")
+    else:
+        log("Audio analysis is already running ('analyze status' for progress)", level="warning")
+    return ctx, True
+
+
 def handle_migrate_command(ctx: AppContext) -> tuple[AppContext, bool]:
     """Handle migrate command - run database migrations.
 
@@ -1,7 +1,7 @@
 """
 AI command handlers for Music Minion CLI.
 
-Handles: ai setup, ai analyze, ai test, ai usage, ai review, ai enhance
+Handles: ai setup, ai analyze, ai batch, ai test, ai usage, ai review, ai enhance
 """
 
 from music_minion.context import AppContext
@@ -106,6 +106,61 @@ def handle_ai_analyze_command(ctx: AppContext) -> tuple[AppContext, bool]:
     return ctx, True
 
 
+def handle_ai_batch_command(
+    ctx: AppContext, args: list[str]
+) -> tuple[AppContext, bool]:
+    """Handle ai batch command - tag every track that needs analysis.
+
+    Args:
+        ctx: Application context
+        args: Optional [limit]
+
+    Returns:
+        (updated_context, should_continue)
+    """
+    limit = None
+    if args:
+        try:
+            limit = int(args[0])
+        except ValueError:
+            log("❌ Usage: ai batch [limit]", level="error")
+            return ctx, True
+
+    def on_progress(done: int, total: int) -> None:
+        if done % 25 == 0 or done == total:
+            log(f"   {done}/{total} tracks processed", level="info")
+
+    log("🤖 Running batch AI analysis...", level="info")
+
+    try:
+        summary = ai.analyze_tracks_batch(limit=limit, progress_callback=on_progress)
+    except ai.AIError as e:
+        log(f"❌ {e}", level="error")
+        return ctx, True
+    except Exception as e:
+        log(f"❌ Error during batch AI analysis: {e}", level="error")
+        return ctx, True
+
+    if summary["total"] == 0:
+        log("✅ No tracks need analysis", level="info")
+        return ctx, True
+
+    log(
+        f"✅ Batch complete: {summary['analyzed']} analyzed, {summary['cached']} from cache, "
+        f"{summary['failed']} failed, {summary['tags_added']} tags added",
+        level="info",
+    )
+    if summary["skipped"]:
+        log(f"   {summary['skipped']} tracks skipped (cost limit reached)", level="warning")
+    log(
+        f"   Tokens used: {summary['prompt_tokens']:,} prompt + {summary['completion_tokens']:,} completion "
+        f"(${summary['cost']:.4f})",
+        level="info",
+    )
+
+    return ctx, True
+
+
 def handle_ai_test_command(ctx: AppContext) -> tuple[AppContext, bool]:
     """Handle ai test command - test AI prompt with random track.
 
@@ -13,9 +13,10 @@ from loguru import logger
 
 from music_minion.context import AppContext
 from music_minion.core import config, database
-from music_minion.core.output import log
+from music_minion.core.output import log, notify_ui
 from music_minion.domain.library import providers
 from music_minion.domain.library.provider import ProviderConfig, ProviderState
+from music_minion.domain.playlists import sync as playlist_sync
 
 # Removed: old sync_provider_tracks import (replaced with batch_insert_provider_tracks)
 
@@ -59,6 +60,7 @@ def _update_sync_state(updates: dict[str, Any]) -> None:
         if _sync_state is None:
             _sync_state = {}
         _sync_state.update(updates)
+    notify_ui()
 
 
 def _clear_sync_state() -> None:
@@ -66,6 +68,7 @@ def _clear_sync_state() -> None:
     global _sync_state
     with _sync_state_lock:
         _sync_state = None
+    notify_ui()
 
 
 def _threaded_sync_worker(ctx: AppContext, provider_name: str, full: bool) -> None:
@@ -110,6 +113,17 @@ def _threaded_sync_worker(ctx: AppContext, provider_name: str, full: bool) -> No
                 _update_sync_state(
                     {"phase": "importing", "status": data.get("status", "")}
                 )
+            elif event_type == "page":
+                # Streaming ingestion: one event per page written
+                _update_sync_state(
+                    {
+                        "phase": "importing",
+                        "tracks_fetched": data.get("tracks_seen", 0),
+                        "tracks_imported": data.get("created", 0),
+                        "pages": data.get("pages", 0),
+                        "status": f"Page {data.get('pages', 0)}: {data.get('created', 0)} new tracks",
+                    }
+                )
             elif event_type == "complete":
                 _update_sync_state(
                     {
@@ -623,60 +637,76 @@ def sync_library(
 
         # Sync library (incremental by default, full if --full flag provided)
         incremental = not full
-        new_state, provider_tracks = provider.sync_library(
-            state, incremental=incremental
-        )
 
-        if not provider_tracks:
-            # Check if this is due to authentication failure vs genuinely no tracks
+        # Streaming providers write each page themselves as it arrives
+        if hasattr(provider, "ingest_library"):
+            new_state, stats = provider.ingest_library(
+                state, incremental=incremental, progress_callback=progress_callback
+            )
             if not new_state.authenticated:
                 log(
                     f"❌ Authentication failed for {provider_name}. Please re-authenticate with: library auth {provider_name}",
                     level="error",
                 )
-            else:
-                message = f"⚠ No tracks found in {provider_name} library"
-                if incremental:
-                    message += " (incremental mode - all tracks already synced)"
-                    log(message, level="warning")
-                    log("💡 Tip: Use '--full' flag to re-sync all tracks", level="info")
-                else:
-                    log(message, level="warning")
-
-            # Save updated provider state even when no tracks found (updates cache/timestamps)
-            # This is important for incremental sync - the cache/timestamps get updated even when no new tracks
-            _save_provider_state_to_db(provider_name, new_state)
+                _save_provider_state_to_db(provider_name, new_state)
+                if progress_callback:
+                    progress_callback("error", {"error": "Authentication failed"})
+                return ctx, True
+        else:
+            new_state, provider_tracks = provider.sync_library(
+                state, incremental=incremental
+            )
 
+            if not provider_tracks:
+                # Check if this is due to authentication failure vs genuinely no tracks
+                if not new_state.authenticated:
+                    log(
+                        f"❌ Authentication failed for {provider_name}. Please re-authenticate with: library auth {provider_name}",
+                        level="error",
+                    )
+                else:
+                    message = f"⚠ No tracks found in {provider_name} library"
+                    if incremental:
+                        message += " (incremental mode - all tracks already synced)"
+                        log(message, level="warning")
+                        log("💡 Tip: Use '--full' flag to re-sync all tracks", level="info")
+                    else:
+                        log(message, level="warning")
+
+                # Save updated provider state even when no tracks found (updates cache/timestamps)
+                # This is important for incremental sync - the cache/timestamps get updated even when no new tracks
+                _save_provider_state_to_db(provider_name, new_state)
+
+                if progress_callback:
+                    progress_callback("complete", {"created": 0, "skipped": 0})
+                return ctx, True
+
+            # Notify track count
             if progress_callback:
-                progress_callback("complete", {"created": 0, "skipped": 0})
-            return ctx, True
+                progress_callback(
+                    "tracks_fetched",
+                    {
+                        "total": len(provider_tracks),
+                        "status": f"Fetched {len(provider_tracks)} tracks",
+                    },
+                )
 
-        # Notify track count
-        if progress_callback:
-            progress_callback(
-                "tracks_fetched",
-                {
-                    "total": len(provider_tracks),
-                    "status": f"Fetched {len(provider_tracks)} tracks",
-                },
+            # Import to database (no deduplication - creates records with source=provider)
+            log(
+                f"📥 Importing {len(provider_tracks)} {provider_name} tracks to database...",
+                level="info",
             )
 
-        # Import to database (no deduplication - creates records with source=provider)
-        log(
-            f"📥 Importing {len(provider_tracks)} {provider_name} tracks to database...",
-            level="info",
-        )
+            if progress_callback:
+                progress_callback(
+                    "importing", {"status": f"Importing {len(provider_tracks)} tracks..."}
+                )
 
-        if progress_callback:
-            progress_callback(
-                "importing", {"status": f"Importing {len(provider_tracks)} tracks..."}
+            from music_minion.domain.library.import_tracks import (
+                batch_insert_provider_tracks,
             )
 
-        from music_minion.domain.library.import_tracks import (
-            batch_insert_provider_tracks,
-        )
-
-        stats = batch_insert_provider_tracks(provider_tracks, provider_name)
+            stats = batch_insert_provider_tracks(provider_tracks, provider_name)
 
         log("✓ Import complete!", level="info")
         log(
@@ -823,7 +853,7 @@ def sync_playlists(
         import time
 
         print_if_not_silent(f"📋 Fetching playlists from {provider_name}...")
-        fetch_start = time.time()
+        sync_start = fetch_start = time.time()
         state, playlists = provider.get_playlists(state, full=full)
         fetch_time = time.time() - fetch_start
         log(
@@ -879,7 +909,8 @@ def sync_playlists(
             if provider_playlist_ids:
                 placeholders = ",".join("?" * len(provider_playlist_ids))
                 query = f"""
-                    SELECT id, name, last_synced_at, provider_last_modified, {provider_id_field}
+                    SELECT id, name, last_synced_at, provider_last_modified,
+                           provider_track_count, {provider_id_field}
                     FROM playlists
                     WHERE {provider_id_field} IN ({placeholders})
                 """
@@ -897,26 +928,35 @@ def sync_playlists(
 
         all_tracks_to_sync = {}  # {soundcloud_id: (soundcloud_id, metadata)}
         playlists_to_sync = []  # [(pl_data, [provider_track_ids])]
+        sync_stats = {"playlists_total": len(playlists)}
 
+        # Probe: skip playlists whose change marker and track count are unchanged
+        changed_playlists = []
         for pl_data in playlists:
-            pl_id = pl_data["id"]
-            pl_name = pl_data["name"]
-            pl_last_modified = pl_data.get("last_modified")
-
-            # Apply incremental sync filter BEFORE fetching tracks
-            existing = existing_playlists_map.get(pl_id)
-            if existing and not full and pl_last_modified:
-                existing_modified = existing["provider_last_modified"]
-                if existing_modified and pl_last_modified <= existing_modified:
-                    # Skip - no changes since last sync
-                    skipped_count += 1
-                    continue
-
-            # Fetch tracks for this playlist (metadata-only API means we need individual fetches)
-            state, provider_tracks, _ = provider.get_playlist_tracks(state, pl_id)
+            existing = existing_playlists_map.get(pl_data["id"])
+            if not full and playlist_sync.playlist_unchanged(pl_data, existing):
+                skipped_count += 1
+                sync_stats["api_calls_saved"] = sync_stats.get(
+                    "api_calls_saved", 0
+                ) + playlist_sync.track_list_requests(
+                    provider_name, pl_data.get("track_count") or 0
+                )
+                continue
+            changed_playlists.append(pl_data)
+
+        # Fetch track lists of changed playlists concurrently (rate limited)
+        state, fetched, sync_stats["api_calls"] = playlist_sync.fetch_playlist_tracks(
+            provider, state, provider_name, changed_playlists
+        )
+        sync_stats["playlists_skipped"] = skipped_count
+        sync_stats["playlists_fetched"] = len(changed_playlists)
 
+        for pl_data in changed_playlists:
+            provider_tracks, created_at = fetched.get(pl_data["id"], ([], None))
             if not provider_tracks:
-                continue  # Skip empty playlists
+                continue  # Skip empty playlists (or failed fetches)
+            if not pl_data.get("created_at") and created_at:
+                pl_data = {**pl_data, "created_at": created_at}
 
             # Collect unique tracks (deduplicate across playlists)
             track_ids = []
@@ -930,11 +970,13 @@ def sync_playlists(
             f"✓ Collected {len(all_tracks_to_sync)} unique tracks from {len(playlists_to_sync)} playlists",
         )
         log(
-            f"Playlist filter: {skipped_count} skipped (unchanged), {len(playlists_to_sync)} syncing",
+            f"Playlist filter: {skipped_count} skipped (unchanged), {len(playlists_to_sync)} syncing, "
+            f"{sync_stats.get('api_calls_saved', 0)} API calls saved",
             level="info",
         )
 
         if not playlists_to_sync:
+            playlist_sync.record_sync_run(provider_name, sync_start, sync_stats)
             print_if_not_silent(
                 f"\n⚠ No playlists need syncing ({skipped_count} unchanged)"
             )
@@ -1008,6 +1050,9 @@ def sync_playlists(
         # Calculate skipped count (playlists filtered out in PHASE 1)
         skipped_count = len(playlists) - len(playlists_to_sync)
 
+        tracks_inserted = 0
+        tracks_deleted = 0
+
         # OPTIMIZATION: Single transaction for all playlist operations
         with database.get_db_connection() as conn:
             conn.execute("BEGIN")
@@ -1053,25 +1098,12 @@ def sync_playlists(
                                 {"status": "Updating existing playlist..."},
                             )
 
-                            # Clear existing tracks
-                            conn.execute(
-                                "DELETE FROM playlist_tracks WHERE playlist_id = ?",
-                                (playlist_id,),
+                            # Write only the tracks that joined, left or moved
+                            inserted, deleted = playlist_sync.apply_playlist_diff(
+                                conn, playlist_id, track_ids
                             )
-
-                            # OPTIMIZATION: Batch insert tracks
-                            if track_ids:
-                                insert_data = [
-                                    (playlist_id, track_id, position)
-                                    for position, track_id in enumerate(track_ids)
-                                ]
-                                conn.executemany(
-                                    """
-                                    INSERT INTO playlist_tracks (playlist_id, track_id, position)
-                                    VALUES (?, ?, ?)
-                                """,
-                                    insert_data,
-                                )
+                            tracks_inserted += inserted
+                            tracks_deleted += deleted
 
                             # Update timestamps and track count
                             # Also update spotify_snapshot_id if provider is Spotify
@@ -1082,6 +1114,7 @@ def sync_playlists(
                                     SET last_synced_at = ?,
                                         provider_last_modified = ?,
                                         provider_created_at = COALESCE(?, provider_created_at),
+                                        provider_track_count = ?,
                                         track_count = ?,
                                         spotify_snapshot_id = ?,
                                         library = ?,
@@ -1092,6 +1125,7 @@ def sync_playlists(
                                         time.time(),
                                         pl_last_modified,
                                         pl_created_at,
+                                        pl_track_count,
                                         len(track_ids),
                                         pl_last_modified,  # snapshot_id
                                         provider_name,
@@ -1105,6 +1139,7 @@ def sync_playlists(
                                     SET last_synced_at = ?,
                                         provider_last_modified = ?,
                                         provider_created_at = COALESCE(?, provider_created_at),
+                                        provider_track_count = ?,
                                         track_count = ?,
                                         library = ?,
                                         updated_at = CURRENT_TIMESTAMP
@@ -1114,6 +1149,7 @@ def sync_playlists(
                                         time.time(),
                                         pl_last_modified,
                                         pl_created_at,
+                                        pl_track_count,
                                         len(track_ids),
                                         provider_name,
                                         playlist_id,
@@ -1180,6 +1216,7 @@ def sync_playlists(
                                     SET {provider_id_field} = ?,
                                         last_synced_at = ?,
                                         provider_last_modified = ?,
+                                        provider_track_count = ?,
                                         provider_created_at = ?,
                                         spotify_snapshot_id = ?
                                     WHERE id = ?
@@ -1188,6 +1225,7 @@ def sync_playlists(
                                         pl_id,
                                         datetime.now().isoformat(),
                                         pl_last_modified,
+                                        pl_track_count,
                                         pl_created_at,
                                         pl_last_modified,  # snapshot_id
                                         playlist_id,
@@ -1200,6 +1238,7 @@ def sync_playlists(
                                     SET {provider_id_field} = ?,
                                         last_synced_at = ?,
                                         provider_last_modified = ?,
+                                        provider_track_count = ?,
                                         provider_created_at = ?
                                     WHERE id = ?
                                 """,
@@ -1207,24 +1246,16 @@ def sync_playlists(
                                         pl_id,
                                         datetime.now().isoformat(),
                                         pl_last_modified,
+                                        pl_track_count,
                                         pl_created_at,
                                         playlist_id,
                                     ),
                                 )
 
-                            # OPTIMIZATION: Batch insert tracks
-                            if track_ids:
-                                insert_data = [
-                                    (playlist_id, track_id, position)
-                                    for position, track_id in enumerate(track_ids)
-                                ]
-                                conn.executemany(
-                                    """
-                                    INSERT INTO playlist_tracks (playlist_id, track_id, position)
-                                    VALUES (?, ?, ?)
-                                """,
-                                    insert_data,
-                                )
+                            inserted, _ = playlist_sync.apply_playlist_diff(
+                                conn, playlist_id, track_ids
+                            )
+                            tracks_inserted += inserted
 
                             print_if_not_silent(
                                 f"  ✅ Created '{final_name}' with {len(track_ids)} tracks",
@@ -1275,6 +1306,16 @@ def sync_playlists(
                 print_if_not_silent(f"❌ Transaction failed, rolled back: {e}")
                 raise
 
+        playlist_sync.record_sync_run(
+            provider_name,
+            sync_start,
+            {
+                **sync_stats,
+                "tracks_inserted": tracks_inserted,
+                "tracks_deleted": tracks_deleted,
+            },
+        )
+
         # Notify complete
         update_progress(
             "complete",
@@ -1293,7 +1334,10 @@ def sync_playlists(
         print_if_not_silent("✓ Playlist sync complete!")
         print_if_not_silent(f"  Created:  {created_count} playlists")
         print_if_not_silent(f"  Updated:  {updated_count} playlists")
-        print_if_not_silent(f"  Skipped:  {skipped_count} (unchanged)")
+        print_if_not_silent(
+            f"  Skipped:  {skipped_count} (unchanged, "
+            f"{sync_stats.get('api_calls_saved', 0)} API calls saved)"
+        )
         print_if_not_silent(f"  Failed:   {failed_count} playlists")
         print_if_not_silent(f"  Tracks:   {total_tracks_added} total tracks added")
         print_if_not_silent("")
@@ -2,7 +2,8 @@
 Playlist command handlers for Music Minion CLI.
 
 Handles: playlist list, playlist new, playlist delete, playlist rename,
-         playlist show, playlist active, playlist import, playlist export
+         playlist show, playlist sort, playlist active, playlist import,
+         playlist export
 """
 
 import shlex
@@ -14,7 +15,7 @@ from typing import Any, Optional
 from music_minion import helpers
 from music_minion.context import AppContext
 from music_minion.core import config, database
-from music_minion.core.output import log
+from music_minion.core.output import log, notify_ui
 from music_minion.domain import ai, library, playback, playlists
 from music_minion.domain.playlists import ai_parser as playlist_ai
 from music_minion.domain.playlists import analytics as playlist_analytics
@@ -58,6 +59,7 @@ def _update_conversion_state(updates: dict[str, Any]) -> None:
         if _conversion_state is None:
             _conversion_state = {}
         _conversion_state.update(updates)
+    notify_ui()
 
 
 def _clear_conversion_state() -> None:
@@ -65,6 +67,7 @@ def _clear_conversion_state() -> None:
     global _conversion_state
     with _conversion_state_lock:
         _conversion_state = None
+    notify_ui()
 
 
 # ============================================================================
@@ -676,6 +679,56 @@ def handle_playlist_rename_command(
         return ctx, True
 
 
+def handle_playlist_sort_command(
+    ctx: AppContext, args: list[str]
+) -> tuple[AppContext, bool]:
+    """
+    Handle playlist sort command - reorder a manual playlist for DJ mixing.
+
+    Usage:
+      playlist sort <name>              - Harmonic order, energy peaks late
+      playlist sort <name> --arc=<arc>  - Energy arc: none, rise, fall, peak
+    """
+    arc = "peak"
+    name_args = []
+    for arg in args:
+        if arg.startswith("--arc="):
+            arc = arg.split("=", 1)[1].strip()
+        else:
+            name_args.append(arg)
+
+    if not name_args:
+        log("Error: Please specify playlist name", level="error")
+        log("Usage: playlist sort <name> [--arc=none|rise|fall|peak]", level="info")
+        return ctx, True
+
+    if arc not in playlists.ENERGY_ARCS:
+        log(f"❌ Invalid arc: {arc}", level="error")
+        log(f"Valid arcs: {', '.join(playlists.ENERGY_ARCS)}", level="info")
+        return ctx, True
+
+    name = " ".join(name_args)
+    pl = playlists.get_playlist_by_name(name)
+    if not pl:
+        log(f"❌ Playlist '{name}' not found", level="error")
+        return ctx, True
+
+    if pl["type"] != "manual":
+        log("❌ Only manual playlists can be reordered", level="error")
+        return ctx, True
+
+    try:
+        log(f"Sequencing {pl['track_count']} tracks for mixing...", level="info")
+        if playlists.reorder_playlist_for_mixing(pl["id"], arc=arc):
+            log(f"✅ Reordered playlist '{name}' for mixing (arc: {arc})", level="info")
+        else:
+            log(f"❌ Failed to reorder playlist: {name}", level="error")
+        return ctx, True
+    except Exception as e:
+        log(f"❌ Error reordering playlist: {e}", level="error")
+        return ctx, True
+
+
 def handle_playlist_show_command(
     ctx: AppContext, args: list[str]
 ) -> tuple[AppContext, bool]:
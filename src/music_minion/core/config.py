@@ -38,6 +38,8 @@ class MusicConfig:
         default_factory=lambda: [".mp3", ".m4a", ".wav", ".flac", ".opus", ".ogg"]
     )
     scan_recursive: bool = True
+    watch_library: bool = True  # Apply file changes live instead of rescanning
+    reconcile_interval_hours: float = 6.0  # Background pass catching missed events
 
 
 @dataclass
@@ -341,6 +343,12 @@ supported_formats = [".mp3", ".m4a", ".wav", ".flac", ".opus", ".ogg"]
 # Recursively scan subdirectories
 scan_recursive = true
 
+# Watch library paths and apply added/changed/moved/deleted files live
+watch_library = true
+
+# Hours between background passes that catch changes the watcher missed
+reconcile_interval_hours = 6.0
+
 [player]
 # Path for mpv socket (auto-detected if not specified)
 # mpv_socket_path = "/tmp/mpv-socket"
@@ -544,6 +552,12 @@ def load_config() -> Config:
                 scan_recursive=music_data.get(
                     "scan_recursive", config.music.scan_recursive
                 ),
+                watch_library=music_data.get(
+                    "watch_library", config.music.watch_library
+                ),
+                reconcile_interval_hours=music_data.get(
+                    "reconcile_interval_hours", config.music.reconcile_interval_hours
+                ),
             )
 
         if "player" in toml_data:
@@ -756,6 +770,8 @@ def save_config(config: Config) -> bool:
 library_paths = {config.music.library_paths!r}
 supported_formats = {config.music.supported_formats!r}
 scan_recursive = {config.music.scan_recursive!r}
+watch_library = {config.music.watch_library!r}
+reconcile_interval_hours = {config.music.reconcile_interval_hours!r}
 
 [player]
 volume = {config.player.volume}
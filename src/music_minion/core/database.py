@@ -17,7 +17,7 @@ from ..domain.library.models import Track
 
 
 # Database schema version for migrations
-SCHEMA_VERSION = 58  # drop dead column from playlist_comparison_history
+SCHEMA_VERSION = 69  # resumable provider likes sync cursor
 
 
 # Initial top 50 curated emojis for music reactions
@@ -1123,7 +1123,7 @@ def migrate_database(conn, current_version: int) -> None:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL UNIQUE,
                 playlist_id INTEGER REFERENCES playlists(id) ON DELETE SET NULL,
-                mode TEXT NOT NULL DEFAULT 'shuffle',  -- 'shuffle' | 'queue'
+                mode TEXT NOT NULL DEFAULT 'shuffle',  -- 'shuffle' | 'queue' | 'mix'
                 is_active BOOLEAN DEFAULT FALSE,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -2670,6 +2670,296 @@ def migrate_database(conn, current_version: int) -> None:
             "  ✓ Migration to v58 complete: dead column dropped from playlist_comparison_history"
         )
 
+    if current_version < 59:
+        logger.info("Running migration to v59: playlist_exports for change-detected export...")
+        # One row per (playlist, format): hash of the rendered export (minus the
+        # volatile "Exported:" timestamp) so auto-export can skip unchanged files.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS playlist_exports (
+                playlist_id INTEGER NOT NULL,
+                format TEXT NOT NULL,
+                output_path TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                exported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (playlist_id, format),
+                FOREIGN KEY (playlist_id) REFERENCES playlists (id) ON DELETE CASCADE
+            )
+        """)
+        conn.commit()
+        logger.info("  ✓ Migration to v59 complete: playlist_exports table created")
+
+    if current_version < 60:
+        logger.info("Running migration to v60: ai_response_cache for batch tagging...")
+        # Keyed by sha256 of (model, instructions, input) so re-running a batch
+        # over unchanged tracks never pays for the same completion twice.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS ai_response_cache (
+                input_hash TEXT PRIMARY KEY,
+                model_name TEXT NOT NULL,
+                output_text TEXT NOT NULL,
+                prompt_tokens INTEGER,
+                completion_tokens INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.commit()
+        logger.info("  ✓ Migration to v60 complete: ai_response_cache table created")
+
+    if current_version < 61:
+        logger.info("Running migration to v61: change log for delta replication...")
+        # Row-level changesets written by triggers (see install_change_log_triggers)
+        # so peers exchange only edits since their last watermark instead of the
+        # whole database file. Triggers are installed by `replicate init`.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS change_log (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                origin TEXT NOT NULL,
+                tbl TEXT NOT NULL,
+                op TEXT NOT NULL CHECK (op IN ('I', 'U', 'D')),
+                pk TEXT NOT NULL,
+                row TEXT,
+                changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%f', 'now'))
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_change_log_row ON change_log (tbl, pk, seq)"
+        )
+        # key/value: origin (this database's ID), applying_origin (set only
+        # inside an import transaction so triggers attribute applied rows)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS replication_state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+        """)
+        # Per peer: highest peer seq applied here, highest local seq the peer acked
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS replication_peers (
+                peer_origin TEXT PRIMARY KEY,
+                last_applied INTEGER NOT NULL DEFAULT 0,
+                last_acked INTEGER NOT NULL DEFAULT 0,
+                last_import_at TIMESTAMP,
+                last_export_at TIMESTAMP
+            )
+        """)
+        # Rows inserted concurrently on two devices with the same AUTOINCREMENT
+        # id are stored under a new local id; this maps the peer's id to ours
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS replication_id_map (
+                peer_origin TEXT NOT NULL,
+                tbl TEXT NOT NULL,
+                remote_id INTEGER NOT NULL,
+                local_id INTEGER NOT NULL,
+                PRIMARY KEY (peer_origin, tbl, remote_id)
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_replication_id_map_local "
+            "ON replication_id_map (peer_origin, tbl, local_id)"
+        )
+        conn.commit()
+        logger.info("  ✓ Migration to v61 complete: change_log and replication tables created")
+
+    if current_version < 62:
+        logger.info("Running migration to v62: daily listening rollups...")
+        # Stats read these instead of scanning every session/play. 0 stands in
+        # for "no playlist"/"unknown track" so the keys stay unique.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS track_listen_daily (
+                play_date DATE NOT NULL,
+                track_id INTEGER NOT NULL,
+                playlist_id INTEGER NOT NULL DEFAULT 0,
+                sessions INTEGER NOT NULL DEFAULT 0,
+                seconds_played REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (play_date, track_id, playlist_id)
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_track_listen_daily_track "
+            "ON track_listen_daily (track_id, play_date)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_track_listen_daily_playlist "
+            "ON track_listen_daily (playlist_id, play_date)"
+        )
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS radio_history_daily (
+                day DATE NOT NULL,
+                track_id INTEGER NOT NULL,
+                plays INTEGER NOT NULL DEFAULT 0,
+                listened_ms INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, track_id)
+            )
+        """)
+        # Range scans over history (date filters, newest-first paging)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_radio_history_started ON radio_history (started_at)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_radio_history_track_started "
+            "ON radio_history (track_id, started_at)"
+        )
+        refresh_listening_rollups(conn)
+        conn.commit()
+        logger.info("  ✓ Migration to v62 complete: listening rollups backfilled")
+
+    if current_version < 63:
+        logger.info("Running migration to v63: filter index change counters...")
+        # playlists.filter_index keeps bitmaps of these tables in memory; the
+        # triggers bump a counter so every process knows what went stale
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS filter_index_versions (
+                component TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        install_filter_index_triggers(conn)
+        conn.commit()
+        logger.info("  ✓ Migration to v63 complete: filter index triggers installed")
+
+    if current_version < 64:
+        logger.info("Running migration to v64: file catalog...")
+        # Stat signature + tag-independent content hash per library file, so
+        # move, duplicate and format-twin detection are index lookups
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_catalog (
+                path TEXT PRIMARY KEY,
+                device INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                content_hash TEXT NOT NULL,
+                twin_key TEXT NOT NULL,
+                cataloged_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_file_catalog_hash ON file_catalog(content_hash)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_file_catalog_inode ON file_catalog(device, inode)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_file_catalog_twin ON file_catalog(twin_key)"
+        )
+        conn.commit()
+        logger.info("  ✓ Migration to v64 complete: file_catalog created")
+
+    if current_version < 65:
+        logger.info("Running migration to v65: audio analysis results...")
+        # One row per (track, analyzer); version and file_mtime say whether a
+        # result is still current, so analyzer upgrades re-run only stale rows
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS track_analysis (
+                track_id INTEGER NOT NULL REFERENCES tracks(id) ON DELETE CASCADE,
+                analyzer TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                file_mtime REAL,
+                features TEXT,
+                error TEXT,
+                analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (track_id, analyzer)
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_track_analysis_analyzer "
+            "ON track_analysis(analyzer, version)"
+        )
+        conn.commit()
+        logger.info("  ✓ Migration to v65 complete: track_analysis created")
+
+    if current_version < 66:
+        logger.info("Running migration to v66: similarity index change counters...")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS filter_index_versions (
+                component TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        install_filter_index_triggers(conn)
+        conn.commit()
+        logger.info("  ✓ Migration to v66 complete: analysis and tags triggers installed")
+
+    if current_version < 67:
+        logger.info("Running migration to v67: fractional track positions...")
+        # Positions become ordering keys (playlists/ordering.py): a move writes
+        # the midpoint between its neighbours. INTEGER affinity keeps those REAL
+        # values as-is, so no table rebuild; lists just start from distinct
+        # 0..n-1 positions so there is room between every pair of rows.
+        existing = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        for table, column in (("playlist_tracks", "playlist_id"), ("bucket_tracks", "bucket_id")):
+            if table not in existing:
+                continue
+            rows = conn.execute(f"""
+                SELECT rowid, rank FROM (
+                    SELECT rowid, position, ROW_NUMBER() OVER (
+                        PARTITION BY {column} ORDER BY position, rowid
+                    ) - 1 AS rank
+                    FROM {table}
+                )
+                WHERE position != rank
+            """).fetchall()
+            conn.executemany(
+                f"UPDATE {table} SET position = ? WHERE rowid = ?",
+                [(row[1], row[0]) for row in rows],
+            )
+            logger.info(f"  Renumbered {len(rows)} {table} rows")
+        if "bucket_tracks" in existing:
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_bucket_tracks_position ON bucket_tracks(bucket_id, position)"
+            )
+        conn.commit()
+        logger.info("  ✓ Migration to v67 complete: track positions renumbered")
+
+    if current_version < 68:
+        logger.info("Running migration to v68: playlist sync change probes and run log...")
+        # Provider-side track count at the last sync: with provider_last_modified,
+        # lets playlist sync skip unchanged playlists without fetching tracks
+        existing = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        if "playlists" in existing:
+            try:
+                conn.execute("ALTER TABLE playlists ADD COLUMN provider_track_count INTEGER")
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" not in str(e).lower():
+                    raise
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS playlist_sync_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                provider TEXT NOT NULL,
+                started_at TIMESTAMP NOT NULL,
+                completed_at TIMESTAMP,
+                playlists_total INTEGER DEFAULT 0,
+                playlists_skipped INTEGER DEFAULT 0,
+                playlists_fetched INTEGER DEFAULT 0,
+                api_calls INTEGER DEFAULT 0,
+                api_calls_saved INTEGER DEFAULT 0,
+                tracks_inserted INTEGER DEFAULT 0,
+                tracks_deleted INTEGER DEFAULT 0,
+                duration_seconds REAL
+            )
+        """)
+        conn.commit()
+        logger.info("  ✓ Migration to v68 complete: provider_track_count, playlist_sync_log")
+
+    if current_version < 69:
+        logger.info("Running migration to v69: provider sync cursors...")
+        # Next page of an interrupted likes ingestion; deleted once a run finishes
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS provider_sync_cursors (
+                provider TEXT PRIMARY KEY,
+                next_href TEXT NOT NULL,
+                incremental BOOLEAN NOT NULL DEFAULT 1,
+                tracks_seen INTEGER DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.commit()
+        logger.info("  ✓ Migration to v69 complete: provider_sync_cursors")
+
 
 def init_database() -> None:
     """Initialize the database with required tables."""
@@ -2822,6 +3112,9 @@ def init_database() -> None:
                 f"Running database migrations from v{current_version} to v{SCHEMA_VERSION}"
             )
             migrate_database(conn, current_version)
+            if is_change_log_enabled(conn):
+                # Migrations may have added columns; regenerate row capture
+                install_change_log_triggers(conn)
         else:
             logger.debug(f"Database schema is up to date (v{current_version})")
 
@@ -2835,6 +3128,221 @@ def init_database() -> None:
         conn.commit()
 
 
+# Tables whose rows are per-device state, caches or replication bookkeeping
+CHANGE_LOG_EXCLUDED_TABLES = frozenset(
+    {
+        "schema_version",
+        "sqlite_sequence",
+        "change_log",
+        "replication_state",
+        "replication_peers",
+        "replication_id_map",
+        "active_library",
+        "active_playlist",
+        "playback_state",
+        "player_queue_state",
+        "radio_state",
+        "provider_state",
+        "sc_feed_sync_state",
+        "discovery_sync_log",
+        "playlist_sync_log",
+        "provider_sync_cursors",
+        "ai_response_cache",
+        "playlist_exports",
+        # Derived from sessions/history; rebuilt for touched dates on import
+        "track_listen_daily",
+        "radio_history_daily",
+        # Cache invalidation counters for this database's own processes
+        "filter_index_versions",
+        # Describes this machine's filesystem (paths, inodes)
+        "file_catalog",
+        # Analysis of this machine's copies of the files (keyed by their mtime)
+        "track_analysis",
+    }
+)
+
+CHANGE_LOG_TRIGGER_PREFIX = "change_log_"
+
+# Origin recorded by triggers: the peer being applied during an import,
+# otherwise this database's own origin
+_CHANGE_LOG_ORIGIN_SQL = (
+    "COALESCE("
+    "(SELECT value FROM replication_state WHERE key = 'applying_origin'), "
+    "(SELECT value FROM replication_state WHERE key = 'origin'))"
+)
+
+
+def get_replicated_tables(conn) -> list[str]:
+    """Names of tables captured by the change log."""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+    ).fetchall()
+    return [
+        row[0]
+        for row in rows
+        if row[0] not in CHANGE_LOG_EXCLUDED_TABLES
+        and not row[0].startswith("sqlite_")
+        and not row[0].endswith("_new")  # Transient copies used by migrations
+    ]
+
+
+def get_table_key_columns(conn, table: str) -> tuple[list[str], list[str]]:
+    """Return (primary key columns, all columns) for a table.
+
+    Tables without a declared primary key are keyed by rowid.
+    """
+    info = conn.execute(f'PRAGMA table_info("{table}")').fetchall()
+    columns = [row[1] for row in info]
+    pk_columns = [row[1] for row in sorted(info, key=lambda r: r[5]) if row[5]]
+    return (pk_columns or ["rowid"]), columns
+
+
+def _change_log_trigger_sql(conn, table: str) -> list[str]:
+    pk_columns, columns = get_table_key_columns(conn, table)
+
+    def ref(alias: str, column: str) -> str:
+        return f"{alias}.rowid" if column == "rowid" else f'{alias}."{column}"'
+
+    def pk_json(alias: str) -> str:
+        return "json_array(" + ", ".join(ref(alias, c) for c in pk_columns) + ")"
+
+    # SQL functions take at most 127 arguments by default; wide tables (tracks)
+    # are built in chunks
+    chunk = 50
+
+    def row_json(alias: str) -> str:
+        keyed = columns if pk_columns != ["rowid"] else ["rowid", *columns]
+        pairs = [f"'{c}', {ref(alias, c)}" for c in keyed]
+        sql = "json_object(" + ", ".join(pairs[:chunk]) + ")"
+        for start in range(chunk, len(pairs), chunk):
+            path_pairs = [f"'$.\"{c}\"', {ref(alias, c)}" for c in keyed[start : start + chunk]]
+            sql = f"json_insert({sql}, " + ", ".join(path_pairs) + ")"
+        return sql
+
+    def changed(old: str, new: str) -> str:
+        parts = []
+        for start in range(0, len(columns), chunk):
+            part = columns[start : start + chunk]
+            parts.append(
+                "json_array(" + ", ".join(ref(old, c) for c in part) + ") IS NOT "
+                "json_array(" + ", ".join(ref(new, c) for c in part) + ")"
+            )
+        return "(" + " OR ".join(parts) + ")"
+
+    def log(op: str, alias: str, row: str) -> str:
+        return (
+            "INSERT INTO change_log (origin, tbl, op, pk, row) VALUES "
+            f"({_CHANGE_LOG_ORIGIN_SQL}, '{table}', '{op}', {pk_json(alias)}, {row});"
+        )
+
+    name = f"{CHANGE_LOG_TRIGGER_PREFIX}{table}"
+    return [
+        f'CREATE TRIGGER "{name}_insert" AFTER INSERT ON "{table}" '
+        f"BEGIN {log('I', 'NEW', row_json('NEW'))} END",
+        # No-op updates (same values written back) are not logged
+        f'CREATE TRIGGER "{name}_update" AFTER UPDATE ON "{table}" '
+        f"WHEN {changed('OLD', 'NEW')} BEGIN "
+        # A changed primary key is a delete of the old row plus an upsert
+        "INSERT INTO change_log (origin, tbl, op, pk, row) "
+        f"SELECT {_CHANGE_LOG_ORIGIN_SQL}, '{table}', 'D', {pk_json('OLD')}, NULL "
+        f"WHERE {pk_json('OLD')} IS NOT {pk_json('NEW')}; "
+        f"{log('U', 'NEW', row_json('NEW'))} END",
+        f'CREATE TRIGGER "{name}_delete" AFTER DELETE ON "{table}" '
+        f"BEGIN {log('D', 'OLD', 'NULL')} END",
+    ]
+
+
+def drop_change_log_triggers(conn) -> None:
+    """Remove all change-log triggers (row capture stops)."""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE ?",
+        (f"{CHANGE_LOG_TRIGGER_PREFIX}%",),
+    ).fetchall()
+    for row in rows:
+        conn.execute(f'DROP TRIGGER IF EXISTS "{row[0]}"')
+
+
+# component -> (table, trigger condition, columns whose UPDATE matters)
+FILTER_INDEX_SOURCES = {
+    "tracks": (
+        "tracks",
+        None,
+        "title, artist, album, genre, year, bpm, key_signature, local_path",
+    ),
+    "emojis": ("track_emojis", None, "track_id, emoji_id"),
+    "archive": ("ratings", "{row}.rating_type = 'archive'", "track_id, rating_type"),
+    "playlist_tracks": ("playlist_tracks", None, "playlist_id, track_id"),
+    "skipped": ("playlist_builder_skipped", None, "playlist_id, track_id"),
+    # Not filterable; analysis.similarity rebuilds its vectors when these move
+    "analysis": ("track_analysis", None, "version, features"),
+    "tags": ("tags", None, "track_id, tag_name, blacklisted"),
+}
+
+
+def install_filter_index_triggers(conn) -> None:
+    """(Re)create the triggers that bump filter_index_versions counters.
+
+    Tables missing from the schema are skipped.
+    """
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    for component, (table, condition, columns) in FILTER_INDEX_SOURCES.items():
+        conn.execute(
+            "INSERT OR IGNORE INTO filter_index_versions (component, version) VALUES (?, 0)",
+            (component,),
+        )
+        if table not in existing:
+            continue
+        bump = (
+            "UPDATE filter_index_versions SET version = version + 1 "
+            f"WHERE component = '{component}';"
+        )
+        for event, rows in (
+            ("INSERT", ["NEW"]),
+            ("DELETE", ["OLD"]),
+            (f"UPDATE OF {columns}", ["OLD", "NEW"]),
+        ):
+            name = f"filter_index_{component}_{event.split()[0].lower()}"
+            when = ""
+            if condition:
+                when = "WHEN " + " OR ".join(condition.format(row=row) for row in rows)
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute(
+                f"CREATE TRIGGER {name} AFTER {event} ON {table} {when} BEGIN {bump} END"
+            )
+
+
+def install_change_log_triggers(conn) -> int:
+    """(Re)create INSERT/UPDATE/DELETE triggers on every replicated table.
+
+    Each trigger writes the full new row as JSON, so a changeset can be
+    applied without reading anything else from the source database.
+    Called by `replicate init` and after migrations (columns may change).
+
+    Returns:
+        Number of tables captured
+    """
+    drop_change_log_triggers(conn)
+    tables = get_replicated_tables(conn)
+    for table in tables:
+        for sql in _change_log_trigger_sql(conn, table):
+            conn.execute(sql)
+    conn.commit()
+    return len(tables)
+
+
+def is_change_log_enabled(conn) -> bool:
+    """Whether replication has been initialized on this database."""
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM replication_state WHERE key = 'origin'"
+        ).fetchone()
+    except sqlite3.OperationalError:
+        return False  # Pre-v61 schema
+    return row is not None
+
+
 def get_or_create_track(
     local_path: str,
     title: Optional[str] = None,
@@ -3399,6 +3907,52 @@ def cleanup_old_sessions() -> None:
 # Playback session tracking functions (new implementation)
 
 
+def refresh_listening_rollups(conn, dates: Optional[list[str]] = None) -> None:
+    """Recompute daily rollups from track_listen_sessions and radio_history.
+
+    Normal writes keep the rollups current incrementally; this is for the
+    initial backfill and for rows written behind their back (replication).
+
+    Args:
+        conn: Open connection (caller commits)
+        dates: YYYY-MM-DD days to recompute; None rebuilds everything
+    """
+    if dates is None:
+        listen_filter, radio_filter, params = "", "", []
+        conn.execute("DELETE FROM track_listen_daily")
+        conn.execute("DELETE FROM radio_history_daily")
+    else:
+        if not dates:
+            return
+        marks = ", ".join("?" * len(dates))
+        listen_filter = f"WHERE play_date IN ({marks})"
+        radio_filter = f"WHERE DATE(started_at) IN ({marks})"
+        params = list(dates)
+        conn.execute(f"DELETE FROM track_listen_daily WHERE play_date IN ({marks})", params)
+        conn.execute(f"DELETE FROM radio_history_daily WHERE day IN ({marks})", params)
+
+    conn.execute(
+        f"""
+        INSERT INTO track_listen_daily (play_date, track_id, playlist_id, sessions, seconds_played)
+        SELECT play_date, track_id, COALESCE(playlist_id, 0), COUNT(*), SUM(seconds_played)
+        FROM track_listen_sessions
+        {listen_filter}
+        GROUP BY play_date, track_id, COALESCE(playlist_id, 0)
+        """,
+        params,
+    )
+    conn.execute(
+        f"""
+        INSERT INTO radio_history_daily (day, track_id, plays, listened_ms)
+        SELECT DATE(started_at), COALESCE(track_id, 0), COUNT(*), COALESCE(SUM(position_ms), 0)
+        FROM radio_history
+        {radio_filter}
+        GROUP BY DATE(started_at), COALESCE(track_id, 0)
+        """,
+        params,
+    )
+
+
 def start_listen_session(track_id: int, playlist_id: Optional[int] = None) -> int:
     """Start a new listening session and return session ID.
 
@@ -3417,28 +3971,50 @@ def start_listen_session(track_id: int, playlist_id: Optional[int] = None) -> in
         """,
             (track_id, playlist_id),
         )
+        conn.execute(
+            """
+            INSERT INTO track_listen_daily (play_date, track_id, playlist_id, sessions)
+            VALUES (DATE('now'), ?, ?, 1)
+            ON CONFLICT (play_date, track_id, playlist_id)
+            DO UPDATE SET sessions = sessions + 1
+        """,
+            (track_id, playlist_id or 0),
+        )
         conn.commit()
         return cursor.lastrowid
 
 
-def tick_listen_session(session_id: int, is_playing: bool) -> None:
-    """Increment seconds_played for an active session if currently playing.
+def add_listen_seconds(increments: dict[int, float]) -> None:
+    """Add buffered listening time to sessions in a single transaction.
 
     Args:
-        session_id: ID of the active session
-        is_playing: Whether playback is currently active
+        increments: Mapping of session_id -> seconds played since last flush
     """
-    if is_playing:
-        with get_db_connection() as conn:
-            conn.execute(
-                """
-                UPDATE track_listen_sessions
-                SET seconds_played = seconds_played + 1
-                WHERE session_id = ?
-            """,
-                (session_id,),
-            )
-            conn.commit()
+    if not increments:
+        return
+    rows = [(seconds, session_id) for session_id, seconds in increments.items()]
+    with get_db_connection() as conn:
+        conn.executemany(
+            """
+            UPDATE track_listen_sessions
+            SET seconds_played = seconds_played + ?
+            WHERE session_id = ?
+        """,
+            rows,
+        )
+        # Same increments into the daily rollup
+        conn.executemany(
+            """
+            INSERT INTO track_listen_daily (play_date, track_id, playlist_id, seconds_played)
+            SELECT play_date, track_id, COALESCE(playlist_id, 0), ?
+            FROM track_listen_sessions
+            WHERE session_id = ?
+            ON CONFLICT (play_date, track_id, playlist_id)
+            DO UPDATE SET seconds_played = seconds_played + excluded.seconds_played
+        """,
+            rows,
+        )
+        conn.commit()
 
 
 def get_track_listen_stats(track_id: int) -> dict[str, Any]:
@@ -3477,15 +4053,14 @@ def get_daily_listening_time(play_date: Optional[str] = None) -> float:
     Returns:
         Total seconds listened
     """
-    date_filter = play_date or "DATE('now')"
     with get_db_connection() as conn:
         cursor = conn.execute(
             """
             SELECT SUM(seconds_played) as total_seconds
-            FROM track_listen_sessions
-            WHERE play_date = ?
+            FROM track_listen_daily
+            WHERE play_date = COALESCE(?, DATE('now'))
         """,
-            (date_filter,),
+            (play_date,),
         )
         row = cursor.fetchone()
         return row["total_seconds"] or 0.0 if row else 0.0
@@ -3504,16 +4079,18 @@ def get_top_tracks_by_time(days: int = 30, limit: int = 20) -> list[dict[str, An
     with get_db_connection() as conn:
         cursor = conn.execute(
             """
-            SELECT s.track_id, SUM(s.seconds_played) as total_seconds,
-                   t.title, t.artist, t.album
-            FROM track_listen_sessions s
-            JOIN tracks t ON t.id = s.track_id
-            WHERE s.play_date >= DATE('now', '-{} days')
-            GROUP BY s.track_id
-            ORDER BY total_seconds DESC
+            SELECT d.track_id, d.total_seconds, t.title, t.artist, t.album
+            FROM (
+                SELECT track_id, SUM(seconds_played) as total_seconds
+                FROM track_listen_daily
+                WHERE play_date >= DATE('now', ?)
+                GROUP BY track_id
+            ) d
+            JOIN tracks t ON t.id = d.track_id
+            ORDER BY d.total_seconds DESC
             LIMIT ?
-        """.format(days),
-            (limit,),
+        """,
+            (f"-{int(days)} days", limit),
         )
         return [dict(row) for row in cursor.fetchall()]
 
@@ -3530,8 +4107,8 @@ def get_playlist_listening_stats(playlist_id: int) -> dict[str, Any]:
     with get_db_connection() as conn:
         cursor = conn.execute(
             """
-            SELECT COUNT(*) as sessions, SUM(seconds_played) as time
-            FROM track_listen_sessions
+            SELECT COALESCE(SUM(sessions), 0) as sessions, SUM(seconds_played) as time
+            FROM track_listen_daily
             WHERE playlist_id = ?
         """,
             (playlist_id,),
@@ -3557,10 +4134,10 @@ def get_playlist_listening_stats_grouped() -> list[dict[str, Any]]:
             """
             SELECT
                 playlist_id,
-                COUNT(*) as sessions,
+                SUM(sessions) as sessions,
                 SUM(seconds_played) as total_seconds
-            FROM track_listen_sessions
-            WHERE playlist_id IS NOT NULL
+            FROM track_listen_daily
+            WHERE playlist_id > 0
             GROUP BY playlist_id
         """
         )
@@ -4419,9 +4996,53 @@ def remove_tag(track_id: int, tag_name: str) -> bool:
         return cursor.rowcount > 0
 
 
+def add_tags_batch(
+    entries: list[tuple[int, list[str], Optional[dict[str, str]]]],
+    source: str = "ai",
+) -> int:
+    """Add tags for many tracks in a single transaction.
+
+    Args:
+        entries: List of (track_id, tags, reasoning) tuples
+        source: Source of tags ('user', 'ai', 'file')
+
+    Returns:
+        Number of tag rows inserted
+    """
+    rows = []
+    for track_id, tags, reasoning in entries:
+        for tag in tags:
+            tag_name = tag.strip().lower()
+            tag_reasoning = reasoning.get(tag_name) if reasoning else None
+            rows.append((track_id, tag_name, source, tag_reasoning))
+
+    if not rows:
+        return 0
+
+    with get_db_connection() as conn:
+        before = conn.total_changes
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO tags (track_id, tag_name, source, reasoning)
+            VALUES (?, ?, ?, ?)
+        """,
+            rows,
+        )
+        inserted = conn.total_changes - before
+        conn.commit()
+        return inserted
+
+
 # AI request logging functions
 
 
+def estimate_ai_cost(prompt_tokens: int, completion_tokens: int) -> float:
+    """Estimate request cost in USD from token counts."""
+    # Hard-coded pricing for gpt-4o-mini (per 1M tokens)
+    # Input: $0.15, Output: $0.60
+    return (prompt_tokens * 0.15 / 1_000_000) + (completion_tokens * 0.60 / 1_000_000)
+
+
 def log_ai_request(
     track_id: int,
     request_type: str,
@@ -4434,12 +5055,7 @@ def log_ai_request(
 ) -> int:
     """Log an AI request and return the request ID."""
     total_tokens = prompt_tokens + completion_tokens
-
-    # Hard-coded pricing for gpt-4o-mini (per 1M tokens)
-    # Input: $0.15, Output: $0.60
-    cost_estimate = (prompt_tokens * 0.15 / 1_000_000) + (
-        completion_tokens * 0.60 / 1_000_000
-    )
+    cost_estimate = estimate_ai_cost(prompt_tokens, completion_tokens)
 
     with get_db_connection() as conn:
         cursor = conn.execute(
@@ -4467,6 +5083,96 @@ def log_ai_request(
         return cursor.lastrowid
 
 
+def log_ai_requests_batch(requests: list[dict[str, Any]]) -> None:
+    """Log many AI requests in a single transaction.
+
+    Args:
+        requests: Dicts with the same keys as log_ai_request's arguments
+            (error_message optional)
+    """
+    if not requests:
+        return
+
+    rows = [
+        (
+            req["track_id"],
+            req["request_type"],
+            req["model_name"],
+            req["prompt_tokens"],
+            req["completion_tokens"],
+            req["prompt_tokens"] + req["completion_tokens"],
+            estimate_ai_cost(req["prompt_tokens"], req["completion_tokens"]),
+            req["response_time_ms"],
+            req["success"],
+            req.get("error_message"),
+        )
+        for req in requests
+    ]
+
+    with get_db_connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO ai_requests (
+                track_id, request_type, model_name, prompt_tokens,
+                completion_tokens, total_tokens, cost_estimate,
+                response_time_ms, success, error_message
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            rows,
+        )
+        conn.commit()
+
+
+def get_cached_ai_responses(input_hashes: list[str]) -> dict[str, dict[str, Any]]:
+    """Look up cached AI responses by input hash.
+
+    Returns:
+        Dictionary mapping input_hash to {output_text, prompt_tokens, completion_tokens}
+    """
+    if not input_hashes:
+        return {}
+
+    result: dict[str, dict[str, Any]] = {}
+    with get_db_connection() as conn:
+        # Chunk to stay under SQLite's bound-parameter limit
+        for start in range(0, len(input_hashes), 500):
+            chunk = input_hashes[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = conn.execute(
+                f"""
+                SELECT input_hash, output_text, prompt_tokens, completion_tokens
+                FROM ai_response_cache
+                WHERE input_hash IN ({placeholders})
+            """,
+                chunk,
+            )
+            for row in cursor.fetchall():
+                result[row["input_hash"]] = dict(row)
+    return result
+
+
+def save_ai_responses(entries: list[tuple[str, str, str, int, int]]) -> None:
+    """Store AI responses in the cache.
+
+    Args:
+        entries: List of (input_hash, model_name, output_text, prompt_tokens,
+            completion_tokens) tuples
+    """
+    if not entries:
+        return
+
+    with get_db_connection() as conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO ai_response_cache (
+                input_hash, model_name, output_text, prompt_tokens, completion_tokens
+            ) VALUES (?, ?, ?, ?, ?)
+        """,
+            entries,
+        )
+        conn.commit()
+
+
 def get_ai_usage_stats(days: Optional[int] = None) -> dict[str, Any]:
     """Get AI usage statistics. If days is provided, filter to last N days."""
     date_filter = ""
@@ -4562,6 +5268,198 @@ def get_tracks_needing_analysis() -> list[dict[str, Any]]:
         return [dict(row) for row in cursor.fetchall()]
 
 
+def get_analysis_inputs(limit: Optional[int] = None) -> list[dict[str, Any]]:
+    """Get tracks needing AI analysis together with their notes and tags.
+
+    Same selection as get_tracks_needing_analysis(), but notes and tags are
+    folded into each row (as lists under 'notes' and 'tags') so a batch run
+    needs one query instead of two per track.
+
+    Args:
+        limit: Optional maximum number of tracks
+
+    Returns:
+        List of track dicts with extra 'notes' and 'tags' keys
+    """
+    import json
+
+    limit_clause = "LIMIT ?" if limit else ""
+    params = (limit,) if limit else ()
+
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            f"""
+            SELECT t.*,
+                (SELECT json_group_array(json_object('note_text', n2.note_text))
+                 FROM (SELECT note_text FROM notes
+                       WHERE track_id = t.id ORDER BY timestamp DESC) n2
+                ) AS notes_json,
+                (SELECT json_group_array(
+                        json_object('tag_name', tg.tag_name, 'source', tg.source))
+                 FROM tags tg WHERE tg.track_id = t.id AND tg.blacklisted = FALSE
+                ) AS tags_json
+            FROM tracks t
+            JOIN (
+                SELECT track_id, MAX(timestamp) AS last_note
+                FROM notes GROUP BY track_id
+            ) latest ON latest.track_id = t.id
+            WHERE NOT EXISTS (
+                SELECT 1 FROM tags WHERE track_id = t.id AND source = 'ai'
+            )
+            AND NOT EXISTS (
+                SELECT 1 FROM ratings
+                WHERE track_id = t.id AND rating_type = 'archive'
+            )
+            ORDER BY latest.last_note DESC
+            {limit_clause}
+        """,
+            params,
+        )
+        rows = []
+        for row in cursor.fetchall():
+            track = dict(row)
+            track["notes"] = json.loads(track.pop("notes_json") or "[]")
+            track["tags"] = json.loads(track.pop("tags_json") or "[]")
+            rows.append(track)
+        return rows
+
+
+def get_tracks_needing_audio_analysis(
+    versions: dict[str, int], limit: Optional[int] = None, force: bool = False
+) -> list[dict[str, Any]]:
+    """Get local tracks whose audio analysis is missing or stale.
+
+    A stored result is stale when another analyzer version produced it, the
+    file changed since (tracks.file_mtime differs), or it recorded an error
+    (decode and analyzer failures are often transient, so they are retried).
+
+    Args:
+        versions: Current version of each analyzer to run, by name
+        limit: Optional maximum number of tracks
+        force: Return every local track, even with current results
+
+    Returns:
+        List of dicts with id, local_path, file_mtime and 'analyzers' (the
+        names that need to run), ordered by track id
+    """
+    if not versions:
+        return []
+
+    wanted = ", ".join("(?, ?)" for _ in versions)
+    params: list[Any] = [value for item in versions.items() for value in item]
+    stale = "1" if force else (
+        "a.track_id IS NULL OR a.error IS NOT NULL"
+        " OR a.version != w.version OR a.file_mtime IS NOT t.file_mtime"
+    )
+    limit_clause = ""
+    if limit:
+        limit_clause = "LIMIT ?"
+        params.append(limit)
+
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            f"""
+            WITH wanted(analyzer, version) AS (VALUES {wanted})
+            SELECT t.id, t.local_path, t.file_mtime,
+                   group_concat(w.analyzer) AS analyzers
+            FROM tracks t
+            CROSS JOIN wanted w
+            LEFT JOIN track_analysis a
+                ON a.track_id = t.id AND a.analyzer = w.analyzer
+            WHERE t.local_path IS NOT NULL AND t.local_path != ''
+            AND ({stale})
+            GROUP BY t.id
+            ORDER BY t.id
+            {limit_clause}
+        """,
+            params,
+        )
+        rows = []
+        for row in cursor.fetchall():
+            track = dict(row)
+            track["analyzers"] = sorted(track["analyzers"].split(","))
+            rows.append(track)
+        return rows
+
+
+def save_audio_analysis_batch(
+    results: list[tuple[int, str, int, Optional[float], Optional[dict], Optional[str]]],
+    track_fills: Optional[list[tuple[int, Optional[float], Optional[str]]]] = None,
+) -> tuple[int, int]:
+    """Store analyzer results and fill in missing BPM/key in one transaction.
+
+    Args:
+        results: (track_id, analyzer, version, file_mtime, features, error)
+            tuples; features is a JSON-serializable dict or None on error
+        track_fills: (track_id, bpm, key) tuples; each value is only written
+            where the track has none yet, so tags always win
+
+    Returns:
+        Tuple of (bpm_filled, keys_filled)
+    """
+    import json
+
+    bpm_filled = keys_filled = 0
+    with get_db_connection() as conn:
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO track_analysis
+                (track_id, analyzer, version, file_mtime, features, error, analyzed_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        """,
+            [
+                (track_id, analyzer, version, file_mtime,
+                 json.dumps(features) if features is not None else None, error)
+                for track_id, analyzer, version, file_mtime, features, error in results
+            ],
+        )
+        for track_id, bpm, key in track_fills or []:
+            if bpm is not None:
+                bpm_filled += conn.execute(
+                    "UPDATE tracks SET bpm = ?, updated_at = CURRENT_TIMESTAMP "
+                    "WHERE id = ? AND bpm IS NULL",
+                    (bpm, track_id),
+                ).rowcount
+            if key:
+                keys_filled += conn.execute(
+                    "UPDATE tracks SET key_signature = ?, updated_at = CURRENT_TIMESTAMP "
+                    "WHERE id = ? AND (key_signature IS NULL OR key_signature = '')",
+                    (key, track_id),
+                ).rowcount
+        conn.commit()
+    return bpm_filled, keys_filled
+
+
+def get_audio_features(
+    analyzer: str, track_ids: Optional[list[int]] = None
+) -> dict[int, dict[str, Any]]:
+    """Get stored features of one analyzer (results that errored are skipped).
+
+    Args:
+        analyzer: Analyzer name, e.g. 'loudness'
+        track_ids: Only these tracks (default: all)
+
+    Returns:
+        Dictionary mapping track_id to its features dict
+    """
+    import json
+
+    query = "SELECT track_id, features FROM track_analysis WHERE analyzer = ? AND error IS NULL"
+    params: list[Any] = [analyzer]
+    if track_ids is not None:
+        if not track_ids:
+            return {}
+        query += f" AND track_id IN ({','.join('?' * len(track_ids))})"
+        params.extend(track_ids)
+
+    with get_db_connection() as conn:
+        return {
+            row["track_id"]: json.loads(row["features"])
+            for row in conn.execute(query, params)
+            if row["features"]
+        }
+
+
 # Provider State Functions
 
 
@@ -211,6 +211,17 @@ def init_postgres_schema() -> None:
         )
     """)
 
+    # Daily rollup read by history stats (see domain/radio/history.roll_up_play)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS radio_history_daily (
+            day DATE NOT NULL,
+            track_id INTEGER NOT NULL,
+            plays INTEGER NOT NULL DEFAULT 0,
+            listened_ms BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, track_id)
+        )
+    """)
+
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS radio_state (
             id INTEGER PRIMARY KEY CHECK (id = 1),
@@ -278,19 +289,33 @@ def init_postgres_schema() -> None:
             id SERIAL PRIMARY KEY,
             playlist_id INTEGER NOT NULL REFERENCES playlists(id) ON DELETE CASCADE,
             track_id INTEGER NOT NULL REFERENCES tracks(id) ON DELETE CASCADE,
-            position INTEGER NOT NULL,
+            position DOUBLE PRECISION NOT NULL,
             added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UNIQUE (playlist_id, track_id)
         )
     """)
+    # Positions are fractional ordering keys (see playlists/ordering.py)
+    cursor.execute("ALTER TABLE playlist_tracks ALTER COLUMN position TYPE DOUBLE PRECISION")
 
     # Create indexes
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_station_schedule_station ON station_schedule(station_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_radio_history_station ON radio_history(station_id, started_at DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_radio_history_started ON radio_history(started_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_radio_history_track_started ON radio_history(track_id, started_at)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_radio_skipped_station_date ON radio_skipped(station_id, skip_date)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_tracks_local_path ON tracks(local_path)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_playlist_tracks_playlist ON playlist_tracks(playlist_id, position)")
 
+    # One-time backfill of the rollup from existing history
+    cursor.execute("SELECT EXISTS (SELECT 1 FROM radio_history_daily)")
+    if not cursor.fetchone()[0]:
+        cursor.execute("""
+            INSERT INTO radio_history_daily (day, track_id, plays, listened_ms)
+            SELECT DATE(started_at), COALESCE(track_id, 0), COUNT(*), COALESCE(SUM(position_ms), 0)
+            FROM radio_history
+            GROUP BY DATE(started_at), COALESCE(track_id, 0)
+        """)
+
     conn.commit()
     cursor.close()
     conn.close()
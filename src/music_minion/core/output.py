@@ -11,6 +11,7 @@ from loguru import logger
 # Global blessed mode tracking (set when blessed UI starts)
 _blessed_mode_active = False
 _blessed_ui_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+_blessed_wakeup: Optional[Callable[[], None]] = None
 _blessed_mode_lock = threading.Lock()
 
 # Pending history messages queue (for executor to drain after handle_command)
@@ -46,29 +47,45 @@ def setup_loguru(log_file: Path, level: str = "INFO") -> None:
 
 def set_blessed_mode(
     ui_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    wakeup: Optional[Callable[[], None]] = None,
 ) -> None:
     """
     Enable blessed mode - suppresses stdout printing, routes through UI callback.
 
     Args:
         ui_callback: Thread-safe callback to update blessed UI state
+        wakeup: Thread-safe callback that wakes the UI event loop
     """
-    global _blessed_mode_active, _blessed_ui_callback
+    global _blessed_mode_active, _blessed_ui_callback, _blessed_wakeup
     with _blessed_mode_lock:
         _blessed_mode_active = True
         _blessed_ui_callback = ui_callback
+        _blessed_wakeup = wakeup
         logger.debug("Blessed mode enabled - log() will route through UI callback")
 
 
 def clear_blessed_mode() -> None:
     """Disable blessed mode - restores stdout printing."""
-    global _blessed_mode_active, _blessed_ui_callback
+    global _blessed_mode_active, _blessed_ui_callback, _blessed_wakeup
     with _blessed_mode_lock:
         _blessed_mode_active = False
         _blessed_ui_callback = None
+        _blessed_wakeup = None
         logger.debug("Blessed mode disabled - log() will print to stdout")
 
 
+def notify_ui() -> None:
+    """
+    Wake the blessed UI loop so it picks up new background state promptly.
+
+    Called by background producers (scan/sync/conversion state, IPC queues).
+    No-op outside blessed mode.
+    """
+    wakeup = _blessed_wakeup
+    if wakeup is not None:
+        wakeup()
+
+
 def drain_pending_history_messages() -> list[tuple[str, str]]:
     """
     Get and clear all pending history messages.
@@ -132,6 +149,8 @@ def log(message: str, level: str = "info") -> None:
                 # This fixes race condition where executor overwrites callback updates
                 with _pending_messages_lock:
                     _pending_history_messages.append((message, color))
+                if _blessed_wakeup is not None:
+                    _blessed_wakeup()
         else:
             # CLI mode: Check silent_logging flag
             silent = getattr(threading.current_thread(), "silent_logging", False)
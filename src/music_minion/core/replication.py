@@ -0,0 +1,592 @@
+"""
+Delta replication of the SQLite database between devices (laptop <-> Pi).
+
+Triggers installed by `replicate init` (see database.install_change_log_triggers)
+record every row change in change_log with the origin that made it. A peer's
+changeset is the compacted list of rows changed since the watermark that peer
+last acknowledged, so what travels is proportional to edit volume rather than
+database size, and neither side ever copies a database file that is open.
+
+Changeset flow for two peers A and B:
+    A: export_changeset(B)      -> rows changed since B's last ack, plus A's ack of B
+    B: import_changeset(...)    -> applies rows, records A's seq as applied,
+                                   records B's changes A has acked (prunable)
+
+Conflicts are resolved per row, last writer wins by change timestamp (ties
+broken by origin). Rows inserted concurrently on both devices with the same
+AUTOINCREMENT id are kept as two rows: the incoming one gets a new local id.
+Changesets always carry the sender's ids; replication_id_map translates them
+(and foreign keys pointing at them) into the receiver's ids, and each
+changeset lists the sender's remaps so the receiver learns the reverse.
+"""
+
+import json
+import sqlite3
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+
+from loguru import logger
+
+from .database import (
+    get_db_connection,
+    get_table_key_columns,
+    install_change_log_triggers,
+    drop_change_log_triggers,
+    is_change_log_enabled,
+    refresh_listening_rollups,
+)
+
+CHANGESET_FORMAT = 1
+
+# Raw tables behind the daily rollups, with the column holding the row's day
+_ROLLUP_SOURCES = {"track_listen_sessions": "play_date", "radio_history": "started_at"}
+
+
+class ReplicationError(Exception):
+    """Raised when a changeset cannot be produced or applied."""
+
+
+def _pk_key(pk: list) -> str:
+    """Serialize a primary key the way the triggers' json_array() does."""
+    return json.dumps(pk, separators=(",", ":"), ensure_ascii=False)
+
+
+def _get_state(conn, key: str) -> Optional[str]:
+    row = conn.execute(
+        "SELECT value FROM replication_state WHERE key = ?", (key,)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def _require_origin(conn) -> str:
+    origin = _get_state(conn, "origin")
+    if origin is None:
+        raise ReplicationError("Replication is not initialized (run: replicate init)")
+    return origin
+
+
+def enable_replication() -> str:
+    """Start capturing row changes on this database.
+
+    Both peers must start from the same database contents (copy the file once
+    while both sides are stopped), then run this on each.
+
+    Returns:
+        This database's origin ID
+    """
+    with get_db_connection() as conn:
+        origin = _get_state(conn, "origin")
+        if origin is None:
+            origin = uuid.uuid4().hex[:12]
+            conn.execute(
+                "INSERT INTO replication_state (key, value) VALUES ('origin', ?)",
+                (origin,),
+            )
+        tables = install_change_log_triggers(conn)
+        conn.commit()
+    logger.info(f"Replication enabled: origin {origin}, {tables} tables captured")
+    return origin
+
+
+def disable_replication() -> None:
+    """Stop capturing row changes (the log and peer watermarks are kept)."""
+    with get_db_connection() as conn:
+        drop_change_log_triggers(conn)
+        conn.execute("DELETE FROM replication_state WHERE key = 'origin'")
+        conn.commit()
+
+
+def get_origin() -> Optional[str]:
+    """This database's origin ID, or None if replication is not enabled."""
+    with get_db_connection() as conn:
+        if not is_change_log_enabled(conn):
+            return None
+        return _get_state(conn, "origin")
+
+
+class _Schema:
+    """Per-import/export cache of table keys and foreign keys."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._tables: dict[str, Optional[dict[str, Any]]] = {}
+
+    def table(self, name: str) -> Optional[dict[str, Any]]:
+        if name not in self._tables:
+            self._tables[name] = self._load(name)
+        return self._tables[name]
+
+    def _load(self, name: str) -> Optional[dict[str, Any]]:
+        row = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return None  # Table does not exist on this side (older schema)
+        pk_columns, columns = get_table_key_columns(self.conn, name)
+        # column -> referenced table (only references to a single-column key)
+        foreign_keys = {
+            fk[3]: fk[2]
+            for fk in self.conn.execute(f'PRAGMA foreign_key_list("{name}")')
+        }
+        # Surrogate ids are the ones two devices can hand out independently
+        surrogate = (
+            len(pk_columns) == 1
+            and pk_columns[0] not in foreign_keys
+            and "AUTOINCREMENT" in (row[0] or "").upper()
+        )
+        return {
+            "pk": pk_columns,
+            "columns": set(columns) | ({"rowid"} if pk_columns == ["rowid"] else set()),
+            "foreign_keys": foreign_keys,
+            "surrogate": surrogate,
+        }
+
+
+def _map_id(conn, peer: str, table: str, value: Any) -> Any:
+    """Translate one of the peer's ids to ours (unchanged if not mapped)."""
+    if value is None:
+        return None
+    row = conn.execute(
+        "SELECT local_id FROM replication_id_map WHERE peer_origin = ? AND tbl = ? AND remote_id = ?",
+        (peer, table, value),
+    ).fetchone()
+    return row[0] if row else value
+
+
+def _record_mapping(conn, peer: str, table: str, remote_id: Any, local_id: Any) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO replication_id_map (peer_origin, tbl, remote_id, local_id) "
+        "VALUES (?, ?, ?, ?)",
+        (peer, table, remote_id, local_id),
+    )
+
+
+def _translate(
+    schema: _Schema, peer: str, table: str, pk: list, row: Optional[dict]
+) -> tuple[list, Optional[dict]]:
+    """Map the peer's surrogate ids and foreign keys into our id space."""
+    info = schema.table(table)
+    if info is None:
+        return pk, row
+    conn = schema.conn
+    if info["surrogate"]:
+        pk = [_map_id(conn, peer, table, pk[0])]
+    elif len(info["pk"]) == len(pk):
+        pk = [
+            _map_id(conn, peer, info["foreign_keys"][col], value)
+            if col in info["foreign_keys"]
+            else value
+            for col, value in zip(info["pk"], pk)
+        ]
+    if row is not None:
+        row = dict(row)
+        for col, ref_table in info["foreign_keys"].items():
+            if col in row:
+                row[col] = _map_id(conn, peer, ref_table, row[col])
+        if info["surrogate"] and info["pk"][0] in row:
+            row[info["pk"][0]] = pk[0]
+    return pk, row
+
+
+def _compact(changes: list[sqlite3.Row], peer_origin: str) -> list[dict[str, Any]]:
+    """Collapse a run of changes to the latest state of each row.
+
+    An insert followed by updates from the same origin ships as one insert
+    carrying the final row; anything ending in a delete ships as the delete.
+    Rows whose latest change came from the peer itself are left out: the
+    peer already has that state, and older local edits must not overwrite it.
+    """
+    latest: dict[tuple[str, str], dict[str, Any]] = {}
+    for change in changes:
+        key = (change["tbl"], change["pk"])
+        entry = {
+            "seq": change["seq"],
+            "origin": change["origin"],
+            "tbl": change["tbl"],
+            "op": change["op"],
+            "pk": change["pk"],
+            "row": change["row"],
+            "changed_at": change["changed_at"],
+        }
+        previous = latest.pop(key, None)  # Re-insert to keep seq order
+        if (
+            previous is not None
+            and previous["op"] == "I"
+            and entry["op"] == "U"
+            and previous["origin"] == entry["origin"]
+        ):
+            entry["op"] = "I"
+        latest[key] = entry
+    return [entry for entry in latest.values() if entry["origin"] != peer_origin]
+
+
+def export_changeset(peer_origin: str, since: Optional[int] = None) -> dict[str, Any]:
+    """Build the changeset for a peer: rows changed since its last ack.
+
+    Changes that came from the peer itself are never sent back.
+
+    Args:
+        peer_origin: Origin ID of the receiving database
+        since: Override the watermark (local seq) to export from
+
+    Returns:
+        JSON-serializable changeset dict
+
+    Raises:
+        ReplicationError: If replication is not enabled, or the change log was
+            pruned past the peer's watermark (peer needs a fresh copy)
+    """
+    with get_db_connection() as conn:
+        origin = _require_origin(conn)
+        if peer_origin == origin:
+            raise ReplicationError("Cannot export a changeset to this database itself")
+        peer = conn.execute(
+            "SELECT last_applied, last_acked FROM replication_peers WHERE peer_origin = ?",
+            (peer_origin,),
+        ).fetchone()
+        watermark = since if since is not None else (peer["last_acked"] if peer else 0)
+
+        pruned_through = conn.execute(
+            "SELECT value FROM replication_state WHERE key = 'pruned_through'"
+        ).fetchone()
+        if pruned_through and watermark < int(pruned_through[0]):
+            raise ReplicationError(
+                f"Change log was pruned past seq {watermark}; "
+                f"re-seed {peer_origin} from a copy of this database"
+            )
+
+        changes = conn.execute(
+            """
+            SELECT seq, origin, tbl, op, pk, row, changed_at FROM change_log
+            WHERE seq > ?
+            ORDER BY seq
+            """,
+            (watermark,),
+        ).fetchall()
+        to_seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()[0]
+        to_seq = max(to_seq, watermark)
+
+        compacted = []
+        for change in _compact(changes, peer_origin):
+            change["pk"] = json.loads(change["pk"])
+            change["row"] = json.loads(change["row"]) if change["row"] else None
+            compacted.append(change)
+        # Ids are always sent in this database's id space; the peer learns
+        # where its own rows live here from our remaps
+        id_map = [
+            list(row)
+            for row in conn.execute(
+                "SELECT tbl, remote_id, local_id FROM replication_id_map WHERE peer_origin = ?",
+                (peer_origin,),
+            )
+        ]
+
+        conn.execute(
+            """
+            INSERT INTO replication_peers (peer_origin, last_export_at)
+            VALUES (?, CURRENT_TIMESTAMP)
+            ON CONFLICT (peer_origin) DO UPDATE SET last_export_at = CURRENT_TIMESTAMP
+            """,
+            (peer_origin,),
+        )
+        conn.commit()
+
+    logger.info(
+        f"Exported {len(compacted)} row changes ({len(changes)} logged) "
+        f"for {peer_origin}, seq {watermark}..{to_seq}"
+    )
+    return {
+        "format": CHANGESET_FORMAT,
+        "origin": origin,
+        "peer": peer_origin,
+        "from_seq": watermark,
+        "to_seq": to_seq,
+        "ack": peer["last_applied"] if peer else 0,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "logged_changes": len(changes),
+        "id_map": id_map,
+        "changes": compacted,
+    }
+
+
+def _where(pk_columns: list[str]) -> str:
+    return " AND ".join(
+        ("rowid = ?" if c == "rowid" else f'"{c}" = ?') for c in pk_columns
+    )
+
+
+def _insert(conn, table: str, row: dict[str, Any]) -> int:
+    columns = list(row)
+    names = ", ".join("rowid" if c == "rowid" else f'"{c}"' for c in columns)
+    cursor = conn.execute(
+        f'INSERT INTO "{table}" ({names}) VALUES ({", ".join("?" * len(columns))})',
+        [row[c] for c in columns],
+    )
+    return cursor.lastrowid
+
+
+def _find_unique_match(conn, table: str, row: dict[str, Any]) -> Optional[int]:
+    """Find the local row an incoming insert duplicates via a UNIQUE index."""
+    for index in conn.execute(f'PRAGMA index_list("{table}")').fetchall():
+        if not index[2]:  # not unique
+            continue
+        columns = [c[2] for c in conn.execute(f'PRAGMA index_info("{index[1]}")')]
+        if not columns or any(c is None or row.get(c) is None for c in columns):
+            continue
+        match = conn.execute(
+            f'SELECT rowid FROM "{table}" WHERE '
+            + " AND ".join(f'"{c}" = ?' for c in columns),
+            [row[c] for c in columns],
+        ).fetchone()
+        if match:
+            return match[0]
+    return None
+
+
+def _apply_change(
+    conn, schema: _Schema, sender: str, local_origin: str, acked: int, change: dict
+) -> str:
+    """Apply one change inside the import transaction.
+
+    Returns:
+        Outcome: applied, conflict, remapped, merged or skipped
+    """
+    table = change["tbl"]
+    info = schema.table(table)
+    if info is None:
+        return "skipped"
+    pk, row = _translate(schema, sender, table, change["pk"], change["row"])
+    if row is not None:
+        # Columns the sender has but this schema does not are dropped
+        row = {k: v for k, v in row.items() if k in info["columns"]}
+    where = _where(info["pk"])
+
+    if change["op"] == "I" and info["surrogate"] and pk == change["pk"]:
+        # Not mapped yet: is the local row with this id a different row that
+        # was inserted here (or by another peer) while the sender made its own?
+        collision = conn.execute(
+            """
+            SELECT 1 FROM change_log
+            WHERE tbl = ? AND pk = ? AND op = 'I' AND origin != ?
+            LIMIT 1
+            """,
+            (table, _pk_key(pk), sender),
+        ).fetchone()
+        if collision and conn.execute(
+            f'SELECT 1 FROM "{table}" WHERE {where}', pk
+        ).fetchone():
+            fresh = {k: v for k, v in row.items() if k != info["pk"][0]}
+            try:
+                local_id = _insert(conn, table, fresh)
+                outcome = "remapped"
+            except sqlite3.IntegrityError:
+                local_id = _find_unique_match(conn, table, fresh)
+                if local_id is None:
+                    raise
+                outcome = "merged"
+            _record_mapping(conn, sender, table, pk[0], local_id)
+            return outcome
+
+    # Last writer wins against local edits the sender has not seen yet
+    local = conn.execute(
+        """
+        SELECT changed_at FROM change_log
+        WHERE tbl = ? AND pk = ? AND origin = ? AND seq > ?
+        ORDER BY seq DESC LIMIT 1
+        """,
+        (table, _pk_key(pk), local_origin, acked),
+    ).fetchone()
+    if local is not None and (local[0], local_origin) > (change["changed_at"], sender):
+        return "conflict"
+
+    if change["op"] == "D":
+        conn.execute(f'DELETE FROM "{table}" WHERE {where}', pk)
+        return "applied"
+
+    assignments = [c for c in row if c not in info["pk"]]
+    updated = 0
+    if assignments:
+        updated = conn.execute(
+            f'UPDATE "{table}" SET '
+            + ", ".join(f'"{c}" = ?' for c in assignments)
+            + f" WHERE {where}",
+            [row[c] for c in assignments] + pk,
+        ).rowcount
+    elif conn.execute(f'SELECT 1 FROM "{table}" WHERE {where}', pk).fetchone():
+        updated = 1
+    if updated:
+        return "applied"
+
+    try:
+        _insert(conn, table, row)
+        return "applied"
+    except sqlite3.IntegrityError:
+        # Same logical row created on both sides (e.g. a track liked on both):
+        # adopt the local row and route the sender's id to it
+        local_id = _find_unique_match(conn, table, row) if info["surrogate"] else None
+        if local_id is None:
+            raise
+        _record_mapping(conn, sender, table, pk[0], local_id)
+        return "merged"
+
+
+def import_changeset(changeset: dict[str, Any]) -> dict[str, int]:
+    """Apply a peer's changeset in one transaction.
+
+    Idempotent: changes at or below the sender's last applied seq are skipped,
+    so re-importing or overlapping exports are harmless.
+
+    Args:
+        changeset: Dict produced by export_changeset on the peer
+
+    Returns:
+        Counts: applied, skipped, conflicts (kept local), remapped, merged,
+        failed, pruned (local change-log rows acknowledged by every peer)
+
+    Raises:
+        ReplicationError: If the changeset is malformed or addressed elsewhere
+    """
+    if changeset.get("format") != CHANGESET_FORMAT:
+        raise ReplicationError(f"Unsupported changeset format: {changeset.get('format')}")
+    sender = changeset["origin"]
+    stats = {
+        "applied": 0,
+        "skipped": 0,
+        "conflict": 0,
+        "remapped": 0,
+        "merged": 0,
+        "failed": 0,
+        "pruned": 0,
+    }
+
+    with get_db_connection() as conn:
+        local_origin = _require_origin(conn)
+        if changeset.get("peer") not in (None, local_origin):
+            raise ReplicationError(
+                f"Changeset is addressed to {changeset['peer']}, this database is {local_origin}"
+            )
+        if sender == local_origin:
+            raise ReplicationError("Changeset was exported by this database")
+
+        peer = conn.execute(
+            "SELECT last_applied, last_acked FROM replication_peers WHERE peer_origin = ?",
+            (sender,),
+        ).fetchone()
+        last_applied = peer["last_applied"] if peer else 0
+        acked = max(peer["last_acked"] if peer else 0, int(changeset.get("ack") or 0))
+        if changeset["from_seq"] > last_applied:
+            raise ReplicationError(
+                f"Gap in changes from {sender}: have seq {last_applied}, "
+                f"changeset starts after {changeset['from_seq']}"
+            )
+
+        schema = _Schema(conn)
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("PRAGMA defer_foreign_keys = ON")
+        try:
+            # Triggers attribute the rows written below to the sender, so
+            # they are forwarded to other peers but never echoed back
+            conn.execute(
+                "INSERT OR REPLACE INTO replication_state (key, value) VALUES ('applying_origin', ?)",
+                (sender,),
+            )
+            # The sender's remaps of our rows: its id -> our id
+            for table, our_id, their_id in changeset.get("id_map", []):
+                _record_mapping(conn, sender, table, their_id, our_id)
+            rollup_days: Optional[set[str]] = set()
+            for change in changeset["changes"]:
+                if change["seq"] <= last_applied:
+                    stats["skipped"] += 1
+                    continue
+                day_column = _ROLLUP_SOURCES.get(change["tbl"])
+                if day_column and rollup_days is not None:
+                    if change["row"] and change["row"].get(day_column):
+                        rollup_days.add(str(change["row"][day_column])[:10])
+                    else:
+                        rollup_days = None  # Deleted rows: day unknown, rebuild all
+                conn.execute("SAVEPOINT change")
+                try:
+                    outcome = _apply_change(conn, schema, sender, local_origin, acked, change)
+                    conn.execute("RELEASE SAVEPOINT change")
+                except sqlite3.DatabaseError as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT change")
+                    conn.execute("RELEASE SAVEPOINT change")
+                    logger.warning(
+                        f"Could not apply {change['op']} {change['tbl']} {change['pk']} "
+                        f"from {sender}: {e}"
+                    )
+                    outcome = "failed"
+                stats[outcome] += 1
+
+            # Rollups are not replicated; recompute them for the days touched
+            if rollup_days is None or rollup_days:
+                refresh_listening_rollups(
+                    conn, sorted(rollup_days) if rollup_days is not None else None
+                )
+            conn.execute("DELETE FROM replication_state WHERE key = 'applying_origin'")
+            conn.execute(
+                """
+                INSERT INTO replication_peers (peer_origin, last_applied, last_acked, last_import_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT (peer_origin) DO UPDATE SET
+                    last_applied = MAX(last_applied, excluded.last_applied),
+                    last_acked = MAX(last_acked, excluded.last_acked),
+                    last_import_at = CURRENT_TIMESTAMP
+                """,
+                (sender, max(last_applied, changeset["to_seq"]), acked),
+            )
+            stats["pruned"] = _prune(conn)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    logger.info(
+        f"Imported changeset from {sender} (seq {changeset['from_seq']}..{changeset['to_seq']}): "
+        + ", ".join(f"{k} {v}" for k, v in stats.items() if v)
+    )
+    return stats
+
+
+def _prune(conn) -> int:
+    """Delete change-log rows every known peer has acknowledged."""
+    row = conn.execute("SELECT MIN(last_acked) FROM replication_peers").fetchone()
+    through = row[0] if row and row[0] else 0
+    if not through:
+        return 0
+    deleted = conn.execute("DELETE FROM change_log WHERE seq <= ?", (through,)).rowcount
+    conn.execute(
+        "INSERT OR REPLACE INTO replication_state (key, value) VALUES ('pruned_through', ?)",
+        (str(through),),
+    )
+    return deleted
+
+
+def get_replication_status() -> dict[str, Any]:
+    """Origin, change-log size and per-peer watermarks for `replicate status`."""
+    with get_db_connection() as conn:
+        if not is_change_log_enabled(conn):
+            return {"enabled": False}
+        log = conn.execute(
+            "SELECT COUNT(*), COALESCE(MAX(seq), 0) FROM change_log"
+        ).fetchone()
+        peers = conn.execute(
+            """
+            SELECT peer_origin, last_applied, last_acked, last_import_at, last_export_at
+            FROM replication_peers ORDER BY peer_origin
+            """
+        ).fetchall()
+        return {
+            "enabled": True,
+            "origin": _get_state(conn, "origin"),
+            "log_rows": log[0],
+            "head_seq": log[1],
+            "peers": [
+                {**dict(peer), "pending": conn.execute(
+                    "SELECT COUNT(*) FROM change_log WHERE seq > ? AND origin != ?",
+                    (peer["last_acked"], peer["peer_origin"]),
+                ).fetchone()[0]}
+                for peer in peers
+            ],
+        }
@@ -3,40 +3,49 @@
 This domain handles:
 - OpenAI API key management
 - Track analysis with AI
-- AI-powered tagging
+- AI-powered tagging (single track and batch)
 - Usage statistics and testing
 - Prompt versioning and management
 - Learning accumulation from tag feedback
 """
 
-from .client import (
-    AIError,
-    is_redundant_tag,
-    filter_redundant_tags,
-    get_api_key,
-    store_api_key,
-    get_user_prompt,
-    build_analysis_input,
-    analyze_track_with_ai,
-    analyze_and_tag_track,
-    format_usage_stats,
-    test_ai_prompt_with_random_track,
-    save_test_report,
-)
+from music_minion.lazy import lazy_exports
 
-from .prompt_manager import (
-    get_ai_dir,
-    get_prompts_dir,
-    get_learnings_file,
-    get_active_prompt_file,
-    init_learnings_file,
-    get_learnings,
-    append_to_learnings_section,
-    save_prompt_version,
-    get_active_prompt,
-    set_active_prompt,
-    get_default_prompt,
-    list_prompt_versions,
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".client": (
+            "AIError",
+            "is_redundant_tag",
+            "filter_redundant_tags",
+            "get_api_key",
+            "store_api_key",
+            "get_user_prompt",
+            "build_analysis_input",
+            "analyze_track_with_ai",
+            "analyze_and_tag_track",
+            "format_usage_stats",
+            "test_ai_prompt_with_random_track",
+            "save_test_report",
+        ),
+        ".batch": (
+            "analyze_tracks_batch",
+        ),
+        ".prompt_manager": (
+            "get_ai_dir",
+            "get_prompts_dir",
+            "get_learnings_file",
+            "get_active_prompt_file",
+            "init_learnings_file",
+            "get_learnings",
+            "append_to_learnings_section",
+            "save_prompt_version",
+            "get_active_prompt",
+            "set_active_prompt",
+            "get_default_prompt",
+            "list_prompt_versions",
+        ),
+    },
 )
 
 __all__ = [
@@ -52,6 +61,7 @@ __all__ = [
     "format_usage_stats",
     "test_ai_prompt_with_random_track",
     "save_test_report",
+    "analyze_tracks_batch",
     "get_ai_dir",
     "get_prompts_dir",
     "get_learnings_file",
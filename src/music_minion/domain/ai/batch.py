@@ -0,0 +1,321 @@
+"""
+Batch AI tagging for all tracks that still need analysis.
+
+Inputs are prefetched in one query, requests run concurrently on a shared
+OpenAI client under a requests-per-minute and tokens-per-minute budget,
+responses are cached by input hash, and results are written in batched
+transactions.
+"""
+
+import hashlib
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from ...core.database import (
+    add_tags_batch,
+    db_track_to_library_track,
+    estimate_ai_cost,
+    get_analysis_inputs,
+    get_cached_ai_responses,
+    log_ai_requests_batch,
+    save_ai_responses,
+)
+from .client import (
+    AI_MODEL,
+    TAG_REASONING_INSTRUCTIONS,
+    AIError,
+    build_analysis_input,
+    filter_redundant_tags,
+    get_api_key,
+    get_openai_client,
+    parse_tags_with_reasoning,
+)
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_REQUESTS_PER_MINUTE = 60
+DEFAULT_TOKENS_PER_MINUTE = 150_000
+WRITE_BATCH_SIZE = 25
+
+# Rough per-request token reservation used before the real usage is known
+ESTIMATED_COMPLETION_TOKENS = 150
+
+
+def compute_input_hash(model: str, instructions: str, input_text: str) -> str:
+    """Hash the exact request payload for response caching."""
+    digest = hashlib.sha256()
+    for part in (model, instructions, input_text):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+class RateBudget:
+    """Sliding 60-second window limiting requests and tokens per minute.
+
+    acquire() blocks until the request fits; record() replaces the reserved
+    estimate with the real token usage once the response arrives.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._events: deque[list[float]] = deque()  # [timestamp, tokens]
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        while self._events and now - self._events[0][0] >= 60.0:
+            self._events.popleft()
+
+    def acquire(self, tokens: int) -> list[float]:
+        """Block until a request of ~tokens fits the budget; return its slot."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._prune(now)
+                used = sum(event[1] for event in self._events)
+                fits_requests = len(self._events) < self.requests_per_minute
+                # A single oversized request is allowed through an empty window
+                fits_tokens = not self._events or used + tokens <= self.tokens_per_minute
+                if fits_requests and fits_tokens:
+                    slot = [now, float(tokens)]
+                    self._events.append(slot)
+                    return slot
+                wait = max(0.05, 60.0 - (now - self._events[0][0]))
+            self._sleep(min(wait, 1.0))
+
+    def record(self, slot: list[float], tokens: int) -> None:
+        """Replace a slot's reserved tokens with the actual usage."""
+        with self._lock:
+            slot[1] = float(tokens)
+
+
+def _request_tags(
+    client: Any, input_text: str, budget: RateBudget
+) -> tuple[str, int, int, int]:
+    """Run one analysis request; returns (output_text, prompt, completion, ms)."""
+    slot = budget.acquire(
+        estimate_tokens(TAG_REASONING_INSTRUCTIONS + input_text)
+        + ESTIMATED_COMPLETION_TOKENS
+    )
+    start_time = time.time()
+    response = client.responses.create(
+        model=AI_MODEL, instructions=TAG_REASONING_INSTRUCTIONS, input=input_text
+    )
+    response_time_ms = int((time.time() - start_time) * 1000)
+
+    prompt_tokens = response.usage.input_tokens
+    completion_tokens = response.usage.output_tokens
+    budget.record(slot, prompt_tokens + completion_tokens)
+    return response.output_text, prompt_tokens, completion_tokens, response_time_ms
+
+
+def _parse_output(output_text: str) -> tuple[list[str], dict[str, str]]:
+    tags, reasoning = parse_tags_with_reasoning(output_text)
+    tags = filter_redundant_tags(tags)
+    reasoning = {tag: reasoning[tag] for tag in tags if tag in reasoning}
+    return tags, reasoning
+
+
+def analyze_tracks_batch(
+    limit: Optional[int] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+    tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
+    max_cost: Optional[float] = None,
+    base_url: Optional[str] = None,
+    request_type: str = "batch_analysis",
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> dict[str, Any]:
+    """Tag every track that needs AI analysis.
+
+    Args:
+        limit: Optional maximum number of tracks to analyze
+        concurrency: Number of requests in flight at once
+        requests_per_minute: Request budget (sliding 60s window)
+        tokens_per_minute: Token budget (sliding 60s window)
+        max_cost: Optional spend ceiling in USD; once reached, remaining
+            tracks are skipped (in-flight requests still complete)
+        base_url: Optional API base URL (e.g. a local stub server)
+        request_type: Request type recorded in ai_requests
+        progress_callback: Optional callback(done, total)
+
+    Returns:
+        Summary dict: total, analyzed, cached, failed, skipped, tags_added,
+        prompt_tokens, completion_tokens, cost
+
+    Raises:
+        AIError: If no API key is configured or openai is not installed
+    """
+    api_key = get_api_key()
+    if not api_key:
+        raise AIError("No OpenAI API key found. Use 'ai setup <key>' to configure.")
+
+    client = get_openai_client(api_key, base_url)
+    import openai
+
+    budget = RateBudget(requests_per_minute, tokens_per_minute)
+
+    # Prefetch every input (track + notes + tags) in one query
+    work = []
+    for row in get_analysis_inputs(limit):
+        track = db_track_to_library_track(row)
+        input_text = build_analysis_input(track, row["notes"], row["tags"])
+        input_hash = compute_input_hash(AI_MODEL, TAG_REASONING_INSTRUCTIONS, input_text)
+        work.append((row["id"], input_text, input_hash))
+
+    summary: dict[str, Any] = {
+        "total": len(work),
+        "analyzed": 0,
+        "cached": 0,
+        "failed": 0,
+        "skipped": 0,
+        "tags_added": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "cost": 0.0,
+    }
+    if not work:
+        return summary
+
+    cached = get_cached_ai_responses([input_hash for _, _, input_hash in work])
+
+    pending_tags: list[tuple[int, list[str], Optional[dict[str, str]]]] = []
+    pending_logs: list[dict[str, Any]] = []
+    pending_cache: list[tuple[str, str, str, int, int]] = []
+    done = 0
+
+    def flush() -> None:
+        summary["tags_added"] += add_tags_batch(pending_tags, source="ai")
+        log_ai_requests_batch(pending_logs)
+        save_ai_responses(pending_cache)
+        pending_tags.clear()
+        pending_logs.clear()
+        pending_cache.clear()
+
+    def advance() -> None:
+        nonlocal done
+        done += 1
+        if progress_callback:
+            progress_callback(done, summary["total"])
+        if len(pending_tags) + len(pending_logs) >= WRITE_BATCH_SIZE:
+            flush()
+
+    # Cached responses cost nothing and need no request
+    uncached = []
+    for track_id, input_text, input_hash in work:
+        hit = cached.get(input_hash)
+        if hit is None:
+            uncached.append((track_id, input_text, input_hash))
+            continue
+        try:
+            tags, reasoning = _parse_output(hit["output_text"])
+            pending_tags.append((track_id, tags, reasoning))
+            summary["cached"] += 1
+        except (AIError, ValueError) as e:
+            logger.warning(f"Discarding unparseable cached response for track {track_id}: {e}")
+            uncached.append((track_id, input_text, input_hash))
+            continue
+        advance()
+
+    def over_budget() -> bool:
+        return max_cost is not None and summary["cost"] >= max_cost
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, concurrency), thread_name_prefix="ai-batch"
+    ) as executor:
+        queue = iter(uncached)
+        futures = {}
+
+        def submit_next() -> None:
+            item = next(queue, None)
+            if item is not None:
+                futures[executor.submit(_request_tags, client, item[1], budget)] = item
+
+        # Keep only `concurrency` requests queued so a cost ceiling stops promptly
+        for _ in range(max(1, concurrency)):
+            submit_next()
+
+        while futures:
+            future = next(as_completed(futures))
+            track_id, _, input_hash = futures.pop(future)
+            try:
+                output_text, prompt_tokens, completion_tokens, response_time_ms = (
+                    future.result()
+                )
+            except Exception as e:
+                # Any per-request error fails just this track
+                summary["failed"] += 1
+                if isinstance(e, openai.APIError):
+                    error_message = f"OpenAI API error: {str(e)}"
+                else:
+                    error_message = f"{type(e).__name__}: {e}"
+                pending_logs.append(
+                    {
+                        "track_id": track_id,
+                        "request_type": request_type,
+                        "model_name": AI_MODEL,
+                        "prompt_tokens": 0,
+                        "completion_tokens": 0,
+                        "response_time_ms": 0,
+                        "success": False,
+                        "error_message": error_message,
+                    }
+                )
+            else:
+                summary["prompt_tokens"] += prompt_tokens
+                summary["completion_tokens"] += completion_tokens
+                summary["cost"] += estimate_ai_cost(prompt_tokens, completion_tokens)
+                log_entry = {
+                    "track_id": track_id,
+                    "request_type": request_type,
+                    "model_name": AI_MODEL,
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "response_time_ms": response_time_ms,
+                    "success": True,
+                }
+                try:
+                    tags, reasoning = _parse_output(output_text)
+                except Exception as e:
+                    summary["failed"] += 1
+                    log_entry["success"] = False
+                    log_entry["error_message"] = str(e) or type(e).__name__
+                else:
+                    summary["analyzed"] += 1
+                    pending_tags.append((track_id, tags, reasoning))
+                    pending_cache.append(
+                        (input_hash, AI_MODEL, output_text, prompt_tokens, completion_tokens)
+                    )
+                pending_logs.append(log_entry)
+
+            advance()
+            if not over_budget():
+                submit_next()
+
+        summary["skipped"] = sum(1 for _ in queue)
+
+    flush()
+    logger.info(
+        f"AI batch: {summary['analyzed']} analyzed, {summary['cached']} cached, "
+        f"{summary['failed']} failed, {summary['skipped']} skipped, "
+        f"${summary['cost']:.4f}"
+    )
+    return summary
@@ -2,8 +2,10 @@
 AI integration for Music Minion CLI using OpenAI Responses API
 """
 
+import json
 import os
 import re
+import threading
 import time
 from pathlib import Path
 from typing import Any, Optional
@@ -27,6 +29,30 @@ class AIError(Exception):
     pass
 
 
+AI_MODEL = "gpt-4o-mini"
+
+TAG_REASONING_INSTRUCTIONS = """Analyze this specific track and suggest 3-6 relevant tags based on the actual metadata, genre, BPM, key, and user notes provided.
+Focus on genre/subgenre, mood, vibe, and instrumentation - what makes THIS track distinctive. Be specific to the actual track data, not generic.
+
+Do NOT output the year, BPM, or musical key as tags - these are already stored in dedicated fields and are redundant. You may reference them in your reasoning, but never as a tag name itself (no pure numbers like "140" or "2020", and no key notations like "am", "c#", or "8a").
+
+Return a JSON object where each key is a tag and each value is a brief explanation (5-10 words) of WHY you chose that tag based on the track's specific characteristics.
+
+Example format:
+{
+    "energetic": "Fast tempo (140 BPM), driving drums",
+    "synth-heavy": "Dominant synthesizer melodies throughout",
+    "dark": "Minor key with brooding atmosphere"
+}
+
+Use lowercase for tag names. Be specific and reference actual track data."""
+
+# Pooled OpenAI clients keyed by (api_key, base_url); the client keeps an
+# HTTP connection pool, so reusing it avoids a TLS handshake per request.
+_clients: dict[tuple[str, Optional[str]], Any] = {}
+_clients_lock = threading.Lock()
+
+
 # Musical key notations the model should never emit as a free-form tag.
 # These are already stored in dedicated track fields (year/bpm/key).
 _MUSICAL_KEY_RE = re.compile(
@@ -127,6 +153,53 @@ def store_api_key(api_key: str) -> None:
     env_file.chmod(0o600)
 
 
+def get_openai_client(api_key: str, base_url: Optional[str] = None) -> Any:
+    """Return a shared OpenAI client for this key/endpoint (thread-safe).
+
+    Args:
+        api_key: OpenAI API key
+        base_url: Optional API base URL (e.g. a local stub server); None uses
+            the library default, which also honours OPENAI_BASE_URL
+
+    Raises:
+        AIError: If the openai library is not installed
+    """
+    try:
+        import openai
+    except ImportError:
+        raise AIError("OpenAI library not installed. Install with: pip install openai")
+
+    key = (api_key, base_url)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = openai.OpenAI(api_key=api_key, base_url=base_url)
+            _clients[key] = client
+        return client
+
+
+def parse_tags_with_reasoning(output_text: str) -> tuple[list[str], dict[str, str]]:
+    """Parse a JSON tag->reasoning response (bare or inside a ```json block).
+
+    Raises:
+        AIError: If no JSON object can be parsed
+    """
+    output_text = output_text.strip()
+    try:
+        tags_with_reasoning = json.loads(output_text)
+    except json.JSONDecodeError:
+        # Fallback: try to extract JSON from markdown code block
+        json_start = output_text.find("{")
+        json_end = output_text.rfind("}") + 1
+        if "```json" not in output_text or json_start == -1 or json_end <= json_start:
+            raise AIError(f"Failed to parse JSON from AI response: {output_text}")
+        tags_with_reasoning = json.loads(output_text[json_start:json_end])
+
+    tags = list(tags_with_reasoning.keys())
+    reasoning = {tag.lower(): reason for tag, reason in tags_with_reasoning.items()}
+    return tags, reasoning
+
+
 def get_user_prompt() -> str:
     """Get user's custom AI prompt from the markdown file."""
     prompt_file = get_config_dir() / "ai-prompt.md"
@@ -254,8 +327,6 @@ def analyze_track_with_ai(
         raise AIError("No OpenAI API key found. Use 'ai setup <key>' to configure.")
 
     try:
-        import json
-
         import openai
     except ImportError:
         raise AIError("OpenAI library not installed. Install with: pip install openai")
@@ -274,72 +345,26 @@ def analyze_track_with_ai(
     # Build input for Responses API
     input_text = build_analysis_input(track, notes, existing_tags)
 
-    # Prepare OpenAI client
-    client = openai.OpenAI(api_key=api_key)
+    # Shared OpenAI client (connection pool reused across calls)
+    client = get_openai_client(api_key)
 
     start_time = time.time()
 
     try:
         if return_reasoning:
             # New format: Return JSON with tag:reasoning pairs
-            instructions = """Analyze this specific track and suggest 3-6 relevant tags based on the actual metadata, genre, BPM, key, and user notes provided.
-Focus on genre/subgenre, mood, vibe, and instrumentation - what makes THIS track distinctive. Be specific to the actual track data, not generic.
-
-Do NOT output the year, BPM, or musical key as tags - these are already stored in dedicated fields and are redundant. You may reference them in your reasoning, but never as a tag name itself (no pure numbers like "140" or "2020", and no key notations like "am", "c#", or "8a").
-
-Return a JSON object where each key is a tag and each value is a brief explanation (5-10 words) of WHY you chose that tag based on the track's specific characteristics.
-
-Example format:
-{
-    "energetic": "Fast tempo (140 BPM), driving drums",
-    "synth-heavy": "Dominant synthesizer melodies throughout",
-    "dark": "Minor key with brooding atmosphere"
-}
-
-Use lowercase for tag names. Be specific and reference actual track data."""
-
             response = client.responses.create(
-                model="gpt-4o-mini", instructions=instructions, input=input_text
+                model=AI_MODEL, instructions=TAG_REASONING_INSTRUCTIONS, input=input_text
             )
 
             end_time = time.time()
             response_time_ms = int((end_time - start_time) * 1000)
 
-            # Parse JSON response
-            output_text = response.output_text.strip()
-
-            try:
-                # Try to parse as JSON
-                tags_with_reasoning = json.loads(output_text)
-                tags = list(tags_with_reasoning.keys())
-                reasoning = {
-                    tag.lower(): reason for tag, reason in tags_with_reasoning.items()
-                }
-            except json.JSONDecodeError:
-                # Fallback: try to extract JSON from markdown code block
-                if "```json" in output_text:
-                    json_start = output_text.find("{")
-                    json_end = output_text.rfind("}") + 1
-                    if json_start != -1 and json_end > json_start:
-                        json_text = output_text[json_start:json_end]
-                        tags_with_reasoning = json.loads(json_text)
-                        tags = list(tags_with_reasoning.keys())
-                        reasoning = {
-                            tag.lower(): reason
-                            for tag, reason in tags_with_reasoning.items()
-                        }
-                    else:
-                        raise AIError(
-                            f"Failed to parse JSON from AI response: {output_text}"
-                        )
-                else:
-                    raise AIError(
-                        f"Failed to parse JSON from AI response: {output_text}"
-                    )
+            tags, reasoning = parse_tags_with_reasoning(response.output_text)
         else:
             # Legacy format: Simple comma-separated tags
             response = client.responses.create(
-                model="gpt-4o-mini",
+                model=AI_MODEL,
                 instructions="Analyze this specific track and suggest 3-6 relevant tags based on the actual metadata, genre, BPM, key, and user notes provided. Focus on genre/subgenre, mood, vibe, and instrumentation - what makes THIS track distinctive. Do NOT output the year, BPM, or musical key as tags - they are redundant (no pure numbers like '140' or '2020', no key notations like 'am' or '8a'). Return ONLY a comma-separated list of tags, nothing else. Be specific to the actual track data, not generic.",
                 input=input_text,
             )
@@ -375,7 +400,7 @@ Use lowercase for tag names. Be specific and reference actual track data."""
         log_ai_request(
             track_id=track_id,
             request_type=request_type,
-            model_name="gpt-4o-mini",
+            model_name=AI_MODEL,
             prompt_tokens=response.usage.input_tokens,
             completion_tokens=response.usage.output_tokens,
             response_time_ms=response_time_ms,
@@ -394,7 +419,7 @@ Use lowercase for tag names. Be specific and reference actual track data."""
         log_ai_request(
             track_id=track_id,
             request_type=request_type,
-            model_name="gpt-4o-mini",
+            model_name=AI_MODEL,
             prompt_tokens=0,
             completion_tokens=0,
             response_time_ms=response_time_ms,
@@ -413,7 +438,7 @@ Use lowercase for tag names. Be specific and reference actual track data."""
         log_ai_request(
             track_id=track_id,
             request_type=request_type,
-            model_name="gpt-4o-mini",
+            model_name=AI_MODEL,
             prompt_tokens=0,
             completion_tokens=0,
             response_time_ms=response_time_ms,
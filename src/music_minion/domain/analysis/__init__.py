@@ -0,0 +1,65 @@
+"""Audio analysis domain - BPM, key, loudness, energy and timbre features.
+
+This domain handles:
+- Chunked ffmpeg PCM decoding shared by all analyzers
+- Versioned streaming analyzers (bpm_key, loudness, energy, timbre)
+- Parallel library-wide analysis with batched result writes
+- The background analysis job used by the CLI and web backend
+- Camelot key notation
+- Memory-mapped feature vectors for similar-track search
+"""
+
+from music_minion.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".analyzers": (
+            "ANALYZERS",
+            "Analyzer",
+        ),
+        ".decode": (
+            "DecodeError",
+            "decode_pcm",
+        ),
+        ".keys": (
+            "CAMELOT_MAP",
+            "parse_camelot",
+            "to_camelot",
+        ),
+        ".service": (
+            "analyze_file",
+            "analyze_library",
+            "get_analysis_job_status",
+            "resolve_analyzers",
+            "start_analysis_job",
+            "stop_analysis_job",
+        ),
+        ".similarity": (
+            "SimilarityIndex",
+            "build_similarity_index",
+            "get_similarity_index",
+            "similar_tracks",
+        ),
+    },
+)
+
+__all__ = [
+    "ANALYZERS",
+    "Analyzer",
+    "DecodeError",
+    "decode_pcm",
+    "CAMELOT_MAP",
+    "parse_camelot",
+    "to_camelot",
+    "analyze_file",
+    "analyze_library",
+    "get_analysis_job_status",
+    "resolve_analyzers",
+    "start_analysis_job",
+    "stop_analysis_job",
+    "SimilarityIndex",
+    "build_similarity_index",
+    "get_similarity_index",
+    "similar_tracks",
+]
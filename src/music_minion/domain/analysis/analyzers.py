@@ -0,0 +1,329 @@
+"""
+Streaming audio analyzers.
+
+An analyzer is fed the decoded PCM of one file chunk by chunk (float32,
+shape (frames, channels)) and returns a dict of features at the end. Each
+has a name, under which its results are stored, and a version: bumping the
+version marks every stored result of that analyzer stale, so the next run
+re-analyzes only what the upgrade affects.
+
+- bpm_key: tempo and Camelot key (Essentia; the whole signal is kept, up
+  to MAX_DURATION_SECONDS)
+- loudness: EBU R128 / ITU-R BS.1770-4 integrated loudness and loudness
+  range
+- energy: RMS, peak, crest factor, spectral centroid and bass share
+- timbre: mean and spread of 13 MFCCs
+"""
+
+import importlib.util
+from typing import Any, Optional
+
+import numpy as np
+from scipy.fft import dct
+from scipy.signal import lfilter
+
+from .keys import to_camelot
+
+MAX_DURATION_SECONDS = 600  # 10 minutes - skip DJ mixes, podcasts, etc.
+KEY_CONFIDENCE_THRESHOLD = 0.5
+
+
+def _db(power: float) -> Optional[float]:
+    return round(float(10 * np.log10(power)), 2) if power > 0 else None
+
+
+class Analyzer:
+    """Base class: one instance analyzes one file."""
+
+    name = ""
+    version = 1
+
+    def __init__(self, sample_rate: int):
+        self.sample_rate = sample_rate
+
+    @classmethod
+    def available(cls) -> bool:
+        """Whether the analyzer's dependencies are installed."""
+        return True
+
+    def feed(self, chunk: np.ndarray) -> None:
+        raise NotImplementedError
+
+    def result(self) -> dict[str, Any]:
+        raise NotImplementedError
+
+
+class BpmKeyAnalyzer(Analyzer):
+    """Tempo and key via Essentia.
+
+    Key detection is an ensemble of the default (Temperley) and EDM minor
+    profiles; whichever is more confident wins.
+    """
+
+    name = "bpm_key"
+    version = 1
+
+    def __init__(self, sample_rate: int):
+        super().__init__(sample_rate)
+        self._chunks: list[np.ndarray] = []
+        self._frames = 0
+        self._too_long = False
+
+    @classmethod
+    def available(cls) -> bool:
+        return importlib.util.find_spec("essentia") is not None
+
+    def feed(self, chunk: np.ndarray) -> None:
+        self._frames += len(chunk)
+        if self._frames > MAX_DURATION_SECONDS * self.sample_rate:
+            self._too_long = True
+            self._chunks.clear()
+        if not self._too_long:
+            self._chunks.append(chunk.mean(axis=1, dtype=np.float32))
+
+    def result(self) -> dict[str, Any]:
+        if self._too_long or not self._chunks:
+            return {"bpm": None, "key": None, "key_strength": None}
+
+        import essentia.standard as es
+
+        audio = np.concatenate(self._chunks)
+        self._chunks.clear()
+
+        bpm, *_ = es.RhythmExtractor2013(method="multifeature")(audio)
+        # Double-time correction: if BPM < 100 and 2×BPM is in 120-160 range, double it
+        if bpm < 100 and 120 <= 2 * bpm <= 160:
+            bpm *= 2
+
+        best_key, best_strength = None, 0.0
+        for extractor in (es.KeyExtractor(), es.KeyExtractor(profileType="edmm")):
+            key, scale, strength = extractor(audio)
+            camelot = to_camelot(key, scale)
+            if camelot and strength > best_strength:
+                best_key, best_strength = camelot, float(strength)
+
+        return {
+            "bpm": round(float(bpm), 1) if bpm > 0 else None,
+            "key": best_key,
+            "key_strength": round(best_strength, 3),
+        }
+
+
+def k_weighting(sample_rate: int) -> tuple[np.ndarray, np.ndarray]:
+    """BS.1770 K-weighting (high shelf + RLB high-pass) as one filter."""
+    # High shelf
+    f0, gain, q = 1681.974450955533, 3.999843853973347, 0.7071752369554196
+    k = np.tan(np.pi * f0 / sample_rate)
+    vh = 10 ** (gain / 20)
+    vb = vh**0.4996667741545416
+    a0 = 1 + k / q + k * k
+    shelf_b = np.array([vh + vb * k / q + k * k, 2 * (k * k - vh), vh - vb * k / q + k * k]) / a0
+    shelf_a = np.array([1, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0])
+
+    # High-pass
+    f0, q = 38.13547087602444, 0.5003270373238773
+    k = np.tan(np.pi * f0 / sample_rate)
+    a0 = 1 + k / q + k * k
+    pass_b = np.array([1.0, -2.0, 1.0])
+    pass_a = np.array([1, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0])
+
+    return np.convolve(shelf_b, pass_b), np.convolve(shelf_a, pass_a)
+
+
+def _block_loudness(power: np.ndarray) -> np.ndarray:
+    return -0.691 + 10 * np.log10(np.maximum(power, 1e-20))
+
+
+class LoudnessAnalyzer(Analyzer):
+    """Integrated loudness (LUFS) and loudness range (LU).
+
+    K-weighted power is kept per 100 ms; 400 ms momentary blocks (75%
+    overlap) and 3 s short-term blocks are built from those at the end.
+    """
+
+    name = "loudness"
+    version = 1
+
+    ABSOLUTE_GATE = -70.0
+
+    def __init__(self, sample_rate: int):
+        super().__init__(sample_rate)
+        self._b, self._a = k_weighting(sample_rate)
+        self._state: Optional[np.ndarray] = None
+        self._step = sample_rate // 10
+        self._carry = np.zeros(0)
+        self._powers: list[np.ndarray] = []
+
+    def feed(self, chunk: np.ndarray) -> None:
+        if self._state is None:
+            self._state = np.zeros((len(self._a) - 1, chunk.shape[1]))
+        weighted, self._state = lfilter(self._b, self._a, chunk, axis=0, zi=self._state)
+        squares = np.concatenate([self._carry, np.square(weighted).sum(axis=1)])
+        whole = len(squares) - len(squares) % self._step
+        self._powers.append(squares[:whole].reshape(-1, self._step).mean(axis=1))
+        self._carry = squares[whole:]
+
+    def _gated(self, blocks: np.ndarray, relative_gate: float) -> np.ndarray:
+        blocks = blocks[_block_loudness(blocks) > self.ABSOLUTE_GATE]
+        if not len(blocks):
+            return blocks
+        threshold = _block_loudness(np.array([blocks.mean()]))[0] + relative_gate
+        return blocks[_block_loudness(blocks) > threshold]
+
+    def result(self) -> dict[str, Any]:
+        powers = np.concatenate(self._powers) if self._powers else np.zeros(0)
+        lufs = lra = None
+
+        if len(powers) >= 4:
+            momentary = np.convolve(powers, np.full(4, 0.25), mode="valid")
+            gated = self._gated(momentary, -10.0)
+            if len(gated):
+                lufs = round(float(_block_loudness(np.array([gated.mean()]))[0]), 2)
+
+        if len(powers) >= 30:
+            short_term = np.convolve(powers, np.full(30, 1 / 30), mode="valid")
+            gated = self._gated(short_term, -20.0)
+            if len(gated):
+                low, high = np.percentile(_block_loudness(gated), [10, 95])
+                lra = round(float(high - low), 2)
+
+        return {"lufs": lufs, "lra": lra}
+
+
+class EnergyAnalyzer(Analyzer):
+    """Level and spectral balance of the mono downmix."""
+
+    name = "energy"
+    version = 1
+
+    FRAME = 2048
+    BASS_CUTOFF_HZ = 150.0
+
+    def __init__(self, sample_rate: int):
+        super().__init__(sample_rate)
+        self._sum_squares = 0.0
+        self._samples = 0
+        self._peak = 0.0
+        self._carry = np.zeros(0, dtype=np.float32)
+        self._window = np.hanning(self.FRAME).astype(np.float32)
+        self._freqs = np.fft.rfftfreq(self.FRAME, 1 / sample_rate)
+        self._bass = self._freqs < self.BASS_CUTOFF_HZ
+        self._spectrum_total = 0.0
+        self._spectrum_bass = 0.0
+        self._centroid_sum = 0.0
+        self._centroid_frames = 0
+
+    def feed(self, chunk: np.ndarray) -> None:
+        if not len(chunk):
+            return
+        self._peak = max(self._peak, float(np.abs(chunk).max()))
+        mono = chunk.mean(axis=1, dtype=np.float32)
+        self._sum_squares += float(np.dot(mono, mono))
+        self._samples += len(mono)
+
+        mono = np.concatenate([self._carry, mono])
+        whole = len(mono) - len(mono) % self.FRAME
+        self._carry = mono[whole:]
+        if not whole:
+            return
+        frames = mono[:whole].reshape(-1, self.FRAME) * self._window
+        power = np.square(np.abs(np.fft.rfft(frames, axis=1)))
+        totals = power.sum(axis=1)
+        self._spectrum_total += float(totals.sum())
+        self._spectrum_bass += float(power[:, self._bass].sum())
+        audible = totals > 1e-9
+        if audible.any():
+            self._centroid_sum += float((power[audible] @ self._freqs / totals[audible]).sum())
+            self._centroid_frames += int(audible.sum())
+
+    def result(self) -> dict[str, Any]:
+        rms_db = _db(self._sum_squares / self._samples) if self._samples else None
+        peak_db = _db(self._peak**2)
+        return {
+            "rms_db": rms_db,
+            "peak_db": peak_db,
+            "crest_db": round(peak_db - rms_db, 2) if rms_db is not None and peak_db is not None else None,
+            "spectral_centroid": (
+                round(self._centroid_sum / self._centroid_frames, 1) if self._centroid_frames else None
+            ),
+            "bass_ratio": (
+                round(self._spectrum_bass / self._spectrum_total, 4) if self._spectrum_total else None
+            ),
+        }
+
+
+def mel_filterbank(
+    sample_rate: int, frame: int, bands: int, low_hz: float, high_hz: float
+) -> np.ndarray:
+    """Triangular mel filters, shape (bands, frame // 2 + 1)."""
+
+    def to_mel(hz):
+        return 2595 * np.log10(1 + np.asarray(hz) / 700)
+
+    edges_mel = np.linspace(to_mel(low_hz), to_mel(high_hz), bands + 2)
+    edges = 700 * (10 ** (edges_mel / 2595) - 1)
+    freqs = np.fft.rfftfreq(frame, 1 / sample_rate)
+    rising = (freqs[None, :] - edges[:-2, None]) / (edges[1:-1] - edges[:-2])[:, None]
+    falling = (edges[2:, None] - freqs[None, :]) / (edges[2:] - edges[1:-1])[:, None]
+    return np.maximum(0, np.minimum(rising, falling)).astype(np.float32)
+
+
+class TimbreAnalyzer(Analyzer):
+    """MFCC summary of the mono downmix: per-coefficient mean and std.
+
+    Frames whose energy is below SILENCE_DB are skipped so intros, outros
+    and gaps don't pull every track towards the same "silence" timbre.
+    """
+
+    name = "timbre"
+    version = 1
+
+    FRAME = 2048
+    BANDS = 40
+    COEFFICIENTS = 13
+    SILENCE_DB = -60.0
+
+    def __init__(self, sample_rate: int):
+        super().__init__(sample_rate)
+        self._window = np.hanning(self.FRAME).astype(np.float32)
+        self._filters = mel_filterbank(
+            sample_rate, self.FRAME, self.BANDS, 20.0, min(16000.0, sample_rate / 2)
+        )
+        self._floor = self.FRAME * 10 ** (self.SILENCE_DB / 10)
+        self._carry = np.zeros(0, dtype=np.float32)
+        self._sum = np.zeros(self.COEFFICIENTS)
+        self._sum_squares = np.zeros(self.COEFFICIENTS)
+        self._frames = 0
+
+    def feed(self, chunk: np.ndarray) -> None:
+        mono = np.concatenate([self._carry, chunk.mean(axis=1, dtype=np.float32)])
+        whole = len(mono) - len(mono) % self.FRAME
+        self._carry = mono[whole:]
+        if not whole:
+            return
+        frames = mono[:whole].reshape(-1, self.FRAME)
+        frames = frames[np.einsum("ij,ij->i", frames, frames) > self._floor]
+        if not len(frames):
+            return
+        power = np.square(np.abs(np.fft.rfft(frames * self._window, axis=1)))
+        bands = np.log(power @ self._filters.T + 1e-10)
+        mfcc = dct(bands, type=2, norm="ortho", axis=1)[:, : self.COEFFICIENTS]
+        self._sum += mfcc.sum(axis=0)
+        self._sum_squares += np.square(mfcc).sum(axis=0)
+        self._frames += len(mfcc)
+
+    def result(self) -> dict[str, Any]:
+        if not self._frames:
+            return {"mfcc_mean": None, "mfcc_std": None}
+        mean = self._sum / self._frames
+        std = np.sqrt(np.maximum(self._sum_squares / self._frames - np.square(mean), 0))
+        return {
+            "mfcc_mean": [round(float(v), 4) for v in mean],
+            "mfcc_std": [round(float(v), 4) for v in std],
+        }
+
+
+ANALYZERS: dict[str, type[Analyzer]] = {
+    analyzer.name: analyzer
+    for analyzer in (BpmKeyAnalyzer, LoudnessAnalyzer, EnergyAnalyzer, TimbreAnalyzer)
+}
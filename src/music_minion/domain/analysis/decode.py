@@ -0,0 +1,83 @@
+"""
+Chunked PCM decoding through ffmpeg.
+
+Each file is decoded once, straight from ffmpeg's stdout into float32
+chunks, and every analyzer is fed the same chunks. Nothing is written to
+disk and memory stays bounded by the chunk size (plus whatever an analyzer
+chooses to keep).
+"""
+
+import shutil
+import subprocess
+import tempfile
+from typing import Iterator, Optional
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+CHANNELS = 2
+CHUNK_SECONDS = 10
+
+
+class DecodeError(Exception):
+    """ffmpeg is unavailable or couldn't decode a file."""
+
+
+def ffmpeg_path() -> Optional[str]:
+    """Path of the ffmpeg binary, or None if it isn't installed."""
+    return shutil.which("ffmpeg")
+
+
+def decode_pcm(
+    path: str,
+    sample_rate: int = SAMPLE_RATE,
+    channels: int = CHANNELS,
+    chunk_seconds: float = CHUNK_SECONDS,
+    max_seconds: Optional[float] = None,
+) -> Iterator[np.ndarray]:
+    """Decode an audio file into float32 chunks of shape (frames, channels).
+
+    Chunks hold chunk_seconds of audio; only the last one may be shorter.
+
+    Args:
+        path: Audio file path
+        sample_rate: Output sample rate
+        channels: Output channel count (ffmpeg up/downmixes as needed)
+        chunk_seconds: Duration per chunk
+        max_seconds: Stop decoding after this much audio
+
+    Raises:
+        DecodeError: ffmpeg missing, or it failed on the file
+    """
+    ffmpeg = ffmpeg_path()
+    if not ffmpeg:
+        raise DecodeError("ffmpeg not found. Install: apt install ffmpeg")
+
+    cmd = [ffmpeg, "-nostdin", "-v", "error", "-i", path]
+    if max_seconds is not None:
+        cmd += ["-t", str(max_seconds)]
+    cmd += ["-vn", "-f", "f32le", "-ac", str(channels), "-ar", str(sample_rate), "pipe:1"]
+
+    frame_bytes = 4 * channels
+    chunk_bytes = int(sample_rate * chunk_seconds) * frame_bytes
+    # stderr goes to a file: a pipe nobody reads could fill up and stall ffmpeg
+    with tempfile.TemporaryFile() as stderr:
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        finished = False
+        try:
+            while not finished:
+                data = proc.stdout.read(chunk_bytes)
+                finished = len(data) < chunk_bytes
+                usable = len(data) - len(data) % frame_bytes
+                if usable:
+                    yield np.frombuffer(data[:usable], dtype="<f4").reshape(-1, channels)
+        finally:
+            proc.stdout.close()
+            if not finished:  # Consumer stopped early
+                proc.kill()
+            proc.wait()
+
+        if proc.returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode(errors="replace").strip()[-500:]
+            raise DecodeError(f"ffmpeg failed ({proc.returncode}): {message}")
@@ -0,0 +1,77 @@
+"""
+Musical key notation: conversion to the Camelot wheel.
+
+Camelot codes number the circle of fifths 1-12, with "A" for minor and "B"
+for major keys, so harmonically compatible keys are neighbours on the wheel.
+"""
+
+import re
+from typing import Optional
+
+# Camelot wheel mapping (musical key → Camelot code)
+# Includes both sharp and flat enharmonic equivalents
+CAMELOT_MAP = {
+    "C": "8B", "Am": "8A",
+    "G": "9B", "Em": "9A",
+    "D": "10B", "Bm": "10A",
+    "A": "11B", "F#m": "11A", "Gbm": "11A",
+    "E": "12B", "C#m": "12A", "Dbm": "12A",
+    "B": "1B", "Cb": "1B", "G#m": "1A", "Abm": "1A",
+    "F#": "2B", "Gb": "2B", "D#m": "2A", "Ebm": "2A",
+    "Db": "3B", "C#": "3B", "Bbm": "3A", "A#m": "3A",
+    "Ab": "4B", "G#": "4B", "Fm": "4A",
+    "Eb": "5B", "D#": "5B", "Cm": "5A",
+    "Bb": "6B", "A#": "6B", "Gm": "6A",
+    "F": "7B", "Dm": "7A",
+}
+
+_CAMELOT_RE = re.compile(r"^\s*(1[0-2]|0?[1-9])\s*([AaBb])\s*$")
+# Musical key spellings from tags: "F#m", "Bb", "C major", "A minor", "bm", "Ebmin"
+_MUSICAL_KEY_RE = re.compile(
+    r"^\s*([A-G])\s*([#♯B♭]?)\s*(MAJOR|MAJ|MINOR|MIN|M)?\s*$", re.IGNORECASE
+)
+
+
+def to_camelot(key: str, scale: str) -> Optional[str]:
+    """Convert musical key to Camelot notation.
+
+    Args:
+        key: Musical key (e.g., "C", "F#")
+        scale: Scale type ("major" or "minor")
+
+    Returns:
+        Camelot code (e.g., "8A", "11B") or None if not found
+    """
+    musical_key = f"{key}m" if scale == "minor" else key
+    return CAMELOT_MAP.get(musical_key)
+
+
+def _normalize_key(value: str) -> Optional[str]:
+    """Spell a musical key the way CAMELOT_MAP does, e.g. "a minor" -> "Am"."""
+    match = _MUSICAL_KEY_RE.match(value)
+    if match is None:
+        return None
+    note, accidental, quality = match.groups()
+    accidental = {"♯": "#", "♭": "b", "B": "b"}.get(accidental, accidental)
+    minor = bool(quality) and quality.upper() in ("M", "MIN", "MINOR")
+    return f"{note.upper()}{accidental}{'m' if minor else ''}"
+
+
+def parse_camelot(value: Optional[str]) -> Optional[tuple[int, str]]:
+    """Parse a key tag into (number, letter), e.g. "8a" -> (8, "A").
+
+    Accepts Camelot codes as well as musical keys in any case, with short or
+    full quality names ("F#m", "Bb", "bm", "C major", "A minor").
+
+    Returns:
+        (1-12, "A" | "B"), or None if the value isn't a recognisable key
+    """
+    if not value:
+        return None
+    match = _CAMELOT_RE.match(value)
+    if match is None:
+        code = CAMELOT_MAP.get(_normalize_key(value) or "")
+        if code is None:
+            return None
+        match = _CAMELOT_RE.match(code)
+    return int(match.group(1)), match.group(2).upper()
@@ -0,0 +1,391 @@
+"""
+Library-wide audio analysis.
+
+Work comes from get_tracks_needing_audio_analysis(): every local track with
+a missing or stale result for one of the analyzers. Files are analyzed in a
+process pool sized to the machine's cores (the work is CPU-bound numpy and
+Essentia code); each worker decodes a file once and feeds every analyzer
+the track needs. Results are written in batched transactions, and detected
+BPM/key also fill in tracks whose tags have none. A worker crash restarts
+the pool; the files it took down are left for the next run.
+
+Runs in the foreground (``music-minion analyze-audio``) or as a single
+background job shared by the interactive CLI and the web backend.
+"""
+
+import itertools
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from music_minion.core.database import (
+    get_tracks_needing_audio_analysis,
+    save_audio_analysis_batch,
+)
+
+from .analyzers import ANALYZERS, KEY_CONFIDENCE_THRESHOLD
+from .decode import SAMPLE_RATE, DecodeError, decode_pcm, ffmpeg_path
+
+WRITE_BATCH_SIZE = 50
+
+# (features, error) per analyzer name
+FileResults = dict[str, tuple[Optional[dict[str, Any]], Optional[str]]]
+
+
+def analyze_file(path: str, names: list[str]) -> Optional[FileResults]:
+    """Decode a file once and run the named analyzers over it.
+
+    Args:
+        path: Audio file path
+        names: Analyzer names (keys of ANALYZERS)
+
+    Returns:
+        (features, error) per analyzer, or None if the file doesn't exist
+    """
+    if not os.path.exists(path):
+        return None
+
+    analyzers = {name: ANALYZERS[name](SAMPLE_RATE) for name in names}
+    errors: dict[str, str] = {}
+    try:
+        for chunk in decode_pcm(path):
+            for name, analyzer in analyzers.items():
+                if name in errors:
+                    continue
+                try:
+                    analyzer.feed(chunk)
+                except Exception as e:
+                    errors[name] = f"{type(e).__name__}: {e}"
+    except DecodeError as e:
+        return {name: (None, str(e)) for name in names}
+
+    results: FileResults = {}
+    for name, analyzer in analyzers.items():
+        if name in errors:
+            results[name] = (None, errors[name])
+            continue
+        try:
+            results[name] = (analyzer.result(), None)
+        except Exception as e:
+            results[name] = (None, f"{type(e).__name__}: {e}")
+    return results
+
+
+def _init_worker() -> None:
+    """Pool initializer: yield the CPU to the player, leave Ctrl+C to the parent."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        os.nice(10)
+    except OSError:
+        pass
+
+
+def _make_executor(workers: int) -> Executor:
+    # spawn: the web backend and the CLI are multi-threaded, so don't fork them
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+
+
+def resolve_analyzers(names: Optional[list[str]] = None) -> list[str]:
+    """Validate analyzer names and drop those whose dependencies are missing.
+
+    Args:
+        names: Analyzer names (default: all)
+
+    Returns:
+        Runnable analyzer names
+
+    Raises:
+        ValueError: Unknown analyzer name
+    """
+    names = list(names or ANALYZERS)
+    unknown = [name for name in names if name not in ANALYZERS]
+    if unknown:
+        raise ValueError(
+            f"Unknown analyzer(s): {', '.join(unknown)}. Available: {', '.join(ANALYZERS)}"
+        )
+    runnable = [name for name in names if ANALYZERS[name].available()]
+    for name in names:
+        if name not in runnable:
+            logger.warning(f"Audio analyzer '{name}' unavailable (missing dependency), skipping")
+    return runnable
+
+
+def analyze_library(
+    limit: Optional[int] = None,
+    workers: Optional[int] = None,
+    analyzers: Optional[list[str]] = None,
+    force: bool = False,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    stop_event: Optional[threading.Event] = None,
+) -> dict[str, Any]:
+    """Analyze every track with missing or outdated audio analysis.
+
+    Args:
+        limit: Optional maximum number of tracks
+        workers: Worker processes (default: one per core)
+        analyzers: Analyzer names to run (default: all available)
+        force: Re-analyze tracks whose results are current
+        progress_callback: Optional callback(done, total)
+        stop_event: When set, queued files are dropped; files being
+            analyzed finish and are saved
+
+    Returns:
+        Summary dict: total, analyzed, failed, missing, skipped,
+        bpm_filled, keys_filled, analyzers
+
+    Raises:
+        ValueError: Unknown analyzer name
+        DecodeError: ffmpeg is not installed
+    """
+    names = resolve_analyzers(analyzers)
+    summary: dict[str, Any] = {
+        "total": 0,
+        "analyzed": 0,
+        "failed": 0,
+        "missing": 0,
+        "skipped": 0,
+        "bpm_filled": 0,
+        "keys_filled": 0,
+        "analyzers": names,
+    }
+    if not names:
+        return summary
+    if not ffmpeg_path():
+        raise DecodeError("ffmpeg not found. Install: apt install ffmpeg")
+
+    versions = {name: ANALYZERS[name].version for name in names}
+    work = get_tracks_needing_audio_analysis(versions, limit=limit, force=force)
+    summary["total"] = len(work)
+    if not work:
+        return summary
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(work)))
+    logger.info(
+        f"Audio analysis: {len(work)} tracks, {workers} workers, analyzers: {', '.join(names)}"
+    )
+    started = time.perf_counter()
+
+    pending_results: list[tuple] = []
+    pending_fills: list[tuple[int, Optional[float], Optional[str]]] = []
+    done = 0
+
+    def flush() -> None:
+        if pending_results or pending_fills:
+            bpm_filled, keys_filled = save_audio_analysis_batch(pending_results, pending_fills)
+            summary["bpm_filled"] += bpm_filled
+            summary["keys_filled"] += keys_filled
+            pending_results.clear()
+            pending_fills.clear()
+
+    def record(track: dict[str, Any], results: Optional[FileResults]) -> None:
+        if results is None:
+            summary["missing"] += 1
+            return
+        for name, (features, error) in results.items():
+            pending_results.append(
+                (track["id"], name, versions[name], track["file_mtime"], features, error)
+            )
+        if any(error for _, error in results.values()):
+            summary["failed"] += 1
+        else:
+            summary["analyzed"] += 1
+
+        features = results.get("bpm_key", (None, None))[0]
+        if features:
+            strength = features.get("key_strength") or 0.0
+            key = features.get("key") if strength >= KEY_CONFIDENCE_THRESHOLD else None
+            if features.get("bpm") or key:
+                pending_fills.append((track["id"], features.get("bpm"), key))
+
+    executor = _make_executor(workers)
+    queue = iter(work)
+    futures: dict[Future, dict[str, Any]] = {}
+    pool_broken = False
+
+    def submit_next() -> bool:
+        nonlocal queue, pool_broken
+        track = next(queue, None)
+        if track is None:
+            return False
+        try:
+            futures[executor.submit(analyze_file, track["local_path"], track["analyzers"])] = track
+        except BrokenProcessPool:
+            queue = itertools.chain([track], queue)  # Resubmitted to the next pool
+            pool_broken = True
+            return False
+        return True
+
+    def collect(future: Future) -> None:
+        nonlocal done, pool_broken
+        track = futures.pop(future)
+        if future.cancelled():
+            summary["skipped"] += 1
+            return
+        try:
+            record(track, future.result())
+        except BrokenProcessPool as e:
+            # A worker died (e.g. a crash in native code, OOM kill) and took
+            # the pool down: leave the track unrecorded so the next run retries it
+            logger.warning(f"Audio analysis worker died on {track['local_path']}: {e}")
+            summary["failed"] += 1
+            pool_broken = True
+        except Exception as e:
+            logger.warning(f"Audio analysis failed on {track['local_path']}: {e}")
+            summary["failed"] += 1
+
+        done += 1
+        if progress_callback:
+            progress_callback(done, summary["total"])
+        if len(pending_results) >= WRITE_BATCH_SIZE:
+            flush()
+
+    try:
+        while True:
+            stopping = stop_event is not None and stop_event.is_set()
+            if pool_broken:
+                # Every file still in the dead pool fails with it
+                for future in wait(futures)[0]:
+                    collect(future)
+                flush()
+                executor.shutdown(wait=False)
+                if stopping:
+                    break
+                logger.info("Audio analysis: restarting worker pool")
+                executor = _make_executor(workers)
+                pool_broken = False
+
+            # A couple of files queued per worker keeps it busy while results are saved
+            while not stopping and len(futures) < 2 * workers and submit_next():
+                pass
+            if pool_broken:
+                continue
+            if not futures:
+                break
+
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                collect(future)
+
+            if stop_event is not None and stop_event.is_set():
+                for future in list(futures):
+                    if future.cancel():
+                        futures.pop(future)
+                        summary["skipped"] += 1
+
+        summary["skipped"] += sum(1 for _ in queue)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        flush()
+    logger.info(
+        f"Audio analysis: {summary['analyzed']} analyzed, {summary['failed']} failed, "
+        f"{summary['missing']} missing, {summary['skipped']} skipped, "
+        f"{summary['bpm_filled']} BPM / {summary['keys_filled']} keys filled "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return summary
+
+
+# Background job (one at a time per process)
+
+_job_lock = threading.Lock()
+_job_thread: Optional[threading.Thread] = None
+_job_stop = threading.Event()
+_job_state: Optional[dict[str, Any]] = None
+
+
+def _run_job(
+    options: dict[str, Any], on_complete: Optional[Callable[[dict[str, Any]], None]]
+) -> None:
+    threading.current_thread().silent_logging = True  # type: ignore[attr-defined]
+
+    def on_progress(done: int, total: int) -> None:
+        with _job_lock:
+            _job_state.update({"done": done, "total": total})
+
+    try:
+        summary = analyze_library(progress_callback=on_progress, stop_event=_job_stop, **options)
+        with _job_lock:
+            _job_state["summary"] = summary
+    except Exception as e:
+        logger.exception("Audio analysis job failed")
+        with _job_lock:
+            _job_state["error"] = str(e)
+    finally:
+        with _job_lock:
+            _job_state.update({"running": False, "finished_at": time.time()})
+            state = dict(_job_state)
+
+    if on_complete:
+        try:
+            on_complete(state)
+        except Exception:
+            logger.exception("Audio analysis completion callback failed")
+
+
+def start_analysis_job(
+    on_complete: Optional[Callable[[dict[str, Any]], None]] = None, **options: Any
+) -> bool:
+    """Start analyze_library() in a background thread.
+
+    Args:
+        on_complete: Optional callback(status) run when the job ends
+        **options: Keyword arguments for analyze_library()
+
+    Returns:
+        True if started, False if a job is already running
+    """
+    global _job_thread, _job_state
+    with _job_lock:
+        if _job_thread is not None and _job_thread.is_alive():
+            return False
+        _job_stop.clear()
+        _job_state = {
+            "running": True,
+            "done": 0,
+            "total": 0,
+            "summary": None,
+            "error": None,
+            "started_at": time.time(),
+            "finished_at": None,
+        }
+        _job_thread = threading.Thread(
+            target=_run_job, args=(options, on_complete), name="audio-analysis", daemon=True
+        )
+        _job_thread.start()
+    return True
+
+
+def get_analysis_job_status() -> Optional[dict[str, Any]]:
+    """Progress of the current or last background job (None if never run)."""
+    with _job_lock:
+        return dict(_job_state) if _job_state else None
+
+
+def stop_analysis_job(timeout: Optional[float] = None) -> bool:
+    """Ask the background job to stop after the files in progress.
+
+    Args:
+        timeout: Seconds to wait for it to finish (None: don't wait)
+
+    Returns:
+        True if a job was running
+    """
+    with _job_lock:
+        thread = _job_thread
+    if thread is None or not thread.is_alive():
+        return False
+    _job_stop.set()
+    if timeout is not None:
+        thread.join(timeout)
+    return True
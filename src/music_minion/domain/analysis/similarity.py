@@ -0,0 +1,446 @@
+"""
+Similar-track search over audio-feature vectors.
+
+Every track with a BPM, key, audio analysis results or tags gets one
+float32 vector made of blocks:
+
+- tempo: log2(BPM / 120), so a track is as far from half time as from
+  double time
+- key: Camelot wheel position as (cos, sin), plus major/minor
+- energy: loudness, loudness range, RMS, crest factor, log spectral
+  centroid and bass share
+- timbre: MFCC means and spreads
+- tags: tag embedding (TF-IDF over tag names reduced with truncated SVD)
+
+Columns are standardized, each block is scaled by weight/sqrt(width) so
+wide blocks don't drown out narrow ones, and rows are L2-normalized:
+cosine similarity is a dot product. A missing block stays at zero, the
+library average.
+
+The index is an inverted file (IVF): k-means partitions the vectors,
+each partition is stored contiguously, and a query scores only the
+NPROBE partitions whose centroids are nearest to the seed. Small
+libraries are searched exhaustively. Builds live next to the database
+(similarity/<build>/*.npy), are memory-mapped so every process shares
+one page-cached copy, and a ``current`` file names the build in use.
+
+A build records the filter_index_versions counters of the tables it was
+made from (schema v66). When they move, the next query starts a rebuild
+in the background and keeps answering from the previous build.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+import numpy as np
+from loguru import logger
+
+from music_minion.core import database
+from music_minion.core.database import get_audio_features, get_db_connection
+
+from .keys import parse_camelot
+
+DEFAULT_K = 20
+EXACT_SEARCH_MAX = 100_000  # Up to here a full scan takes ~1ms and is exact
+NPROBE = 16
+TAG_DIMENSIONS = 16
+REBUILD_INTERVAL_SECONDS = 60.0  # Debounce: analysis runs bump counters every batch
+
+# Counters (filter_index_versions) of the tables vectors are built from
+SOURCE_COMPONENTS = ("tracks", "analysis", "tags")
+
+BLOCK_WEIGHTS = {
+    "tempo": 1.0,
+    "key": 1.0,
+    "energy": 1.0,
+    "timbre": 1.5,
+    "tags": 1.0,
+}
+
+# (analyzer, feature, transform) per energy column
+ENERGY_FEATURES = (
+    ("loudness", "lufs", None),
+    ("loudness", "lra", None),
+    ("energy", "rms_db", None),
+    ("energy", "crest_db", None),
+    ("energy", "spectral_centroid", np.log),
+    ("energy", "bass_ratio", None),
+)
+MFCC_COEFFICIENTS = 13
+
+
+def _index_root() -> Path:
+    return database.get_database_path().parent / "similarity"
+
+
+def _read_versions(conn) -> dict[str, int]:
+    placeholders = ",".join("?" * len(SOURCE_COMPONENTS))
+    try:
+        rows = conn.execute(
+            f"SELECT component, version FROM filter_index_versions "
+            f"WHERE component IN ({placeholders})",
+            SOURCE_COMPONENTS,
+        ).fetchall()
+    except Exception:
+        return {}  # Pre-v63 schema: no change tracking
+    return {row[0]: row[1] for row in rows}
+
+
+def _standardize(block: np.ndarray) -> np.ndarray:
+    """Z-score each column over the tracks that have it; missing values become 0."""
+    present = ~np.isnan(block)
+    counts = present.sum(axis=0)
+    filled = np.where(present, block, 0.0)
+    mean = filled.sum(axis=0) / np.maximum(counts, 1)
+    variance = np.where(present, np.square(block - mean), 0.0).sum(axis=0) / np.maximum(counts, 1)
+    std = np.sqrt(variance)
+    std[std < 1e-9] = 1.0
+    return np.where(present, (block - mean) / std, 0.0)
+
+
+def _tag_block(track_ids: list[int], tags: dict[int, list[str]]) -> np.ndarray:
+    """Tag embeddings: TF-IDF over tag names, reduced to TAG_DIMENSIONS."""
+    block = np.full((len(track_ids), TAG_DIMENSIONS), np.nan)
+    tagged = [i for i, track_id in enumerate(track_ids) if tags.get(track_id)]
+    if len(tagged) < 2:
+        return block
+
+    from sklearn.decomposition import TruncatedSVD
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    matrix = TfidfVectorizer(analyzer=lambda names: names, sublinear_tf=True).fit_transform(
+        [tags[track_ids[i]] for i in tagged]
+    )
+    dimensions = min(TAG_DIMENSIONS, matrix.shape[1] - 1, len(tagged) - 1)
+    if dimensions < 1:
+        return block
+    embedded = TruncatedSVD(n_components=dimensions, random_state=0).fit_transform(matrix)
+    block[np.ix_(tagged, range(dimensions))] = embedded
+    return block
+
+
+def build_vectors() -> tuple[np.ndarray, np.ndarray, dict[str, int]]:
+    """Assemble the feature vector of every track that has any features.
+
+    Returns:
+        (track ids, L2-normalized float32 vectors, source versions)
+    """
+    with get_db_connection() as conn:
+        # Read the counters first: a change made while we read triggers a rebuild
+        versions = _read_versions(conn)
+        tracks = conn.execute("SELECT id, bpm, key_signature FROM tracks ORDER BY id").fetchall()
+        tags: dict[int, list[str]] = defaultdict(list)
+        for row in conn.execute(
+            "SELECT track_id, tag_name FROM tags WHERE COALESCE(blacklisted, 0) = 0"
+        ):
+            tags[row["track_id"]].append(row["tag_name"].lower())
+    features = {
+        name: get_audio_features(name) for name in ("bpm_key", "loudness", "energy", "timbre")
+    }
+
+    track_ids = [row["id"] for row in tracks]
+    n = len(track_ids)
+    tempo = np.full((n, 1), np.nan)
+    key = np.full((n, 3), np.nan)
+    energy = np.full((n, len(ENERGY_FEATURES)), np.nan)
+    timbre = np.full((n, 2 * MFCC_COEFFICIENTS), np.nan)
+
+    for i, row in enumerate(tracks):
+        track_id = row["id"]
+        detected = features["bpm_key"].get(track_id, {})
+        bpm = row["bpm"] or detected.get("bpm")
+        if bpm and bpm > 0:
+            tempo[i, 0] = np.log2(bpm / 120)
+        camelot = parse_camelot(row["key_signature"] or "") or parse_camelot(
+            detected.get("key") or ""
+        )
+        if camelot:
+            angle = 2 * np.pi * (camelot[0] - 1) / 12
+            key[i] = (np.cos(angle), np.sin(angle), 1.0 if camelot[1] == "B" else -1.0)
+        for j, (analyzer, name, transform) in enumerate(ENERGY_FEATURES):
+            value = features[analyzer].get(track_id, {}).get(name)
+            if value is not None and (transform is None or value > 0):
+                energy[i, j] = transform(value) if transform else value
+        mfcc = features["timbre"].get(track_id, {})
+        if mfcc.get("mfcc_mean") and mfcc.get("mfcc_std"):
+            timbre[i] = mfcc["mfcc_mean"] + mfcc["mfcc_std"]
+
+    blocks = {
+        "tempo": tempo,
+        "key": key,  # Already unit scale; standardizing would distort the wheel
+        "energy": energy,
+        "timbre": timbre,
+        "tags": _tag_block(track_ids, tags),
+    }
+    has_features = np.zeros(n, dtype=bool)
+    scaled = []
+    for name, block in blocks.items():
+        has_features |= ~np.isnan(block).all(axis=1)
+        values = np.nan_to_num(block) if name == "key" else _standardize(block)
+        scaled.append(values * (BLOCK_WEIGHTS[name] / np.sqrt(block.shape[1])))
+
+    vectors = np.hstack(scaled).astype(np.float32)
+    norms = np.linalg.norm(vectors, axis=1)
+    keep = has_features & (norms > 1e-6)
+    vectors = vectors[keep] / norms[keep, None]
+    return np.asarray(track_ids, dtype=np.int64)[keep], vectors, versions
+
+
+def _partition(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """k-means partitions for IVF search: (centroids, label per vector)."""
+    if len(vectors) <= EXACT_SEARCH_MAX:
+        return np.zeros((1, vectors.shape[1]), dtype=np.float32), np.zeros(len(vectors), dtype=np.int64)
+
+    from sklearn.cluster import MiniBatchKMeans
+
+    lists = int(np.sqrt(len(vectors)))
+    kmeans = MiniBatchKMeans(
+        n_clusters=lists, batch_size=4096, n_init=1, random_state=0
+    ).fit(vectors)
+    centroids = kmeans.cluster_centers_.astype(np.float32)
+    return centroids, _nearest_lists(vectors, centroids, 1)[:, 0]
+
+
+def _nearest_lists(vectors: np.ndarray, centroids: np.ndarray, count: int) -> np.ndarray:
+    # argmin |v - c|^2 == argmax (v.c - |c|^2 / 2)
+    scores = vectors @ centroids.T - 0.5 * np.einsum("ij,ij->i", centroids, centroids)
+    if count >= len(centroids):
+        return np.argsort(-scores, axis=1)
+    top = np.argpartition(-scores, count - 1, axis=1)[:, :count]
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+_build_lock = threading.RLock()
+
+
+def build_similarity_index() -> dict[str, Any]:
+    """Build the vectors and IVF partitions and make them the current index.
+
+    Returns:
+        Build metadata: build, count, dimensions, lists, versions,
+        built_at, seconds
+    """
+    with _build_lock:
+        started = time.perf_counter()
+        track_ids, vectors, versions = build_vectors()
+        centroids, labels = _partition(vectors)
+        order = np.argsort(labels, kind="stable")
+        offsets = np.searchsorted(labels[order], np.arange(len(centroids) + 1))
+
+        root = _index_root()
+        build = f"{time.time_ns()}-{os.getpid()}"
+        path = root / build
+        path.mkdir(parents=True)
+        np.save(path / "vectors.npy", vectors[order])
+        np.save(path / "ids.npy", track_ids[order])
+        np.save(path / "centroids.npy", centroids)
+        np.save(path / "offsets.npy", offsets.astype(np.int64))
+        meta = {
+            "build": build,
+            "count": len(track_ids),
+            "dimensions": int(vectors.shape[1]),
+            "lists": len(centroids),
+            "versions": versions,
+            "built_at": time.time(),
+            "seconds": round(time.perf_counter() - started, 2),
+        }
+        (path / "meta.json").write_text(json.dumps(meta))
+
+        pointer = root / f"current.{os.getpid()}.tmp"
+        pointer.write_text(build)
+        os.replace(pointer, root / "current")
+
+        # Keep the previous build for readers that resolved `current` just now
+        builds = sorted((entry for entry in root.iterdir() if entry.is_dir()), key=lambda p: p.name)
+        for old in builds[:-2]:
+            shutil.rmtree(old, ignore_errors=True)
+
+    logger.info(
+        f"Similarity index: {meta['count']} tracks, {meta['lists']} lists "
+        f"in {meta['seconds']:.2f}s"
+    )
+    return meta
+
+
+class SimilarityIndex:
+    """A loaded (memory-mapped) index build."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.meta: dict[str, Any] = json.loads((path / "meta.json").read_text())
+        self.vectors = np.load(path / "vectors.npy", mmap_mode="r")
+        self.ids = np.load(path / "ids.npy")
+        self.centroids = np.load(path / "centroids.npy")
+        self.offsets = np.load(path / "offsets.npy")
+        self._sorted = np.argsort(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def positions(self, track_ids: Iterable[int]) -> np.ndarray:
+        """Row positions of the given tracks (tracks not indexed are dropped)."""
+        wanted = np.fromiter(track_ids, dtype=np.int64)
+        if not len(self.ids) or not len(wanted):
+            return np.zeros(0, dtype=np.int64)
+        found = np.searchsorted(self.ids, wanted, sorter=self._sorted)
+        found = np.minimum(found, len(self.ids) - 1)
+        positions = self._sorted[found]
+        return positions[self.ids[positions] == wanted]
+
+    def search(
+        self,
+        seed_id: int,
+        k: int = DEFAULT_K,
+        exclude: Optional[Iterable[int]] = None,
+        within: Optional[Iterable[int]] = None,
+    ) -> list[tuple[int, float]]:
+        """Nearest tracks to a seed track by cosine similarity.
+
+        Args:
+            seed_id: Seed track ID
+            k: Maximum number of results
+            exclude: Track IDs never to return (the seed never is)
+            within: Restrict results to these track IDs (searched exactly)
+
+        Returns:
+            (track_id, similarity) pairs, most similar first; empty if the
+            seed has no features
+        """
+        seed = self.positions([seed_id])
+        if not len(seed) or k <= 0:
+            return []
+        query = np.array(self.vectors[seed[0]])
+        excluded = np.fromiter(exclude or (), dtype=np.int64)
+        excluded = np.append(excluded, seed_id)
+
+        if within is not None:
+            positions = np.sort(self.positions(within))
+            return self._top(positions, query, excluded, k)
+
+        lists = len(self.centroids)
+        probe = lists if lists == 1 else min(NPROBE, lists)
+        ranked = _nearest_lists(query[None, :], self.centroids, lists)[0]
+        while True:
+            chosen = np.sort(ranked[:probe])
+            positions = np.concatenate(
+                [np.arange(self.offsets[i], self.offsets[i + 1]) for i in chosen]
+            )
+            # Heavy exclusions can empty the probed lists: widen until k fit
+            if probe >= lists or len(positions) >= k + len(excluded):
+                return self._top(positions, query, excluded, k)
+            probe *= 2
+
+    def _top(
+        self, positions: np.ndarray, query: np.ndarray, excluded: np.ndarray, k: int
+    ) -> list[tuple[int, float]]:
+        if not len(positions):
+            return []
+        ids = self.ids[positions]
+        scores = self.vectors[positions] @ query
+        scores[np.isin(ids, excluded)] = -np.inf
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(ids[i]), round(float(scores[i]), 4)) for i in top if scores[i] > -np.inf]
+
+
+# Process-wide loaded build, swapped when another build becomes current
+
+_lock = threading.Lock()
+_index: Optional[SimilarityIndex] = None
+_rebuild_thread: Optional[threading.Thread] = None
+
+
+def _current_build(root: Path) -> Optional[Path]:
+    try:
+        return root / (root / "current").read_text().strip()
+    except OSError:
+        return None
+
+
+def _rebuild_in_background() -> None:
+    threading.current_thread().silent_logging = True  # type: ignore[attr-defined]
+    try:
+        build_similarity_index()
+    except Exception:
+        logger.exception("Similarity index rebuild failed")
+
+
+def _start_rebuild() -> None:
+    global _rebuild_thread
+    with _lock:
+        if _rebuild_thread is not None and _rebuild_thread.is_alive():
+            return
+        _rebuild_thread = threading.Thread(
+            target=_rebuild_in_background, name="similarity-index", daemon=True
+        )
+        _rebuild_thread.start()
+
+
+def _is_stale(index: SimilarityIndex) -> bool:
+    if time.time() - index.meta["built_at"] < REBUILD_INTERVAL_SECONDS:
+        return False
+    with get_db_connection() as conn:
+        return _read_versions(conn) != index.meta["versions"]
+
+
+def get_similarity_index() -> SimilarityIndex:
+    """The current index, building it on first use.
+
+    A stale index is returned as is while a rebuild runs in the background.
+    """
+    global _index
+    root = _index_root()
+    with _lock:
+        path = _current_build(root)
+        if path is None or (_index is not None and _index.path != path):
+            _index = None
+        if _index is None and path is not None:
+            try:
+                _index = SimilarityIndex(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Similarity index at {path} unreadable ({e}), rebuilding")
+        index = _index
+
+    if index is None:
+        with _build_lock:  # Another thread may have built it meanwhile
+            path = _current_build(root)
+            if path is None or not path.exists():
+                path = root / build_similarity_index()["build"]
+            index = SimilarityIndex(path)
+        with _lock:
+            _index = index
+        return index
+    if _is_stale(index):
+        _start_rebuild()
+    return index
+
+
+def similar_tracks(
+    seed_id: int,
+    k: int = DEFAULT_K,
+    exclude: Optional[Iterable[int]] = None,
+    within: Optional[Iterable[int]] = None,
+) -> list[tuple[int, float]]:
+    """Tracks that sound most like a seed track.
+
+    Args:
+        seed_id: Seed track ID
+        k: Maximum number of results
+        exclude: Track IDs never to return (the seed never is)
+        within: Restrict results to these track IDs
+
+    Returns:
+        (track_id, similarity) pairs, most similar first; empty if the
+        seed has no features yet
+    """
+    return get_similarity_index().search(seed_id, k, exclude=exclude, within=within)
@@ -0,0 +1,101 @@
+"""
+Cover art helpers shared by the web artwork cache and the backfill script.
+
+Reads embedded pictures with Mutagen's own parsers (including the FLAC
+picture block inside Ogg metadata_block_picture) and fetches SoundCloud
+artwork at full resolution.
+"""
+
+import base64
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+
+
+def read_embedded_art(file_path: str) -> Optional[bytes]:
+    """Return the first embedded cover image in an audio file, if any.
+
+    Args:
+        file_path: Path to an mp3/ogg/opus/m4a/aac/mp4/flac file
+
+    Returns:
+        Raw image bytes, or None if the file has no art or cannot be read
+    """
+    suffix = Path(file_path).suffix.lower()
+
+    try:
+        if suffix == ".mp3":
+            from mutagen.id3 import ID3, ID3NoHeaderError
+
+            try:
+                tags = ID3(file_path)
+            except ID3NoHeaderError:
+                return None
+            pictures = tags.getall("APIC")
+            return pictures[0].data if pictures else None
+
+        elif suffix in (".ogg", ".opus"):
+            from mutagen.flac import Picture
+            from mutagen.oggopus import OggOpus
+            from mutagen.oggvorbis import OggVorbis
+
+            loader = OggOpus if suffix == ".opus" else OggVorbis
+            blocks = (loader(file_path).tags or {}).get("metadata_block_picture")
+            return Picture(base64.b64decode(blocks[0])).data if blocks else None
+
+        elif suffix in (".m4a", ".aac", ".mp4"):
+            from mutagen.mp4 import MP4
+
+            audio = MP4(file_path)
+            covers = audio.tags.get("covr") if audio.tags else None
+            return bytes(covers[0]) if covers else None
+
+        elif suffix == ".flac":
+            from mutagen.flac import FLAC
+
+            pictures = FLAC(file_path).pictures
+            return pictures[0].data if pictures else None
+
+        # WAV and unknown formats carry no standard cover art
+        return None
+
+    except Exception as exc:
+        logger.warning(f"Could not read cover art for {file_path}: {exc}")
+        return None
+
+
+def has_embedded_art(file_path: str) -> bool:
+    """Return True if the audio file already has embedded cover art."""
+    return read_embedded_art(file_path) is not None
+
+
+def upgrade_artwork_url(url: str) -> str:
+    """Replace -large suffix with -t500x500 for full-resolution art."""
+    return url.replace("-large.", "-t500x500.")
+
+
+def download_image(url: str) -> Optional[bytes]:
+    """Download image bytes from a URL."""
+    import requests
+
+    try:
+        resp = requests.get(url, timeout=30)
+        resp.raise_for_status()
+        content_type = resp.headers.get("Content-Type", "")
+        if "image" not in content_type:
+            logger.warning(f"Unexpected content-type '{content_type}' for {url}")
+        return resp.content
+    except Exception as exc:
+        logger.warning(f"Image download failed for {url}: {exc}")
+        return None
+
+
+def download_artwork(artwork_url: str) -> Optional[bytes]:
+    """Download SoundCloud artwork, preferring the 500x500 variant."""
+    hq_url = upgrade_artwork_url(artwork_url)
+    img_bytes = download_image(hq_url)
+    if not img_bytes and hq_url != artwork_url:
+        # Fall back to original URL in case -large isn't in it
+        img_bytes = download_image(artwork_url)
+    return img_bytes
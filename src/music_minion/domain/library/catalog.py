@@ -0,0 +1,288 @@
+"""
+Persistent catalog of the music files under the library paths.
+
+One row per file: (path, device, inode, size, mtime, content_hash,
+twin_key). The scanner, the library watcher and its reconciliation pass
+keep it current; a file is only re-fingerprinted when its stat signature
+changes, and a rename (same device/inode/size/mtime) reuses the old hash.
+
+With the catalog in place, questions that used to need a filesystem-wide
+glob and fuzzy name matching become indexed lookups:
+
+- moved files: the content hash a missing path had vs. untracked files
+- duplicate files: rows sharing a content hash
+- format twins (e.g. an .opus transcode next to its .mp3): rows sharing a
+  twin_key, the path without its extension. Transcodes have different
+  bytes, so they are matched by location rather than by hash.
+"""
+
+import os
+from typing import Iterable, Optional
+
+from loguru import logger
+
+from music_minion.core.database import get_db_connection
+
+from .fingerprint import content_fingerprint
+
+_CHUNK = 500  # Parameters per IN (...) query
+
+
+def twin_key(path: str) -> str:
+    """Path without its extension, shared by format twins."""
+    return os.path.splitext(path)[0]
+
+
+def _chunks(items: list, size: int = _CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def refresh_catalog(paths: Iterable[str]) -> dict[str, int]:
+    """Record current stat signatures and fingerprints for files.
+
+    Args:
+        paths: Files to (re)catalog; unreadable ones are skipped
+
+    Returns:
+        Stats dict: {'hashed', 'renamed', 'unchanged', 'failed'}
+    """
+    stats = {"hashed": 0, "renamed": 0, "unchanged": 0, "failed": 0}
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return stats
+
+    updates = []
+    with get_db_connection() as conn:
+        known: dict[str, tuple] = {}
+        for chunk in _chunks(paths):
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT path, device, inode, size, mtime FROM file_catalog WHERE path IN ({placeholders})",
+                chunk,
+            ):
+                known[row["path"]] = tuple(row)[1:]
+
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                stats["failed"] += 1
+                continue
+            signature = (st.st_dev, st.st_ino, st.st_size, st.st_mtime)
+            if known.get(path) == signature:
+                stats["unchanged"] += 1
+                continue
+            # Renamed or hard-linked: same inode, untouched since it was hashed
+            row = conn.execute(
+                """
+                SELECT content_hash FROM file_catalog
+                WHERE device = ? AND inode = ? AND size = ? AND mtime = ?
+                LIMIT 1
+                """,
+                signature,
+            ).fetchone()
+            if row:
+                content_hash = row["content_hash"]
+                stats["renamed"] += 1
+            else:
+                content_hash = content_fingerprint(path)
+                if content_hash is None:
+                    stats["failed"] += 1
+                    continue
+                stats["hashed"] += 1
+            updates.append((path, *signature, content_hash, twin_key(path)))
+
+    if updates:
+        with get_db_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO file_catalog
+                    (path, device, inode, size, mtime, content_hash, twin_key, cataloged_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(path) DO UPDATE SET
+                    device = excluded.device,
+                    inode = excluded.inode,
+                    size = excluded.size,
+                    mtime = excluded.mtime,
+                    content_hash = excluded.content_hash,
+                    twin_key = excluded.twin_key,
+                    cataloged_at = excluded.cataloged_at
+                """,
+                updates,
+            )
+            conn.commit()
+    if stats["hashed"]:
+        logger.debug(f"Catalog: fingerprinted {stats['hashed']} file(s)")
+    return stats
+
+
+def rename_in_catalog(src: str, dest: str, is_directory: bool = False) -> int:
+    """Follow a move without re-fingerprinting.
+
+    Returns:
+        Number of catalog rows moved
+    """
+    with get_db_connection() as conn:
+        conn.execute("DELETE FROM file_catalog WHERE path = ?", (dest,))
+        if is_directory:
+            src_prefix = src.rstrip(os.sep) + os.sep
+            dest_prefix = dest.rstrip(os.sep) + os.sep
+            cursor = conn.execute(
+                """
+                UPDATE OR REPLACE file_catalog
+                SET path = ? || substr(path, ?),
+                    twin_key = ? || substr(twin_key, ?)
+                WHERE substr(path, 1, ?) = ?
+                """,
+                (
+                    dest_prefix, len(src_prefix) + 1,
+                    dest_prefix, len(src_prefix) + 1,
+                    len(src_prefix), src_prefix,
+                ),
+            )
+        else:
+            cursor = conn.execute(
+                "UPDATE OR REPLACE file_catalog SET path = ?, twin_key = ? WHERE path = ?",
+                (dest, twin_key(dest), src),
+            )
+        conn.commit()
+        return cursor.rowcount
+
+
+def forget_paths(paths: Iterable[str]) -> int:
+    """Drop catalog rows for files that are gone for good."""
+    paths = list(paths)
+    removed = 0
+    with get_db_connection() as conn:
+        for chunk in _chunks(paths):
+            placeholders = ",".join("?" * len(chunk))
+            removed += conn.execute(
+                f"DELETE FROM file_catalog WHERE path IN ({placeholders})", chunk
+            ).rowcount
+        conn.commit()
+    return removed
+
+
+def prune_catalog(present: set[str], roots: list[str]) -> int:
+    """Drop rows under the given roots whose files were not found.
+
+    Args:
+        present: Every file currently under the roots
+        roots: Library directories that were fully walked
+
+    Returns:
+        Number of rows removed
+    """
+    prefixes = tuple(root.rstrip(os.sep) + os.sep for root in roots)
+    with get_db_connection() as conn:
+        stale = [
+            row["path"]
+            for row in conn.execute("SELECT path FROM file_catalog")
+            if row["path"].startswith(prefixes) and row["path"] not in present
+        ]
+    return forget_paths(stale)
+
+
+def fingerprints_for(paths: Iterable[str]) -> dict[str, str]:
+    """Last recorded content hash for each cataloged path."""
+    paths = list(paths)
+    result: dict[str, str] = {}
+    with get_db_connection() as conn:
+        for chunk in _chunks(paths):
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT path, content_hash FROM file_catalog WHERE path IN ({placeholders})",
+                chunk,
+            ):
+                result[row["path"]] = row["content_hash"]
+    return result
+
+
+def match_moved_files(
+    missing_paths: Iterable[str], candidate_paths: Iterable[str]
+) -> dict[str, list[str]]:
+    """Find where missing files went, by the content hash they were cataloged with.
+
+    Args:
+        missing_paths: Paths that no longer exist (their catalog rows are stale)
+        candidate_paths: Untracked files that could be their new location
+
+    Returns:
+        Dictionary mapping each missing path with a match to its candidates
+    """
+    old_hashes = fingerprints_for(missing_paths)
+    if not old_hashes:
+        return {}
+    candidates = set(candidate_paths)
+
+    by_hash: dict[str, list[str]] = {}
+    hashes = list(set(old_hashes.values()))
+    with get_db_connection() as conn:
+        for chunk in _chunks(hashes):
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT path, content_hash FROM file_catalog WHERE content_hash IN ({placeholders})",
+                chunk,
+            ):
+                if row["path"] in candidates:
+                    by_hash.setdefault(row["content_hash"], []).append(row["path"])
+
+    return {
+        path: sorted(by_hash[content_hash])
+        for path, content_hash in old_hashes.items()
+        if content_hash in by_hash
+    }
+
+
+def find_duplicate_files(roots: Optional[list[str]] = None) -> list[list[str]]:
+    """Groups of cataloged files with identical audio content.
+
+    Args:
+        roots: Only consider files under these directories (default: all)
+
+    Returns:
+        Lists of paths (sorted), one per content hash seen more than once
+    """
+    with get_db_connection() as conn:
+        rows = conn.execute(
+            """
+            SELECT path, content_hash FROM file_catalog
+            WHERE content_hash IN (
+                SELECT content_hash FROM file_catalog
+                GROUP BY content_hash HAVING COUNT(*) > 1
+            )
+            ORDER BY content_hash, path
+            """
+        ).fetchall()
+
+    prefixes = tuple(root.rstrip(os.sep) + os.sep for root in roots) if roots else None
+    groups: dict[str, list[str]] = {}
+    for row in rows:
+        if prefixes is None or row["path"].startswith(prefixes):
+            groups.setdefault(row["content_hash"], []).append(row["path"])
+    return [paths for paths in groups.values() if len(paths) > 1]
+
+
+def find_twins(paths: Iterable[str], suffix: str) -> dict[str, str]:
+    """Cataloged files next to the given ones with the same name but another format.
+
+    Args:
+        paths: Files to find twins for
+        suffix: Extension of the twin, e.g. ".mp3"
+
+    Returns:
+        Dictionary mapping each path with a twin to the twin's path
+    """
+    keys: dict[str, str] = {twin_key(path): path for path in paths}
+    result: dict[str, str] = {}
+    with get_db_connection() as conn:
+        for chunk in _chunks(list(keys)):
+            placeholders = ",".join("?" * len(chunk))
+            for row in conn.execute(
+                f"SELECT path, twin_key FROM file_catalog WHERE twin_key IN ({placeholders})",
+                chunk,
+            ):
+                if row["path"].lower().endswith(suffix.lower()):
+                    result[keys[row["twin_key"]]] = row["path"]
+    return result
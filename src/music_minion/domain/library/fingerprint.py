@@ -0,0 +1,200 @@
+"""
+Tag-independent content fingerprints for audio files.
+
+A fingerprint hashes a few samples of a file's audio payload (its start,
+middle and end) together with the payload length, skipping the container's
+tag blocks: ID3v2/ID3v1/APEv2 in MP3, metadata blocks in FLAC, header pages
+and page framing in Ogg (Opus/Vorbis), everything but ``mdat`` in MP4 and
+everything but the ``data`` chunk in WAV. Retagging a file or embedding
+artwork leaves its fingerprint unchanged; re-encoding changes it.
+
+Reads at most ~3 * SAMPLE_BYTES per file, so fingerprinting a large library
+is bounded by seeks rather than file sizes.
+"""
+
+import hashlib
+import os
+import struct
+from typing import BinaryIO, Optional
+
+SAMPLE_BYTES = 16 * 1024
+
+
+def _skip_id3v2(f: BinaryIO, offset: int) -> int:
+    """Offset just past any ID3v2 tags starting at offset."""
+    while True:
+        f.seek(offset)
+        header = f.read(10)
+        if len(header) < 10 or header[:3] != b"ID3":
+            return offset
+        size = (
+            (header[6] & 0x7F) << 21
+            | (header[7] & 0x7F) << 14
+            | (header[8] & 0x7F) << 7
+            | (header[9] & 0x7F)
+        )
+        footer = 10 if header[5] & 0x10 else 0
+        offset += 10 + size + footer
+
+
+def _trailing_tags_start(f: BinaryIO, start: int, end: int) -> int:
+    """Offset where ID3v1/APEv2 tags at the end of an MP3 begin."""
+    if end - start >= 128:
+        f.seek(end - 128)
+        if f.read(3) == b"TAG":
+            end -= 128
+    if end - start >= 32:
+        f.seek(end - 32)
+        footer = f.read(32)
+        if footer[:8] == b"APETAGEX":
+            tag_size, _items, flags = struct.unpack("<III", footer[12:24])
+            has_header = flags & 0x80000000
+            end -= tag_size + (32 if has_header else 0)
+    return max(start, end)
+
+
+def _flac_audio_start(f: BinaryIO, offset: int) -> int:
+    f.seek(offset + 4)  # "fLaC"
+    position = offset + 4
+    while True:
+        header = f.read(4)
+        if len(header) < 4:
+            return position
+        length = int.from_bytes(header[1:4], "big")
+        position += 4 + length
+        if header[0] & 0x80:  # Last metadata block
+            return position
+        f.seek(position)
+
+
+def _riff_data_range(f: BinaryIO, size: int) -> Optional[tuple[int, int]]:
+    position = 12
+    while position + 8 <= size:
+        f.seek(position)
+        chunk_id, chunk_size = struct.unpack("<4sI", f.read(8))
+        if chunk_id == b"data":
+            return position + 8, min(size, position + 8 + chunk_size)
+        position += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _mp4_mdat_range(f: BinaryIO, size: int) -> Optional[tuple[int, int]]:
+    best: Optional[tuple[int, int]] = None
+    position = 0
+    while position + 8 <= size:
+        f.seek(position)
+        box_size, box_type = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if box_size == 1:
+            box_size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif box_size == 0:
+            box_size = size - position
+        if box_size < header:
+            break
+        if box_type == b"mdat" and (best is None or box_size - header > best[1] - best[0]):
+            best = (position + header, min(size, position + box_size))
+        position += box_size
+    return best
+
+
+def _payload_range(f: BinaryIO, size: int) -> tuple[int, int]:
+    """Byte range holding the audio of a non-Ogg file."""
+    f.seek(0)
+    head = f.read(12)
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return _riff_data_range(f, size) or (0, size)
+    if head[4:8] == b"ftyp":
+        return _mp4_mdat_range(f, size) or (0, size)
+
+    start = _skip_id3v2(f, 0)
+    f.seek(start)
+    if f.read(4) == b"fLaC":
+        return _flac_audio_start(f, start), size
+    return start, _trailing_tags_start(f, start, size)
+
+
+def _ogg_pages(f: BinaryIO, offset: int, end: int, read_payload: bool = True):
+    """Yield (offset, granule, payload) for Ogg pages from the first sync at offset.
+
+    With read_payload=False the payload is b"" and only page headers are read.
+    """
+    f.seek(offset)
+    window = f.read(min(end - offset, 64 * 1024))
+    sync = window.find(b"OggS")
+    if sync < 0:
+        return
+    position = offset + sync
+    while position + 27 <= end:
+        f.seek(position)
+        header = f.read(27)
+        if header[:4] != b"OggS":
+            return
+        granule = struct.unpack("<q", header[6:14])[0]
+        segments = f.read(header[26])
+        payload_size = sum(segments)
+        yield position, granule, f.read(payload_size) if read_payload else b""
+        position += 27 + len(segments) + payload_size
+
+
+def _ogg_fingerprint(f: BinaryIO, size: int, digest) -> None:
+    """Hash Ogg page payloads, skipping header pages and page framing.
+
+    Page headers carry sequence numbers and CRCs that shift when a longer
+    comment header adds pages, so only payloads are hashed.
+    """
+    audio_start = size
+    for position, granule, _payload in _ogg_pages(f, 0, size, read_payload=False):
+        if granule != 0:  # Header pages (OpusHead/OpusTags, Vorbis headers) are granule 0
+            audio_start = position
+            break
+
+    length = size - audio_start
+    digest.update(length.to_bytes(8, "little"))
+    for offset in (audio_start, audio_start + length // 2):
+        collected = 0
+        for _position, _granule, payload in _ogg_pages(f, offset, size):
+            digest.update(payload)
+            collected += len(payload)
+            if collected >= SAMPLE_BYTES:
+                break
+    # The tail runs to end of file
+    for _position, _granule, payload in _ogg_pages(f, max(audio_start, size - SAMPLE_BYTES), size):
+        digest.update(payload)
+
+
+def content_fingerprint(path: str) -> Optional[str]:
+    """Fingerprint the audio content of a file, ignoring its tags.
+
+    Args:
+        path: Audio file path
+
+    Returns:
+        Hex digest, or None if the file can't be read
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            if f.read(4) == b"OggS":
+                _ogg_fingerprint(f, size, digest)
+                return digest.hexdigest()
+
+            try:
+                start, end = _payload_range(f, size)
+            except (struct.error, ValueError):
+                start, end = 0, size
+            length = end - start
+            digest.update(length.to_bytes(8, "little"))
+            if length <= 3 * SAMPLE_BYTES:
+                offsets = [start]
+                sample = length
+            else:
+                offsets = [start, start + (length - SAMPLE_BYTES) // 2, end - SAMPLE_BYTES]
+                sample = SAMPLE_BYTES
+            for offset in offsets:
+                f.seek(offset)
+                digest.update(f.read(sample))
+    except OSError:
+        return None
+    return digest.hexdigest()
@@ -49,6 +49,42 @@ def _get_folder_tracks(folder_path: Path) -> list[dict]:
         return [dict(row) for row in cursor.fetchall()]
 
 
+def _get_twin_tracks(opus_files: list[Path]) -> dict[str, dict]:
+    """Tier 0: MP3 tracks cataloged next to an opus file under the same name.
+
+    An indexed lookup in the file catalog, independent of album tags.
+
+    Args:
+        opus_files: Opus files to find twins for
+
+    Returns:
+        Dict mapping opus path to the twin's track dict
+    """
+    from .catalog import find_twins
+
+    twins = find_twins([str(f) for f in opus_files], ".mp3")
+    if not twins:
+        return {}
+
+    placeholders = ",".join("?" * len(twins))
+    with database.get_db_connection() as conn:
+        cursor = conn.execute(
+            f"""
+            SELECT id, title, artist, album, local_path
+            FROM tracks
+            WHERE local_path IN ({placeholders})
+            """,
+            list(twins.values()),
+        )
+        by_path = {row["local_path"]: dict(row) for row in cursor.fetchall()}
+
+    return {
+        opus_path: by_path[mp3_path]
+        for opus_path, mp3_path in twins.items()
+        if mp3_path in by_path
+    }
+
+
 def _match_tier1_filename(opus_stem: str, tracks: list[dict]) -> list[dict]:
     """Tier 1: Exact filename stem match.
 
@@ -244,6 +280,7 @@ def locate_opus_replacements(
     Searches for .opus files in the specified folder and attempts to match
     them to existing MP3 tracks in the database using tiered matching:
 
+    0. MP3 twin at the same path (file catalog lookup)
     1. Exact filename stem match
     2. Exact title match (case-insensitive)
     3. Fuzzy title match (TF-IDF, 85% threshold)
@@ -277,8 +314,9 @@ def locate_opus_replacements(
     logger.info(
         f"Found {len(mp3_tracks)} MP3 tracks in database for album '{folder.name}'"
     )
+    twin_tracks = _get_twin_tracks(opus_files)
 
-    if not mp3_tracks:
+    if not mp3_tracks and not twin_tracks:
         # All opus files are "no match" since there are no MP3 tracks
         no_match = [
             {
@@ -306,6 +344,26 @@ def locate_opus_replacements(
             "opus_stem": opus_stem,
         }
 
+        # Tier 0: Cataloged MP3 twin
+        twin = twin_tracks.get(str(opus_path))
+        if twin:
+            result_info["matched_track_id"] = twin["id"]
+            result_info["matched_title"] = twin.get("title")
+            result_info["matched_path"] = twin.get("local_path")
+            result_info["match_tier"] = 0
+            result_info["match_reason"] = "catalog_twin"
+
+            if not dry_run:
+                if _update_track_path(twin["id"], str(opus_path)):
+                    result_info["status"] = "updated"
+                else:
+                    result_info["status"] = "update_failed"
+            else:
+                result_info["status"] = "dry_run"
+
+            updated.append(result_info)
+            continue
+
         # Tier 1: Exact filename match
         tier1_matches = _match_tier1_filename(opus_stem, mp3_tracks)
 
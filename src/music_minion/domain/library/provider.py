@@ -93,6 +93,11 @@ class LibraryProvider(Protocol):
             # Fetch tracks from API...
             tracks = [("track_id_123", {"title": "Song", "artist": "Artist"})]
             return state.with_sync_time(), tracks
+
+    A provider may also define ingest_library(state, incremental,
+    progress_callback) -> (new_state, stats) that writes tracks to the
+    database as pages stream in; library sync then uses it instead of
+    sync_library.
     """
 
     def init_provider(config: ProviderConfig) -> ProviderState:
@@ -4,6 +4,7 @@ Music library provider registry.
 Provides access to all available provider modules.
 """
 
+import importlib
 from typing import Any, List
 
 # Provider registry will be populated as providers are implemented
@@ -17,7 +18,8 @@ def register_provider(name: str, provider_module: Any) -> None:
 
     Args:
         name: Provider name (e.g., 'local', 'soundcloud')
-        provider_module: Module implementing LibraryProvider protocol
+        provider_module: Module implementing LibraryProvider protocol, or its
+            dotted import path to import on first get_provider() call
     """
     PROVIDERS[name] = provider_module
 
@@ -40,7 +42,11 @@ def get_provider(name: str) -> Any:
             f"Unknown provider: '{name}'. "
             f"Available providers: {', '.join(available) if available else 'none'}"
         )
-    return PROVIDERS[name]
+    provider = PROVIDERS[name]
+    if isinstance(provider, str):
+        # Registered by path: import on first use (keeps requests off startup)
+        provider = PROVIDERS[name] = importlib.import_module(provider)
+    return provider
 
 
 def list_providers() -> List[str]:
@@ -64,9 +70,14 @@ def provider_exists(name: str) -> bool:
     return name in PROVIDERS
 
 
-# Import and register providers as they are implemented
-from . import local, soundcloud, spotify
+# Register providers by import path; each module is imported when first requested
+register_provider("local", f"{__name__}.local")
+register_provider("soundcloud", f"{__name__}.soundcloud")
+register_provider("spotify", f"{__name__}.spotify")
 
-register_provider("local", local)
-register_provider("soundcloud", soundcloud)
-register_provider("spotify", spotify)
+
+def __getattr__(name: str) -> Any:
+    """Import provider subpackages on attribute access (providers.soundcloud)."""
+    if name in PROVIDERS:
+        return get_provider(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,9 +5,7 @@ Implements OAuth 2.0 authentication and API access for SoundCloud.
 Adapted from soundcloud-discovery project.
 """
 
-from typing import Tuple
-
-from ...provider import ProviderConfig, ProviderState, TrackList
+from ...provider import ProviderConfig, ProviderState
 
 # Import from submodules
 from . import api, auth
@@ -75,6 +73,7 @@ authenticate = auth.authenticate
 
 # Re-export API functions
 sync_library = api.sync_library
+ingest_library = api.ingest_library
 search = api.search
 get_stream_url = api.get_stream_url
 get_playlists = api.get_playlists
@@ -90,6 +89,7 @@ __all__ = [
     "init_provider",
     "authenticate",
     "sync_library",
+    "ingest_library",
     "search",
     "get_stream_url",
     "get_playlists",
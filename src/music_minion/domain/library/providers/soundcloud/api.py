@@ -6,8 +6,9 @@ Handles library sync, playlists, likes, and stream URLs.
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional
 
 import requests
 from requests import Response
@@ -24,6 +25,9 @@ from .exceptions import TrackUnavailableError
 # SoundCloud API base URL
 API_BASE_URL = "https://api.soundcloud.com"
 
+# Likes per page (the API's maximum)
+LIKES_PAGE_SIZE = 200
+
 
 def _ensure_valid_token(
     state: ProviderState,
@@ -93,113 +97,227 @@ def _format_playlist_urn(playlist_id: str) -> str:
 def sync_library(
     state: ProviderState, incremental: bool = True
 ) -> tuple[ProviderState, TrackList]:
-    """Sync SoundCloud likes/playlists and like markers.
-
-    Performs incremental sync by default - only fetches new likes since last sync.
-    Stops when encountering a track that's already been imported.
+    """Sync SoundCloud likes and like markers.
 
-    Also syncs like markers for ALL tracks that are liked on SoundCloud,
-    including tracks that were imported in previous syncs.
+    Likes are written to the database page by page (see ingest_library), so
+    no tracks are left for the caller to import.
 
     Args:
         state: Current provider state
         incremental: If True, stop at first existing track; if False, fetch all (default: True)
 
     Returns:
-        (new_state, [(track_id, metadata), ...])
+        (new_state, []) - tracks are already in the database
     """
-    if not state.authenticated:
-        return state, []
+    state, _ = ingest_library(state, incremental=incremental)
+    return state, []
 
-    # Ensure token is valid, refresh if needed
-    state, token_data = _ensure_valid_token(state)
-    if not token_data:
-        return state, []
 
-    access_token = token_data["access_token"]
+def ingest_library(
+    state: ProviderState,
+    incremental: bool = True,
+    progress_callback: Optional[Callable[[str, dict], None]] = None,
+) -> tuple[ProviderState, dict[str, int]]:
+    """Stream the user's SoundCloud likes into the database, one page at a time.
 
-    # Get existing SoundCloud IDs for incremental sync
+    Each page is written as it arrives while the next one downloads: new
+    tracks are inserted, like markers are added for every liked track on
+    the page, and the next page's cursor is stored. Existence checks are
+    indexed lookups of the page's IDs, not a set of every SoundCloud ID.
+
+    Incremental mode stops at the first already-imported track (likes are
+    newest first). An interrupted run resumes from its stored cursor, in
+    the mode it was started with.
+
+    Args:
+        state: Current provider state
+        incremental: If True, stop at first existing track; if False, fetch all
+        progress_callback: Optional callback("page", data) after each page
+
+    Returns:
+        (new_state, {'created', 'skipped', 'fetched', 'likes', 'pages'})
+    """
     from music_minion.core import database
 
-    existing_ids = set()
-    try:
-        with database.get_db_connection() as conn:
-            cursor = conn.execute(
-                "SELECT soundcloud_id FROM tracks WHERE soundcloud_id IS NOT NULL AND source = 'soundcloud'"
-            )
-            existing_ids = {row[0] for row in cursor.fetchall()}
-        logger.info(
-            f"Found {len(existing_ids)} existing SoundCloud tracks for incremental sync"
+    stats = {"created": 0, "skipped": 0, "fetched": 0, "likes": 0, "pages": 0}
+    if not state.authenticated:
+        return state, stats
+
+    # Ensure token is valid, refresh if needed
+    state, token_data = _ensure_valid_token(state)
+    if not token_data:
+        return state, stats
+
+    with database.get_db_connection() as conn:
+        cursor_row = conn.execute(
+            "SELECT next_href, incremental, tracks_seen FROM provider_sync_cursors WHERE provider = 'soundcloud'"
+        ).fetchone()
+    start_url = None
+    if cursor_row:
+        start_url = cursor_row["next_href"]
+        incremental = bool(cursor_row["incremental"])
+        log(
+            f"  ↻ Resuming interrupted likes sync after {cursor_row['tracks_seen']} tracks",
+            level="info",
         )
-    except Exception as e:
-        logger.warning(f"Failed to load existing SoundCloud IDs: {e}")
-        # Continue with full sync if we can't load existing tracks
-        pass
 
-    # Fetch user's likes (with progress reporting)
     logger.info("Starting SoundCloud likes sync")
     log("\n🔄 Syncing SoundCloud likes...", level="info")
+    tracks_seen = cursor_row["tracks_seen"] if cursor_row else 0
+    finished = False
     try:
-        tracks, all_liked_ids = _fetch_user_likes_with_markers(
-            access_token, existing_ids=existing_ids, incremental=incremental
-        )
-        logger.info(
-            f"Fetched {len(tracks)} new tracks, {len(all_liked_ids)} total liked tracks"
-        )
-    except HTTPError as e:
-        # Authentication failures - mark state as unauthenticated
-        if e.response.status_code in (401, 403):
-            from dataclasses import replace
-
-            state = replace(state, authenticated=False)
-            return state, []
-        else:
-            # Other HTTP errors - log and return empty
-            logger.error(f"HTTP error syncing library: {e}")
-            return state, []
+        for page_tracks, next_href in iter_likes_pages(
+            token_data["access_token"], start_url=start_url
+        ):
+            stats["pages"] += 1
+            page_stats, found_existing = _write_likes_page(page_tracks, incremental)
+            for key, value in page_stats.items():
+                stats[key] += value
+            tracks_seen += page_stats["fetched"]
 
-    # Sync like markers for all matched tracks (both new and existing)
-    likes_synced = 0
-    try:
-        if all_liked_ids:
             log(
-                f"📊 Syncing like markers for {len(all_liked_ids)} liked tracks...",
+                f"  → {tracks_seen} (page {stats['pages']}, +{page_stats['created']} new)",
                 level="info",
             )
-            logger.debug(
-                f"Syncing like markers for {len(all_liked_ids)} SoundCloud tracks"
+            if progress_callback:
+                progress_callback("page", {**stats, "tracks_seen": tracks_seen})
+
+            if found_existing or not next_href:
+                if found_existing:
+                    log(
+                        "  ✓ Stopping at first existing track (incremental mode)",
+                        level="info",
+                    )
+                finished = True
+                break
+            with database.get_db_connection() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO provider_sync_cursors
+                        (provider, next_href, incremental, tracks_seen, updated_at)
+                    VALUES ('soundcloud', ?, ?, ?, CURRENT_TIMESTAMP)
+                    """,
+                    (next_href, incremental, tracks_seen),
+                )
+                conn.commit()
+    except HTTPError as e:
+        # Authentication failures - mark state as unauthenticated (cursor kept)
+        if e.response is not None and e.response.status_code in (401, 403):
+            log(
+                "SoundCloud authentication expired. Please re-authenticate with: library auth soundcloud",
+                level="error",
             )
+            return state.with_authenticated(False), stats
+        logger.error(f"HTTP error syncing library: {e}")
+        log(f"  ⚠ HTTP error fetching likes: {e} (will resume next sync)", level="warning")
+    except Exception as e:
+        # Network errors - keep what was written, resume from the stored cursor
+        logger.error(f"Error syncing SoundCloud likes: {e}", exc_info=True)
+        log(f"  ⚠ Error fetching likes: {e} (will resume next sync)", level="warning")
 
-            # Get track IDs from database for all soundcloud tracks that are liked
-            with database.get_db_connection() as conn:
-                # Build query with proper parameterization
-                placeholders = ",".join("?" * len(all_liked_ids))
-                cursor = conn.execute(
+    if finished:
+        with database.get_db_connection() as conn:
+            conn.execute("DELETE FROM provider_sync_cursors WHERE provider = 'soundcloud'")
+            conn.commit()
+
+    logger.info(
+        f"SoundCloud likes sync: {stats['created']} new tracks, {stats['likes']} like markers, "
+        f"{stats['pages']} pages"
+    )
+    log(
+        f"✓ Fetched {stats['fetched']} liked tracks ({stats['created']} new, "
+        f"{stats['likes']} like markers added)",
+        level="info",
+    )
+    return state.with_sync_time(), stats
+
+
+def _write_likes_page(page_tracks: TrackList, incremental: bool) -> tuple[dict[str, int], bool]:
+    """Insert a page of liked tracks and their like markers in one transaction.
+
+    Writes are idempotent, so re-running a page after a resume adds nothing
+    twice.
+
+    Returns:
+        (page stats, whether an already-imported track ended the run)
+    """
+    from music_minion.core import database
+
+    stats = {"created": 0, "skipped": 0, "fetched": 0, "likes": 0}
+    if not page_tracks:
+        return stats, False
+
+    def lookup(conn: Any, ids: list[str]) -> dict[str, int]:
+        # Indexed by idx_tracks_soundcloud_id (source, soundcloud_id)
+        cursor = conn.execute(
+            f"SELECT id, soundcloud_id FROM tracks WHERE source = 'soundcloud' AND soundcloud_id IN ({','.join('?' * len(ids))})",
+            ids,
+        )
+        return {row["soundcloud_id"]: row["id"] for row in cursor}
+
+    with database.get_db_connection() as conn:
+        conn.execute("BEGIN")
+        try:
+            existing = lookup(conn, [track_id for track_id, _ in page_tracks])
+
+            found_existing = False
+            if incremental:
+                for index, (track_id, _) in enumerate(page_tracks):
+                    if track_id in existing:
+                        # Liked tracks up to and including the first existing one get markers
+                        page_tracks = page_tracks[: index + 1]
+                        found_existing = True
+                        break
+
+            new_tracks = [(tid, metadata) for tid, metadata in page_tracks if tid not in existing]
+            if new_tracks:
+                fields = ["soundcloud_id", "source", *new_tracks[0][1].keys()]
+                before = conn.total_changes
+                conn.executemany(
+                    f"INSERT OR IGNORE INTO tracks ({', '.join(fields)}, soundcloud_synced_at) "
+                    f"VALUES ({', '.join('?' * len(fields))}, CURRENT_TIMESTAMP)",
+                    [
+                        (track_id, "soundcloud", *(metadata.get(field) for field in fields[2:]))
+                        for track_id, metadata in new_tracks
+                    ],
+                )
+                stats["created"] = conn.total_changes - before
+            db_track_ids = list(lookup(conn, [track_id for track_id, _ in page_tracks]).values())
+
+            # ratings has no unique key: only mark tracks without a SoundCloud like
+            marked = {
+                row["track_id"]
+                for row in conn.execute(
                     f"""
-                    SELECT id FROM tracks
-                    WHERE soundcloud_id IN ({placeholders})
+                    SELECT track_id FROM ratings
+                    WHERE track_id IN ({",".join("?" * len(db_track_ids))})
+                      AND source = 'soundcloud' AND rating_type = 'like'
                     """,
-                    list(all_liked_ids),
+                    db_track_ids,
                 )
-                db_track_ids = [row[0] for row in cursor.fetchall()]
-
-            # Batch insert like markers (uses INSERT OR IGNORE to avoid duplicates)
-            if db_track_ids:
-                likes_synced = database.batch_add_soundcloud_likes(db_track_ids)
-                logger.info(f"Synced {likes_synced} like markers to database")
-                # Show combined status: likes synced + new tracks imported
-                new_tracks_msg = f"{len(tracks)} new" if tracks else "no new"
-                log(
-                    f"✓ Synced {likes_synced} like markers ({new_tracks_msg} tracks to import)",
-                    level="info",
-                )
-    except Exception as e:
-        logger.error(f"Error syncing like markers: {e}", exc_info=True)
-        log(f"⚠ Error syncing like markers: {e}", level="warning")
-        log("  Check logs for details", level="info")
+            }
+            now = datetime.now()
+            markers = [
+                (track_id, "like", now.hour, now.weekday(), "Synced from SoundCloud", "soundcloud")
+                for track_id in db_track_ids
+                if track_id not in marked
+            ]
+            conn.executemany(
+                """
+                INSERT INTO ratings (track_id, rating_type, hour_of_day, day_of_week, context, source)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                markers,
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
 
-    new_state = state.with_sync_time()
-    return new_state, tracks
+    stats["fetched"] = len(page_tracks)
+    stats["skipped"] = len(page_tracks) - stats["created"]
+    stats["likes"] = len(markers)
+    return stats, found_existing
 
 
 def search(
@@ -742,6 +860,60 @@ def _fetch_user_likes(
     return tracks
 
 
+def iter_likes_pages(
+    access_token: str, start_url: Optional[str] = None
+) -> Iterator[tuple[TrackList, Optional[str]]]:
+    """Page through the user's liked tracks, prefetching the next page.
+
+    While the caller handles one page, the next is already downloading.
+
+    Args:
+        access_token: OAuth access token
+        start_url: next_href to resume from (default: first page)
+
+    Yields:
+        (page tracks as (track_id, metadata), next_href or None on the last page)
+
+    Raises:
+        HTTPError: On HTTP errors (the caller decides what is fatal)
+    """
+    headers = {"Authorization": f"OAuth {access_token}"}
+    url = start_url or f"{API_BASE_URL}/me/likes/tracks"
+    params = (
+        {}  # Pagination URL contains all params
+        if start_url
+        else {
+            "limit": LIKES_PAGE_SIZE,
+            "linked_partitioning": True,  # Enable cursor-based pagination
+            "access": "playable",
+        }
+    )
+
+    def fetch(page_url: str, page_params: dict[str, Any]) -> Any:
+        response = requests.get(page_url, params=page_params, headers=headers, timeout=30)
+        response.raise_for_status()
+        return response.json()
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sc-likes")
+    try:
+        pending = executor.submit(fetch, url, params)
+        while pending is not None:
+            data = pending.result()
+            next_href = data.get("next_href") if isinstance(data, dict) else None
+            pending = executor.submit(fetch, next_href, {}) if next_href else None
+
+            collection = data.get("collection", []) if isinstance(data, dict) else []
+            yield [
+                (str(item["id"]), _normalize_soundcloud_track(item))
+                for item in collection
+                # Filter to only tracks (API may return other kinds)
+                if item and item.get("kind") == "track"
+            ], next_href
+    finally:
+        # Stopping early must not wait on a prefetch nobody will read
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def _fetch_user_likes_with_markers(
     access_token: str, existing_ids: Optional[set] = None, incremental: bool = True
 ) -> tuple[TrackList, set]:
@@ -762,59 +934,24 @@ def _fetch_user_likes_with_markers(
 
     tracks = []
     all_liked_ids = set()  # Track ALL liked IDs for marker sync
-    url = f"{API_BASE_URL}/me/likes/tracks"
-    headers = {"Authorization": f"OAuth {access_token}"}
-
-    # Pagination
-    params = {
-        "limit": 200,
-        "linked_partitioning": True,  # Enable cursor-based pagination
-        "access": "playable",
-    }
-
     page = 0
-    total_fetched = 0
 
     try:
-        while url:
+        for page_tracks, _ in iter_likes_pages(access_token):
             page += 1
-            response = requests.get(url, params=params, headers=headers, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-
-            # Show pagination progress
-            collection = data.get("collection", [])
-            fetched_this_page = len(
-                [item for item in collection if item and item.get("kind") == "track"]
-            )
-
-            # Process tracks
-            page_tracks = 0
             found_existing = False
+            for track_id, metadata in page_tracks:
+                all_liked_ids.add(track_id)  # Always track ALL liked IDs
 
-            if "collection" in data:
-                for item in data["collection"]:
-                    # Filter to only tracks (API may return other kinds)
-                    if not item or item.get("kind") != "track":
-                        continue
-
-                    track_id = str(item["id"])
-                    all_liked_ids.add(track_id)  # Always track ALL liked IDs
-
-                    # Incremental sync: stop if we've already imported this track
-                    if incremental and track_id in existing_ids:
-                        found_existing = True
-                        break
-
-                    metadata = _normalize_soundcloud_track(item)
-                    tracks.append((track_id, metadata))
-                    page_tracks += 1
-
-            total_fetched = len(all_liked_ids)
+                # Incremental sync: stop if we've already imported this track
+                if incremental and track_id in existing_ids:
+                    found_existing = True
+                    break
+                tracks.append((track_id, metadata))
 
             # Show progress per page
             log(
-                f"  → {total_fetched} (page {page}, +{fetched_this_page})", level="info"
+                f"  → {len(all_liked_ids)} (page {page}, +{len(page_tracks)})", level="info"
             )
 
             # Incremental mode: Stop if we found an existing track
@@ -825,10 +962,6 @@ def _fetch_user_likes_with_markers(
                 )
                 break
 
-            # Next page
-            url = data.get("next_href")
-            params = {}  # Pagination URL contains all params
-
     except HTTPError as e:
         # Authentication failures should be raised to caller
         if e.response.status_code in (401, 403):
@@ -847,7 +980,7 @@ def _fetch_user_likes_with_markers(
         # Network errors - show error but return what we have
         log(f"  ⚠ Error fetching likes: {e}", level="warning")
 
-    log(f"  ✓ Fetched {total_fetched} liked tracks", level="info")
+    log(f"  ✓ Fetched {len(all_liked_ids)} liked tracks", level="info")
     return tracks, all_liked_ids
 
 
@@ -1068,6 +1201,62 @@ def remove_track_from_playlist(
         return state, False, f"Unexpected error: {str(e)}"
 
 
+def get_playlist_track_ids(
+    state: ProviderState, playlist_id: str
+) -> tuple[ProviderState, Optional[list[str]], Optional[str]]:
+    """Fetch the current track ID order of a SoundCloud playlist.
+
+    Used by callers that compute a final track list locally and write it
+    back with a single reorder_playlist() PUT.
+
+    Args:
+        state: Current provider state
+        playlist_id: SoundCloud playlist ID
+
+    Returns:
+        (new_state, track_ids or None on failure, error_message)
+    """
+    if not state.authenticated:
+        return state, None, "Not authenticated with SoundCloud"
+
+    # Ensure token is valid, refresh if needed
+    state, token_data = _ensure_valid_token(state)
+    if not token_data:
+        return state, None, "Token expired and refresh failed"
+
+    access_token = token_data["access_token"]
+
+    try:
+        playlist_urn = _format_playlist_urn(playlist_id)
+        url = f"{API_BASE_URL}/playlists/{playlist_urn}"
+        headers = {"Authorization": f"OAuth {access_token}"}
+
+        response = requests.get(url, headers=headers, timeout=30)
+        response.raise_for_status()
+        playlist_data = response.json()
+
+        track_ids = [str(t["id"]) for t in playlist_data.get("tracks", []) if t]
+        return state, track_ids, None
+
+    except requests.HTTPError as e:
+        logger.error(f"HTTP error fetching playlist: {e.response.status_code}")
+
+        if e.response.status_code == 401:
+            return state.with_authenticated(False), None, "Authentication failed (401)"
+        elif e.response.status_code == 404:
+            return state, None, "Playlist not found (404)"
+        elif e.response.status_code == 429:
+            return state, None, "Rate limit exceeded (429)"
+        else:
+            return state, None, f"HTTP {e.response.status_code}: {e.response.text[:500]}"
+    except requests.RequestException as e:
+        logger.error(f"Network error fetching playlist: {str(e)}", exc_info=True)
+        return state, None, f"Network error: {str(e)}"
+    except Exception as e:
+        logger.error(f"Unexpected error fetching playlist: {str(e)}", exc_info=True)
+        return state, None, f"Unexpected error: {str(e)}"
+
+
 def reorder_playlist(
     state: ProviderState, playlist_id: str, track_ids: list[str]
 ) -> tuple[ProviderState, bool, Optional[str]]:
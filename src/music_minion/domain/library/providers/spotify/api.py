@@ -434,25 +434,24 @@ def get_stream_url(state: ProviderState, spotify_id: str) -> Optional[str]:
 def get_playlists(
     state: ProviderState, full: bool = False
 ) -> tuple[ProviderState, list[dict[str, Any]]]:
-    """Fetch user's playlists with snapshot_id change detection optimization.
+    """Fetch user's playlists metadata (one request per 50 playlists).
 
-    Optimization: Only fetches tracks for playlists with changed snapshot_id.
-    This reduces API calls from 51 (1 + 50 playlists) to 1-6 typically (88-98% reduction).
-    Can be bypassed with full=True to always fetch tracks.
+    Tracks are fetched separately with get_playlist_tracks() for playlists
+    whose snapshot_id changed; playlist sync compares snapshot_ids against
+    the stored ones, so unchanged playlists cost no track requests.
 
     Args:
         state: Provider state
-        full: If True, bypass snapshot_id optimization and fetch all tracks (default: False)
+        full: Unused (metadata is always complete); kept for the provider interface
 
     Returns list of playlist dicts with structure:
     {
         "id": "playlist_id",
         "name": "Playlist Name",
         "track_count": N,
-        "tracks": [(track_id, metadata), ...],  # Empty if snapshot_id unchanged
         "description": "...",
         "last_modified": "snapshot_id",
-        "created_at": "ISO-8601 timestamp" or None  # Oldest track added_at (proxy for creation)
+        "created_at": None  # Oldest track added_at comes from get_playlist_tracks()
     }
     """
     state, token = _ensure_valid_token(state)
@@ -460,86 +459,33 @@ def get_playlists(
         logger.warning("Cannot fetch playlists - not authenticated")
         return state, []
 
-    # Load stored snapshot_ids from database for change detection
-    stored_snapshots = {}
-    try:
-        with database.get_db_connection() as conn:
-            cursor = conn.execute(
-                "SELECT spotify_playlist_id, spotify_snapshot_id FROM playlists WHERE spotify_playlist_id IS NOT NULL"
-            )
-            stored_snapshots = {row[0]: row[1] for row in cursor.fetchall()}
-        logger.debug(f"Loaded {len(stored_snapshots)} stored playlist snapshot_ids")
-    except Exception as e:
-        logger.warning(f"Could not load stored snapshots: {e}")
-        # Continue without optimization if database error
-
     playlists = []
     url = f"{API_BASE}/me/playlists"
     params = {"limit": 50}
     headers = {"Authorization": f"Bearer {token['access_token']}"}
-    skipped_count = 0
-    fetched_count = 0
 
     try:
-        logger.debug("Fetching playlists from Spotify (optimized with snapshot_id)")
-
         while url:
             response = requests.get(url, params=params, headers=headers, timeout=30)
             response.raise_for_status()
             data = response.json()
 
             for item in data["items"]:
-                playlist_id = item["id"]
-                current_snapshot = item["snapshot_id"]
-                stored_snapshot = stored_snapshots.get(playlist_id)
-
-                # Optimization: Only fetch tracks if snapshot_id changed (unless full=True)
-                if stored_snapshot and current_snapshot == stored_snapshot and not full:
-                    # Playlist unchanged - return empty tracks list
-                    tracks = []
-                    created_at = None  # Will preserve existing DB value during sync
-                    skipped_count += 1
-                    logger.debug(
-                        f"Skipping unchanged playlist: {item['name']} (snapshot: {current_snapshot})"
-                    )
-                else:
-                    # Playlist changed or new - fetch tracks
-                    state, tracks, created_at = get_playlist_tracks(state, playlist_id)
-                    fetched_count += 1
-                    if full:
-                        logger.debug(
-                            f"Fetching playlist (full sync): {item['name']} (snapshot: {current_snapshot})"
-                        )
-                    elif stored_snapshot:
-                        logger.debug(
-                            f"Fetching updated playlist: {item['name']} (snapshot: {stored_snapshot} → {current_snapshot})"
-                        )
-                    else:
-                        logger.debug(
-                            f"Fetching new playlist: {item['name']} (snapshot: {current_snapshot})"
-                        )
-
-                playlist_data = {
-                    "id": playlist_id,
-                    "name": item["name"],
-                    "track_count": item["tracks"]["total"],
-                    "tracks": tracks,
-                    "description": item.get("description", ""),
-                    "last_modified": current_snapshot,
-                    "created_at": created_at,
-                }
-                playlists.append(playlist_data)
+                playlists.append(
+                    {
+                        "id": item["id"],
+                        "name": item["name"],
+                        "track_count": item["tracks"]["total"],
+                        "description": item.get("description", ""),
+                        "last_modified": item["snapshot_id"],
+                        "created_at": None,
+                    }
+                )
 
             url = data.get("next")
             params = {}
 
-        log(
-            f"✓ Fetched {len(playlists)} playlists ({fetched_count} updated, {skipped_count} unchanged)",
-            level="info",
-        )
-        logger.info(
-            f"Playlists fetch complete: {len(playlists)} total, {fetched_count} fetched, {skipped_count} skipped"
-        )
+        logger.info(f"Playlists fetch complete: {len(playlists)} playlists")
         return state, playlists
 
     except Exception as e:
@@ -138,6 +138,7 @@ def scan_music_library_optimized(
     logger.info(f"Database has {len(known_files)} known files")
 
     all_tracks = []
+    seen_paths = []
     skipped = 0
     processed = 0
 
@@ -165,6 +166,7 @@ def scan_music_library_optimized(
                 continue
 
             file_path_str = str(file_path)
+            seen_paths.append(file_path_str)
 
             # Check if file is unchanged
             if file_path_str in known_files:
@@ -188,12 +190,20 @@ def scan_music_library_optimized(
             except Exception as e:
                 logger.error(f"Error processing {file_path_str}: {e}")
 
+    # Keep the file catalog current; only new/changed files are fingerprinted
+    from .catalog import refresh_catalog
+
+    catalog_stats = refresh_catalog(seen_paths)
+
     if show_progress:
         print(f"\nScan complete:")
         print(f"  Processed: {processed} new/changed files")
         print(f"  Skipped: {skipped} unchanged files")
 
-    logger.info(f"Scan stats - processed: {processed}, skipped: {skipped}")
+    logger.info(
+        f"Scan stats - processed: {processed}, skipped: {skipped}, "
+        f"fingerprinted: {catalog_stats['hashed']}"
+    )
 
     return all_tracks
 
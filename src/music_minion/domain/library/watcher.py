@@ -0,0 +1,579 @@
+"""
+Live library watcher.
+
+Subscribes to filesystem events under ``config.music.library_paths`` (inotify
+on Linux, via watchdog) and applies them to the tracks table incrementally:
+new and modified files are upserted, moves relocate the existing row (so
+ratings, tags and playlist membership follow the file), deletions drop the
+row, and smart playlists are refreshed once per applied batch. The file
+catalog follows along, so a delete plus a create of the same audio (a move
+across filesystems) is recognised as a relocation too. Events are
+debounced so a file that is still being copied or re-tagged is read once,
+after it settles.
+
+A low-priority reconciliation pass walks the library periodically (and
+shortly after startup) to catch what the event stream can't see: changes
+made while nothing was watching, inotify queue overflows, network mounts.
+
+Only one process watches at a time. The TUI and the web backend both call
+start_library_watcher(); whichever starts second leaves it to the first.
+"""
+
+import fcntl
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Optional
+
+from loguru import logger
+
+from music_minion.core.config import Config, get_data_dir, load_config
+from music_minion.core.database import batch_upsert_tracks, get_db_connection
+
+from . import catalog
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    Observer = None
+    FileSystemEventHandler = object  # Fallback to object instead of None
+
+DEBOUNCE_SECONDS = 2.0  # Quiet period before a batch of events is applied
+MAX_BATCH_DELAY_SECONDS = 30.0  # Apply anyway during long copies
+RECONCILE_STARTUP_DELAY_SECONDS = 60.0
+POLL_INTERVAL_SECONDS = 0.5
+WATCHER_LOCK_NAME = ".library-watcher.lock"
+
+
+@dataclass
+class FileChange:
+    """One filesystem change, as reported by the event stream.
+
+    Attributes:
+        kind: 'upsert' (created/modified), 'delete' or 'move'
+        path: Affected path (source path for moves)
+        dest: Destination path for moves
+        is_directory: Whether the path is a directory
+    """
+
+    kind: str
+    path: str
+    dest: Optional[str] = None
+    is_directory: bool = False
+
+
+class ChangeQueue:
+    """Debounces filesystem events into batches.
+
+    Changes are kept in arrival order (a move followed by a create at the old
+    path must stay in that order), with repeated modifications of the same
+    file collapsed. A batch becomes ready once no event has arrived for
+    DEBOUNCE_SECONDS, or MAX_BATCH_DELAY_SECONDS after its first event.
+    """
+
+    def __init__(
+        self,
+        debounce_seconds: float = DEBOUNCE_SECONDS,
+        max_delay_seconds: float = MAX_BATCH_DELAY_SECONDS,
+    ):
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self._changes: list[FileChange] = []
+        self._first_event = 0.0
+        self._last_event = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, change: FileChange, now: Optional[float] = None) -> None:
+        """Queue a change, collapsing it into the previous one if redundant."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._changes:
+                self._first_event = now
+            self._last_event = now
+            previous = self._changes[-1] if self._changes else None
+            if (
+                previous is not None
+                and previous.kind == change.kind == "upsert"
+                and previous.path == change.path
+            ):
+                return
+            self._changes.append(change)
+
+    def pop_ready(self, now: Optional[float] = None) -> list[FileChange]:
+        """Return and clear the pending batch if it has settled.
+
+        Returns:
+            The batch in arrival order, or an empty list if none is ready
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if not self._changes:
+                return []
+            settled = now - self._last_event >= self.debounce_seconds
+            overdue = now - self._first_event >= self.max_delay_seconds
+            if not (settled or overdue):
+                return []
+            changes, self._changes = self._changes, []
+            return changes
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._changes)
+
+
+def _is_music_file(path: str, config: Config) -> bool:
+    return (
+        Path(path).suffix.lower() in config.music.supported_formats
+        and ".sync-conflict-" not in path
+    )
+
+
+def _library_roots(config: Config) -> list[Path]:
+    return [Path(p).expanduser() for p in config.music.library_paths]
+
+
+def walk_library(config: Config, roots: Optional[list[Path]] = None) -> dict[str, float]:
+    """List music files under the library paths in a single traversal.
+
+    Args:
+        config: Configuration object
+        roots: Directories to walk (default: all library paths)
+
+    Returns:
+        Dictionary mapping file path to mtime
+    """
+    files: dict[str, float] = {}
+    stack = [str(root) for root in (roots or _library_roots(config))]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if config.music.scan_recursive:
+                                stack.append(entry.path)
+                        elif entry.is_file() and _is_music_file(entry.path, config):
+                            files[entry.path] = entry.stat().st_mtime
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug(f"Cannot read {directory}: {e}")
+    return files
+
+
+def _upsert_files(paths: list[str]) -> tuple[int, int]:
+    """Extract metadata for existing files and upsert their tracks."""
+    from .metadata import extract_track_metadata
+
+    tracks = []
+    for path in paths:
+        if not os.path.isfile(path):
+            continue
+        try:
+            tracks.append(extract_track_metadata(path))
+        except Exception as e:
+            logger.warning(f"Failed to read metadata from {path}: {e}")
+    return batch_upsert_tracks(tracks)
+
+
+def _under(prefix: str) -> tuple[str, tuple[int, str]]:
+    """SQL predicate and parameters matching local_path below a directory."""
+    prefix = prefix.rstrip(os.sep) + os.sep
+    return "substr(local_path, 1, ?) = ?", (len(prefix), prefix)
+
+
+def _mark_missing(rows, upserts: dict[str, None], gone: dict[str, int]) -> None:
+    """Queue tracks whose files are gone for removal; re-read those that exist again."""
+    for row in rows:
+        if os.path.exists(row["local_path"]):
+            upserts[row["local_path"]] = None
+            continue
+        upserts.pop(row["local_path"], None)
+        gone[row["local_path"]] = row["id"]
+
+
+def _resolve_missing(
+    gone: dict[str, int], upserts: dict[str, None], stats: dict[str, int]
+) -> None:
+    """Relocate gone tracks to new files with the same content, remove the rest.
+
+    A move between filesystems (or watched roots) arrives as a delete plus a
+    create; the file catalog still has the deleted file's fingerprint.
+    """
+    new_files = [path for path in upserts if os.path.isfile(path)]
+    catalog.refresh_catalog(new_files)
+    matches = catalog.match_moved_files(gone, new_files)
+
+    with get_db_connection() as conn:
+        for old_path, track_id in gone.items():
+            for new_path in matches.get(old_path, []):
+                taken = conn.execute(
+                    "SELECT 1 FROM tracks WHERE local_path = ?", (new_path,)
+                ).fetchone()
+                if not taken:
+                    conn.execute(
+                        "UPDATE tracks SET local_path = ?, file_mtime = NULL WHERE id = ?",
+                        (new_path, track_id),
+                    )
+                    stats["relocated"] += 1
+                    logger.info(f"Relocated track {track_id}: {old_path} → {new_path}")
+                    break
+            else:
+                conn.execute("DELETE FROM tracks WHERE id = ?", (track_id,))
+                stats["deleted"] += 1
+                logger.info(f"Removed track {track_id}: {old_path} deleted")
+        conn.commit()
+    catalog.forget_paths(gone)
+
+
+def apply_changes(changes: list[FileChange], config: Config) -> dict[str, int]:
+    """Apply a batch of filesystem changes to the database.
+
+    Deletions and moves are applied in order; upserts are collected and done
+    last, once relocations have settled which paths are already known.
+    A deleted path that exists again by the time the batch is applied (a
+    delete-and-recreate save) is treated as a modification.
+
+    Args:
+        changes: Changes in the order they happened
+        config: Configuration object
+
+    Returns:
+        Stats dict: {'added', 'updated', 'relocated', 'deleted'}
+    """
+    stats = {"added": 0, "updated": 0, "relocated": 0, "deleted": 0}
+    upserts: dict[str, None] = {}  # Ordered set of paths to (re)read
+    gone: dict[str, int] = {}  # Missing path -> track ID, resolved last
+    relocated_dirs: list[str] = []
+    moves: list[FileChange] = []
+
+    with get_db_connection() as conn:
+        for change in changes:
+            if change.kind == "upsert":
+                if change.is_directory:
+                    # Moved in from outside the library, contents unknown
+                    for path in walk_library(config, [Path(change.path)]):
+                        upserts[path] = None
+                elif _is_music_file(change.path, config):
+                    upserts[change.path] = None
+
+            elif change.kind == "delete":
+                if change.is_directory:
+                    where, params = _under(change.path)
+                    rows = conn.execute(
+                        f"SELECT id, local_path FROM tracks WHERE {where}", params
+                    ).fetchall()
+                else:
+                    rows = conn.execute(
+                        "SELECT id, local_path FROM tracks WHERE local_path = ?",
+                        (change.path,),
+                    ).fetchall()
+                _mark_missing(rows, upserts, gone)
+
+            elif change.kind == "move" and change.is_directory:
+                moves.append(change)
+                where, params = _under(change.path)
+                src_prefix = params[1]
+                dest_prefix = change.dest.rstrip(os.sep) + os.sep
+                cursor = conn.execute(
+                    f"""
+                    UPDATE tracks
+                    SET local_path = ? || substr(local_path, ?), file_mtime = NULL
+                    WHERE {where}
+                    """,
+                    (dest_prefix, len(src_prefix) + 1, *params),
+                )
+                stats["relocated"] += cursor.rowcount
+                relocated_dirs.append(dest_prefix)
+                for path in [p for p in upserts if p.startswith(src_prefix)]:
+                    upserts.pop(path)
+                    upserts[dest_prefix + path[len(src_prefix):]] = None
+                if cursor.rowcount:
+                    logger.info(
+                        f"Relocated {cursor.rowcount} tracks: {change.path} → {change.dest}"
+                    )
+
+            elif change.kind == "move":
+                moves.append(change)
+                src = conn.execute(
+                    "SELECT id, local_path FROM tracks WHERE local_path = ?", (change.path,)
+                ).fetchone()
+                if not _is_music_file(change.dest, config):
+                    # Renamed out of the supported formats
+                    upserts.pop(change.path, None)
+                    _mark_missing([src] if src else [], upserts, gone)
+                    continue
+                if change.path in upserts:
+                    # Never reached the database under its old name
+                    upserts.pop(change.path)
+                    upserts[change.dest] = None
+                    continue
+
+                dest = conn.execute(
+                    "SELECT id FROM tracks WHERE local_path = ?", (change.dest,)
+                ).fetchone()
+                if src and not dest:
+                    conn.execute(
+                        "UPDATE tracks SET local_path = ?, file_mtime = NULL WHERE id = ?",
+                        (change.dest, src["id"]),
+                    )
+                    stats["relocated"] += 1
+                    logger.info(f"Relocated track {src['id']}: {change.path} → {change.dest}")
+                    continue
+                if src:
+                    # Moved over another tracked file: the destination keeps its identity
+                    conn.execute("DELETE FROM tracks WHERE id = ?", (src["id"],))
+                    stats["deleted"] += 1
+                elif dest and any(change.dest.startswith(d) for d in relocated_dirs):
+                    continue  # Per-file echo of a directory move already applied
+                # Also covers editors that save via a temp file renamed into place
+                upserts[change.dest] = None
+
+        conn.commit()
+
+    # Fingerprints follow their files, so moved files aren't re-read
+    for move in moves:
+        catalog.rename_in_catalog(move.path, move.dest, move.is_directory)
+    if gone:
+        _resolve_missing(gone, upserts, stats)
+    if upserts:
+        stats["added"], stats["updated"] = _upsert_files(list(upserts))
+        catalog.refresh_catalog(upserts)
+
+    if any(stats.values()):
+        from music_minion.domain.playlists.filters import refresh_all_smart_playlists
+
+        refresh_all_smart_playlists()
+        logger.info(
+            f"Library watcher: {stats['added']} added, {stats['updated']} updated, "
+            f"{stats['relocated']} relocated, {stats['deleted']} removed"
+        )
+
+    return stats
+
+
+def reconcile_library(config: Config) -> dict[str, int]:
+    """Bring the database in line with the library after missed events.
+
+    Walks the library once, relocates or removes tracks whose files are gone
+    (see detect_missing_and_moved_files), brings the file catalog up to date,
+    then upserts files that are new or modified since their last sync.
+    Skipped entirely if any library path is
+    unavailable, so an unmounted drive doesn't read as a mass deletion.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Stats dict: {'added', 'updated', 'relocated', 'deleted'}
+    """
+    from music_minion.domain.sync.engine import detect_missing_and_moved_files
+
+    stats = {"added": 0, "updated": 0, "relocated": 0, "deleted": 0}
+    unavailable = [str(root) for root in _library_roots(config) if not root.is_dir()]
+    if unavailable:
+        logger.warning(f"Skipping library reconciliation, unavailable: {', '.join(unavailable)}")
+        return stats
+
+    on_disk = walk_library(config)
+    cleanup = detect_missing_and_moved_files(config, files_on_disk=set(on_disk))
+    stats["relocated"] = cleanup["relocated"]
+    stats["deleted"] = cleanup["deleted"]
+    catalog.refresh_catalog(on_disk)
+    catalog.prune_catalog(set(on_disk), [str(root) for root in _library_roots(config)])
+
+    with get_db_connection() as conn:
+        known = {
+            row["local_path"]: row["file_mtime"]
+            for row in conn.execute(
+                "SELECT local_path, file_mtime FROM tracks WHERE local_path IS NOT NULL"
+            )
+        }
+    changed = [
+        path
+        for path, mtime in on_disk.items()
+        if path not in known or (known[path] is not None and mtime > known[path])
+    ]
+    if changed:
+        stats["added"], stats["updated"] = _upsert_files(changed)
+
+    if any(stats.values()):
+        from music_minion.domain.playlists.filters import refresh_all_smart_playlists
+
+        refresh_all_smart_playlists()
+    logger.info(
+        f"Library reconciliation: {len(on_disk)} files, {stats['added']} added, "
+        f"{stats['updated']} updated, {stats['relocated']} relocated, "
+        f"{stats['deleted']} removed"
+    )
+    return stats
+
+
+if WATCHDOG_AVAILABLE:
+
+    class LibraryEventHandler(FileSystemEventHandler):
+        """Translates watchdog events into queued FileChanges."""
+
+        def __init__(self, queue: ChangeQueue, config: Config):
+            self.queue = queue
+            self.config = config
+
+        def _relevant(self, path: str, is_directory: bool) -> bool:
+            return is_directory or _is_music_file(path, self.config)
+
+        def on_created(self, event) -> None:
+            if self._relevant(event.src_path, event.is_directory):
+                self.queue.add(FileChange("upsert", event.src_path, is_directory=event.is_directory))
+
+        def on_modified(self, event) -> None:
+            # Directory mtimes change with their contents; files report themselves
+            if not event.is_directory and self._relevant(event.src_path, False):
+                self.queue.add(FileChange("upsert", event.src_path))
+
+        def on_deleted(self, event) -> None:
+            if self._relevant(event.src_path, event.is_directory):
+                self.queue.add(FileChange("delete", event.src_path, is_directory=event.is_directory))
+
+        def on_moved(self, event) -> None:
+            if self._relevant(event.src_path, event.is_directory) or self._relevant(
+                event.dest_path, event.is_directory
+            ):
+                self.queue.add(
+                    FileChange("move", event.src_path, event.dest_path, event.is_directory)
+                )
+
+else:
+    LibraryEventHandler = None
+
+
+def _lower_thread_priority() -> None:
+    """Nice the calling thread so reconciliation yields to playback and UI."""
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+
+class LibraryWatcher:
+    """Observer plus the worker thread applying its debounced batches."""
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.queue = ChangeQueue()
+        self.observer: Any = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        roots = [root for root in _library_roots(self.config) if root.is_dir()]
+        if not WATCHDOG_AVAILABLE:
+            logger.warning("watchdog not installed - library changes applied by periodic reconciliation only")
+        elif roots:
+            try:
+                self.observer = Observer()
+                handler = LibraryEventHandler(self.queue, self.config)
+                for root in roots:
+                    self.observer.schedule(handler, str(root), recursive=self.config.music.scan_recursive)
+                self.observer.daemon = True
+                self.observer.start()
+                logger.info(f"Watching {len(roots)} library path(s) for changes")
+            except OSError as e:
+                # e.g. fs.inotify.max_user_watches exhausted
+                logger.warning(f"Library watcher unavailable ({e}); relying on reconciliation")
+                self.observer = None
+
+        self._thread = threading.Thread(target=self._run, name="library-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self.observer:
+            try:
+                self.observer.stop()
+                self.observer.join(timeout=1.0)
+            except Exception:
+                pass  # Silent cleanup
+        if self._thread:
+            self._thread.join(timeout=2.0)
+
+    def _run(self) -> None:
+        threading.current_thread().silent_logging = True  # type: ignore[attr-defined]
+        _lower_thread_priority()
+        interval = max(self.config.music.reconcile_interval_hours, 0.0) * 3600
+        next_reconcile = time.monotonic() + RECONCILE_STARTUP_DELAY_SECONDS
+
+        while not self._stop.wait(POLL_INTERVAL_SECONDS):
+            try:
+                changes = self.queue.pop_ready()
+                if changes:
+                    apply_changes(changes, self.config)
+                elif interval and time.monotonic() >= next_reconcile and not len(self.queue):
+                    reconcile_library(self.config)
+                    next_reconcile = time.monotonic() + interval
+            except Exception:
+                logger.exception("Library watcher failed to apply changes")
+
+
+_watcher: Optional[LibraryWatcher] = None
+_lock_file: Optional[IO[str]] = None
+_start_lock = threading.Lock()
+
+
+def start_library_watcher(config: Optional[Config] = None) -> bool:
+    """Start watching the library, unless another process already is.
+
+    Args:
+        config: Configuration object (loaded from disk if None)
+
+    Returns:
+        True if this process is now the one watching the library
+    """
+    global _watcher, _lock_file
+
+    with _start_lock:
+        if _watcher is not None:
+            return True
+        config = config or load_config()
+        if not config.music.watch_library:
+            return False
+
+        lock_file = open(Path(get_data_dir()) / WATCHER_LOCK_NAME, "w")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            logger.debug("Library already watched by another process")
+            return False
+
+        _lock_file = lock_file
+        _watcher = LibraryWatcher(config)
+        _watcher.start()
+        return True
+
+
+def stop_library_watcher() -> None:
+    """Stop the watcher and release the cross-process lock."""
+    global _watcher, _lock_file
+
+    with _start_lock:
+        if _watcher is not None:
+            _watcher.stop()
+            _watcher = None
+        if _lock_file is not None:
+            try:
+                fcntl.flock(_lock_file.fileno(), fcntl.LOCK_UN)
+            finally:
+                _lock_file.close()
+                _lock_file = None
+
+
+def is_watching() -> bool:
+    """Whether this process is the one watching the library."""
+    return _watcher is not None
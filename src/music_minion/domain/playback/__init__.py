@@ -33,6 +33,12 @@ from .player import (
     tick_session,
 )
 
+# Buffered listen-session accounting
+from .listen_tracker import (
+    flush_listen_sessions,
+    get_listen_accounting_stats,
+)
+
 # State management
 from .state import (
     get_shuffle_mode,
@@ -68,6 +74,9 @@ __all__ = [
     "is_track_finished",
     "format_time",
     "tick_session",
+    # Listen accounting
+    "flush_listen_sessions",
+    "get_listen_accounting_stats",
     # State
     "get_shuffle_mode",
     "set_shuffle_mode",
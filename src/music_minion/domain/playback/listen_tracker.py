@@ -0,0 +1,179 @@
+"""
+Buffered listen-session accounting.
+
+Playback time is accumulated in memory and written to track_listen_sessions in
+one batched transaction on track change, pause/stop, shutdown, or every
+LISTEN_FLUSH_SECONDS while playing. A crash loses at most that much listening
+time instead of costing one committed UPDATE per second of playback.
+"""
+
+import atexit
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from music_minion.core.database import add_listen_seconds
+
+# Upper bound on listening time lost if the process dies without flushing
+LISTEN_FLUSH_SECONDS = 15.0
+
+# Gaps between ticks longer than this (suspend, stalled loop) are not counted
+MAX_TICK_GAP_SECONDS = 5.0
+
+
+class ListenAccumulator:
+    """In-memory seconds_played counters with periodic batched flushes.
+
+    Time is measured from the wall clock between ticks rather than assuming
+    one tick per second, so the result does not depend on how often the UI
+    polls the player.
+
+    Args:
+        flush_seconds: Maximum age of unflushed listening time
+        clock: Time source (time.time; matches PlayerState.playback_started_at)
+        writer: Persists {session_id: seconds} in one transaction
+    """
+
+    def __init__(
+        self,
+        flush_seconds: float = LISTEN_FLUSH_SECONDS,
+        clock: Callable[[], float] = time.time,
+        writer: Callable[[dict[int, float]], None] = add_listen_seconds,
+    ):
+        self.flush_seconds = flush_seconds
+        self._clock = clock
+        self._writer = writer
+        self._lock = threading.Lock()
+        self._pending: dict[int, float] = {}
+        self._session_id: Optional[int] = None
+        self._last_tick: Optional[float] = None
+        self._pending_since = 0.0  # Start of the oldest unflushed interval
+        # Metrics
+        self._playing_ticks = 0
+        self._flushes = 0
+        self._rows_written = 0
+        self._seconds_flushed = 0.0
+
+    def tick(
+        self,
+        session_id: Optional[int],
+        is_playing: bool,
+        started_at: Optional[float] = None,
+    ) -> None:
+        """Account for playback since the previous tick.
+
+        Args:
+            session_id: Active listening session (None when nothing is tracked)
+            is_playing: Whether playback is currently active
+            started_at: When the session's track started playing, used to
+                credit the time before the first tick of a new session
+        """
+        with self._lock:
+            track_changed = session_id != self._session_id
+        if track_changed:
+            # The previous session's time is complete
+            self.flush()
+
+        now = self._clock()
+        with self._lock:
+            flush_due = False
+            if track_changed:
+                self._session_id = session_id
+                self._last_tick = started_at if is_playing else None
+
+            if session_id is None or not is_playing:
+                # Paused or stopped: persist what we have, restart timing on resume
+                flush_due = bool(self._pending)
+                self._last_tick = None
+            else:
+                if self._last_tick is not None:
+                    gap = now - self._last_tick
+                    if 0 < gap <= MAX_TICK_GAP_SECONDS:
+                        if not self._pending:
+                            self._pending_since = self._last_tick
+                        self._pending[session_id] = self._pending.get(session_id, 0.0) + gap
+                        self._playing_ticks += 1
+                self._last_tick = now
+                flush_due = (
+                    bool(self._pending) and now - self._pending_since >= self.flush_seconds
+                )
+
+        if flush_due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all pending listening time in one transaction.
+
+        On failure the time is kept in memory and retried on the next flush.
+
+        Returns:
+            Number of sessions updated
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+
+        try:
+            self._writer(batch)
+        except Exception:
+            logger.exception(f"Failed to flush listening time for {len(batch)} sessions")
+            with self._lock:
+                if not self._pending:
+                    self._pending_since = self._clock()
+                for session_id, seconds in batch.items():
+                    self._pending[session_id] = self._pending.get(session_id, 0.0) + seconds
+            return 0
+
+        with self._lock:
+            self._flushes += 1
+            self._rows_written += len(batch)
+            self._seconds_flushed += sum(batch.values())
+        return len(batch)
+
+    def stats(self) -> dict[str, Any]:
+        """Write-amplification metrics.
+
+        Returns:
+            Dict with playing_ticks (what used to be one committed UPDATE each),
+            flushes (transactions actually committed), rows_written,
+            seconds_flushed, pending_seconds, writes_saved and
+            ticks_per_flush
+        """
+        with self._lock:
+            return {
+                "playing_ticks": self._playing_ticks,
+                "flushes": self._flushes,
+                "rows_written": self._rows_written,
+                "seconds_flushed": round(self._seconds_flushed, 1),
+                "pending_seconds": round(sum(self._pending.values()), 1),
+                "writes_saved": max(0, self._playing_ticks - self._flushes),
+                "ticks_per_flush": round(self._playing_ticks / self._flushes, 1)
+                if self._flushes
+                else None,
+            }
+
+
+_accumulator = ListenAccumulator()
+
+
+def record_listen_tick(
+    session_id: Optional[int], is_playing: bool, started_at: Optional[float] = None
+) -> None:
+    """Account for playback time on the shared accumulator (see ListenAccumulator.tick)."""
+    _accumulator.tick(session_id, is_playing, started_at)
+
+
+def flush_listen_sessions() -> int:
+    """Persist buffered listening time now (track change, pause, shutdown)."""
+    return _accumulator.flush()
+
+
+def get_listen_accounting_stats() -> dict[str, Any]:
+    """Write-amplification metrics for the shared accumulator."""
+    return _accumulator.stats()
+
+
+atexit.register(flush_listen_sessions)
@@ -15,7 +15,9 @@ from typing import Any, NamedTuple, Optional
 from loguru import logger
 
 from music_minion.core.config import Config
-from music_minion.core.database import start_listen_session, tick_listen_session
+from music_minion.core.database import start_listen_session
+
+from .listen_tracker import flush_listen_sessions, record_listen_tick
 
 # Minimum valid duration (seconds) - durations below this indicate metadata errors
 MIN_VALID_DURATION = 10.0
@@ -221,6 +223,67 @@ def get_mpv_property(socket_path: Optional[str], property_name: str) -> Any:
         return None
 
 
+# Properties observed on the event connection; changes arrive as
+# "property-change" events alongside mpv's own start-file/end-file/seek events.
+MPV_OBSERVED_PROPERTIES = ("pause", "path", "duration")
+
+
+def open_mpv_event_socket(socket_path: Optional[str]) -> Optional[socket.socket]:
+    """Open a persistent, non-blocking MPV IPC connection for playback events.
+
+    Lets the UI loop select() on MPV instead of polling it to notice pause,
+    resume, track changes and end of file.
+
+    Returns:
+        Connected socket, or None if MPV is not reachable
+    """
+    if not socket_path or not os.path.exists(socket_path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(2.0)
+        sock.connect(socket_path)
+        for observe_id, property_name in enumerate(MPV_OBSERVED_PROPERTIES, start=1):
+            command = {"command": ["observe_property", observe_id, property_name]}
+            sock.sendall((json.dumps(command) + "\n").encode("utf-8"))
+        sock.setblocking(False)
+        return sock
+    except (socket.error, OSError):
+        sock.close()
+        return None
+
+
+def read_mpv_events(sock: socket.socket) -> Optional[list[str]]:
+    """Read all pending events from an MPV event connection.
+
+    Returns:
+        Event names received (command replies are skipped), or None if MPV
+        closed the connection
+    """
+    chunks = []
+    while True:
+        try:
+            data = sock.recv(65536)
+        except BlockingIOError:
+            break
+        except OSError:
+            return None
+        if not data:
+            return None
+        chunks.append(data)
+
+    events = []
+    for line in b"".join(chunks).splitlines():
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # Partial line split across reads - the next poll catches up
+        if isinstance(message, dict) and "event" in message:
+            events.append(message["event"])
+    return events
+
+
 def play_file(
     state: PlayerState,
     local_path: str,
@@ -289,6 +352,9 @@ def play_file(
             state.socket_path, {"command": ["set_property", "pause", False]}
         )
 
+        # Previous track's listening time is complete
+        flush_listen_sessions()
+
         # Start new listening session if we have a track_id
         session_id = None
         if track_id is not None:
@@ -326,7 +392,8 @@ def pause_playback(state: PlayerState) -> tuple[PlayerState, bool]:
     )
 
     if success:
-        # Note: Session continues but won't be ticked while paused
+        # Session continues but won't accumulate time while paused
+        flush_listen_sessions()
         return state._replace(is_playing=False), True
 
     return state, False
@@ -356,6 +423,8 @@ def toggle_pause(state: PlayerState) -> tuple[PlayerState, bool]:
     success = send_mpv_command(state.socket_path, {"command": ["cycle", "pause"]})
 
     if success:
+        if state.is_playing:
+            flush_listen_sessions()
         return state._replace(is_playing=not state.is_playing), True
 
     return state, False
@@ -370,6 +439,7 @@ def stop_playback(state: PlayerState) -> tuple[PlayerState, bool]:
 
     if success:
         # Session ends when playback stops
+        flush_listen_sessions()
         return state._replace(
             current_track=None,
             current_track_id=None,
@@ -384,23 +454,25 @@ def stop_playback(state: PlayerState) -> tuple[PlayerState, bool]:
 
 
 def tick_session(state: PlayerState) -> PlayerState:
-    """Tick the current listening session if playing.
+    """Account listening time for the current session.
 
-    Should be called every second during playback.
+    Called on every player poll. Time is buffered in memory and written in
+    batches (see listen_tracker), so polling frequency doesn't drive writes.
 
     Args:
         state: Current player state
 
     Returns:
-        Updated state (unchanged, but session is ticked)
+        Updated state (unchanged, but session time is accumulated)
     """
-    if state.current_session_id is not None and state.is_playing:
-        try:
-            tick_listen_session(state.current_session_id, state.is_playing)
-        except Exception:
-            logger.exception(
-                f"Failed to tick listening session: session_id={state.current_session_id}"
-            )
+    try:
+        record_listen_tick(
+            state.current_session_id, state.is_playing, state.playback_started_at
+        )
+    except Exception:
+        logger.exception(
+            f"Failed to tick listening session: session_id={state.current_session_id}"
+        )
 
     return state
 
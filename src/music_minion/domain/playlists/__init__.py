@@ -6,69 +6,83 @@ This domain handles:
 - AI-powered natural language playlist parsing
 - Import from M3U/M3U8/Serato formats
 - Export to M3U8/Serato formats with auto-export
+- Harmonic-mixing order (Camelot keys, BPM, energy arcs)
 """
 
-# CRUD operations
-from .crud import (
-    create_playlist,
-    update_playlist_track_count,
-    delete_playlist,
-    rename_playlist,
-    get_all_playlists,
-    get_playlists_sorted_by_recent,
-    get_playlist_by_name,
-    get_playlist_by_id,
-    get_playlist_tracks,
-    get_playlist_track_count,
-    add_track_to_playlist,
-    remove_track_from_playlist,
-    reorder_playlist_track,
-    set_active_playlist,
-    get_active_playlist,
-    clear_active_playlist,
-    get_available_playlist_tracks,
-)
-
-# Filter operations
-from .filters import (
-    VALID_FIELDS,
-    TEXT_OPERATORS,
-    NUMERIC_OPERATORS,
-    TEXT_FIELDS,
-    NUMERIC_FIELDS,
-    validate_filter,
-    add_filter,
-    remove_filter,
-    update_filter,
-    get_playlist_filters,
-    build_filter_query,
-    evaluate_filters,
-)
-
-# AI parsing
-from .ai_parser import (
-    parse_natural_language_to_filters,
-    format_filters_for_preview,
-    edit_filters_interactive,
-)
-
-# Import
-from .importers import (
-    detect_playlist_format,
-    resolve_relative_path,
-    import_m3u,
-    import_serato_crate,
-    import_playlist,
-)
+from music_minion.lazy import lazy_exports
 
-# Export
-from .exporters import (
-    make_relative_path,
-    export_m3u8,
-    export_serato_crate,
-    export_playlist,
-    auto_export_playlist,
-    export_all_playlists,
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        # CRUD operations
+        ".crud": (
+            "create_playlist",
+            "update_playlist_track_count",
+            "delete_playlist",
+            "rename_playlist",
+            "get_all_playlists",
+            "get_playlists_sorted_by_recent",
+            "get_playlist_by_name",
+            "get_playlist_by_id",
+            "get_playlist_tracks",
+            "get_playlist_track_count",
+            "add_track_to_playlist",
+            "remove_track_from_playlist",
+            "reorder_playlist_track",
+            "reorder_playlist_for_mixing",
+            "set_active_playlist",
+            "get_active_playlist",
+            "clear_active_playlist",
+            "get_available_playlist_tracks",
+        ),
+        # Filter operations
+        ".filters": (
+            "VALID_FIELDS",
+            "TEXT_OPERATORS",
+            "NUMERIC_OPERATORS",
+            "TEXT_FIELDS",
+            "NUMERIC_FIELDS",
+            "validate_filter",
+            "add_filter",
+            "remove_filter",
+            "update_filter",
+            "get_playlist_filters",
+            "build_filter_query",
+            "build_filter_match",
+            "evaluate_filters",
+        ),
+        # AI parsing
+        ".ai_parser": (
+            "parse_natural_language_to_filters",
+            "format_filters_for_preview",
+            "edit_filters_interactive",
+        ),
+        # Import
+        ".importers": (
+            "detect_playlist_format",
+            "resolve_relative_path",
+            "import_m3u",
+            "import_serato_crate",
+            "import_playlist",
+        ),
+        # Export
+        ".exporters": (
+            "make_relative_path",
+            "export_m3u8",
+            "export_serato_crate",
+            "export_playlist",
+            "auto_export_playlist",
+            "export_all_playlists",
+            "get_auto_export_options",
+            "schedule_auto_export",
+        ),
+        # Harmonic mixing
+        ".sequencer": (
+            "ENERGY_ARCS",
+            "sequence_tracks",
+            "load_mix_features",
+        ),
+    },
 )
 
 __all__ = [
@@ -86,6 +100,7 @@ __all__ = [
     "add_track_to_playlist",
     "remove_track_from_playlist",
     "reorder_playlist_track",
+    "reorder_playlist_for_mixing",
     "set_active_playlist",
     "get_active_playlist",
     "clear_active_playlist",
@@ -102,6 +117,7 @@ __all__ = [
     "update_filter",
     "get_playlist_filters",
     "build_filter_query",
+    "build_filter_match",
     "evaluate_filters",
     # AI parsing
     "parse_natural_language_to_filters",
@@ -120,4 +136,10 @@ __all__ = [
     "export_playlist",
     "auto_export_playlist",
     "export_all_playlists",
+    "get_auto_export_options",
+    "schedule_auto_export",
+    # Harmonic mixing
+    "ENERGY_ARCS",
+    "sequence_tracks",
+    "load_mix_features",
 ]
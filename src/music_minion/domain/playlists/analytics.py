@@ -58,7 +58,7 @@ def get_basic_stats(playlist_id: int) -> dict[str, Any]:
                     "year_max": None,
                 }
 
-            where_clause, params = filters.build_filter_query(playlist_filters)
+            where_clause, params = filters.build_filter_match(playlist_filters)
             cursor = conn.execute(
                 f"""
                 SELECT
@@ -153,7 +153,7 @@ def get_artist_analysis(playlist_id: int, top_n: int = 10) -> dict[str, Any]:
                     "diversity_ratio": 0.0,
                 }
 
-            where_clause, params = filters.build_filter_query(playlist_filters)
+            where_clause, params = filters.build_filter_match(playlist_filters)
 
             # Get total tracks
             cursor = conn.execute(
@@ -250,7 +250,7 @@ def get_genre_distribution(playlist_id: int) -> dict[str, Any]:
             if not playlist_filters:
                 return {"genres": []}
 
-            where_clause, params = filters.build_filter_query(playlist_filters)
+            where_clause, params = filters.build_filter_match(playlist_filters)
 
             # Get total tracks
             cursor = conn.execute(
@@ -393,7 +393,7 @@ def get_tag_analysis(playlist_id: int, top_n: int = 10) -> dict[str, Any]:
                     "most_confident_ai_tags": [],
                 }
 
-            where_clause, params = filters.build_filter_query(playlist_filters)
+            where_clause, params = filters.build_filter_match(playlist_filters)
 
             # Get top tags by source
             cursor = conn.execute(
@@ -524,7 +524,7 @@ def get_bpm_analysis(playlist_id: int) -> dict[str, Any]:
                     "distribution": {},
                 }
 
-            where_clause, params = filters.build_filter_query(playlist_filters)
+            where_clause, params = filters.build_filter_match(playlist_filters)
             cursor = conn.execute(
                 f"""
                 SELECT
@@ -688,7 +688,7 @@ def get_key_distribution(playlist_id: int) -> dict[str, Any]:
                     "harmonic_pairs_count": 0,
                 }
 
-            where_clause, params = filters.build_filter_query(playlist_filters)
+            where_clause, params = filters.build_filter_match(playlist_filters)
 
             cursor = conn.execute(
                 f"""
@@ -782,7 +782,7 @@ def get_year_distribution(playlist_id: int) -> dict[str, Any]:
                     "recent_percentage": 0,
                 }
 
-            where_clause, params = filters.build_filter_query(playlist_filters)
+            where_clause, params = filters.build_filter_match(playlist_filters)
             cursor = conn.execute(
                 f"""
                 SELECT
@@ -883,7 +883,7 @@ def get_rating_analysis(playlist_id: int) -> dict[str, Any]:
             if not playlist_filters:
                 return {"rating_counts": {}, "most_loved_tracks": []}
 
-            where_clause, params = filters.build_filter_query(playlist_filters)
+            where_clause, params = filters.build_filter_match(playlist_filters)
 
             cursor = conn.execute(
                 f"""
@@ -984,7 +984,7 @@ def get_quality_metrics(playlist_id: int) -> dict[str, Any]:
                     "completeness_score": 0,
                 }
 
-            where_clause, params = filters.build_filter_query(playlist_filters)
+            where_clause, params = filters.build_filter_match(playlist_filters)
 
             cursor = conn.execute(
                 f"""
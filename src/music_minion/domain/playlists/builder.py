@@ -3,18 +3,24 @@
 Provides core functionality for the web-based playlist builder:
 - Filter management (separate from smart playlist filters)
 - Candidate track selection with exclusions
+- Per-session candidate pools (shuffled once, consumed on add/skip)
+- "More like this": candidates nearest to a seed track, from the same pool
 - Skip/add operations
 - Session persistence
 """
 
+import random
 import sqlite3
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
 from loguru import logger
 
 from music_minion.core.database import get_db_connection
-from .filters import build_filter_query, validate_filter
+from .filter_index import bitmap_to_ids, match_filters, page_track_ids
+from .filters import validate_filter
 from .crud import add_track_to_playlist as add_track_to_playlist_crud
 
 
@@ -88,6 +94,8 @@ def set_builder_filters(playlist_id: int, filters: list[dict]) -> None:
 
         conn.commit()
 
+    invalidate_candidate_pool(playlist_id)
+
 
 def clear_builder_filters(playlist_id: int) -> None:
     """Remove all builder filters for a playlist.
@@ -102,6 +110,8 @@ def clear_builder_filters(playlist_id: int) -> None:
         )
         conn.commit()
 
+    invalidate_candidate_pool(playlist_id)
+
 
 # Candidate Selection
 
@@ -131,7 +141,7 @@ def get_candidate_tracks(
     Returns:
         Tuple of (tracks list, total count)
     """
-    # Validate sort_field against allowlist to prevent SQL injection
+    # Validate sort_field against the orders the filter index can produce
     ALLOWED_SORT_FIELDS = {
         "artist",
         "title",
@@ -144,111 +154,223 @@ def get_candidate_tracks(
     if sort_field not in ALLOWED_SORT_FIELDS:
         sort_field = "artist"
 
-    # Map elo_rating to the computed column
-    order_column = (
-        "COALESCE(er.rating, 1500.0)" if sort_field == "elo_rating" else f"t.{sort_field}"
-    )
-    order_dir = "DESC" if sort_direction == "desc" else "ASC"
-
     # Get builder filters
     filters = get_builder_filters(playlist_id)
 
-    # Build WHERE clause for filters
-    filter_where = ""
-    filter_params = []
-    if filters:
-        filter_where, filter_params = build_filter_query(filters)
-        filter_where = f"({filter_where}) AND "
+    # Exact candidate set from bitmap algebra: count is a popcount, and the
+    # page comes from the index's presorted order - no COUNT + page queries
+    candidates = match_filters(
+        filters,
+        playlist_id,
+        playable_only=True,
+        exclude_members=True,
+        exclude_skipped=True,
+        exclude_archived=True,
+    )
+    total_count = candidates.bit_count()
+    page_ids = page_track_ids(
+        candidates, sort_field, sort_direction == "desc", limit, offset
+    )
+    if not page_ids:
+        return ([], total_count)
 
-    # Query with NOT EXISTS optimization for better performance
     with get_db_connection() as conn:
-        # First get total count (without LIMIT/OFFSET)
-        count_query = f"""
-            SELECT COUNT(DISTINCT t.id)
-            FROM tracks t
-            WHERE {filter_where}
-                t.local_path IS NOT NULL AND t.local_path != ''
-                AND NOT EXISTS (
-                    SELECT 1 FROM playlist_tracks
-                    WHERE playlist_id = ? AND track_id = t.id
-                )
-                AND NOT EXISTS (
-                    SELECT 1 FROM playlist_builder_skipped
-                    WHERE playlist_id = ? AND track_id = t.id
-                )
-                AND NOT EXISTS (
-                    SELECT 1 FROM ratings
-                    WHERE rating_type = 'archive' AND track_id = t.id
-                )
-        """
-
+        placeholders = ",".join("?" * len(page_ids))
         cursor = conn.execute(
-            count_query,
-            tuple(filter_params) + (playlist_id, playlist_id),
+            f"SELECT t.* FROM tracks t WHERE t.id IN ({placeholders})", page_ids
         )
-        total_count = cursor.fetchone()[0]
-
-        # Then get paginated results
-        query = f"""
-            SELECT DISTINCT
-                t.*
-            FROM tracks t
-            WHERE {filter_where}
-                t.local_path IS NOT NULL AND t.local_path != ''
-                AND NOT EXISTS (
-                    SELECT 1 FROM playlist_tracks
-                    WHERE playlist_id = ? AND track_id = t.id
-                )
-                AND NOT EXISTS (
-                    SELECT 1 FROM playlist_builder_skipped
-                    WHERE playlist_id = ? AND track_id = t.id
-                )
-                AND NOT EXISTS (
-                    SELECT 1 FROM ratings
-                    WHERE rating_type = 'archive' AND track_id = t.id
-                )
-            ORDER BY {order_column} {order_dir} NULLS LAST, t.id ASC
-            LIMIT ? OFFSET ?
-        """
+        rows = {row["id"]: dict(row) for row in cursor.fetchall()}
 
-        cursor = conn.execute(
-            query,
-            tuple(filter_params) + (playlist_id, playlist_id, limit, offset),
-        )
-        tracks = [dict(row) for row in cursor.fetchall()]
+    tracks = [rows[track_id] for track_id in page_ids if track_id in rows]
+    return (tracks, total_count)
+
+
+# Candidate Pools
+
+# Upcoming candidates to hand out for cache warm-up
+PREFETCH_CANDIDATES = 3
+
+
+@dataclass
+class _CandidatePool:
+    """Shuffled candidate IDs for one builder session."""
+
+    order: list[int]
+    removed: set[int] = field(default_factory=set)
+    cursor: int = 0  # Everything before this index has been removed
 
-        return (tracks, total_count)
+
+_pools: dict[int, _CandidatePool] = {}
+_pools_lock = threading.Lock()
+
+
+def _build_pool(playlist_id: int) -> _CandidatePool:
+    candidates = match_filters(
+        get_builder_filters(playlist_id),
+        playlist_id,
+        playable_only=True,
+        exclude_members=True,
+        exclude_skipped=True,
+        exclude_archived=True,
+    )
+    order = bitmap_to_ids(candidates)
+    random.shuffle(order)
+    logger.debug(f"Builder pool for playlist {playlist_id}: {len(order)} candidates")
+    return _CandidatePool(order)
+
+
+def _get_pool(playlist_id: int) -> _CandidatePool:
+    with _pools_lock:
+        pool = _pools.get(playlist_id)
+    if pool is None:
+        pool = _build_pool(playlist_id)
+        with _pools_lock:
+            pool = _pools.setdefault(playlist_id, pool)
+    return pool
+
+
+def _upcoming(pool: _CandidatePool, count: int, exclude_track_id: Optional[int]) -> list[int]:
+    """Next ``count`` IDs in pool order, skipping removed and excluded tracks."""
+    with _pools_lock:
+        while pool.cursor < len(pool.order) and pool.order[pool.cursor] in pool.removed:
+            pool.cursor += 1
+        upcoming = []
+        for track_id in pool.order[pool.cursor :]:
+            if len(upcoming) >= count:
+                break
+            if track_id not in pool.removed and track_id != exclude_track_id:
+                upcoming.append(track_id)
+        return upcoming
+
+
+def _similar_in_pool(
+    pool: _CandidatePool, seed_track_id: int, count: int, exclude_track_id: Optional[int]
+) -> list[int]:
+    """The ``count`` remaining pool tracks that sound most like the seed."""
+    from music_minion.domain.analysis import similar_tracks
+
+    with _pools_lock:
+        remaining = [
+            track_id
+            for track_id in pool.order[pool.cursor :]
+            if track_id not in pool.removed and track_id != exclude_track_id
+        ]
+    return [track_id for track_id, _ in similar_tracks(seed_track_id, count, within=remaining)]
+
+
+def _next_ids(
+    pool: _CandidatePool,
+    count: int,
+    exclude_track_id: Optional[int],
+    like_track_id: Optional[int],
+) -> list[int]:
+    if like_track_id is not None:
+        similar = _similar_in_pool(pool, like_track_id, count, exclude_track_id)
+        if similar:
+            return similar
+        # Seed not analyzed yet, or no analyzed candidates: plain shuffle order
+    return _upcoming(pool, count, exclude_track_id)
+
+
+def _remove_from_pool(playlist_id: int, track_id: int) -> None:
+    with _pools_lock:
+        pool = _pools.get(playlist_id)
+        if pool is not None:
+            pool.removed.add(track_id)
+
+
+def invalidate_candidate_pool(playlist_id: int) -> None:
+    """Drop a playlist's candidate pool; the next request reshuffles from scratch.
+
+    Called when builder filters change or a skipped track is restored.
+    """
+    with _pools_lock:
+        _pools.pop(playlist_id, None)
+
+
+def _fetch_if_candidate(conn, playlist_id: int, track_id: int) -> Optional[dict]:
+    """Return the track if it is still a candidate (another client may have
+    added, skipped or archived it since the pool was built)."""
+    row = conn.execute(
+        """
+        SELECT t.* FROM tracks t
+        WHERE t.id = ?
+            AND t.local_path IS NOT NULL AND t.local_path != ''
+            AND NOT EXISTS (
+                SELECT 1 FROM playlist_tracks WHERE playlist_id = ? AND track_id = t.id
+            )
+            AND NOT EXISTS (
+                SELECT 1 FROM playlist_builder_skipped WHERE playlist_id = ? AND track_id = t.id
+            )
+            AND NOT EXISTS (
+                SELECT 1 FROM ratings WHERE rating_type = 'archive' AND track_id = t.id
+            )
+        """,
+        (track_id, playlist_id, playlist_id),
+    ).fetchone()
+    return dict(row) if row else None
 
 
 def get_next_candidate(
-    playlist_id: int, exclude_track_id: Optional[int] = None
+    playlist_id: int,
+    exclude_track_id: Optional[int] = None,
+    like_track_id: Optional[int] = None,
 ) -> Optional[dict]:
     """Get next random candidate track for the session.
 
-    Excludes the last processed track for variety.
-    Returns None if no candidates available.
+    Candidates come from the session's pool, shuffled once when the session
+    starts (or after a filter change), so the whole filtered library is
+    sampled rather than the first alphabetical page. The candidate stays at
+    the head of the pool until it is added or skipped.
 
     Args:
         playlist_id: Playlist ID
         exclude_track_id: Track ID to exclude (typically last processed)
+        like_track_id: Prefer the candidate that sounds most like this track
+            (falls back to pool order when it has no audio features)
 
     Returns:
         Track dict or None
     """
-    # Get all candidates (first page, random order)
-    candidates, _ = get_candidate_tracks(playlist_id, sort_field="artist", sort_direction="asc", limit=100, offset=0)
-
-    # Filter out excluded track
-    if exclude_track_id is not None:
-        candidates = [c for c in candidates if c["id"] != exclude_track_id]
-
-    # Return random candidate
-    if candidates:
-        import random
+    rebuilt = False
+    with get_db_connection() as conn:
+        while True:
+            pool = _get_pool(playlist_id)
+            for track_id in _next_ids(
+                pool, 1 + PREFETCH_CANDIDATES, exclude_track_id, like_track_id
+            ):
+                track = _fetch_if_candidate(conn, playlist_id, track_id)
+                if track is not None:
+                    return track
+                _remove_from_pool(playlist_id, track_id)  # Stale: handled elsewhere
+
+            if _upcoming(pool, 1, exclude_track_id):
+                continue  # Only stale heads were checked; try the next ones
+            if rebuilt:
+                return None
+            # Exhausted: pick up tracks added to the library since the pool was built
+            invalidate_candidate_pool(playlist_id)
+            rebuilt = True
+
+
+def peek_next_candidates(
+    playlist_id: int,
+    current_track_id: int,
+    count: int = PREFETCH_CANDIDATES,
+    like_track_id: Optional[int] = None,
+) -> list[int]:
+    """IDs of the candidates after the current one, for warming caches.
 
-        return random.choice(candidates)
+    Args:
+        playlist_id: Playlist ID
+        current_track_id: Candidate currently being shown
+        count: How many upcoming candidates to return
+        like_track_id: Seed track of a "more like this" session
 
-    return None
+    Returns:
+        Track IDs in the order get_next_candidate will hand them out
+    """
+    return _next_ids(_get_pool(playlist_id), count, current_track_id, like_track_id)
 
 
 # Skip/Add Operations
@@ -309,6 +431,7 @@ def skip_track(playlist_id: int, track_id: int) -> dict:
 
             conn.commit()
 
+        _remove_from_pool(playlist_id, track_id)
         return {"skipped_track_id": track_id, "success": True}
 
     except sqlite3.Error as e:
@@ -328,6 +451,8 @@ def add_track(playlist_id: int, track_id: int) -> dict:
     """
     try:
         success = add_track_to_playlist_crud(playlist_id, track_id)
+        if success:
+            _remove_from_pool(playlist_id, track_id)
         return {"added_track_id": track_id, "success": success}
 
     except Exception as e:
@@ -368,6 +493,8 @@ def unskip_track(playlist_id: int, track_id: int) -> bool:
 
         conn.commit()
 
+    invalidate_candidate_pool(playlist_id)
+
     # For smart playlists: refresh to re-add the track if it still matches filters
     playlist = get_playlist_by_id(playlist_id)
     if playlist and playlist["type"] == "smart":
@@ -408,6 +535,7 @@ def start_builder_session(playlist_id: int) -> dict:
     """Create or resume builder session.
 
     Note: Does NOT return current track. Frontend calls get_next_candidate() separately.
+    Materializes a freshly shuffled candidate pool for the session.
 
     Args:
         playlist_id: Playlist ID
@@ -418,6 +546,10 @@ def start_builder_session(playlist_id: int) -> dict:
     Raises:
         sqlite3.Error: If database operation fails
     """
+    pool = _build_pool(playlist_id)
+    with _pools_lock:
+        _pools[playlist_id] = pool
+
     with get_db_connection() as conn:
         # Check if session exists
         cursor = conn.execute(
@@ -507,6 +639,7 @@ def end_builder_session(playlist_id: int) -> None:
     Raises:
         sqlite3.Error: If database operation fails
     """
+    invalidate_candidate_pool(playlist_id)
     with get_db_connection() as conn:
         conn.execute(
             """
@@ -11,7 +11,7 @@ from loguru import logger
 
 from music_minion.core.database import get_db_connection
 
-from . import sync
+from . import ordering, sync
 
 
 def _insert_playlist(
@@ -218,16 +218,10 @@ def reorder_playlist_by_elo(playlist_id: int) -> bool:
             logger.info(f"No tracks found in playlist {playlist_id}")
             return True
 
-        # Update positions based on rating order
-        for position, track in enumerate(tracks, 1):
-            conn.execute(
-                """
-                UPDATE playlist_tracks
-                SET position = ?
-                WHERE playlist_id = ? AND track_id = ?
-            """,
-                (position, playlist_id, track["track_id"]),
-            )
+        # Update positions based on rating order (rows already in order are kept)
+        ordering.apply_order(
+            conn, "playlist_tracks", playlist_id, [track["track_id"] for track in tracks]
+        )
 
         conn.commit()
         logger.info(
@@ -236,6 +230,59 @@ def reorder_playlist_by_elo(playlist_id: int) -> bool:
         return True
 
 
+def reorder_playlist_for_mixing(playlist_id: int, arc: str = "peak") -> bool:
+    """
+    Reorder a manual playlist for smooth DJ transitions.
+
+    Sequences by Camelot key moves, BPM deltas and energy (see
+    playlists.sequencer); tracks added while sequencing runs keep their
+    relative order at the end.
+
+    Args:
+        playlist_id: Playlist ID to reorder
+        arc: Energy arc over the playlist: none, rise, fall or peak
+
+    Returns:
+        True if reordering was successful, False if playlist not found or not manual
+
+    Raises:
+        ValueError: Unknown energy arc
+    """
+    from .sequencer import load_mix_features, sequence_tracks
+
+    with get_db_connection() as conn:
+        row = conn.execute("SELECT type FROM playlists WHERE id = ?", (playlist_id,)).fetchone()
+        if not row or row["type"] != "manual":
+            logger.warning(f"Playlist {playlist_id} not found or not a manual playlist")
+            return False
+        track_ids = [
+            r["track_id"]
+            for r in conn.execute(
+                "SELECT track_id FROM playlist_tracks WHERE playlist_id = ? ORDER BY position",
+                (playlist_id,),
+            )
+        ]
+
+    # Seconds for large playlists: don't hold a write transaction meanwhile
+    order = sequence_tracks(load_mix_features(track_ids), arc=arc)
+
+    with get_db_connection() as conn:
+        conn.execute("BEGIN")
+        try:
+            ordering.apply_order(conn, "playlist_tracks", playlist_id, order)
+            conn.execute(
+                "UPDATE playlists SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (playlist_id,),
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    logger.info(f"Reordered {len(order)} tracks in playlist {playlist_id} for mixing (arc={arc})")
+    return True
+
+
 def get_all_playlists(
     library: Optional[str] = None, conn: Optional[Connection] = None
 ) -> list[dict[str, Any]]:
@@ -417,7 +464,7 @@ def get_playlist_tracks(
             """
             SELECT
                 t.*,
-                pt.position,
+                ROW_NUMBER() OVER (ORDER BY pt.position) - 1 AS position,
                 pt.added_at,
                 COALESCE(per.rating, 1500.0) as playlist_elo_rating,
                 COALESCE(per.comparison_count, 0) as playlist_elo_comparison_count,
@@ -556,7 +603,7 @@ def _track_in_playlist_has_sc(c: Connection, playlist_id: int, track_id: int) ->
 
 
 def _remove_track_local(c: Connection, playlist_id: int, track_id: int) -> bool:
-    """Delete a track from a playlist locally and resequence positions."""
+    """Delete a track from a playlist locally."""
     c.execute("BEGIN")
     try:
         cursor = c.execute(
@@ -567,17 +614,7 @@ def _remove_track_local(c: Connection, playlist_id: int, track_id: int) -> bool:
             c.rollback()
             return False  # Track wasn't in playlist
 
-        # Reorder remaining tracks to fill gap (O(n) instead of O(n²))
-        cursor = c.execute(
-            "SELECT id FROM playlist_tracks WHERE playlist_id = ? ORDER BY position",
-            (playlist_id,),
-        )
-        remaining_track_ids = [row["id"] for row in cursor.fetchall()]
-        for new_position, playlist_track_id in enumerate(remaining_track_ids):
-            c.execute(
-                "UPDATE playlist_tracks SET position = ? WHERE id = ?",
-                (new_position, playlist_track_id),
-            )
+        # Positions are ordering keys (see ordering.py): the gap needs no fill
         c.execute(
             "UPDATE playlists SET updated_at = CURRENT_TIMESTAMP, track_count = track_count - 1 WHERE id = ?",
             (playlist_id,),
@@ -647,6 +684,9 @@ def reorder_playlist_track(playlist_id: int, from_pos: int, to_pos: int) -> bool
     """
     Reorder a track within a playlist.
 
+    Only the moved row is written: it takes a position between its new
+    neighbours (see ordering.py).
+
     Args:
         playlist_id: Playlist ID
         from_pos: Current position (0-indexed)
@@ -659,35 +699,24 @@ def reorder_playlist_track(playlist_id: int, from_pos: int, to_pos: int) -> bool
         # Begin explicit transaction for atomicity
         conn.execute("BEGIN")
         try:
-            # Get all tracks in order
-            cursor = conn.execute(
-                """
-                SELECT id, position FROM playlist_tracks
-                WHERE playlist_id = ?
-                ORDER BY position
-            """,
+            count = conn.execute(
+                "SELECT COUNT(*) FROM playlist_tracks WHERE playlist_id = ?",
                 (playlist_id,),
-            )
-            tracks = [dict(row) for row in cursor.fetchall()]
-
-            if not tracks or from_pos >= len(tracks) or to_pos >= len(tracks):
+            ).fetchone()[0]
+            if not 0 <= from_pos < count or not 0 <= to_pos < count:
                 conn.rollback()
                 return False
 
-            # Move track from from_pos to to_pos
-            track_to_move = tracks.pop(from_pos)
-            tracks.insert(to_pos, track_to_move)
-
-            # Update all positions
-            for i, track in enumerate(tracks):
-                conn.execute(
-                    """
-                    UPDATE playlist_tracks
-                    SET position = ?
-                    WHERE id = ?
-                """,
-                    (i, track["id"]),
-                )
+            row = conn.execute(
+                """
+                SELECT track_id FROM playlist_tracks
+                WHERE playlist_id = ?
+                ORDER BY position, rowid
+                LIMIT 1 OFFSET ?
+            """,
+                (playlist_id, from_pos),
+            ).fetchone()
+            ordering.move_track(conn, "playlist_tracks", playlist_id, row["track_id"], to_pos)
 
             # Update playlist updated_at
             conn.execute(
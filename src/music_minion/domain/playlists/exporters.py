@@ -1,19 +1,69 @@
 """
 Playlist export functionality for Music Minion CLI.
 Supports exporting to M3U/M3U8 and Serato .crate formats.
+
+Auto-export is change-detected: each (playlist, format) export stores a hash
+of its rendered content in playlist_exports and unchanged outputs are skipped.
 """
 
 import csv
+import hashlib
+import io
 import os
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
+
+from loguru import logger
 
+from music_minion.core.config import load_config
+from music_minion.core.database import get_db_connection
 from music_minion.domain.library.metadata import write_elo_to_file
 
 from .crud import get_playlist_by_id, get_playlist_by_name, get_playlist_tracks
 
+# Process umask, read once at import (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Concurrent playlist exports in export_all_playlists
+EXPORT_WORKERS = 4
+
+# Seconds of quiet before a scheduled auto-export runs (coalesces edit bursts)
+EXPORT_DEBOUNCE_SECONDS = 2.0
+
+CSV_FIELDNAMES = [
+    "id",  # Database ID
+    "position",  # Position in playlist
+    "playlist_elo_rating",
+    "title",
+    "artist",
+    "top_level_artist",
+    "remix_artist",
+    "genre",
+    "year",
+    "duration",
+    "key_signature",
+    "bpm",
+    "album",
+    "local_path",
+    "soundcloud_id",
+    "spotify_id",
+    "youtube_id",
+    "source",
+    # ELO Ratings
+    "playlist_elo_comparison_count",
+    "playlist_elo_wins",
+    "global_elo_rating",
+    "global_elo_comparison_count",
+    "global_elo_wins",
+]
+
 
 def make_relative_path(track_path: Path, library_root: Path) -> str:
     """
@@ -36,6 +86,120 @@ def make_relative_path(track_path: Path, library_root: Path) -> str:
         return str(track_path)
 
 
+def _content_hash(content: str) -> str:
+    """Hash rendered export content for change detection."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _atomic_write(output_path: Path, write: Callable[[Path], None]) -> None:
+    """
+    Write a file atomically: write() fills a temp file that replaces output_path.
+
+    Readers (Serato, Syncthing) never observe a partially written playlist.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    temp_path = Path(tmp_name)
+    try:
+        write(temp_path)
+        # mkstemp creates 0600; give the export the permissions a plain open() would
+        os.chmod(temp_path, 0o666 & ~_UMASK)
+        os.replace(temp_path, output_path)
+    except Exception:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise
+
+
+def _atomic_write_text(output_path: Path, content: str) -> None:
+    """Atomically write UTF-8 text (newlines written verbatim)."""
+
+    def _write(temp_path: Path) -> None:
+        with open(temp_path, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+
+    _atomic_write(output_path, _write)
+
+
+def _render_m3u8(
+    pl: dict[str, Any],
+    tracks: list[dict[str, Any]],
+    library_root: Path,
+    use_relative_paths: bool,
+    exported_at: Optional[str],
+) -> str:
+    """Render M3U8 content. exported_at=None omits the volatile timestamp line."""
+    lines = ["#EXTM3U\n", f"# Playlist: {pl['name']}\n"]
+    if pl.get("description"):
+        lines.append(f"# Description: {pl['description']}\n")
+    if exported_at is not None:
+        lines.append(f"# Exported: {exported_at}\n")
+    lines.append(f"# Tracks: {len(tracks)}\n")
+    lines.append("\n")
+
+    for track in tracks:
+        track_path = Path(track["local_path"])
+
+        # EXTINF line (metadata)
+        duration = int(track.get("duration") or 0)
+        artist = track.get("artist", "Unknown Artist")
+        title = track.get("title", track_path.stem)
+        lines.append(f"#EXTINF:{duration},{artist} - {title}\n")
+
+        # File path
+        if use_relative_paths:
+            path_str = make_relative_path(track_path, library_root)
+        else:
+            path_str = str(track_path)
+
+        lines.append(f"{path_str}\n")
+
+    return "".join(lines)
+
+
+def _load_export_data(playlist_id: int) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Fetch playlist row and tracks, raising ValueError if missing or empty."""
+    pl = get_playlist_by_id(playlist_id)
+    if not pl:
+        raise ValueError(f"Playlist with ID {playlist_id} not found")
+
+    tracks = get_playlist_tracks(playlist_id)
+    if not tracks:
+        raise ValueError(f"Playlist '{pl['name']}' is empty")
+
+    return pl, tracks
+
+
+def _write_m3u8(
+    pl: dict[str, Any],
+    tracks: list[dict[str, Any]],
+    output_path: Path,
+    library_root: Path,
+    use_relative_paths: bool,
+    previous_hash: Optional[str] = None,
+) -> Optional[str]:
+    """Write M3U8 unless its content hash equals previous_hash.
+
+    Returns:
+        New content hash, or None if the write was skipped
+    """
+    content_hash = _content_hash(
+        _render_m3u8(pl, tracks, library_root, use_relative_paths, exported_at=None)
+    )
+    if content_hash == previous_hash:
+        return None
+
+    exported_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    _atomic_write_text(
+        output_path,
+        _render_m3u8(pl, tracks, library_root, use_relative_paths, exported_at),
+    )
+    return content_hash
+
+
 def export_m3u8(
     playlist_id: int,
     output_path: Path,
@@ -57,49 +221,68 @@ def export_m3u8(
     Raises:
         ValueError: If playlist doesn't exist or is empty
     """
-    # Get playlist info
-    pl = get_playlist_by_id(playlist_id)
-    if not pl:
-        raise ValueError(f"Playlist with ID {playlist_id} not found")
+    pl, tracks = _load_export_data(playlist_id)
+    _write_m3u8(pl, tracks, output_path, library_root, use_relative_paths)
+    return len(tracks)
 
-    # Get tracks
-    tracks = get_playlist_tracks(playlist_id)
-    if not tracks:
-        raise ValueError(f"Playlist '{pl['name']}' is empty")
 
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+def _build_serato_crate_data(
+    tracks: list[dict[str, Any]], syncthing_config=None
+) -> list:
+    """Build serato-crate records: version + column defs + one otrk per track."""
+    crate_data: list = [
+        ("vrsn", "1.0/Serato ScratchLive Crate"),
+        ("ovct", [("tvcn", "track"), ("tvcw", "0")]),
+        ("ovct", [("tvcn", "artist"), ("tvcw", "0")]),
+        ("ovct", [("tvcn", "album"), ("tvcw", "0")]),
+        ("ovct", [("tvcn", "length"), ("tvcw", "0")]),
+    ]
+    # Dedupe paths, preserving first-seen order (Serato shows duplicates twice).
+    seen: set[str] = set()
+    for track in tracks:
+        path_str = _serato_track_path(track["local_path"], syncthing_config)
+        if path_str in seen:
+            continue
+        seen.add(path_str)
+        crate_data.append(("otrk", [("ptrk", path_str)]))
+    return crate_data
 
-    # Write M3U8 file
-    with open(output_path, "w", encoding="utf-8") as f:
-        # Write header
-        f.write("#EXTM3U\n")
-        f.write(f"# Playlist: {pl['name']}\n")
-        if pl.get("description"):
-            f.write(f"# Description: {pl['description']}\n")
-        f.write(f"# Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"# Tracks: {len(tracks)}\n")
-        f.write("\n")
-
-        # Write tracks
-        for track in tracks:
-            track_path = Path(track["local_path"])
-
-            # Write EXTINF line (metadata)
-            duration = int(track.get("duration") or 0)
-            artist = track.get("artist", "Unknown Artist")
-            title = track.get("title", track_path.stem)
-            f.write(f"#EXTINF:{duration},{artist} - {title}\n")
-
-            # Write file path
-            if use_relative_paths:
-                path_str = make_relative_path(track_path, library_root)
-            else:
-                path_str = str(track_path)
 
-            f.write(f"{path_str}\n")
+def _crate_file_path(output_path: Path, playlist_name: str) -> Path:
+    """Location of a playlist's crate under output_path/_Serato_/Subcrates."""
+    # Serato reads "Subcrates" (lowercase c)
+    return output_path / "_Serato_" / "Subcrates" / f"{playlist_name}.crate"
 
-    return len(tracks)
+
+def _write_serato_crate(
+    pl: dict[str, Any],
+    tracks: list[dict[str, Any]],
+    output_path: Path,
+    syncthing_config=None,
+    previous_hash: Optional[str] = None,
+) -> tuple[int, Optional[str]]:
+    """Write a crate unless its content hash equals previous_hash.
+
+    Returns:
+        Tuple of (tracks in crate, new content hash or None if skipped)
+    """
+    try:
+        from serato_crate import SeratoCrate
+    except ImportError:
+        raise ImportError(
+            "serato-crate library not installed. Install with: "
+            "uv pip install 'serato-crate @ git+https://github.com/stephanlensky/python-serato-crates.git'"
+        )
+
+    crate_data = _build_serato_crate_data(tracks, syncthing_config)
+    track_count = sum(1 for tag, _ in crate_data if tag == "otrk")
+    content_hash = _content_hash(repr(crate_data))
+    if content_hash == previous_hash:
+        return track_count, None
+
+    crate = SeratoCrate(crate_data)
+    _atomic_write(_crate_file_path(output_path, pl["name"]), crate.write)
+    return track_count, content_hash
 
 
 def export_serato_crate(
@@ -127,47 +310,9 @@ def export_serato_crate(
         ValueError: If playlist doesn't exist or is empty
         ImportError: If serato-crate is not installed
     """
-    try:
-        from serato_crate import SeratoCrate
-    except ImportError:
-        raise ImportError(
-            "serato-crate library not installed. Install with: "
-            "uv pip install 'serato-crate @ git+https://github.com/stephanlensky/python-serato-crates.git'"
-        )
-
-    pl = get_playlist_by_id(playlist_id)
-    if not pl:
-        raise ValueError(f"Playlist with ID {playlist_id} not found")
-
-    tracks = get_playlist_tracks(playlist_id)
-    if not tracks:
-        raise ValueError(f"Playlist '{pl['name']}' is empty")
-
-    # Serato reads "Subcrates" (lowercase c); ensure the directory exists.
-    crate_dir = output_path / "_Serato_" / "Subcrates"
-    crate_dir.mkdir(parents=True, exist_ok=True)
-
-    # Build crate_data: version + column defs + one otrk record per track.
-    crate_data: list = [
-        ("vrsn", "1.0/Serato ScratchLive Crate"),
-        ("ovct", [("tvcn", "track"), ("tvcw", "0")]),
-        ("ovct", [("tvcn", "artist"), ("tvcw", "0")]),
-        ("ovct", [("tvcn", "album"), ("tvcw", "0")]),
-        ("ovct", [("tvcn", "length"), ("tvcw", "0")]),
-    ]
-    # Dedupe paths, preserving first-seen order (Serato shows duplicates twice).
-    seen: set[str] = set()
-    for track in tracks:
-        path_str = _serato_track_path(track["local_path"], syncthing_config)
-        if path_str in seen:
-            continue
-        seen.add(path_str)
-        crate_data.append(("otrk", [("ptrk", path_str)]))
-
-    crate = SeratoCrate(crate_data)
-    crate.write(crate_dir / f"{pl['name']}.crate")
-
-    return len(seen)
+    pl, tracks = _load_export_data(playlist_id)
+    track_count, _ = _write_serato_crate(pl, tracks, output_path, syncthing_config)
+    return track_count
 
 
 def _serato_track_path(local_path: str, syncthing_config=None) -> str:
@@ -184,6 +329,48 @@ def _serato_track_path(local_path: str, syncthing_config=None) -> str:
     return abs_path.lstrip("/")
 
 
+def _render_csv(tracks: list[dict[str, Any]]) -> str:
+    """Render playlist tracks as CSV text (NULLs become empty strings)."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDNAMES, quoting=csv.QUOTE_ALL)
+    writer.writeheader()
+
+    for track in tracks:
+        # Convert track dict to CSV row, ensuring all fields are present
+        row = {}
+        for field in CSV_FIELDNAMES:
+            value = track.get(field)
+            # Convert None to empty string for CSV
+            if value is None:
+                row[field] = ""
+            elif field in ["playlist_elo_rating", "global_elo_rating"]:
+                # Round ELO ratings to 0 decimal places
+                row[field] = str(int(round(float(value))))
+            else:
+                row[field] = str(value)
+        writer.writerow(row)
+
+    return buffer.getvalue()
+
+
+def _write_csv(
+    tracks: list[dict[str, Any]],
+    output_path: Path,
+    previous_hash: Optional[str] = None,
+) -> Optional[str]:
+    """Write CSV unless its content hash equals previous_hash.
+
+    Returns:
+        New content hash, or None if the write was skipped
+    """
+    content = _render_csv(tracks)
+    content_hash = _content_hash(content)
+    if content_hash == previous_hash:
+        return None
+    _atomic_write_text(output_path, content)
+    return content_hash
+
+
 def export_csv(
     playlist_id: int,
     output_path: Path,
@@ -203,68 +390,138 @@ def export_csv(
     Raises:
         ValueError: If playlist doesn't exist or is empty
     """
-    # Get playlist info
-    pl = get_playlist_by_id(playlist_id)
-    if not pl:
-        raise ValueError(f"Playlist with ID {playlist_id} not found")
+    _, tracks = _load_export_data(playlist_id)
+    _write_csv(tracks, output_path)
+    return len(tracks)
 
-    # Get tracks
-    tracks = get_playlist_tracks(playlist_id)
-    if not tracks:
-        raise ValueError(f"Playlist '{pl['name']}' is empty")
 
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+def _get_export_hash(playlist_id: int, format_type: str, output_path: Path) -> Optional[str]:
+    """Return the stored content hash if output_path still holds that export."""
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            """
+            SELECT output_path, content_hash FROM playlist_exports
+            WHERE playlist_id = ? AND format = ?
+            """,
+            (playlist_id, format_type),
+        )
+        row = cursor.fetchone()
+
+    if not row or row["output_path"] != str(output_path) or not output_path.exists():
+        return None
+    return row["content_hash"]
+
+
+def _save_export_hash(
+    playlist_id: int, format_type: str, output_path: Path, content_hash: str
+) -> None:
+    """Record the content hash of a completed export."""
+    with get_db_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO playlist_exports (playlist_id, format, output_path, content_hash, exported_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(playlist_id, format) DO UPDATE SET
+                output_path = excluded.output_path,
+                content_hash = excluded.content_hash,
+                exported_at = excluded.exported_at
+            """,
+            (playlist_id, format_type, str(output_path), content_hash),
+        )
+        conn.commit()
 
-    # Define CSV field names (all available track metadata)
-    fieldnames = [
-        "id",  # Database ID
-        "position",  # Position in playlist
-        "playlist_elo_rating",
-        "title",
-        "artist",
-        "top_level_artist",
-        "remix_artist",
-        "genre",
-        "year",
-        "duration",
-        "key_signature",
-        "bpm",
-        "album",
-        "local_path",
-        "soundcloud_id",
-        "spotify_id",
-        "youtube_id",
-        "source",
-        # ELO Ratings
-        "playlist_elo_comparison_count",
-        "playlist_elo_wins",
-        "global_elo_rating",
-        "global_elo_comparison_count",
-        "global_elo_wins",
-    ]
 
-    # Write CSV file
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
-        writer.writeheader()
-
-        for track in tracks:
-            # Convert track dict to CSV row, ensuring all fields are present
-            row = {}
-            for field in fieldnames:
-                value = track.get(field)
-                # Convert None to empty string for CSV
-                if value is None:
-                    row[field] = ""
-                elif field in ["playlist_elo_rating", "global_elo_rating"]:
-                    # Round ELO ratings to 0 decimal places
-                    row[field] = str(int(round(float(value))))
-                else:
-                    row[field] = str(value)
-            writer.writerow(row)
+def _default_output_path(pl: dict[str, Any], format_type: str, library_root: Path) -> Path:
+    """Default export location for a format (crate: library root, others: playlists/)."""
+    if format_type == "crate":
+        # Crate format: export to library_root/_Serato_/Subcrates (standard Serato location)
+        return library_root
+    if format_type == "m3u8":
+        return library_root / "playlists" / f"{pl['name']}.m3u8"
+    if format_type == "csv":
+        return library_root / "playlists" / f"{pl['name']}.csv"
+    raise ValueError(
+        f"Unsupported format: {format_type}. Use 'm3u8', 'crate', or 'csv'"
+    )
+
+
+def _export_format(
+    pl: dict[str, Any],
+    tracks: list[dict[str, Any]],
+    format_type: str,
+    output_path: Path,
+    library_root: Path,
+    use_relative_paths: bool,
+    syncthing_config=None,
+    skip_unchanged: bool = False,
+) -> tuple[Path, int, bool]:
+    """
+    Export already-loaded playlist data to one format.
 
-    return len(tracks)
+    Returns:
+        Tuple of (output_path, tracks_exported, written) - written is False
+        when skip_unchanged found the stored content hash still current
+    """
+    file_path = (
+        _crate_file_path(output_path, pl["name"]) if format_type == "crate" else output_path
+    )
+    previous_hash = (
+        _get_export_hash(pl["id"], format_type, file_path) if skip_unchanged else None
+    )
+
+    if format_type == "m3u8":
+        tracks_exported = len(tracks)
+        content_hash = _write_m3u8(
+            pl, tracks, file_path, library_root, use_relative_paths, previous_hash
+        )
+    elif format_type == "crate":
+        tracks_exported, content_hash = _write_serato_crate(
+            pl, tracks, output_path, syncthing_config, previous_hash
+        )
+    elif format_type == "csv":
+        tracks_exported = len(tracks)
+        content_hash = _write_csv(tracks, file_path, previous_hash)
+    else:
+        raise ValueError(
+            f"Unsupported format: {format_type}. Use 'm3u8', 'crate', or 'csv'"
+        )
+
+    if content_hash is not None:
+        _save_export_hash(pl["id"], format_type, file_path, content_hash)
+
+    return file_path, tracks_exported, content_hash is not None
+
+
+def _sync_elo_metadata(tracks: list[dict[str, Any]]) -> None:
+    """Write PLAYLIST_ELO to the COMMENT field of each rated local file."""
+    elo_success = 0
+    elo_failed = 0
+
+    for track in tracks:
+        local_path = track.get("local_path")
+        playlist_elo = track.get("playlist_elo_rating")
+
+        # Skip tracks without local files or ELO ratings
+        if not local_path or not os.path.exists(local_path):
+            continue
+        if playlist_elo is None or playlist_elo == 1500.0:
+            continue
+
+        success = write_elo_to_file(
+            local_path=local_path,
+            playlist_elo=playlist_elo,
+            update_comment=True,  # Prepend to COMMENT for DJ software sorting
+        )
+
+        if success:
+            elo_success += 1
+        else:
+            elo_failed += 1
+
+    if elo_success > 0 or elo_failed > 0:
+        logger.info(
+            f"ELO metadata sync: {elo_success} succeeded, {elo_failed} failed"
+        )
 
 
 def export_playlist(
@@ -276,6 +533,7 @@ def export_playlist(
     use_relative_paths: bool = True,
     sync_metadata: bool = False,
     syncthing_config=None,
+    skip_unchanged: bool = False,
 ) -> tuple[Path, int]:
     """
     Export a playlist to a file, with flexible format selection.
@@ -288,6 +546,7 @@ def export_playlist(
         library_root: Root directory of music library (defaults to ~/Music)
         use_relative_paths: Whether to use relative paths for M3U8 (default True)
         sync_metadata: Whether to sync PLAYLIST_ELO to COMMENT field in audio files
+        skip_unchanged: Skip writing if the stored content hash is still current
 
     Returns:
         Tuple of (output_path, tracks_exported)
@@ -313,82 +572,25 @@ def export_playlist(
         # Ensure library_root is a Path (no-op if already Path, converts if string)
         library_root = Path(library_root)
 
-    # Default output path based on format
     if output_path is None:
-        if format_type == "crate":
-            # Crate format: export to library_root/_Serato_/SubCrates (standard Serato location)
-            output_path = library_root
-        else:
-            # Other formats: export to library_root/playlists
-            playlists_dir = library_root / "playlists"
-            playlists_dir.mkdir(parents=True, exist_ok=True)
-
-            if format_type == "m3u8":
-                output_path = playlists_dir / f"{pl['name']}.m3u8"
-            elif format_type == "csv":
-                output_path = playlists_dir / f"{pl['name']}.csv"
-            else:
-                raise ValueError(
-                    f"Unsupported format: {format_type}. Use 'm3u8', 'crate', or 'csv'"
-                )
+        output_path = _default_output_path(pl, format_type, library_root)
 
-    # Export based on format
-    if format_type == "m3u8":
-        tracks_exported = export_m3u8(
-            playlist_id=pl["id"],
-            output_path=output_path,
-            library_root=library_root,
-            use_relative_paths=use_relative_paths,
-        )
-    elif format_type == "crate":
-        tracks_exported = export_serato_crate(
-            playlist_id=pl["id"],
-            output_path=output_path,
-            library_root=library_root,
-            syncthing_config=syncthing_config,
-        )
-        # Update output_path to reflect the actual .crate file location
-        output_path = output_path / "_Serato_" / "Subcrates" / f"{pl['name']}.crate"
-    elif format_type == "csv":
-        tracks_exported = export_csv(playlist_id=pl["id"], output_path=output_path)
-    else:
-        raise ValueError(
-            f"Unsupported format: {format_type}. Use 'm3u8', 'crate', or 'csv'"
-        )
+    _, tracks = _load_export_data(pl["id"])
+
+    output_path, tracks_exported, _ = _export_format(
+        pl,
+        tracks,
+        format_type,
+        output_path,
+        library_root,
+        use_relative_paths,
+        syncthing_config=syncthing_config,
+        skip_unchanged=skip_unchanged,
+    )
 
     # Sync ELO metadata to files if requested
     if sync_metadata:
-        from loguru import logger
-
-        tracks = get_playlist_tracks(pl["id"])
-        elo_success = 0
-        elo_failed = 0
-
-        for track in tracks:
-            local_path = track.get("local_path")
-            playlist_elo = track.get("playlist_elo_rating")
-
-            # Skip tracks without local files or ELO ratings
-            if not local_path or not os.path.exists(local_path):
-                continue
-            if playlist_elo is None or playlist_elo == 1500.0:
-                continue
-
-            success = write_elo_to_file(
-                local_path=local_path,
-                playlist_elo=playlist_elo,
-                update_comment=True,  # Prepend to COMMENT for DJ software sorting
-            )
-
-            if success:
-                elo_success += 1
-            else:
-                elo_failed += 1
-
-        if elo_success > 0 or elo_failed > 0:
-            logger.info(
-                f"ELO metadata sync: {elo_success} succeeded, {elo_failed} failed"
-            )
+        _sync_elo_metadata(tracks)
 
     return output_path, tracks_exported
 
@@ -405,6 +607,8 @@ def auto_export_playlist(
     Auto-export a playlist to multiple formats.
 
     Used internally when playlists are modified and auto-export is enabled.
+    The playlist is loaded once for all formats, and formats whose rendered
+    content hash matches the last export are not rewritten.
 
     Args:
         playlist_id: ID of the playlist to export
@@ -415,20 +619,32 @@ def auto_export_playlist(
         syncthing_config: Syncthing configuration for path translation
 
     Returns:
-        List of tuples (format, output_path, tracks_exported)
+        List of tuples (format, output_path, tracks_exported), including
+        formats that were already up to date
     """
     results = []
+    library_root = Path(library_root)
+
+    try:
+        pl, tracks = _load_export_data(playlist_id)
+    except ValueError as e:
+        print(f"Auto-export skipped for playlist {playlist_id}: {e}", file=sys.stderr)
+        return results
 
     for format_type in export_formats:
         try:
-            output_path, tracks_exported = export_playlist(
-                playlist_id=playlist_id,
-                format_type=format_type,
-                library_root=library_root,
-                use_relative_paths=use_relative_paths,
-                sync_metadata=sync_metadata,
+            output_path, tracks_exported, written = _export_format(
+                pl,
+                tracks,
+                format_type,
+                _default_output_path(pl, format_type, library_root),
+                library_root,
+                use_relative_paths,
                 syncthing_config=syncthing_config,
+                skip_unchanged=True,
             )
+            if not written:
+                logger.debug(f"Auto-export: {pl['name']} ({format_type}) unchanged, skipped")
             results.append((format_type, output_path, tracks_exported))
         except (ValueError, FileNotFoundError, ImportError, OSError) as e:
             # Expected errors during export - fail silently for auto-export
@@ -441,19 +657,29 @@ def auto_export_playlist(
                 file=sys.stderr,
             )
 
+    if sync_metadata:
+        _sync_elo_metadata(tracks)
+
     return results
 
 
 def export_all_playlists(
-    export_formats: list[str], library_root: Path, use_relative_paths: bool = True
+    export_formats: list[str],
+    library_root: Path,
+    use_relative_paths: bool = True,
+    syncthing_config=None,
 ) -> dict[str, list[tuple[str, Path, int]]]:
     """
     Export all playlists to specified formats.
 
+    Playlists are exported concurrently (EXPORT_WORKERS threads); unchanged
+    outputs are skipped, so re-exports cost proportional to what changed.
+
     Args:
         export_formats: List of formats to export ('m3u8', 'crate', 'csv')
         library_root: Root directory of music library
         use_relative_paths: Whether to use relative paths for M3U8
+        syncthing_config: Syncthing configuration for path translation
 
     Returns:
         Dict mapping playlist names to list of (format, output_path, tracks_exported)
@@ -463,14 +689,124 @@ def export_all_playlists(
     all_playlists = get_all_playlists()
     results = {}
 
-    for pl in all_playlists:
-        playlist_results = auto_export_playlist(
+    def _export(pl: dict[str, Any]) -> list[tuple[str, Path, int]]:
+        return auto_export_playlist(
             playlist_id=pl["id"],
             export_formats=export_formats,
             library_root=library_root,
             use_relative_paths=use_relative_paths,
+            syncthing_config=syncthing_config,
         )
-        if playlist_results:
-            results[pl["name"]] = playlist_results
+
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+        for pl, playlist_results in zip(all_playlists, executor.map(_export, all_playlists)):
+            if playlist_results:
+                results[pl["name"]] = playlist_results
 
     return results
+
+
+def get_auto_export_options(cfg) -> Optional[dict[str, Any]]:
+    """
+    Resolve auto_export_playlist keyword arguments from config.
+
+    Only exports when active library is 'local'. Streaming libraries (soundcloud,
+    spotify, youtube) do not support file export.
+
+    Args:
+        cfg: Loaded Config
+
+    Returns:
+        Dict of export options, or None if auto-export doesn't apply
+    """
+    if not cfg.playlists.auto_export:
+        return None
+
+    # Check active library - only export for local library
+    with get_db_connection() as conn:
+        cursor = conn.execute("SELECT provider FROM active_library WHERE id = 1")
+        row = cursor.fetchone()
+        active_library = row["provider"] if row else "local"
+
+    if active_library != "local":
+        return None
+
+    # Validate library paths exist
+    if not cfg.music.library_paths:
+        logger.warning("Cannot auto-export - no library paths configured")
+        return None
+
+    # Get library root from config
+    library_root = Path(cfg.music.library_paths[0]).expanduser()
+
+    # For crate format: use syncthing music root if enabled, otherwise Music directory
+    if "crate" in cfg.playlists.export_formats:
+        if cfg.syncthing.enabled:
+            library_root = Path(cfg.syncthing.linux_music_root).expanduser()
+        else:
+            # Default to ~/Music for crates (standard Serato location)
+            library_root = Path.home() / "Music"
+
+    return {
+        "export_formats": cfg.playlists.export_formats,
+        "library_root": library_root,
+        "use_relative_paths": cfg.playlists.use_relative_paths,
+        "syncthing_config": cfg.syncthing,
+    }
+
+
+# Debounced background export queue: playlist_id -> monotonic deadline
+_pending_exports: dict[int, float] = {}
+_pending_lock = threading.Condition()
+_export_thread: Optional[threading.Thread] = None
+
+
+def schedule_auto_export(playlist_id: int) -> None:
+    """
+    Queue a background auto-export, coalescing bursts of edits.
+
+    Each call pushes the playlist's deadline EXPORT_DEBOUNCE_SECONDS into the
+    future, so a run of web UI edits produces a single export once they stop.
+    Config is loaded when the export actually runs.
+
+    Args:
+        playlist_id: ID of the edited playlist
+    """
+    global _export_thread
+    with _pending_lock:
+        _pending_exports[playlist_id] = time.monotonic() + EXPORT_DEBOUNCE_SECONDS
+        if _export_thread is None or not _export_thread.is_alive():
+            _export_thread = threading.Thread(target=_export_worker_loop, daemon=True)
+            _export_thread.start()
+        _pending_lock.notify()
+
+
+def _take_due_exports() -> list[int]:
+    """Block until at least one scheduled export is due and return the due IDs."""
+    with _pending_lock:
+        while True:
+            if not _pending_exports:
+                _pending_lock.wait()
+                continue
+            now = time.monotonic()
+            due = [pid for pid, deadline in _pending_exports.items() if deadline <= now]
+            if due:
+                for pid in due:
+                    del _pending_exports[pid]
+                return due
+            _pending_lock.wait(timeout=min(_pending_exports.values()) - now)
+
+
+def _export_worker_loop() -> None:
+    """Run due auto-exports. Runs as daemon thread."""
+    threading.current_thread().silent_logging = True
+    while True:
+        playlist_ids = _take_due_exports()
+        try:
+            options = get_auto_export_options(load_config())
+            if options is None:
+                continue
+            for playlist_id in playlist_ids:
+                auto_export_playlist(playlist_id=playlist_id, **options)
+        except Exception:
+            logger.exception("Background auto-export failed")
@@ -0,0 +1,481 @@
+"""In-process bitmap index for playlist filter evaluation.
+
+Filter rules are answered from inverted indexes over track IDs instead of
+ad-hoc SQL (LIKE scans, EXISTS/NOT EXISTS subqueries per row):
+
+- genre, year, key and bpm bucket: value -> bitmap
+- title, artist, album, local_path: value -> posting list (these are close
+  to unique per track, so a bitmap per value would waste memory)
+- emoji: emoji_id -> bitmap; archived: one bitmap
+- playlist membership and builder skips: per-playlist bitmaps, loaded lazily
+
+Bitmaps are Python ints with bit N set for track ID N, so AND/OR/NOT and
+popcount run in C. Text predicates are evaluated once per distinct value, not
+per track. Results match build_filter_query() exactly, including SQLite's
+ASCII-only case folding for LIKE and AND-before-OR precedence.
+
+Triggers (schema v63) bump a counter in filter_index_versions whenever an
+indexed table changes, so every process rebuilds only the stale parts on its
+next query.
+"""
+
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+from music_minion.core import database
+from music_minion.core.database import get_db_connection
+
+# Filter field -> tracks column
+_COLUMNS = {
+    "title": "title",
+    "artist": "artist",
+    "album": "album",
+    "genre": "genre",
+    "year": "year",
+    "bpm": "bpm",
+    "key": "key_signature",
+    "local_path": "local_path",
+}
+# Few distinct values: keep a bitmap per value
+_DENSE_COLUMNS = {"genre", "year", "key_signature"}
+# Many distinct values: keep a sorted ID list per value
+_SPARSE_COLUMNS = {"title", "artist", "album", "local_path"}
+
+# bpm bucket for values stored as text (or non-finite), which SQLite orders
+# after every number
+_TEXT_BUCKET = None
+
+_LIKE_PATTERNS = {"contains": "%{}%", "starts_with": "{}%", "ends_with": "%{}"}
+
+# Positions of the set bits in each byte value
+_BYTE_BITS = tuple(tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256))
+
+
+def bitmap_from_ids(ids: Iterable[int]) -> int:
+    """Build a bitmap with the bit for each ID set (linear in len(ids))."""
+    ids = list(ids)
+    if not ids:
+        return 0
+    buffer = bytearray(max(ids) // 8 + 1)
+    for track_id in ids:
+        buffer[track_id >> 3] |= 1 << (track_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def bitmap_to_ids(bitmap: int) -> list[int]:
+    """List the IDs set in a bitmap, ascending."""
+    ids = []
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for index, byte in enumerate(data):
+        if byte:
+            base = index * 8
+            ids.extend(base + bit for bit in _BYTE_BITS[byte])
+    return ids
+
+
+def _union_postings(postings: Iterable[list[int]]) -> int:
+    return bitmap_from_ids(track_id for ids in postings for track_id in ids)
+
+
+def _sqlite_order_key(value: Any) -> tuple:
+    """Sort key reproducing SQLite's ordering of mixed types (numbers < text < blob)."""
+    if isinstance(value, (int, float)):
+        return (0, value)
+    if isinstance(value, str):
+        return (1, value)
+    return (2, bytes(value))
+
+
+def _compare_numeric(value: Any, operator: str, target: float) -> bool:
+    """Evaluate ``column <op> ?`` for an INTEGER/REAL column, as SQLite would.
+
+    Values that did not convert to a number on insert are stored as text,
+    and SQLite orders text after every number.
+    """
+    if isinstance(value, (int, float)):
+        left, right = value, target
+    else:
+        left, right = 1, 0  # text > any number
+    if operator == "equals":
+        return left == right and isinstance(value, (int, float))
+    if operator == "not_equals":
+        return left != right or not isinstance(value, (int, float))
+    if operator == "gt":
+        return left > right
+    if operator == "gte":
+        return left >= right
+    if operator == "lt":
+        return left < right
+    return left <= right  # lte
+
+
+def _like_regex(operator: str, value: str) -> re.Pattern:
+    """Compile the LIKE pattern build_filter_query would bind, with LIKE semantics."""
+    pattern = _LIKE_PATTERNS[operator].format(value)
+    parts = []
+    for char in pattern:
+        if char == "%":
+            parts.append(".*")
+        elif char == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+    # LIKE folds case for ASCII letters only
+    return re.compile("".join(parts), re.IGNORECASE | re.ASCII | re.DOTALL)
+
+
+def _text_predicate(operator: str, value: str):
+    if operator == "equals":
+        return lambda v: v == value
+    if operator == "not_equals":
+        return lambda v: v != value
+    regex = _like_regex(operator, value)
+    return lambda v: regex.fullmatch(v if isinstance(v, str) else str(v)) is not None
+
+
+@dataclass
+class _TrackIndex:
+    """Snapshot of the indexed tracks columns, built in one table scan."""
+
+    universe: int
+    playable: int  # local_path set and non-empty
+    dense: dict[str, dict[Any, int]]
+    sparse: dict[str, dict[Any, list[int]]]
+    bpm_buckets: dict[Optional[int], int]  # floor(bpm) -> bitmap
+    bpm_values: dict[Optional[int], dict[Any, list[int]]]  # floor(bpm) -> bpm -> ids
+    nulls: dict[str, int]
+    orders: dict[tuple[str, bool], list[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, conn: sqlite3.Connection) -> "_TrackIndex":
+        columns = sorted(set(_COLUMNS.values()))
+        dense_ids: dict[str, dict[Any, list[int]]] = {c: {} for c in _DENSE_COLUMNS}
+        sparse: dict[str, dict[Any, list[int]]] = {c: {} for c in _SPARSE_COLUMNS}
+        bucket_ids: dict[Optional[int], list[int]] = {}
+        bpm_values: dict[Optional[int], dict[Any, list[int]]] = {}
+        null_ids: dict[str, list[int]] = {c: [] for c in columns}
+        all_ids: list[int] = []
+        playable_ids: list[int] = []
+
+        cursor = conn.execute(f"SELECT id, {', '.join(columns)} FROM tracks ORDER BY id")
+        for row in cursor:
+            track_id = row[0]
+            all_ids.append(track_id)
+            for column, value in zip(columns, row[1:]):
+                if value is None:
+                    null_ids[column].append(track_id)
+                elif column == "bpm":
+                    numeric = isinstance(value, (int, float)) and math.isfinite(value)
+                    bucket = math.floor(value) if numeric else _TEXT_BUCKET
+                    bucket_ids.setdefault(bucket, []).append(track_id)
+                    bpm_values.setdefault(bucket, {}).setdefault(value, []).append(track_id)
+                elif column in _DENSE_COLUMNS:
+                    dense_ids[column].setdefault(value, []).append(track_id)
+                else:
+                    sparse[column].setdefault(value, []).append(track_id)
+                    if column == "local_path" and value != "":
+                        playable_ids.append(track_id)
+
+        return cls(
+            universe=bitmap_from_ids(all_ids),
+            playable=bitmap_from_ids(playable_ids),
+            dense={
+                column: {value: bitmap_from_ids(ids) for value, ids in values.items()}
+                for column, values in dense_ids.items()
+            },
+            sparse=sparse,
+            bpm_buckets={bucket: bitmap_from_ids(ids) for bucket, ids in bucket_ids.items()},
+            bpm_values=bpm_values,
+            nulls={column: bitmap_from_ids(ids) for column, ids in null_ids.items()},
+        )
+
+    def match(self, column: str, operator: str, value: str) -> int:
+        """Bitmap of tracks where ``column <operator> value`` holds (NULLs never match)."""
+        if column == "bpm":
+            return self._match_bpm(operator, float(value))
+        if column == "year":
+            target = float(value)
+            return _or_bitmaps(
+                bitmap
+                for v, bitmap in self.dense[column].items()
+                if _compare_numeric(v, operator, target)
+            )
+
+        predicate = _text_predicate(operator, value)
+        if column in _DENSE_COLUMNS:
+            return _or_bitmaps(
+                bitmap for v, bitmap in self.dense[column].items() if predicate(v)
+            )
+        return _union_postings(
+            ids for v, ids in self.sparse[column].items() if predicate(v)
+        )
+
+    def _match_bpm(self, operator: str, target: float) -> int:
+        target_bucket = math.floor(target)
+        bitmaps = []
+        postings = []
+        for bucket, bitmap in self.bpm_buckets.items():
+            if bucket == target_bucket:
+                postings.extend(
+                    ids
+                    for v, ids in self.bpm_values[bucket].items()
+                    if _compare_numeric(v, operator, target)
+                )
+                continue
+            # Every value in any other bucket compares to the target the same
+            # way the bucket's floor does (text sorts above all numbers)
+            representative = "text" if bucket is _TEXT_BUCKET else bucket
+            if _compare_numeric(representative, operator, target):
+                bitmaps.append(bitmap)
+        return _or_bitmaps(bitmaps) | _union_postings(postings)
+
+    def order(self, column: str, descending: bool) -> list[int]:
+        """All track IDs in ``ORDER BY column [DESC] NULLS LAST, id`` order."""
+        key = (column, descending)
+        if key not in self.orders:
+            if column == "bpm":
+                groups = [
+                    (v, ids) for values in self.bpm_values.values() for v, ids in values.items()
+                ]
+            elif column in _DENSE_COLUMNS:
+                groups = [(v, bitmap_to_ids(b)) for v, b in self.dense[column].items()]
+            else:
+                groups = list(self.sparse[column].items())
+            groups.sort(key=lambda group: _sqlite_order_key(group[0]), reverse=descending)
+            ordered = [track_id for _, ids in groups for track_id in ids]
+            ordered.extend(bitmap_to_ids(self.nulls[column]))
+            self.orders[key] = ordered
+        return self.orders[key]
+
+
+def _or_bitmaps(bitmaps: Iterable[int]) -> int:
+    result = 0
+    for bitmap in bitmaps:
+        result |= bitmap
+    return result
+
+
+class _FilterIndex:
+    """Per-process index state, refreshed component by component."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.database: Optional[tuple] = None
+        self.versions: dict[str, int] = {}
+        self.tracks: Optional[_TrackIndex] = None
+        self.emojis: Optional[dict[str, int]] = None
+        self.archived: Optional[int] = None
+        self.members: dict[int, int] = {}
+        self.skipped: dict[int, int] = {}
+
+    def refresh(self, conn: sqlite3.Connection) -> None:
+        """Drop every component whose table changed since it was loaded."""
+        db_path = database.get_database_path()
+        try:
+            identity = (str(db_path), os.stat(db_path).st_ino)
+        except OSError:
+            identity = (str(db_path), None)
+        try:
+            versions = dict(
+                conn.execute("SELECT component, version FROM filter_index_versions").fetchall()
+            )
+        except sqlite3.OperationalError:
+            versions = None  # Pre-v63 schema: no change tracking, always reload
+
+        if identity != self.database or versions is None:
+            self._reset()
+            self.database = identity if versions is not None else None
+            self.versions = versions or {}
+            return
+
+        for component, version in versions.items():
+            if self.versions.get(component) != version:
+                if component == "tracks":
+                    self.tracks = None
+                elif component == "emojis":
+                    self.emojis = None
+                elif component == "archive":
+                    self.archived = None
+                elif component == "playlist_tracks":
+                    self.members.clear()
+                elif component == "skipped":
+                    self.skipped.clear()
+        self.versions = versions
+
+    def get_tracks(self, conn: sqlite3.Connection) -> _TrackIndex:
+        if self.tracks is None:
+            self.tracks = _TrackIndex.build(conn)
+        return self.tracks
+
+    def get_emoji(self, conn: sqlite3.Connection, emoji_id: str) -> int:
+        if self.emojis is None:
+            grouped: dict[str, list[int]] = {}
+            for emoji, track_id in conn.execute("SELECT emoji_id, track_id FROM track_emojis"):
+                grouped.setdefault(emoji, []).append(track_id)
+            self.emojis = {emoji: bitmap_from_ids(ids) for emoji, ids in grouped.items()}
+        return self.emojis.get(emoji_id, 0)
+
+    def get_archived(self, conn: sqlite3.Connection) -> int:
+        if self.archived is None:
+            self.archived = bitmap_from_ids(
+                row[0]
+                for row in conn.execute(
+                    "SELECT track_id FROM ratings WHERE rating_type = 'archive'"
+                )
+            )
+        return self.archived
+
+    def get_members(self, conn: sqlite3.Connection, playlist_id: int) -> int:
+        if playlist_id not in self.members:
+            self.members[playlist_id] = bitmap_from_ids(
+                row[0]
+                for row in conn.execute(
+                    "SELECT track_id FROM playlist_tracks WHERE playlist_id = ?", (playlist_id,)
+                )
+            )
+        return self.members[playlist_id]
+
+    def get_skipped(self, conn: sqlite3.Connection, playlist_id: int) -> int:
+        if playlist_id not in self.skipped:
+            self.skipped[playlist_id] = bitmap_from_ids(
+                row[0]
+                for row in conn.execute(
+                    "SELECT track_id FROM playlist_builder_skipped WHERE playlist_id = ?",
+                    (playlist_id,),
+                )
+            )
+        return self.skipped[playlist_id]
+
+    def evaluate(self, conn: sqlite3.Connection, filters: list[dict[str, Any]]) -> int:
+        tracks = self.get_tracks(conn)
+        if not filters:
+            return tracks.universe
+
+        def predicate(f: dict[str, Any]) -> int:
+            if f["field"] == "emoji":
+                has = self.get_emoji(conn, f["value"])
+                return has if f["operator"] == "has" else tracks.universe & ~has
+            column = _COLUMNS.get(f["field"])
+            if column is None:
+                raise ValueError(f"Invalid field '{f['field']}' - not in field mapping")
+            return tracks.match(column, f["operator"], f["value"])
+
+        # Same grouping as the SQL: each filter's conjunction joins it to the
+        # next one, and AND binds tighter than OR
+        result = 0
+        group = predicate(filters[0])
+        for previous, current in zip(filters, filters[1:]):
+            bitmap = predicate(current)
+            if previous.get("conjunction", "AND") == "OR":
+                result |= group
+                group = bitmap
+            else:
+                group &= bitmap
+        return result | group
+
+
+_index = _FilterIndex()
+
+
+def match_filters(
+    filters: list[dict[str, Any]],
+    playlist_id: Optional[int] = None,
+    playable_only: bool = False,
+    exclude_members: bool = False,
+    exclude_skipped: bool = False,
+    exclude_archived: bool = False,
+) -> int:
+    """Evaluate filter rules to a bitmap of track IDs.
+
+    Args:
+        filters: Filter dicts (field, operator, value, conjunction); empty matches all
+        playlist_id: Playlist whose members/skips the exclusions refer to
+        playable_only: Only tracks with a non-empty local_path
+        exclude_members: Drop tracks already in the playlist
+        exclude_skipped: Drop tracks skipped in the playlist builder
+        exclude_archived: Drop archived tracks
+
+    Returns:
+        Bitmap (int with bit N set for track N); use bitmap_to_ids/page_track_ids
+    """
+    with _index.lock, get_db_connection() as conn:
+        _index.refresh(conn)
+        result = _index.evaluate(conn, filters)
+        if playable_only:
+            result &= _index.get_tracks(conn).playable
+        if exclude_members and playlist_id is not None:
+            result &= ~_index.get_members(conn, playlist_id)
+        if exclude_skipped and playlist_id is not None:
+            result &= ~_index.get_skipped(conn, playlist_id)
+        if exclude_archived:
+            result &= ~_index.get_archived(conn)
+        return result
+
+
+def page_track_ids(
+    bitmap: int, sort_column: str, descending: bool, limit: int, offset: int
+) -> list[int]:
+    """One page of a bitmap's IDs in ``ORDER BY sort_column NULLS LAST, id`` order.
+
+    Args:
+        bitmap: Result of match_filters
+        sort_column: A tracks column in the index, or "elo_rating"
+        descending: Sort descending (ties still break on ascending id)
+        limit: Page size
+        offset: IDs to skip
+
+    Returns:
+        Track IDs for the page
+    """
+    if sort_column == "elo_rating":
+        # Ratings change on every comparison; read the order fresh
+        direction = "DESC" if descending else "ASC"
+        with get_db_connection() as conn:
+            ordered = [
+                row[0]
+                for row in conn.execute(
+                    f"""
+                    SELECT t.id FROM tracks t
+                    LEFT JOIN elo_ratings er ON er.track_id = t.id
+                    ORDER BY COALESCE(er.rating, 1500.0) {direction}, t.id
+                    """
+                )
+            ]
+    else:
+        with _index.lock, get_db_connection() as conn:
+            _index.refresh(conn)
+            ordered = _index.get_tracks(conn).order(sort_column, descending)
+
+    members = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    size = len(members)
+    page: list[int] = []
+    skipped = 0
+    for track_id in ordered:
+        byte = track_id >> 3
+        if byte >= size or not members[byte] >> (track_id & 7) & 1:
+            continue
+        if skipped < offset:
+            skipped += 1
+            continue
+        page.append(track_id)
+        if len(page) >= limit:
+            break
+    return page
+
+
+def track_ids_clause(bitmap: int, column: str = "t.id") -> tuple[str, list[str]]:
+    """SQL condition selecting the tracks in a bitmap, bound as one JSON parameter.
+
+    Returns:
+        (clause, params) to splice into a WHERE
+    """
+    return f"{column} IN (SELECT value FROM json_each(?))", [json.dumps(bitmap_to_ids(bitmap))]
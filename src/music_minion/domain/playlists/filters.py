@@ -3,7 +3,7 @@
 This module handles filter rules for smart playlists, including:
 - Adding/removing/updating filter rules
 - Building SQL queries from filter rules
-- Evaluating filters to get matching tracks
+- Evaluating filters to get matching tracks (via the bitmap filter index)
 - Validating filter fields and operators
 """
 
@@ -347,6 +347,24 @@ def build_filter_query(filters: list[dict[str, Any]]) -> tuple[str, list[str]]:
     return where_clause, params
 
 
+def build_filter_match(filters: list[dict[str, Any]]) -> tuple[str, list[str]]:
+    """Resolve filter rules through the bitmap filter index to a WHERE condition.
+
+    Drop-in for build_filter_query() in queries over ``tracks t``: the
+    condition selects the matching track IDs directly instead of re-running
+    LIKE scans and EMOJI subqueries per row.
+
+    Args:
+        filters: List of filter dictionaries (empty matches every track)
+
+    Returns:
+        Tuple of (where_clause, parameters) for parameterized query
+    """
+    from .filter_index import match_filters, track_ids_clause
+
+    return track_ids_clause(match_filters(filters))
+
+
 def evaluate_filters(playlist_id: int) -> list[dict[str, Any]]:
     """Evaluate smart playlist filters and return matching tracks.
 
@@ -357,20 +375,16 @@ def evaluate_filters(playlist_id: int) -> list[dict[str, Any]]:
         List of track dictionaries matching the filters.
         If no filters are defined, returns all tracks with a local_path.
     """
-    # Get filters for this playlist
-    filters = get_playlist_filters(playlist_id)
+    from .filter_index import match_filters, track_ids_clause
 
-    # Build WHERE clause (empty string if no filters = match all tracks)
-    if filters:
-        where_clause, params = build_filter_query(filters)
-        where_clause = f"({where_clause}) AND "
-    else:
-        where_clause = ""
-        params = []
+    # Get filters for this playlist (none = match all tracks)
+    filters = get_playlist_filters(playlist_id)
+    matches = match_filters(
+        filters, playlist_id, playable_only=True, exclude_skipped=True
+    )
+    where_clause, params = track_ids_clause(matches)
 
     # Query tracks with ELO ratings
-    # Note: f-string is safe here because build_filter_query() validates column names
-    # via FIELD_TO_COLUMN whitelist and returns parameterized WHERE clause with ? placeholders
     with get_db_connection() as conn:
         query = f"""
             SELECT
@@ -382,13 +396,10 @@ def evaluate_filters(playlist_id: int) -> list[dict[str, Any]]:
                 NULL as added_at   -- Smart playlists don't have added_at timestamps
             FROM tracks t
             LEFT JOIN playlist_elo_ratings per ON t.id = per.track_id AND per.playlist_id = ?
-            WHERE {where_clause}t.local_path IS NOT NULL AND t.local_path != ''
-            AND t.id NOT IN (
-                SELECT track_id FROM playlist_builder_skipped WHERE playlist_id = ?
-            )
+            WHERE {where_clause}
             ORDER BY artist, album, title
         """
-        cursor = conn.execute(query, (playlist_id,) + tuple(params) + (playlist_id,))
+        cursor = conn.execute(query, (playlist_id, *params))
         return [dict(row) for row in cursor.fetchall()]
 
 
@@ -4,13 +4,17 @@ Supports importing M3U/M3U8 and Serato .crate playlists.
 """
 
 import csv
+import posixpath
 import urllib.parse
+from dataclasses import dataclass
 from pathlib import Path
+from sqlite3 import Connection
 from typing import Optional, cast
 
 from music_minion.core import database
 from music_minion.core.database import get_db_connection
 
+from . import sync
 from .crud import add_track_to_playlist, create_playlist
 
 # CSV import security limits
@@ -95,7 +99,7 @@ def resolve_relative_path(
     # e.g., "Users/kevin/Music/EDM/track.mp3" → "EDM/track.mp3"
     parts = track_path_obj.parts
     for i, part in enumerate(parts):
-        if part.lower() in ["music", "music library", "itunes", "serato"]:
+        if part.lower() in _LIBRARY_MARKERS:
             rel_parts = parts[i + 1 :]
             if rel_parts:
                 candidate = library_root / Path(*rel_parts)
@@ -117,6 +121,222 @@ def resolve_relative_path(
     return None
 
 
+# Directory names that mark the start of the library-relative part of a path
+# exported from another machine (Mac/Windows Serato, iTunes, etc.)
+_LIBRARY_MARKERS = ("music", "music library", "itunes", "serato")
+
+
+@dataclass(frozen=True)
+class TrackPathIndex:
+    """In-memory lookup of track IDs by normalized path.
+
+    Both maps contain absolute and library-relative keys. ``exact`` keys keep
+    their case; ``folded`` keys are case-folded and only used when the exact
+    lookup misses (playlists written on case-insensitive filesystems).
+    """
+
+    exact: dict[str, int]
+    folded: dict[str, int]
+
+    def lookup(self, keys: list[str]) -> Optional[int]:
+        """Return the track ID for the first matching key, exact before folded."""
+        for key in keys:
+            if key in self.exact:
+                return self.exact[key]
+        for key in keys:
+            track_id = self.folded.get(key.casefold())
+            if track_id is not None:
+                return track_id
+        return None
+
+
+def _normalize_path_key(path: str) -> str:
+    """Normalize a path string for index lookups (no filesystem access)."""
+    if "%" in path:
+        path = urllib.parse.unquote(path)
+    path = path.replace("\\", "/")
+    # Strip Windows drive letters ("C:/Music/..." -> "/Music/...")
+    if len(path) >= 2 and path[1] == ":" and path[0].isalpha():
+        path = path[2:]
+    return posixpath.normpath(path) if path else path
+
+
+def build_track_path_index(conn: Connection, library_root: Path) -> TrackPathIndex:
+    """
+    Load every track path from the database into a normalized lookup index.
+
+    Args:
+        conn: Database connection
+        library_root: Root directory of music library (for relative keys)
+
+    Returns:
+        TrackPathIndex keyed by absolute and library-relative paths
+    """
+    root = _normalize_path_key(str(library_root)).rstrip("/") + "/"
+    exact: dict[str, int] = {}
+    folded: dict[str, int] = {}
+
+    cursor = conn.execute(
+        "SELECT id, local_path FROM tracks WHERE local_path IS NOT NULL"
+    )
+    for row in cursor:
+        key = _normalize_path_key(row["local_path"])
+        keys = [key]
+        if key.startswith(root):
+            keys.append(key[len(root) :])
+        for k in keys:
+            # First writer wins so duplicates resolve deterministically
+            exact.setdefault(k, row["id"])
+            folded.setdefault(k.casefold(), row["id"])
+
+    return TrackPathIndex(exact=exact, folded=folded)
+
+
+def _candidate_path_keys(
+    playlist_dir: str, track_path: str, library_root: str
+) -> list[str]:
+    """
+    Build lookup keys for a playlist entry, mirroring resolve_relative_path order.
+
+    Args:
+        playlist_dir: Normalized directory containing the playlist file
+        track_path: Track path from playlist (may be relative or absolute)
+        library_root: Normalized root directory of music library
+
+    Returns:
+        Ordered list of normalized candidate keys
+    """
+    key = _normalize_path_key(track_path)
+    keys = []
+
+    if key.startswith("/"):
+        keys.append(key)
+
+    parts = [p for p in key.split("/") if p]
+    for i, part in enumerate(parts):
+        if part.lower() in _LIBRARY_MARKERS:
+            rel_parts = parts[i + 1 :]
+            if rel_parts:
+                rel = "/".join(rel_parts)
+                keys.append(posixpath.join(library_root, rel))
+                keys.append(rel)
+            break  # Only try first match
+
+    if not key.startswith("/"):
+        keys.append(posixpath.normpath(posixpath.join(playlist_dir, key)))
+        keys.append(posixpath.normpath(posixpath.join(library_root, key)))
+        keys.append(key)
+
+    return keys
+
+
+def resolve_track_ids(
+    conn: Connection,
+    playlist_path: Path,
+    track_paths: list[str],
+    library_root: Path,
+) -> tuple[list[int], list[str]]:
+    """
+    Resolve playlist entries to track IDs in bulk.
+
+    Known tracks are resolved purely in memory against a path index built with
+    one query. Only entries that miss the index fall back to
+    resolve_relative_path (filesystem checks), e.g. to follow symlinks.
+
+    Args:
+        conn: Database connection
+        playlist_path: Path to the playlist file (for relative resolution)
+        track_paths: List of track path strings from playlist
+        library_root: Root directory of music library
+
+    Returns:
+        Tuple of (track_ids in playlist order, unresolved_paths)
+    """
+    index = build_track_path_index(conn, library_root)
+    playlist_dir = _normalize_path_key(str(playlist_path.parent))
+    root = _normalize_path_key(str(library_root))
+
+    track_ids = []
+    unresolved_paths = []
+
+    for track_path_str in track_paths:
+        track_id = index.lookup(
+            _candidate_path_keys(playlist_dir, track_path_str, root)
+        )
+
+        if track_id is None:
+            resolved_path = resolve_relative_path(
+                playlist_path, track_path_str, library_root
+            )
+            if resolved_path is not None:
+                track_id = index.exact.get(_normalize_path_key(str(resolved_path)))
+
+        if track_id is None:
+            unresolved_paths.append(track_path_str)
+        else:
+            track_ids.append(track_id)
+
+    return track_ids, unresolved_paths
+
+
+def _bulk_add_tracks_to_playlist(
+    conn: Connection, playlist_id: int, track_ids: list[int]
+) -> tuple[int, int]:
+    """
+    Append tracks to a manual playlist with a single executemany.
+
+    Tracks already in the playlist (or repeated within track_ids) are skipped.
+    Playlists synced to SoundCloud go through add_track_to_playlist per track
+    so the remote playlist stays authoritative.
+
+    Args:
+        conn: Database connection (committed on success)
+        playlist_id: ID of the playlist to add tracks to
+        track_ids: Track IDs in the order they should appear
+
+    Returns:
+        Tuple of (tracks_added, duplicates_skipped)
+    """
+    if sync.should_sync_to_soundcloud(playlist_id):
+        conn.commit()  # Release pending writes before per-track connections
+        tracks_added = sum(
+            1 for track_id in track_ids if add_track_to_playlist(playlist_id, track_id)
+        )
+        return tracks_added, len(track_ids) - tracks_added
+
+    cursor = conn.execute(
+        "SELECT track_id FROM playlist_tracks WHERE playlist_id = ?", (playlist_id,)
+    )
+    seen = {row["track_id"] for row in cursor.fetchall()}
+
+    new_track_ids = []
+    for track_id in track_ids:
+        if track_id not in seen:
+            seen.add(track_id)
+            new_track_ids.append(track_id)
+
+    if new_track_ids:
+        cursor = conn.execute(
+            "SELECT COALESCE(MAX(position) + 1, 0) as next_position FROM playlist_tracks WHERE playlist_id = ?",
+            (playlist_id,),
+        )
+        next_position = cursor.fetchone()["next_position"]
+        conn.executemany(
+            "INSERT INTO playlist_tracks (playlist_id, track_id, position) VALUES (?, ?, ?)",
+            [
+                (playlist_id, track_id, next_position + offset)
+                for offset, track_id in enumerate(new_track_ids)
+            ],
+        )
+        conn.execute(
+            "UPDATE playlists SET updated_at = CURRENT_TIMESTAMP, track_count = track_count + ? WHERE id = ?",
+            (len(new_track_ids), playlist_id),
+        )
+    conn.commit()
+
+    return len(new_track_ids), len(track_ids) - len(new_track_ids)
+
+
 def _add_tracks_from_paths(
     playlist_id: int,
     playlist_local_path: Path,
@@ -135,40 +355,13 @@ def _add_tracks_from_paths(
     Returns:
         Tuple of (tracks_added, duplicates_skipped, unresolved_paths)
     """
-    tracks_added = 0
-    duplicates_skipped = 0
-    unresolved_paths = []
-
     with get_db_connection() as conn:
-        cursor = conn.cursor()
-
-        for track_path_str in track_paths:
-            # Resolve track path
-            resolved_path = resolve_relative_path(
-                playlist_local_path, track_path_str, library_root
-            )
-
-            if resolved_path is None:
-                unresolved_paths.append(track_path_str)
-                continue
-
-            # Look up track in database by local file path
-            cursor.execute(
-                "SELECT id FROM tracks WHERE local_path = ?", (str(resolved_path),)
-            )
-            row = cursor.fetchone()
-
-            if row:
-                track_id = row["id"]
-                # Add track to playlist
-                if add_track_to_playlist(playlist_id, track_id):
-                    tracks_added += 1
-                else:
-                    # Track already in playlist or other failure
-                    duplicates_skipped += 1
-            else:
-                # Track not in database
-                unresolved_paths.append(track_path_str)
+        track_ids, unresolved_paths = resolve_track_ids(
+            conn, playlist_local_path, track_paths, library_root
+        )
+        tracks_added, duplicates_skipped = _bulk_add_tracks_to_playlist(
+            conn, playlist_id, track_ids
+        )
 
     return tracks_added, duplicates_skipped, unresolved_paths
 
@@ -439,8 +632,7 @@ def _upsert_tracks_to_playlist(
     Returns:
         Tuple of (tracks_added, duplicates_skipped)
     """
-    tracks_added = 0
-    duplicates_skipped = 0
+    track_ids = []
 
     with get_db_connection() as conn:
         cursor = conn.cursor()
@@ -491,13 +683,10 @@ def _upsert_tracks_to_playlist(
                     # This would be an error case, but we'll skip for now
                     continue
 
-            # Add track to playlist
-            if add_track_to_playlist(playlist_id, cast(int, track_id)):
-                tracks_added += 1
-            else:
-                duplicates_skipped += 1
+            track_ids.append(cast(int, track_id))
 
-    return tracks_added, duplicates_skipped
+        # Add all tracks to playlist in the same transaction
+        return _bulk_add_tracks_to_playlist(conn, playlist_id, track_ids)
 
 
 def import_csv(
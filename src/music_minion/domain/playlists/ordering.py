@@ -0,0 +1,279 @@
+"""
+Fractional ordering keys for playlist_tracks and bucket_tracks.
+
+Rows are ordered by position, and positions only need to be increasing,
+not consecutive. Moving a track writes one row: its new position is the
+midpoint between its new neighbours. Applying a whole new order keeps
+the longest run of tracks that are already in relative order and writes
+only the others, so a drag-and-drop in a 3k-track list is one UPDATE.
+
+Each move into the same gap halves it. Once a gap drops below
+RENUMBER_GAP, the list is queued for a background renumber back to
+0..n-1. That takes about ten moves into the same spot. A gap below
+MIN_GAP is renumbered inline, but the background pass gets there first
+in practice. Renumbering never changes the relative order, so readers
+that ORDER BY position (exporters, the queue, radio) see a stable order
+throughout.
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Optional, Sequence
+
+from loguru import logger
+
+# Ordered table -> the column that scopes a list within it
+ORDERED_TABLES = {"playlist_tracks": "playlist_id", "bucket_tracks": "bucket_id"}
+
+RENUMBER_GAP = 1e-3  # Queue a background renumber below this gap
+MIN_GAP = 1e-9  # Renumber inline below this (float precision is ~1e-13 here)
+RENUMBER_DEBOUNCE_SECONDS = 5.0
+
+
+def _scope_column(table: str) -> str:
+    if table not in ORDERED_TABLES:
+        raise ValueError(f"Not an ordered table: {table}")
+    return ORDERED_TABLES[table]
+
+
+def position_between(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    """Position for a row between two neighbours (None: list start / end).
+
+    Returns:
+        The new position, or None when the gap is too small to split
+    """
+    if before is None and after is None:
+        return 0.0
+    if before is None:
+        return after - 1.0
+    if after is None:
+        return before + 1.0
+    if after - before < MIN_GAP:
+        return None
+    return (before + after) / 2
+
+
+def get_order(conn: Any, table: str, scope_id: Any) -> list[tuple[int, float]]:
+    """(track_id, position) pairs of a list, in order."""
+    column = _scope_column(table)
+    cursor = conn.execute(
+        f"SELECT track_id, position FROM {table} WHERE {column} = ? ORDER BY position, rowid",
+        (scope_id,),
+    )
+    return [(row["track_id"], row["position"]) for row in cursor.fetchall()]
+
+
+def renumber_positions(conn: Any, table: str, scope_id: Any) -> int:
+    """Rewrite a list's positions as 0..n-1, keeping the order.
+
+    Only rows whose position changes are written. The caller commits.
+
+    Returns:
+        Number of rows rewritten
+    """
+    column = _scope_column(table)
+    updates = [
+        (index, scope_id, track_id)
+        for index, (track_id, position) in enumerate(get_order(conn, table, scope_id))
+        if position != index
+    ]
+    conn.executemany(
+        f"UPDATE {table} SET position = ? WHERE {column} = ? AND track_id = ?", updates
+    )
+    return len(updates)
+
+
+def move_track(conn: Any, table: str, scope_id: Any, track_id: int, to_index: int) -> bool:
+    """Move a track to an index in its list by writing its row only.
+
+    Args:
+        conn: Database connection (the caller commits)
+        table: playlist_tracks or bucket_tracks
+        scope_id: Playlist or bucket ID
+        track_id: Track to move
+        to_index: Index among the list's other tracks (past the end appends)
+
+    Returns:
+        True if moved, False if the track is not in the list
+    """
+    column = _scope_column(table)
+    if not conn.execute(
+        f"SELECT 1 FROM {table} WHERE {column} = ? AND track_id = ?", (scope_id, track_id)
+    ).fetchone():
+        return False
+
+    for _ in range(2):
+        neighbours = [
+            row["position"]
+            for row in conn.execute(
+                f"""
+                SELECT position FROM {table}
+                WHERE {column} = ? AND track_id != ?
+                ORDER BY position, rowid
+                LIMIT ? OFFSET ?
+                """,
+                (scope_id, track_id, 1 if to_index <= 0 else 2, max(to_index - 1, 0)),
+            )
+        ]
+        if to_index <= 0:
+            before, after = None, neighbours[0] if neighbours else None
+        elif neighbours:
+            before, after = neighbours[0], neighbours[1] if len(neighbours) > 1 else None
+        else:  # Past the end
+            before = conn.execute(
+                f"SELECT MAX(position) AS p FROM {table} WHERE {column} = ? AND track_id != ?",
+                (scope_id, track_id),
+            ).fetchone()["p"]
+            after = None
+
+        position = position_between(before, after)
+        if position is not None:
+            break
+        renumber_positions(conn, table, scope_id)
+
+    conn.execute(
+        f"UPDATE {table} SET position = ? WHERE {column} = ? AND track_id = ?",
+        (position, scope_id, track_id),
+    )
+    if before is not None and after is not None and after - before < RENUMBER_GAP:
+        schedule_renumber(table, scope_id)
+    return True
+
+
+def _increasing_run(values: Sequence[float]) -> set[int]:
+    """Indices of a longest strictly increasing subsequence (O(n log n))."""
+    tails: list[float] = []  # Smallest tail value of a run of each length
+    tail_index: list[int] = []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        length = bisect.bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_index.append(i)
+        else:
+            tails[length] = value
+            tail_index[length] = i
+        previous[i] = tail_index[length - 1] if length else -1
+
+    keep = set()
+    i = tail_index[-1] if tail_index else -1
+    while i >= 0:
+        keep.add(i)
+        i = previous[i]
+    return keep
+
+
+def apply_order(conn: Any, table: str, scope_id: Any, track_ids: Sequence[int]) -> int:
+    """Put a list in the given order, writing as few rows as possible.
+
+    Tracks already in the right relative order keep their positions; the
+    others get positions spaced evenly between their new neighbours.
+    Tracks of the list missing from track_ids keep their relative order
+    at the end, and IDs not in the list are ignored. The caller commits.
+
+    Returns:
+        Number of rows written
+    """
+    column = _scope_column(table)
+    current = get_order(conn, table, scope_id)
+    positions = dict(current)
+    wanted = list(dict.fromkeys(t for t in track_ids if t in positions))
+    listed = set(wanted)
+    wanted += [t for t, _ in current if t not in listed]
+
+    old = [positions[t] for t in wanted]
+    keep = _increasing_run(old)
+    updates: list[tuple[float, Any, int]] = []
+    smallest_gap = float("inf")
+
+    i = 0
+    while i < len(wanted):
+        if i in keep:
+            i += 1
+            continue
+        end = i
+        while end < len(wanted) and end not in keep:
+            end += 1
+        before = old[i - 1] if i > 0 else None  # i - 1 is kept (or the start)
+        after = old[end] if end < len(wanted) else None
+        count = end - i
+        if before is not None and after is not None:
+            step = (after - before) / (count + 1)
+            if step < MIN_GAP:
+                # No room: write the whole list densely instead
+                updates = [
+                    (float(index), scope_id, t)
+                    for index, t in enumerate(wanted)
+                    if positions[t] != index
+                ]
+                smallest_gap = 1.0
+                break
+            smallest_gap = min(smallest_gap, step)
+            new = [before + step * (k + 1) for k in range(count)]
+        elif before is not None:
+            new = [before + k + 1 for k in range(count)]
+        elif after is not None:
+            new = [after - count + k for k in range(count)]
+        else:
+            new = [float(k) for k in range(count)]
+        updates += [(p, scope_id, t) for p, t in zip(new, wanted[i:end])]
+        i = end
+
+    conn.executemany(
+        f"UPDATE {table} SET position = ? WHERE {column} = ? AND track_id = ?", updates
+    )
+    if smallest_gap < RENUMBER_GAP:
+        schedule_renumber(table, scope_id)
+    return len(updates)
+
+
+# Debounced background renumbering: (table, scope_id) -> monotonic deadline
+_pending_renumbers: dict[tuple[str, Any], float] = {}
+_pending_lock = threading.Condition()
+_renumber_thread: Optional[threading.Thread] = None
+
+
+def schedule_renumber(table: str, scope_id: Any) -> None:
+    """Queue a background renumber of a list, coalescing bursts of moves."""
+    global _renumber_thread
+    _scope_column(table)
+    with _pending_lock:
+        _pending_renumbers[(table, scope_id)] = time.monotonic() + RENUMBER_DEBOUNCE_SECONDS
+        if _renumber_thread is None or not _renumber_thread.is_alive():
+            _renumber_thread = threading.Thread(target=_renumber_worker_loop, daemon=True)
+            _renumber_thread.start()
+        _pending_lock.notify()
+
+
+def _take_due_renumbers() -> list[tuple[str, Any]]:
+    """Block until at least one scheduled renumber is due and return the due lists."""
+    with _pending_lock:
+        while True:
+            if not _pending_renumbers:
+                _pending_lock.wait()
+                continue
+            now = time.monotonic()
+            due = [key for key, deadline in _pending_renumbers.items() if deadline <= now]
+            if due:
+                for key in due:
+                    del _pending_renumbers[key]
+                return due
+            _pending_lock.wait(timeout=min(_pending_renumbers.values()) - now)
+
+
+def _renumber_worker_loop() -> None:
+    """Run due renumbers. Runs as daemon thread."""
+    from music_minion.core.database import get_db_connection
+
+    threading.current_thread().silent_logging = True
+    while True:
+        for table, scope_id in _take_due_renumbers():
+            try:
+                with get_db_connection() as conn:
+                    conn.execute("BEGIN")
+                    rewritten = renumber_positions(conn, table, scope_id)
+                    conn.commit()
+                logger.debug(f"Renumbered {rewritten} rows of {table} {scope_id}")
+            except Exception as e:
+                logger.exception(f"Renumbering {table} {scope_id} failed: {e}")
@@ -0,0 +1,349 @@
+"""
+Harmonic-mixing sequencer: order tracks for smooth DJ transitions.
+
+The cost of playing track j after track i adds up:
+
+- key: the Camelot move (same key, ±1, relative major/minor and the +2 /
+  +7 energy boosts are cheap; clashing keys cost the most)
+- tempo: the BPM change in percent, half/double time folded in; changes
+  beyond MAX_BPM_DELTA_PERCENT are heavily penalised
+- energy: the jump in energy (loudness, brightness and tempo, ranked
+  within the playlist)
+
+On top of the transitions, an energy arc asks for a target energy at each
+point of the set (warm up to a peak, say), costed per position.
+
+Ordering is a shortest-Hamiltonian-path problem, solved heuristically:
+greedy construction (cheapest next track, arc included) followed by 2-opt
+segment reversals. For each segment start, all segment ends are scored
+at once with prefix sums, so a pass over a 2k-track playlist is a few
+thousand NumPy operations.
+"""
+
+import sqlite3
+import time
+from typing import Any, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from music_minion.domain.analysis.keys import parse_camelot
+
+MAX_BPM_DELTA_PERCENT = 6.0  # Beyond this, beatmatching needs audible pitch shift
+BPM_LIMIT_PENALTY = 3.0
+HALF_DOUBLE_TIME_COST = 0.2
+UNKNOWN_COST = 0.5  # Transitions to or from a track without a key / BPM
+TIME_LIMIT_SECONDS = 10.0
+
+WEIGHTS = {"key": 1.0, "bpm": 1.0, "energy": 0.5, "arc": 1.0}
+
+# (letter change, steps clockwise on the wheel) -> cost; anything else is 1.0
+KEY_MOVE_COSTS = {
+    (False, 0): 0.0,  # Same key
+    (False, 1): 0.1,  # One fifth up / down
+    (False, 11): 0.1,
+    (True, 0): 0.2,  # Relative major/minor
+    (True, 1): 0.5,  # Diagonal mood change
+    (True, 11): 0.5,
+    (False, 2): 0.6,  # Energy boost (+2)
+    (False, 7): 0.6,  # Semitone up (+7)
+}
+
+# Target energy (0-1) at the start, knee and end of the set, knee position
+ENERGY_ARCS: dict[str, Optional[tuple[float, float, float, float]]] = {
+    "none": None,
+    "rise": (0.2, 0.9, 0.9, 1.0),
+    "fall": (0.9, 0.2, 0.2, 1.0),
+    "peak": (0.3, 0.95, 0.6, 0.7),  # Warm up, peak at 70%, ease off
+}
+
+
+def key_costs(keys: Sequence[Optional[str]]) -> np.ndarray:
+    """Pairwise Camelot transition costs, shape (n, n)."""
+    parsed = [parse_camelot(key) for key in keys]
+    known = np.array([p is not None for p in parsed])
+    number = np.array([p[0] if p else 0 for p in parsed])
+    minor = np.array([p[1] == "A" if p else False for p in parsed])
+
+    table = np.ones((2, 12))
+    for (switch, steps), cost in KEY_MOVE_COSTS.items():
+        table[int(switch), steps] = cost
+    steps = (number[None, :] - number[:, None]) % 12
+    switch = (minor[None, :] != minor[:, None]).astype(int)
+    costs = table[switch, steps]
+    costs[~(known[:, None] & known[None, :])] = UNKNOWN_COST
+    return costs
+
+
+def bpm_costs(bpms: Sequence[Optional[float]]) -> np.ndarray:
+    """Pairwise tempo transition costs, shape (n, n)."""
+    bpm = np.array([b if b and b > 0 else np.nan for b in bpms], dtype=float)
+    octaves = np.log2(bpm[None, :] / bpm[:, None])
+    folded = octaves - np.round(octaves)  # Half/double time mixes at the folded tempo
+    percent = (np.exp2(np.abs(folded)) - 1) * 100
+    costs = np.where(
+        percent <= MAX_BPM_DELTA_PERCENT,
+        np.square(percent / MAX_BPM_DELTA_PERCENT),
+        BPM_LIMIT_PENALTY + (percent - MAX_BPM_DELTA_PERCENT) / MAX_BPM_DELTA_PERCENT,
+    )
+    costs += np.where(np.round(octaves) != 0, HALF_DOUBLE_TIME_COST, 0.0)
+    return np.where(np.isnan(costs), UNKNOWN_COST, costs)
+
+
+def energy_levels(tracks: Sequence[dict[str, Any]]) -> np.ndarray:
+    """Energy of each track ranked within the set, 0 (calmest) to 1.
+
+    Averages the standardized loudness, RMS, log spectral centroid and
+    BPM that are known for a track; tracks with none sit at 0.5.
+    """
+    columns = []
+    for name, transform in (
+        ("lufs", None),
+        ("rms_db", None),
+        ("spectral_centroid", np.log),
+        ("bpm", None),
+    ):
+        values = np.array(
+            [t.get(name) if t.get(name) is not None else np.nan for t in tracks], dtype=float
+        )
+        if transform is not None:
+            values = np.where(values > 0, values, np.nan)
+            values = transform(values)
+        if np.isnan(values).all():
+            continue
+        std = np.nanstd(values)
+        columns.append((values - np.nanmean(values)) / (std if std > 1e-9 else 1.0))
+
+    levels = np.full(len(tracks), 0.5)
+    if not columns:
+        return levels
+    stacked = np.vstack(columns)
+    known = ~np.isnan(stacked).all(axis=0)
+    if known.sum() > 1:
+        score = np.nanmean(stacked[:, known], axis=0)
+        ranks = np.argsort(np.argsort(score, kind="stable"), kind="stable")
+        levels[known] = ranks / (known.sum() - 1)
+    return levels
+
+
+def transition_costs(tracks: Sequence[dict[str, Any]], energy: np.ndarray) -> np.ndarray:
+    """Full cost of playing track j right after track i, shape (n, n)."""
+    costs = WEIGHTS["key"] * key_costs([t.get("key_signature") for t in tracks])
+    costs += WEIGHTS["bpm"] * bpm_costs([t.get("bpm") for t in tracks])
+    costs += WEIGHTS["energy"] * np.abs(energy[None, :] - energy[:, None])
+    return costs
+
+
+def _arc_targets(arc: str, n: int) -> tuple[np.ndarray, tuple[float, float, float, float]]:
+    """Target energy per position as alpha + beta*p + gamma*max(0, p - knee)."""
+    if arc not in ENERGY_ARCS:
+        raise ValueError(f"Unknown energy arc: {arc}. Available: {', '.join(ENERGY_ARCS)}")
+    shape = ENERGY_ARCS[arc]
+    if shape is None or n < 2:
+        return np.zeros(n), (0.0, 0.0, 0.0, float(n))
+    start, peak, end, knee_at = shape
+    knee = knee_at * (n - 1)
+    beta = (peak - start) / knee
+    gamma = ((end - peak) / (n - 1 - knee) - beta) if knee < n - 1 else 0.0
+    positions = np.arange(n)
+    targets = start + beta * positions + gamma * np.maximum(0.0, positions - knee)
+    return targets, (start, beta, gamma, knee)
+
+
+def path_cost(order: Sequence[int], costs: np.ndarray, energy: np.ndarray, arc: str = "none") -> float:
+    """Total cost of playing tracks in the given order (indices into costs)."""
+    order = np.asarray(order)
+    targets, _ = _arc_targets(arc, len(order))
+    total = float(costs[order[:-1], order[1:]].sum())
+    if ENERGY_ARCS[arc] is not None:
+        total += WEIGHTS["arc"] * float(np.square(energy[order] - targets).sum())
+    return total
+
+
+def _greedy(costs: np.ndarray, energy: np.ndarray, targets: np.ndarray, start: int, arc_weight: float) -> np.ndarray:
+    n = len(costs)
+    order = np.empty(n, dtype=np.int64)
+    used = np.zeros(n, dtype=bool)
+    order[0], used[start] = start, True
+    for position in range(1, n):
+        score = costs[order[position - 1]] + arc_weight * np.square(energy - targets[position])
+        score[used] = np.inf
+        order[position] = nxt = int(np.argmin(score))
+        used[nxt] = True
+    return order
+
+
+def _two_opt(
+    order: np.ndarray,
+    costs: np.ndarray,
+    energy: np.ndarray,
+    arc: tuple[float, float, float, float],
+    arc_weight: float,
+    deadline: float,
+    first: int = 0,
+) -> tuple[np.ndarray, int]:
+    """Reverse segments while that lowers the total cost (or time runs out).
+
+    For a segment start a, the cost change of reversing order[a:b+1] is
+    computed for every b at once from prefix sums of the forward and
+    backward edge costs along the path and of the energies; the best
+    improving b is applied.
+    """
+    n = len(order)
+    alpha, beta, gamma, knee = arc
+    q = np.arange(n, dtype=float)
+    targets = alpha + beta * q + gamma * np.maximum(0.0, q - knee)
+
+    def prefix_sums() -> dict[str, np.ndarray]:
+        e = energy[order]
+        return {
+            name: np.concatenate([[0.0], np.cumsum(values)])
+            for name, values in (
+                ("forward", costs[order[:-1], order[1:]]),
+                ("backward", costs[order[1:], order[:-1]]),  # Edges once reversed
+                ("e", e),
+                ("qe", q * e),
+                ("te", targets * e),
+            )
+        }
+
+    prefix = prefix_sums()
+    moves = 0
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for a in range(first, n - 1):
+            b = np.arange(a + 1, n)
+            delta = (prefix["backward"][b] - prefix["backward"][a]) - (
+                prefix["forward"][b] - prefix["forward"][a]
+            )
+            if a > 0:
+                delta += costs[order[a - 1], order[b]] - costs[order[a - 1], order[a]]
+            right = np.minimum(b + 1, n - 1)
+            delta += np.where(
+                b < n - 1, costs[order[a], order[right]] - costs[order[b], order[right]], 0.0
+            )
+
+            if arc_weight:
+                # Arc change: -2 * sum over the segment of T_p * (E_reversed(p) - E_p)
+                s = a + b
+                sum_e = prefix["e"][b + 1] - prefix["e"][a]
+                sum_qe = prefix["qe"][b + 1] - prefix["qe"][a]
+                reversed_te = alpha * sum_e + beta * (s * sum_e - sum_qe)
+                if gamma:
+                    upper = np.minimum(b, np.floor(s - knee)).astype(np.int64)
+                    valid = upper >= a
+                    upper = np.where(valid, upper, a)
+                    hinge = (s - knee) * (prefix["e"][upper + 1] - prefix["e"][a]) - (
+                        prefix["qe"][upper + 1] - prefix["qe"][a]
+                    )
+                    reversed_te += gamma * np.where(valid, hinge, 0.0)
+                current_te = prefix["te"][b + 1] - prefix["te"][a]
+                delta -= 2 * arc_weight * (reversed_te - current_te)
+
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-9:
+                end = a + 1 + best
+                order[a : end + 1] = order[a : end + 1][::-1].copy()
+                prefix = prefix_sums()
+                moves += 1
+                improved = True
+            if time.perf_counter() >= deadline:
+                break
+    return order, moves
+
+
+def sequence_tracks(
+    tracks: Sequence[dict[str, Any]],
+    arc: str = "peak",
+    start_track_id: Optional[int] = None,
+    time_limit: float = TIME_LIMIT_SECONDS,
+) -> list[int]:
+    """Order tracks for smooth mixing.
+
+    Args:
+        tracks: Dicts with id and, when known, bpm, key_signature, lufs,
+            rms_db and spectral_centroid
+        arc: Energy arc over the set: none, rise, fall or peak
+        start_track_id: Open with this track (default: whichever suits the arc)
+        time_limit: Seconds to spend improving the greedy order
+
+    Returns:
+        Track IDs in play order
+
+    Raises:
+        ValueError: Unknown energy arc
+    """
+    n = len(tracks)
+    targets, shape = _arc_targets(arc, n)
+    if n < 3:
+        return [t["id"] for t in tracks]
+
+    started = time.perf_counter()
+    energy = energy_levels(tracks)
+    costs = transition_costs(tracks, energy)
+    arc_weight = WEIGHTS["arc"] if ENERGY_ARCS[arc] is not None else 0.0
+
+    ids = [t["id"] for t in tracks]
+    if start_track_id is not None and start_track_id in ids:
+        start = ids.index(start_track_id)
+    elif arc_weight:
+        start = int(np.argmin(np.square(energy - targets[0])))
+    else:
+        start = int(np.argmin(costs.sum(axis=1)))  # Best-connected track
+
+    order = _greedy(costs, energy, targets, start, arc_weight)
+    greedy_cost = path_cost(order, costs, energy, arc)
+    # A requested opener stays in place: only segments after it are reversed
+    first = 1 if start_track_id is not None else 0
+    order, moves = _two_opt(
+        order, costs, energy, shape, arc_weight, started + time_limit, first=first
+    )
+
+    logger.debug(
+        f"Sequenced {n} tracks (arc={arc}): cost {greedy_cost:.1f} greedy -> "
+        f"{path_cost(order, costs, energy, arc):.1f} after {moves} 2-opt moves "
+        f"in {time.perf_counter() - started:.2f}s"
+    )
+    return [ids[i] for i in order]
+
+
+def load_mix_features(track_ids: Sequence[int]) -> list[dict[str, Any]]:
+    """Key, BPM and audio-analysis energy features for sequencing.
+
+    Detected BPM/key fill in for tracks whose tags have none. Analysis
+    features are skipped where the analysis tables don't exist.
+    """
+    from music_minion.core.database import get_audio_features, get_db_connection
+
+    if not track_ids:
+        return []
+    placeholders = ",".join("?" * len(track_ids))
+    with get_db_connection() as conn:
+        rows = {
+            row["id"]: dict(row)
+            for row in conn.execute(
+                f"SELECT id, bpm, key_signature FROM tracks WHERE id IN ({placeholders})",
+                list(track_ids),
+            )
+        }
+    try:
+        features = {
+            name: get_audio_features(name, list(track_ids))
+            for name in ("bpm_key", "loudness", "energy")
+        }
+    except sqlite3.OperationalError:
+        features = {"bpm_key": {}, "loudness": {}, "energy": {}}
+
+    tracks = []
+    for track_id in track_ids:
+        track = rows.get(track_id, {"id": track_id, "bpm": None, "key_signature": None})
+        detected = features["bpm_key"].get(track_id, {})
+        track["bpm"] = track["bpm"] or detected.get("bpm")
+        track["key_signature"] = track["key_signature"] or detected.get("key")
+        track["lufs"] = features["loudness"].get(track_id, {}).get("lufs")
+        energy = features["energy"].get(track_id, {})
+        track["rms_db"] = energy.get("rms_db")
+        track["spectral_centroid"] = energy.get("spectral_centroid")
+        tracks.append(track)
+    return tracks
@@ -9,8 +9,11 @@ Sync strategy:
 4. Push updated playlist back to provider
 """
 
+import math
 import time
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Optional, Tuple
 
 from loguru import logger
 
@@ -129,6 +132,187 @@ def should_sync_playlist(playlist_id: int, force: bool = False) -> bool:
     return time_since_sync > ttl_seconds
 
 
+# Bulk playlist sync: track lists of changed playlists are fetched
+# concurrently under a per-provider requests-per-minute budget
+SYNC_FETCH_WORKERS = 4
+PROVIDER_REQUESTS_PER_MINUTE = {"soundcloud": 60, "spotify": 120}
+DEFAULT_REQUESTS_PER_MINUTE = 60
+# Tracks per track-list request; absent means one request per playlist
+TRACK_PAGE_SIZE = {"spotify": 100}
+
+
+def track_list_requests(provider_name: str, track_count: int) -> int:
+    """API requests needed to fetch a playlist's track list."""
+    page_size = TRACK_PAGE_SIZE.get(provider_name)
+    if page_size is None:
+        return 1
+    return max(1, math.ceil((track_count or 0) / page_size))
+
+
+def playlist_unchanged(remote: dict[str, Any], existing: Optional[dict[str, Any]]) -> bool:
+    """Cheap probe: can a synced playlist skip fetching its track list?
+
+    The provider's last-modified marker (SoundCloud timestamp, Spotify
+    snapshot_id) must equal the one stored at the last sync, and the
+    provider's track count must match too (catches edits that don't bump
+    the marker). Without a marker, nothing proves the playlist unchanged.
+
+    Args:
+        remote: Playlist metadata from provider.get_playlists()
+        existing: Local playlist row with provider_last_modified and
+            provider_track_count, or None if never synced
+    """
+    if not existing or not remote.get("last_modified"):
+        return False
+    if remote["last_modified"] != existing.get("provider_last_modified"):
+        return False
+    stored_count = existing.get("provider_track_count")
+    return stored_count is None or stored_count == remote.get("track_count")
+
+
+def fetch_playlist_tracks(
+    provider: Any,
+    state: Any,
+    provider_name: str,
+    playlists: list[dict[str, Any]],
+    workers: int = SYNC_FETCH_WORKERS,
+    budget: Any = None,
+) -> tuple[Any, dict[str, tuple[list, Optional[str]]], int]:
+    """Fetch the track lists of several provider playlists concurrently.
+
+    The first fetch runs alone so an expired token is refreshed once; the
+    rest share the refreshed state. Every fetch reserves its expected
+    request count from the provider's per-minute budget first.
+
+    Args:
+        provider: Provider module
+        state: Provider state
+        provider_name: Provider name (budget and page size lookup)
+        playlists: Playlist metadata dicts with id and track_count
+        workers: Concurrent fetches
+        budget: RateBudget to draw from (default: the provider's limit)
+
+    Returns:
+        (state, {provider_playlist_id: (tracks, created_at)}, api_calls)
+    """
+    from music_minion.domain.ai.batch import RateBudget
+
+    if budget is None:
+        budget = RateBudget(
+            PROVIDER_REQUESTS_PER_MINUTE.get(provider_name, DEFAULT_REQUESTS_PER_MINUTE),
+            tokens_per_minute=0,  # Requests only
+        )
+
+    def fetch(pl_data: dict[str, Any], fetch_state: Any) -> tuple[Any, list, Optional[str]]:
+        for _ in range(track_list_requests(provider_name, pl_data.get("track_count") or 0)):
+            budget.acquire(0)
+        return provider.get_playlist_tracks(fetch_state, pl_data["id"])
+
+    results: dict[str, tuple[list, Optional[str]]] = {}
+    api_calls = sum(
+        track_list_requests(provider_name, pl.get("track_count") or 0) for pl in playlists
+    )
+    if not playlists:
+        return state, results, 0
+
+    state, tracks, created_at = fetch(playlists[0], state)
+    results[playlists[0]["id"]] = (tracks, created_at)
+    if not state.authenticated:
+        return state, results, api_calls
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, workers), thread_name_prefix="playlist-sync"
+    ) as executor:
+        futures = {
+            pl_data["id"]: executor.submit(fetch, pl_data, state) for pl_data in playlists[1:]
+        }
+        for playlist_id, future in futures.items():
+            try:
+                fetched_state, tracks, created_at = future.result()
+            except Exception as e:
+                logger.error(f"Failed to fetch tracks for playlist {playlist_id}: {e}")
+                continue
+            if not fetched_state.authenticated:
+                state = fetched_state
+            results[playlist_id] = (tracks, created_at)
+    return state, results, api_calls
+
+
+def apply_playlist_diff(conn: Any, playlist_id: int, track_ids: list[int]) -> tuple[int, int]:
+    """Make a playlist hold exactly track_ids, in order, with minimal writes.
+
+    Deletes tracks that left, inserts tracks that joined, and repositions
+    only the rows that moved (see ordering.apply_order). Duplicate IDs keep
+    their first occurrence. The caller commits.
+
+    Returns:
+        (tracks inserted, tracks deleted)
+    """
+    from . import ordering
+
+    track_ids = list(dict.fromkeys(track_ids))
+    current = {
+        row["track_id"]
+        for row in conn.execute(
+            "SELECT track_id FROM playlist_tracks WHERE playlist_id = ?", (playlist_id,)
+        )
+    }
+    wanted = set(track_ids)
+    removed = current - wanted
+    added = [track_id for track_id in track_ids if track_id not in current]
+
+    conn.executemany(
+        "DELETE FROM playlist_tracks WHERE playlist_id = ? AND track_id = ?",
+        [(playlist_id, track_id) for track_id in removed],
+    )
+    if added:
+        next_position = conn.execute(
+            "SELECT COALESCE(MAX(position) + 1, 0) AS p FROM playlist_tracks WHERE playlist_id = ?",
+            (playlist_id,),
+        ).fetchone()["p"]
+        conn.executemany(
+            "INSERT INTO playlist_tracks (playlist_id, track_id, position) VALUES (?, ?, ?)",
+            [(playlist_id, track_id, next_position + i) for i, track_id in enumerate(added)],
+        )
+    ordering.apply_order(conn, "playlist_tracks", playlist_id, track_ids)
+    return len(added), len(removed)
+
+
+def record_sync_run(provider_name: str, started_at: float, stats: dict[str, int]) -> None:
+    """Log a bulk playlist sync run to playlist_sync_log.
+
+    Args:
+        provider_name: Provider synced from
+        started_at: Unix timestamp the run started
+        stats: playlists_total, playlists_skipped, playlists_fetched, api_calls,
+            api_calls_saved, tracks_inserted, tracks_deleted
+    """
+    columns = (
+        "playlists_total",
+        "playlists_skipped",
+        "playlists_fetched",
+        "api_calls",
+        "api_calls_saved",
+        "tracks_inserted",
+        "tracks_deleted",
+    )
+    with get_db_connection() as conn:
+        conn.execute(
+            f"""
+            INSERT INTO playlist_sync_log
+                (provider, started_at, completed_at, {", ".join(columns)}, duration_seconds)
+            VALUES (?, ?, datetime('now'), {", ".join("?" * len(columns))}, ?)
+            """,
+            (
+                provider_name,
+                datetime.fromtimestamp(started_at).isoformat(),
+                *(stats.get(column, 0) for column in columns),
+                time.time() - started_at,
+            ),
+        )
+        conn.commit()
+
+
 def should_sync_to_soundcloud(playlist_id: int) -> bool:
     """Check if a playlist should sync to SoundCloud.
 
@@ -285,40 +469,31 @@ def sync_playlist_from_soundcloud(playlist_id: int) -> Tuple[bool, Optional[str]
         )
 
     # Update local database to match SoundCloud
-    # Strategy: Clear local playlist and re-add all tracks in order
+    # Strategy: diff against the local playlist, writing only changed rows
+    soundcloud_ids = [str(soundcloud_id) for soundcloud_id, _ in tracks]
     with get_db_connection() as conn:
         # Begin transaction
         conn.execute("BEGIN")
         try:
-            # Clear existing tracks
-            conn.execute(
-                "DELETE FROM playlist_tracks WHERE playlist_id = ?", (playlist_id,)
-            )
-
-            # Add tracks in order
-            # tracks is a list of tuples: [(track_id, metadata), ...]
-            for position, track_data in enumerate(tracks):
-                soundcloud_id, metadata = track_data  # Unpack tuple
-
-                # Find local track by soundcloud_id
+            local_ids: dict[str, int] = {}
+            for i in range(0, len(soundcloud_ids), 500):
+                chunk = soundcloud_ids[i : i + 500]
                 cursor = conn.execute(
-                    "SELECT id FROM tracks WHERE soundcloud_id = ?", (soundcloud_id,)
+                    f"SELECT id, soundcloud_id FROM tracks WHERE soundcloud_id IN ({','.join('?' * len(chunk))})",
+                    chunk,
                 )
-                track_row = cursor.fetchone()
-
-                if track_row:
-                    track_id = track_row["id"]
-                    conn.execute(
-                        """
-                        INSERT INTO playlist_tracks (playlist_id, track_id, position)
-                        VALUES (?, ?, ?)
-                        """,
-                        (playlist_id, track_id, position),
-                    )
-                else:
+                local_ids.update({str(row["soundcloud_id"]): row["id"] for row in cursor})
+
+            for soundcloud_id in soundcloud_ids:
+                if soundcloud_id not in local_ids:
                     logger.warning(
                         f"Track {soundcloud_id} in SoundCloud playlist not found in local database"
                     )
+            apply_playlist_diff(
+                conn,
+                playlist_id,
+                [local_ids[sc_id] for sc_id in soundcloud_ids if sc_id in local_ids],
+            )
 
             # Update playlist metadata
             conn.execute(
@@ -5,54 +5,69 @@ Provides personal radio station functionality with deterministic timeline
 calculation, schedule management, and multi-source support.
 """
 
-from .models import NowPlaying, ScheduleEntry, Station
-from .schedule import (
-    add_schedule_entry,
-    delete_schedule_entry,
-    get_schedule_entries,
-    get_schedule_entry,
-    get_schedule_for_time,
-    reorder_schedule_entries,
-    time_in_range,
-    update_schedule_entry,
-)
-from .stations import (
-    activate_station,
-    create_station,
-    deactivate_all_stations,
-    delete_station,
-    get_active_station,
-    get_actual_now_playing,
-    get_all_stations,
-    get_station,
-    get_station_by_name,
-    record_now_playing,
-    record_track_history,
-    update_station,
-)
-from .timeline import (
-    calculate_now_playing,
-    clear_daily_skipped,
-    deterministic_shuffle,
-    get_next_track,
-    get_skipped_tracks,
-    get_upcoming_tracks,
-    mark_track_skipped,
-)
-from .scheduler import (
-    get_current_state,
-    get_next_track_path,
-    get_scheduler_info,
-    handle_track_unavailable,
-    reset_scheduler_state,
-)
-from .history import (
-    HistoryEntry,
-    StationStats,
-    TrackPlayStats,
-    get_history_entries,
-    get_most_played_tracks,
-    get_station_stats,
+from music_minion.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".models": (
+            "NowPlaying",
+            "ScheduleEntry",
+            "Station",
+        ),
+        ".schedule": (
+            "add_schedule_entry",
+            "delete_schedule_entry",
+            "get_schedule_entries",
+            "get_schedule_entry",
+            "get_schedule_for_time",
+            "reorder_schedule_entries",
+            "time_in_range",
+            "update_schedule_entry",
+        ),
+        ".stations": (
+            "activate_station",
+            "create_station",
+            "deactivate_all_stations",
+            "delete_station",
+            "get_active_station",
+            "get_actual_now_playing",
+            "get_all_stations",
+            "get_station",
+            "get_station_by_name",
+            "record_now_playing",
+            "record_track_history",
+            "update_station",
+        ),
+        ".timeline": (
+            "calculate_now_playing",
+            "clear_daily_skipped",
+            "deterministic_shuffle",
+            "get_next_track",
+            "get_skipped_tracks",
+            "get_upcoming_tracks",
+            "mark_track_skipped",
+            "mix_order",
+            "precompute_mix_order",
+            "prepare_mix_order",
+            "schedule_mix_order",
+        ),
+        ".scheduler": (
+            "get_current_state",
+            "get_next_track_path",
+            "get_scheduler_info",
+            "handle_track_unavailable",
+            "reset_scheduler_state",
+        ),
+        ".history": (
+            "HistoryEntry",
+            "StationStats",
+            "TrackPlayStats",
+            "get_history_entries",
+            "get_most_played_tracks",
+            "get_station_stats",
+        ),
+    },
 )
 
 __all__ = [
@@ -88,6 +103,10 @@ __all__ = [
     # Timeline calculation
     "calculate_now_playing",
     "deterministic_shuffle",
+    "mix_order",
+    "precompute_mix_order",
+    "prepare_mix_order",
+    "schedule_mix_order",
     "get_skipped_tracks",
     "mark_track_skipped",
     "clear_daily_skipped",
@@ -2,7 +2,9 @@
 Radio playback history queries and analytics.
 
 Provides functions for querying radio_history table with filtering,
-pagination, and aggregation for stats and analytics.
+pagination, and aggregation for stats and analytics. Aggregates read the
+radio_history_daily rollup (one row per day and track), which every write
+to radio_history updates in the same transaction.
 """
 
 from dataclasses import dataclass
@@ -74,6 +76,31 @@ def _get_last_play(conn, track_id: int) -> Optional[tuple[int, datetime]]:
     return row["id"], _parse_timestamp(row["started_at"])
 
 
+def roll_up_play(conn, history_id: int, plays: int, listened_ms: int) -> None:
+    """Add a play and/or listening time for a history row to its daily rollup.
+
+    Must run in the same transaction as the radio_history write.
+
+    Args:
+        conn: Open connection (SQLite or PostgreSQL adapter)
+        history_id: radio_history row the change belongs to
+        plays: Plays to add (1 for a new row, 0 for an update)
+        listened_ms: Change in position_ms (listening time) for the row
+    """
+    conn.execute(
+        """
+        INSERT INTO radio_history_daily (day, track_id, plays, listened_ms)
+        SELECT DATE(started_at), COALESCE(track_id, 0), ?, ?
+        FROM radio_history
+        WHERE id = ?
+        ON CONFLICT (day, track_id) DO UPDATE SET
+            plays = radio_history_daily.plays + excluded.plays,
+            listened_ms = radio_history_daily.listened_ms + excluded.listened_ms
+        """,
+        (plays, listened_ms, history_id),
+    )
+
+
 def start_play(
     track_id: int,
     source_type: str = "local",
@@ -111,6 +138,7 @@ def start_play(
             """,
             (track_id, source_type)
         )
+        roll_up_play(conn, cursor.lastrowid, plays=1, listened_ms=0)
         conn.commit()
         return cursor.lastrowid
 
@@ -124,6 +152,11 @@ def end_play(history_id: int, duration_ms: int, reason: str = "skip") -> None:
         reason: Why playback ended - 'skip', 'completed', or 'new_play'
     """
     with get_radio_db_connection() as conn:
+        row = conn.execute(
+            "SELECT position_ms FROM radio_history WHERE id = ?", (history_id,)
+        ).fetchone()
+        if row is None:
+            return
         conn.execute(
             """
             UPDATE radio_history
@@ -132,6 +165,7 @@ def end_play(history_id: int, duration_ms: int, reason: str = "skip") -> None:
             """,
             (duration_ms, reason, history_id)
         )
+        roll_up_play(conn, history_id, plays=0, listened_ms=duration_ms - (row["position_ms"] or 0))
         conn.commit()
 
 
@@ -187,7 +221,7 @@ def get_history_entries(
         limit: Maximum number of entries to return
         offset: Number of entries to skip (for pagination)
         start_date: Filter entries on or after this date (YYYY-MM-DD)
-        end_date: Filter entries before this date (YYYY-MM-DD)
+        end_date: Filter entries on or before this date (YYYY-MM-DD)
 
     Returns:
         List of HistoryEntry objects, ordered by started_at DESC
@@ -213,13 +247,15 @@ def get_history_entries(
         """
         params = []
 
+        # Compare the raw column against day boundaries so the started_at
+        # index serves the range (DATE(started_at) would scan every row)
         if start_date:
-            query += " AND DATE(rh.started_at) >= ?"
-            params.append(start_date)
+            query += " AND rh.started_at >= ?"
+            params.append(date.fromisoformat(start_date).isoformat())
 
         if end_date:
-            query += " AND DATE(rh.started_at) <= ?"
-            params.append(end_date)
+            query += " AND rh.started_at < ?"
+            params.append((date.fromisoformat(end_date) + timedelta(days=1)).isoformat())
 
         query += " ORDER BY rh.started_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
@@ -271,11 +307,11 @@ def get_stats(days: int = 30) -> Stats:
         cursor = conn.execute(
             """
             SELECT
-                COUNT(*) as total_plays,
-                COALESCE(SUM(position_ms) / 60000, 0) as total_minutes,
-                COUNT(DISTINCT track_id) as unique_tracks
-            FROM radio_history
-            WHERE DATE(started_at) >= ?
+                COALESCE(SUM(plays), 0) as total_plays,
+                COALESCE(SUM(listened_ms) / 60000, 0) as total_minutes,
+                COUNT(DISTINCT NULLIF(track_id, 0)) as unique_tracks
+            FROM radio_history_daily
+            WHERE day >= ?
             """,
             (start_date.isoformat(),)
         )
@@ -322,13 +358,16 @@ def get_most_played_tracks(
                 t.artist,
                 t.album,
                 t.duration,
-                COUNT(*) as play_count,
-                SUM(rh.position_ms) / 1000 as total_duration_seconds
-            FROM radio_history rh
-            JOIN tracks t ON rh.track_id = t.id
-            WHERE DATE(rh.started_at) >= ?
-            GROUP BY t.id, t.local_path, t.title, t.artist, t.album, t.duration
-            ORDER BY play_count DESC
+                d.play_count,
+                d.listened_ms / 1000 as total_duration_seconds
+            FROM (
+                SELECT track_id, SUM(plays) as play_count, SUM(listened_ms) as listened_ms
+                FROM radio_history_daily
+                WHERE day >= ? AND track_id > 0
+                GROUP BY track_id
+            ) d
+            JOIN tracks t ON d.track_id = t.id
+            ORDER BY d.play_count DESC
             LIMIT ?
         """
         params = [start_date.isoformat(), limit]
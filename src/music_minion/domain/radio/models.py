@@ -15,14 +15,14 @@ from music_minion.domain.library.models import Track
 class Station:
     """Represents a radio station.
 
-    A station is a playlist with radio-specific metadata (shuffle/queue mode).
+    A station is a playlist with radio-specific metadata (shuffle/queue/mix mode).
     Only one station can be active at a time.
     """
 
     id: int
     name: str
     playlist_id: Optional[int]  # Links to existing playlist, None for meta-stations
-    mode: str  # 'shuffle' | 'queue'
+    mode: str  # 'shuffle' | 'queue' | 'mix'
     source_filter: str  # 'all' | 'local' | 'youtube' | 'soundcloud' | 'spotify'
     is_active: bool
     created_at: datetime
@@ -14,6 +14,7 @@ from loguru import logger
 from music_minion.core.db_adapter import get_radio_db_connection
 from music_minion.domain.library.models import Track
 
+from .history import roll_up_play
 from .models import NowPlaying
 from .stations import get_active_station
 from .timeline import calculate_now_playing, mark_track_skipped
@@ -74,6 +75,7 @@ def get_next_track_path() -> Optional[str]:
             current_started_at=now,
             last_request_time=now,
         )
+        _prefetch_upcoming(now_playing.upcoming)
     else:
         # Same track - just update request time
         _scheduler_state.last_request_time = now
@@ -105,6 +107,19 @@ def get_next_track_path() -> Optional[str]:
     return None
 
 
+def _prefetch_upcoming(upcoming: list[Track]) -> None:
+    """Resolve stream URLs for the next streaming tracks in the background.
+
+    Liquidsoap then gets a cached URL at the transition instead of waiting
+    on yt-dlp.
+    """
+    from .stream_resolver import PREFETCH_AHEAD, prefetch_stream_urls
+
+    prefetch_stream_urls(
+        t.source_url for t in upcoming[:PREFETCH_AHEAD] if t.source_url and not t.local_path
+    )
+
+
 def _record_history(
     station_id: int,
     track: Track,
@@ -123,13 +138,15 @@ def _record_history(
     source_url = track.source_url if source_type != "local" else None
 
     with get_radio_db_connection() as conn:
-        conn.execute(
+        history_id = conn.execute(
             """
             INSERT INTO radio_history (station_id, track_id, source_type, source_url, started_at, position_ms)
             VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+            RETURNING id
             """,
             (station_id, track.id, source_type, source_url, position_ms),
-        )
+        ).fetchone()["id"]
+        roll_up_play(conn, history_id, plays=1, listened_ms=position_ms)
         conn.commit()
         logger.debug(
             f"Recorded history: station={station_id}, track={track.id}, "
@@ -11,6 +11,7 @@ from loguru import logger
 
 from music_minion.core.db_adapter import get_radio_db_connection, is_postgres
 
+from .history import roll_up_play
 from .models import Station
 
 
@@ -30,6 +31,8 @@ def _parse_datetime(val: Any) -> datetime:
 
 
 VALID_SOURCE_FILTERS = ("all", "local", "youtube", "soundcloud", "spotify")
+# mix: harmonic order (Camelot keys, BPM), see playlists.sequencer
+VALID_MODES = ("shuffle", "queue", "mix")
 
 
 def _row_to_station(row: dict[str, Any]) -> Station:
@@ -46,6 +49,16 @@ def _row_to_station(row: dict[str, Any]) -> Station:
     )
 
 
+def _prepare_mix_order(station_id: int) -> None:
+    """Sequence a mix station's order up front so playback doesn't wait on it."""
+    from .timeline import prepare_mix_order
+
+    try:
+        prepare_mix_order(station_id)
+    except Exception as e:
+        logger.warning(f"Could not prepare mix order for station {station_id}: {e}")
+
+
 def create_station(
     name: str,
     playlist_id: Optional[int] = None,
@@ -57,7 +70,7 @@ def create_station(
     Args:
         name: Unique station name
         playlist_id: Optional playlist to associate with this station
-        mode: Playback mode - 'shuffle' or 'queue'
+        mode: Playback mode - 'shuffle', 'queue' or 'mix'
         source_filter: Filter tracks by source - 'all', 'local', 'youtube', 'soundcloud', 'spotify'
 
     Returns:
@@ -66,8 +79,8 @@ def create_station(
     Raises:
         ValueError: If name already exists, mode is invalid, or source_filter is invalid
     """
-    if mode not in ("shuffle", "queue"):
-        raise ValueError(f"Invalid mode: {mode}. Must be 'shuffle' or 'queue'")
+    if mode not in VALID_MODES:
+        raise ValueError(f"Invalid mode: {mode}. Must be one of {VALID_MODES}")
 
     if source_filter not in VALID_SOURCE_FILTERS:
         raise ValueError(
@@ -214,12 +227,14 @@ def activate_station(station_id: int) -> bool:
 
             conn.commit()
             logger.info(f"Activated station {station_id}")
-            return True
 
         except Exception:
             conn.rollback()
             raise
 
+    _prepare_mix_order(station_id)
+    return True
+
 
 def deactivate_all_stations() -> bool:
     """Deactivate all stations (stop radio).
@@ -267,7 +282,7 @@ def update_station(
         station_id: Station ID to update
         name: New name (optional)
         playlist_id: New playlist ID (optional, use -1 to clear)
-        mode: New mode - 'shuffle' or 'queue' (optional)
+        mode: New mode - 'shuffle', 'queue' or 'mix' (optional)
         source_filter: New source filter (optional)
 
     Returns:
@@ -276,8 +291,8 @@ def update_station(
     Raises:
         ValueError: If name already exists, mode is invalid, or source_filter is invalid
     """
-    if mode is not None and mode not in ("shuffle", "queue"):
-        raise ValueError(f"Invalid mode: {mode}. Must be 'shuffle' or 'queue'")
+    if mode is not None and mode not in VALID_MODES:
+        raise ValueError(f"Invalid mode: {mode}. Must be one of {VALID_MODES}")
 
     if source_filter is not None and source_filter not in VALID_SOURCE_FILTERS:
         raise ValueError(
@@ -316,13 +331,18 @@ def update_station(
             updated = cursor.rowcount > 0
             if updated:
                 logger.info(f"Updated station {station_id}")
-            return updated
 
         except Exception as e:
             if "UNIQUE constraint failed" in str(e):
                 raise ValueError(f"Station '{name}' already exists")
             raise
 
+    if updated and (playlist_id, mode, source_filter) != (None, None, None):
+        active = get_active_station()
+        if active is not None:
+            _prepare_mix_order(active.id)
+    return updated
+
 
 def delete_station(station_id: int) -> bool:
     """Delete a station.
@@ -388,13 +408,15 @@ def record_track_history(
         position_ms: Starting position in track (default: 0)
     """
     with get_radio_db_connection() as conn:
-        conn.execute(
+        history_id = conn.execute(
             """
             INSERT INTO radio_history (station_id, track_id, source_type, started_at, position_ms)
             VALUES (?, ?, ?, CURRENT_TIMESTAMP, ?)
+            RETURNING id
             """,
             (station_id, track_id, source_type, position_ms),
-        )
+        ).fetchone()["id"]
+        roll_up_play(conn, history_id, plays=1, listened_ms=position_ms)
         conn.commit()
         logger.debug(
             f"Recorded history: station={station_id}, track={track_id}, source={source_type}"
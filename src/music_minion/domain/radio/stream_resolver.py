@@ -1,48 +1,207 @@
 """Stream URL resolution for non-local tracks using yt-dlp.
 
-Extracts playable stream URLs from source permalinks (SoundCloud, YouTube, etc.)
-with short-lived caching since stream URLs expire.
+Extracts playable stream URLs from source permalinks (SoundCloud, YouTube, etc.).
+Resolving costs a cold yt-dlp extraction (~2-3s), so results are cached until
+shortly before the stream URL itself expires: in memory (bounded LRU) and in a
+small SQLite file in the data directory that survives restarts. Concurrent
+requests for the same URL share one resolution, and callers that know what
+plays next (radio timeline, web queue) prefetch it on a background pool so
+track transitions are served from cache.
 """
 
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from time import time
-from typing import Optional
+from typing import Callable, Iterable, Mapping, Optional
+from urllib.parse import parse_qs, urlsplit
 
-import yt_dlp
 from loguru import logger
 
-# Cache stream URLs for 10 minutes (SoundCloud URLs typically expire after ~15 min)
-_stream_cache: dict[
-    str, tuple[str, float]
-] = {}  # source_url -> (stream_url, expires_at)
-CACHE_TTL_SECONDS = 600  # 10 minutes
+CACHE_TTL_SECONDS = 600  # Used when the stream URL carries no expiry of its own
+EXPIRY_MARGIN_SECONDS = 60  # Drop entries this long before the URL expires
+MAX_CACHE_ENTRIES = 1000  # Per layer (memory and disk)
+PREFETCH_AHEAD = 3  # Upcoming tracks to resolve ahead of playback
+PREFETCH_WORKERS = 3
+PREFETCH_MIN_TTL_SECONDS = 300  # Prefetch re-resolves entries expiring sooner
 
+# Query parameters CDNs use for the expiry epoch (CloudFront, googlevideo)
+_EXPIRY_PARAMS = ("Expires", "expires", "expire")
+
+# source key -> (stream_url, expires_at), most recently used last
+_stream_cache: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+_inflight: dict[str, Future] = {}
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _cache_path():
+    from music_minion.core.config import get_data_dir
+
+    return get_data_dir() / "stream_cache.db"
+
+
+def _connect_disk() -> sqlite3.Connection:
+    """Open the on-disk cache, creating its table if needed."""
+    conn = sqlite3.connect(_cache_path(), timeout=5)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS stream_urls (
+            source_key TEXT PRIMARY KEY,
+            stream_url TEXT NOT NULL,
+            expires_at REAL NOT NULL
+        )
+        """
+    )
+    return conn
+
+
+def _url_expiry(stream_url: str) -> Optional[float]:
+    """Return the expiry epoch embedded in a signed stream URL, if any."""
+    params = parse_qs(urlsplit(stream_url).query)
+    for name in _EXPIRY_PARAMS:
+        values = params.get(name)
+        if values and values[0].isdigit():
+            return float(values[0])
+    return None
 
-def resolve_stream_url(source_url: str) -> Optional[str]:
-    """Resolve a source permalink to a playable stream URL using yt-dlp.
 
-    Uses short-lived caching since stream URLs expire. Cache is checked first,
-    and yt-dlp is only called if the cache misses or is expired.
+def _expires_at(stream_url: str, now: float) -> float:
+    url_expiry = _url_expiry(stream_url)
+    if url_expiry is None:
+        return now + CACHE_TTL_SECONDS
+    return url_expiry - EXPIRY_MARGIN_SECONDS
+
+
+def _remember(key: str, stream_url: str, expires_at: float) -> None:
+    """Insert into the memory LRU (caller holds _lock)."""
+    _stream_cache[key] = (stream_url, expires_at)
+    _stream_cache.move_to_end(key)
+    while len(_stream_cache) > MAX_CACHE_ENTRIES:
+        _stream_cache.popitem(last=False)
+
+
+def _cache_get(key: str, min_ttl: float = 0) -> Optional[str]:
+    """Return a cached stream URL valid for at least min_ttl more seconds."""
+    now = time()
+    with _lock:
+        entry = _stream_cache.get(key)
+        if entry is not None:
+            stream_url, expires_at = entry
+            if expires_at > now + min_ttl:
+                _stream_cache.move_to_end(key)
+                return stream_url
+            if expires_at <= now:
+                del _stream_cache[key]
+
+    try:
+        conn = _connect_disk()
+        try:
+            row = conn.execute(
+                "SELECT stream_url, expires_at FROM stream_urls "
+                "WHERE source_key = ? AND expires_at > ?",
+                (key, now + min_ttl),
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Stream cache read failed: {e}")
+        return None
+
+    if row is None:
+        return None
+    with _lock:
+        _remember(key, row[0], row[1])
+    return row[0]
+
+
+def _cache_put(key: str, stream_url: str) -> None:
+    now = time()
+    expires_at = _expires_at(stream_url, now)
+    if expires_at <= now:
+        return
+    with _lock:
+        _remember(key, stream_url, expires_at)
+
+    try:
+        conn = _connect_disk()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO stream_urls (source_key, stream_url, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, stream_url, expires_at),
+            )
+            conn.execute("DELETE FROM stream_urls WHERE expires_at <= ?", (now,))
+            conn.execute(
+                """
+                DELETE FROM stream_urls WHERE source_key NOT IN (
+                    SELECT source_key FROM stream_urls ORDER BY expires_at DESC LIMIT ?
+                )
+                """,
+                (MAX_CACHE_ENTRIES,),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Stream cache write failed: {e}")
+
+
+def resolve_cached(
+    key: str,
+    resolve: Callable[[], Optional[str]],
+    min_ttl: float = 0,
+) -> Optional[str]:
+    """Resolve a stream URL through the cache, sharing in-flight resolutions.
+
+    If another thread is already resolving ``key``, waits for its result
+    instead of starting a second extraction. Exceptions raised by ``resolve``
+    propagate to every caller waiting on it. Failures (None) are not cached.
 
     Args:
-        source_url: Source track permalink (SoundCloud, YouTube, etc.)
+        key: Cache key identifying the source (e.g. its permalink)
+        resolve: Function doing the actual (slow) resolution
+        min_ttl: Treat cache entries expiring within this many seconds as misses
 
     Returns:
         Direct stream URL or None if resolution fails
     """
-    if not source_url:
-        return None
+    stream_url = _cache_get(key, min_ttl)
+    if stream_url is not None:
+        logger.debug(f"Stream URL cache hit for {key}")
+        return stream_url
+
+    with _lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = Future()
+            _inflight[key] = future
+
+    if not owner:
+        logger.debug(f"Waiting on in-flight stream resolution for {key}")
+        return future.result()
+
+    try:
+        stream_url = resolve()
+        if stream_url:
+            _cache_put(key, stream_url)
+        future.set_result(stream_url)
+        return stream_url
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _lock:
+            _inflight.pop(key, None)
+
+
+def _extract_stream_url(source_url: str) -> Optional[str]:
+    """Run yt-dlp to get a direct stream URL (slow, uncached)."""
+    import yt_dlp
 
-    # Check cache first
-    if source_url in _stream_cache:
-        stream_url, expires_at = _stream_cache[source_url]
-        if time() < expires_at:
-            logger.debug(f"Stream URL cache hit for {source_url}")
-            return stream_url
-        else:
-            # Expired - remove from cache
-            del _stream_cache[source_url]
-
-    # Extract with yt-dlp
     try:
         ydl_opts = {
             "quiet": True,
@@ -51,6 +210,7 @@ def resolve_stream_url(source_url: str) -> Optional[str]:
             "extract_flat": False,  # Need actual URL, not just metadata
             # Don't download, just extract
             "skip_download": True,
+            "socket_timeout": 15,
         }
 
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
@@ -76,8 +236,6 @@ def resolve_stream_url(source_url: str) -> Optional[str]:
                         stream_url = formats[-1].get("url")
 
             if stream_url:
-                # Cache the result
-                _stream_cache[source_url] = (stream_url, time() + CACHE_TTL_SECONDS)
                 logger.debug(f"Resolved stream URL for {source_url}")
                 return stream_url
             else:
@@ -89,17 +247,102 @@ def resolve_stream_url(source_url: str) -> Optional[str]:
     except yt_dlp.utils.DownloadError as e:
         logger.warning(f"yt-dlp download error for {source_url}: {e}")
         return None
-    except Exception as e:
+    except Exception:
         logger.exception(f"Unexpected error resolving stream URL for {source_url}")
         return None
 
 
+def resolve_stream_url(source_url: str) -> Optional[str]:
+    """Resolve a source permalink to a playable stream URL using yt-dlp.
+
+    Served from cache when possible; yt-dlp is only called on a miss, and at
+    most once at a time per URL.
+
+    Args:
+        source_url: Source track permalink (SoundCloud, YouTube, etc.)
+
+    Returns:
+        Direct stream URL or None if resolution fails
+    """
+    if not source_url:
+        return None
+    return resolve_cached(source_url, lambda: _extract_stream_url(source_url))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=PREFETCH_WORKERS, thread_name_prefix="stream-prefetch"
+            )
+        return _executor
+
+
+def _prefetch_one(key: str, resolve: Callable[[], Optional[str]]) -> None:
+    try:
+        resolve_cached(key, resolve, min_ttl=PREFETCH_MIN_TTL_SECONDS)
+    except Exception as e:
+        # The playback request will resolve again and handle the error itself
+        logger.debug(f"Prefetch failed for {key}: {e}")
+
+
+def prefetch(jobs: Mapping[str, Callable[[], Optional[str]]]) -> int:
+    """Resolve stream URLs in the background ahead of playback.
+
+    Keys already cached (with PREFETCH_MIN_TTL_SECONDS to spare) or currently
+    being resolved are skipped. Never blocks on resolution.
+
+    Args:
+        jobs: Mapping of cache key -> resolve function (see resolve_cached)
+
+    Returns:
+        Number of resolutions queued
+    """
+    queued = 0
+    for key, resolve in jobs.items():
+        with _lock:
+            if key in _inflight:
+                continue
+        if _cache_get(key, PREFETCH_MIN_TTL_SECONDS) is not None:
+            continue
+        _get_executor().submit(_prefetch_one, key, resolve)
+        queued += 1
+    if queued:
+        logger.debug(f"Prefetching {queued} stream URLs")
+    return queued
+
+
+def prefetch_stream_urls(source_urls: Iterable[str]) -> int:
+    """Prefetch yt-dlp stream URLs for upcoming source permalinks.
+
+    Args:
+        source_urls: Permalinks of tracks expected to play soon
+
+    Returns:
+        Number of resolutions queued
+    """
+    return prefetch(
+        {url: (lambda url=url: _extract_stream_url(url)) for url in source_urls if url}
+    )
+
+
 def clear_stream_cache() -> None:
-    """Clear the stream URL cache.
+    """Clear the stream URL cache (memory and disk).
 
     Useful for testing or forcing fresh URL resolution.
     """
-    _stream_cache.clear()
+    with _lock:
+        _stream_cache.clear()
+    try:
+        conn = _connect_disk()
+        try:
+            conn.execute("DELETE FROM stream_urls")
+            conn.commit()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Stream cache clear failed: {e}")
     logger.debug("Stream URL cache cleared")
 
 
@@ -107,32 +350,35 @@ def get_cache_stats() -> dict:
     """Get cache statistics for monitoring.
 
     Returns:
-        Dict with cache size and entries (for debugging)
+        Dict with in-memory entry counts and in-flight resolutions (for debugging)
     """
     now = time()
-    valid_entries = sum(1 for _, (_, exp) in _stream_cache.items() if exp > now)
-    expired_entries = len(_stream_cache) - valid_entries
+    with _lock:
+        valid_entries = sum(1 for _, exp in _stream_cache.values() if exp > now)
+        total_entries = len(_stream_cache)
+        in_flight = len(_inflight)
 
     return {
-        "total_entries": len(_stream_cache),
+        "total_entries": total_entries,
         "valid_entries": valid_entries,
-        "expired_entries": expired_entries,
+        "expired_entries": total_entries - valid_entries,
+        "in_flight": in_flight,
     }
 
 
 def prune_expired_cache() -> int:
-    """Remove expired entries from cache.
+    """Remove expired entries from the in-memory cache.
 
-    Called periodically to prevent memory growth.
+    The disk cache prunes itself on every write.
 
     Returns:
         Number of entries removed
     """
     now = time()
-    expired_keys = [k for k, (_, exp) in _stream_cache.items() if exp <= now]
-
-    for key in expired_keys:
-        del _stream_cache[key]
+    with _lock:
+        expired_keys = [k for k, (_, exp) in _stream_cache.items() if exp <= now]
+        for key in expired_keys:
+            del _stream_cache[key]
 
     if expired_keys:
         logger.debug(f"Pruned {len(expired_keys)} expired stream URL cache entries")
@@ -7,6 +7,7 @@ exactly what track and position should be playing at any given time.
 
 import hashlib
 import random
+import threading
 from datetime import date, datetime, time, timedelta
 from typing import Optional
 
@@ -49,6 +50,189 @@ def deterministic_shuffle(tracks: list[Track], seed: str) -> list[Track]:
     return shuffled
 
 
+# (station_id, seed, track ids) -> play order. Per station: the day being
+# played and the next day's, sequenced ahead of the rollover
+_mix_order_cache: dict[tuple[int, str, tuple[int, ...]], list[int]] = {}
+_mix_order_lock = threading.Lock()
+MIX_ORDERS_PER_STATION = 2
+
+# Mix orders waiting for the background worker: cache key -> tracks
+_pending_mix_orders: dict[tuple[int, str, tuple[int, ...]], list[Track]] = {}
+_pending_lock = threading.Condition()
+_mix_order_thread: Optional[threading.Thread] = None
+
+
+def _store_mix_order(key: tuple[int, str, tuple[int, ...]], order: list[int]) -> list[int]:
+    """Cache a play order unless one is already stored; returns the stored order."""
+    station_id, seed, _ = key
+    with _mix_order_lock:
+        existing = _mix_order_cache.get(key)
+        if existing is not None:
+            return existing
+        # Drop the station's orders for older track lists of this seed
+        for stale in [k for k in _mix_order_cache if k[:2] == (station_id, seed)]:
+            del _mix_order_cache[stale]
+        _mix_order_cache[key] = order
+        kept = [k for k in _mix_order_cache if k[0] == station_id]
+        for stale in kept[:-MIX_ORDERS_PER_STATION]:
+            del _mix_order_cache[stale]
+        return order
+
+
+def precompute_mix_order(station_id: int, tracks: list[Track], seed: str) -> list[int]:
+    """Sequence a station's tracks for mixing and cache the order.
+
+    Runs the greedy + 2-opt sequencer, which can take seconds on large
+    playlists; the radio request path never calls this directly. An order
+    already cached for the seed (including a shuffle that has been played)
+    is kept.
+
+    Args:
+        station_id: Station ID (cache key)
+        tracks: Tracks to order
+        seed: Seed string (typically "{station_id}-{date}")
+
+    Returns:
+        Track IDs in play order
+    """
+    from music_minion.domain.playlists.sequencer import sequence_tracks
+
+    key = (station_id, seed, tuple(t.id for t in tracks))
+    order = _mix_order_cache.get(key)
+    if order is not None:
+        return order
+    opener = deterministic_shuffle(tracks, seed)[0]
+    order = sequence_tracks(
+        [{"id": t.id, "bpm": t.bpm, "key_signature": t.key} for t in tracks],
+        arc="none",
+        start_track_id=opener.id,
+    )
+    return _store_mix_order(key, order)
+
+
+def schedule_mix_order(station_id: int, tracks: list[Track], seed: str) -> None:
+    """Queue a background computation of a station's mix order."""
+    global _mix_order_thread
+    key = (station_id, seed, tuple(t.id for t in tracks))
+    if key in _mix_order_cache:
+        return
+    with _pending_lock:
+        _pending_mix_orders[key] = list(tracks)
+        if _mix_order_thread is None or not _mix_order_thread.is_alive():
+            _mix_order_thread = threading.Thread(target=_mix_order_worker_loop, daemon=True)
+            _mix_order_thread.start()
+        _pending_lock.notify()
+
+
+def _mix_order_worker_loop() -> None:
+    """Compute queued mix orders. Runs as daemon thread."""
+    threading.current_thread().silent_logging = True
+    while True:
+        with _pending_lock:
+            while not _pending_mix_orders:
+                _pending_lock.wait()
+            key = next(iter(_pending_mix_orders))
+            tracks = _pending_mix_orders.pop(key)
+        station_id, seed, _ = key
+        try:
+            precompute_mix_order(station_id, tracks, seed)
+            logger.debug(f"Computed mix order for station {station_id} ({seed})")
+        except Exception as e:
+            logger.exception(f"Mix order for station {station_id} failed: {e}")
+
+
+def mix_order(station_id: int, tracks: list[Track], seed: str) -> list[Track]:
+    """Order tracks for harmonic mixing (Camelot keys, BPM), deterministically.
+
+    The opener is the first track of the day's shuffle, so the loop starts
+    somewhere new each day while the transitions stay smooth. No energy arc:
+    a station loops, so there is no set to build up.
+
+    Orders are sequenced ahead of time (on activation and before the day
+    rollover), never here. If none is ready for this seed and track list,
+    the day's shuffle plays and stays for the rest of the seed, so the
+    timeline doesn't jump when sequencing would have finished.
+
+    Args:
+        station_id: Station ID (cache key)
+        tracks: Tracks to order
+        seed: Seed string (typically "{station_id}-{date}")
+
+    Returns:
+        New list with tracks in mixing order
+    """
+    if len(tracks) < 3:
+        return list(tracks)
+
+    key = (station_id, seed, tuple(t.id for t in tracks))
+    order = _mix_order_cache.get(key)
+    if order is None:
+        logger.info(f"No mix order ready for station {station_id} ({seed}), playing shuffle")
+        order = _store_mix_order(key, [t.id for t in deterministic_shuffle(tracks, seed)])
+
+    by_id = {t.id: t for t in tracks}
+    return [by_id[track_id] for track_id in order]
+
+
+def prepare_mix_order(station_id: int, current_time: Optional[datetime] = None) -> None:
+    """Sequence the mix order a station is about to play, before it's requested.
+
+    Called when a station is activated or reconfigured, so a mix station
+    starts in mixing order rather than the day's shuffle. Blocks for up to
+    the sequencer's time limit.
+
+    Args:
+        station_id: Station ID (resolved through its schedule)
+        current_time: Time to prepare for (default: now)
+    """
+    current_time = current_time or datetime.now()
+    resolved_station_id, _ = _resolve_target_station(station_id, current_time)
+    station = get_station(resolved_station_id)
+    if station is None or station.mode != "mix" or station.playlist_id is None:
+        return
+
+    day = current_time.date()
+    tracks = _get_playlist_tracks_as_models(
+        station.playlist_id,
+        get_skipped_tracks(station.id, day),
+        source_filter=station.source_filter,
+    )
+    if len(tracks) >= 3:
+        precompute_mix_order(station.id, tracks, f"{station.id}-{day}")
+
+
+def _schedule_next_mix_order(
+    station_id: int,
+    playlist_id: int,
+    source_filter: str,
+    day: date,
+    tracks: Optional[list[Track]],
+) -> None:
+    """Sequence the next day's mix order in the background, ahead of the rollover.
+
+    Args:
+        station_id: Station ID
+        playlist_id: Station's playlist
+        source_filter: Station's source filter
+        day: Day being played
+        tracks: Today's tracks if none were skipped (skips are per day)
+    """
+    if tracks is None:
+        tracks = _get_playlist_tracks_as_models(playlist_id, set(), source_filter=source_filter)
+    if len(tracks) >= 3:
+        schedule_mix_order(station_id, tracks, f"{station_id}-{day + timedelta(days=1)}")
+
+
+def _order_tracks(station_id: int, mode: str, tracks: list[Track], day: date) -> list[Track]:
+    """Apply the station's playback mode (deterministic daily seed)."""
+    seed = f"{station_id}-{day}"
+    if mode == "shuffle":
+        return deterministic_shuffle(tracks, seed)
+    if mode == "mix":
+        return mix_order(station_id, tracks, seed)
+    return tracks
+
+
 def get_skipped_tracks(station_id: int, skip_date: date) -> set[int]:
     """Get track IDs that have been skipped for a station on a given date.
 
@@ -343,10 +527,19 @@ def calculate_now_playing(
         )
         return None
 
-    # Apply shuffle if needed (deterministic daily seed)
-    if resolved_station.mode == "shuffle":
-        seed = f"{resolved_station_id}-{current_time.date()}"
-        tracks = deterministic_shuffle(tracks, seed)
+    if resolved_station.mode == "mix":
+        _schedule_next_mix_order(
+            resolved_station_id,
+            resolved_station.playlist_id,
+            resolved_station.source_filter,
+            current_time.date(),
+            None if skipped_ids else tracks,
+        )
+
+    # Apply shuffle or mix order if needed (deterministic daily seed)
+    tracks = _order_tracks(
+        resolved_station_id, resolved_station.mode, tracks, current_time.date()
+    )
 
     # Calculate position in the playlist loop
     total_duration_ms = sum((t.duration or 0) * 1000 for t in tracks)
@@ -470,9 +663,9 @@ def get_upcoming_tracks(
                 source_filter=station.source_filter,
             )
 
-            if station.mode == "shuffle":
-                seed = f"{now_playing.station_id}-{current_time.date()}"
-                tracks = deterministic_shuffle(tracks, seed)
+            tracks = _order_tracks(
+                now_playing.station_id, station.mode, tracks, current_time.date()
+            )
 
             # Find current track index and extend upcoming
             for i, track in enumerate(tracks):
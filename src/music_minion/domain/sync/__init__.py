@@ -8,21 +8,28 @@ This domain handles:
 - Library rescanning with incremental updates
 """
 
-from .engine import (
-    get_file_mtime,
-    write_tags_to_file,
-    read_tags_from_file,
-    detect_file_changes,
-    sync_export,
-    sync_import,
-    sync_metadata_export,
-    sync_elo_export,
-    get_sync_status,
-    rescan_library,
-    path_similarity,
-    detect_missing_and_moved_files,
-    sync_pull,
-    sync_push,
+from music_minion.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".engine": (
+            "get_file_mtime",
+            "write_tags_to_file",
+            "read_tags_from_file",
+            "detect_file_changes",
+            "sync_export",
+            "sync_import",
+            "sync_metadata_export",
+            "sync_elo_export",
+            "get_sync_status",
+            "rescan_library",
+            "path_similarity",
+            "detect_missing_and_moved_files",
+            "sync_pull",
+            "sync_push",
+        ),
+    },
 )
 
 __all__ = [
@@ -1245,25 +1245,33 @@ def path_similarity(path1: str, path2: str) -> float:
     return SequenceMatcher(None, parts1, parts2).ratio()
 
 
-def detect_missing_and_moved_files(config: Config) -> dict[str, Any]:
+def detect_missing_and_moved_files(
+    config: Config, files_on_disk: Optional[set[str]] = None
+) -> dict[str, Any]:
     """Detect missing files and attempt to relocate moved files.
 
     Scans all local tracks in the database and checks if their files still exist.
-    For missing files, attempts to match them with untracked files on disk using
-    filename + filesize. Files with .sync-conflict- in their path are auto-deleted.
+    For missing files, attempts to match them with untracked files on disk by the
+    content fingerprint recorded in the file catalog, falling back to filename +
+    filesize. Files with .sync-conflict- in their path are auto-deleted.
 
     Algorithm:
         1. Query all source='local' tracks from database
         2. Check which tracks have missing files (local_path doesn't exist)
-        3. Build index of all untracked files on disk
+        3. Build index of all untracked files on disk, and catalog them
         4. For each missing file:
            - If Syncthing conflict → delete
+           - If an untracked file has the content hash the missing one was
+             cataloged with → relocate (closest path if several)
            - If filename match with same filesize → relocate
            - If multiple matches → pick closest by path similarity (≥0.8)
            - If no match → delete
 
     Args:
         config: Configuration object with library paths
+        files_on_disk: Paths of the music files currently in the library, when
+            the caller has already walked it (e.g. the library watcher's
+            reconciliation pass). Globbed from library_paths if None.
 
     Returns:
         Dictionary with keys:
@@ -1314,41 +1322,66 @@ def detect_missing_and_moved_files(config: Config) -> dict[str, Any]:
     logger.info(f"Found {len(missing_tracks)} tracks with missing files")
 
     # Step 3: Build untracked file index
-    all_files_on_disk = set()
-    for library_path in config.music.library_paths:
-        for ext in config.music.supported_formats:
-            all_files_on_disk.update(Path(library_path).rglob(f"*{ext}"))
+    if files_on_disk is None:
+        files_on_disk = set()
+        for library_path in config.music.library_paths:
+            for ext in config.music.supported_formats:
+                files_on_disk.update(str(p) for p in Path(library_path).rglob(f"*{ext}"))
 
     # Filter to untracked files (not in database)
     db_paths = {t['local_path'] for t in db_tracks}
-    untracked_files = all_files_on_disk - db_paths
+    untracked_files = files_on_disk - db_paths
 
     # Index by filename: {filename: [(full_path, filesize), ...]}
     untracked_index = {}
     for filepath in untracked_files:
+        filename = Path(filepath).name
         # Skip Syncthing conflicts
-        if '.sync-conflict-' in filepath.name:
+        if '.sync-conflict-' in filename:
             continue
 
-        filename = filepath.name
         try:
-            filesize = filepath.stat().st_size
-            untracked_index.setdefault(filename, []).append((str(filepath), filesize))
+            filesize = os.stat(filepath).st_size
+            untracked_index.setdefault(filename, []).append((filepath, filesize))
         except OSError:
             # Skip files we can't stat
             continue
 
     logger.info(f"Found {len(untracked_files)} untracked files, {len(untracked_index)} unique filenames")
 
+    # Fingerprint untracked files; missing ones keep the hash they were cataloged with
+    from music_minion.domain.library import catalog
+
+    catalog.refresh_catalog(untracked_files)
+    fingerprint_matches = catalog.match_moved_files(
+        [t['local_path'] for t in missing_tracks], untracked_files
+    )
+    claimed: set[str] = set()
+
     # Step 4: Match and classify missing files
     # Note: actions list already initialized in Step 2 with Syncthing conflicts
 
     for missing in missing_tracks:
         old_path = missing['local_path']
 
+        # Same audio content: certain regardless of name or location
+        matches = [p for p in fingerprint_matches.get(old_path, []) if p not in claimed]
+        if matches:
+            old_dir = str(Path(old_path).parent)
+            new_path = max(matches, key=lambda p: path_similarity(old_dir, str(Path(p).parent)))
+            claimed.add(new_path)
+            actions.append({
+                'type': 'relocate',
+                'track_id': missing['id'],
+                'old_path': old_path,
+                'new_path': new_path,
+                'reason': 'fingerprint'
+            })
+            continue
+
         # Try to match by filename
         filename = Path(old_path).name
-        candidates = untracked_index.get(filename, [])
+        candidates = [c for c in untracked_index.get(filename, []) if c[0] not in claimed]
 
         if not candidates:
             # No match - schedule for deletion
@@ -1362,6 +1395,7 @@ def detect_missing_and_moved_files(config: Config) -> dict[str, Any]:
         elif len(candidates) == 1:
             # Single candidate - auto-relocate
             new_path, new_size = candidates[0]
+            claimed.add(new_path)
             actions.append({
                 'type': 'relocate',
                 'track_id': missing['id'],
@@ -1383,6 +1417,7 @@ def detect_missing_and_moved_files(config: Config) -> dict[str, Any]:
                     best_match = new_path
 
             if best_score >= AUTO_RELOCATE_THRESHOLD:
+                claimed.add(best_match)
                 actions.append({
                     'type': 'relocate',
                     'track_id': missing['id'],
@@ -1430,6 +1465,11 @@ def detect_missing_and_moved_files(config: Config) -> dict[str, Any]:
 
         conn.commit()
 
+    # Catalog rows of the old paths have served their purpose
+    catalog.forget_paths(
+        action['old_path'] for action in actions if action['old_path'] not in files_on_disk
+    )
+
     # Log detailed actions
     logger.info(f"Cleanup complete: {relocated_count} relocated, {deleted_count} deleted")
     for action in actions:
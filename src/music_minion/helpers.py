@@ -264,45 +264,13 @@ def auto_export_if_enabled(playlist_id: int, ctx: Optional[AppContext] = None) -
     else:
         cfg = config.load_config()
 
-    if not cfg.playlists.auto_export:
+    options = playlist_export.get_auto_export_options(cfg)
+    if options is None:
         return
 
-    # Check active library - only export for local library
-    with database.get_db_connection() as conn:
-        cursor = conn.execute("SELECT provider FROM active_library WHERE id = 1")
-        row = cursor.fetchone()
-        active_library = row["provider"] if row else "local"
-
-    # Skip export for streaming libraries (soundcloud, spotify, youtube)
-    # Export is only supported for local file libraries
-    if active_library != "local":
-        return
-
-    # Validate library paths exist
-    if not cfg.music.library_paths:
-        logger.warning("Cannot auto-export - no library paths configured")
-        return
-
-    # Get library root from config
-    library_root = Path(cfg.music.library_paths[0]).expanduser()
-
-    # For crate format: use syncthing music root if enabled, otherwise Music directory
-    if "crate" in cfg.playlists.export_formats:
-        if cfg.syncthing.enabled:
-            library_root = Path(cfg.syncthing.linux_music_root).expanduser()
-        else:
-            # Default to ~/Music for crates (standard Serato location)
-            library_root = Path.home() / "Music"
-
     # Silently export in the background - don't interrupt user workflow
     try:
-        playlist_export.auto_export_playlist(
-            playlist_id=playlist_id,
-            export_formats=cfg.playlists.export_formats,
-            library_root=library_root,
-            use_relative_paths=cfg.playlists.use_relative_paths,
-            syncthing_config=cfg.syncthing,
-        )
+        playlist_export.auto_export_playlist(playlist_id=playlist_id, **options)
     except (ValueError, FileNotFoundError, ImportError, OSError) as e:
         # Expected errors - log but don't interrupt workflow
         logger.exception("Auto-export failed")
@@ -492,3 +460,25 @@ def cleanup_file_watcher_safe(observer) -> None:
         logger.debug("File watcher stopped successfully")
     except Exception as e:
         logger.debug(f"File watcher cleanup error (non-critical): {e}")
+
+
+def cleanup_library_watcher_safe() -> None:
+    """Safely stop the library watcher with isolated error handling."""
+    try:
+        from music_minion.domain.library.watcher import stop_library_watcher
+
+        stop_library_watcher()
+        logger.debug("Library watcher stopped successfully")
+    except Exception as e:
+        logger.debug(f"Library watcher cleanup error (non-critical): {e}")
+
+
+def cleanup_audio_analysis_safe() -> None:
+    """Safely stop a background audio analysis job with isolated error handling."""
+    try:
+        from music_minion.domain.analysis.service import stop_analysis_job
+
+        if stop_analysis_job(timeout=10.0):
+            logger.debug("Audio analysis stopped successfully")
+    except Exception as e:
+        logger.debug(f"Audio analysis cleanup error (non-critical): {e}")
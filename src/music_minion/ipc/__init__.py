@@ -3,6 +3,6 @@
 Enables external commands to communicate with running Music Minion instance.
 """
 
-from .client import send_command
+from .client import IPCClient, IPCError, send_command
 
-__all__ = ["send_command"]
+__all__ = ["IPCClient", "IPCError", "send_command"]
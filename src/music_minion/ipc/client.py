@@ -1,10 +1,17 @@
-"""IPC client for sending commands to running Music Minion instance."""
+"""IPC client for sending commands to running Music Minion instance.
+
+send_command() covers one-shot hotkey use. Scripts that send bursts should
+keep an IPCClient open: it reuses one connection and can pipeline requests,
+matching responses to requests by id.
+"""
 
 import socket
 import json
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+DEFAULT_TIMEOUT_SECONDS = 15.0
 
 
 def get_socket_path() -> Path:
@@ -23,6 +30,122 @@ def get_socket_path() -> Path:
         return data_dir / "control.sock"
 
 
+class IPCError(Exception):
+    """The server closed the connection or sent an unreadable response."""
+
+
+class IPCClient:
+    """Persistent connection to the running Music Minion instance.
+
+    Usage:
+        with IPCClient() as client:
+            client.request("like")
+            results = client.pipeline([("add", ["Nov 25"]), ("skip", [])])
+
+    Raises (on construction):
+        FileNotFoundError / ConnectionRefusedError: Music Minion not running
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        try:
+            self.sock.connect(str(socket_path or get_socket_path()))
+        except OSError:
+            self.sock.close()
+            raise
+        self._next_id = 1
+        self._buffer = b""
+        self._responses: dict[int, dict] = {}  # Arrived before being asked for
+
+    def __enter__(self) -> "IPCClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.sock.close()
+
+    def _encode(self, command: str, args: Optional[list[str]]) -> tuple[int, bytes]:
+        request_id = self._next_id
+        self._next_id += 1
+        payload = {"id": request_id, "command": command, "args": args or []}
+        return request_id, (json.dumps(payload) + "\n").encode("utf-8")
+
+    def _read_response(self) -> dict:
+        while b"\n" not in self._buffer:
+            chunk = self.sock.recv(65536)
+            if not chunk:
+                raise IPCError("No response from Music Minion")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        try:
+            return json.loads(line.decode("utf-8"))
+        except ValueError as e:
+            raise IPCError(f"Invalid response from Music Minion: {e}") from e
+
+    def _wait_for(self, request_id: int) -> dict:
+        if request_id in self._responses:
+            return self._responses.pop(request_id)
+        while True:
+            response = self._read_response()
+            response_id = response.get("id")
+            # Responses without an id (malformed request) answer the caller
+            if response_id is None or response_id == request_id:
+                return response
+            self._responses[response_id] = response
+
+    def call(self, command: str, args: Optional[list[str]] = None) -> dict:
+        """
+        Send one command and wait for its full response dict.
+
+        Returns:
+            Response with "success", "message" and any extra fields (e.g. "metrics")
+        """
+        request_id, data = self._encode(command, args)
+        self.sock.sendall(data)
+        return self._wait_for(request_id)
+
+    def request(self, command: str, args: Optional[list[str]] = None) -> tuple[bool, str]:
+        """
+        Send one command and wait for its result.
+
+        Returns:
+            (success, message) tuple
+        """
+        response = self.call(command, args)
+        return response.get("success", False), response.get("message", "No message")
+
+    def pipeline(self, commands: list[tuple[str, list[str]]]) -> list[tuple[bool, str]]:
+        """
+        Send several commands in one write, then collect all results.
+
+        Args:
+            commands: (command, args) pairs, executed in order by the main loop
+
+        Returns:
+            (success, message) per command, in the order given
+        """
+        encoded = [self._encode(command, args) for command, args in commands]
+        self.sock.sendall(b"".join(data for _, data in encoded))
+        results = []
+        for request_id, _ in encoded:
+            response = self._wait_for(request_id)
+            results.append(
+                (response.get("success", False), response.get("message", "No message"))
+            )
+        return results
+
+    def status(self) -> dict:
+        """Fetch server metrics (request counts, in-flight, latency percentiles)."""
+        return self.call("status").get("metrics", {})
+
+
 def send_command(command: str, args: Optional[list[str]] = None) -> tuple[bool, str]:
     """
     Send a command to the running Music Minion instance.
@@ -42,41 +165,9 @@ def send_command(command: str, args: Optional[list[str]] = None) -> tuple[bool,
     if not socket_path.exists():
         return False, "Music Minion is not running"
 
-    # Prepare command payload
-    payload = {"command": command, "args": args or []}
-
     try:
-        # Connect to Unix socket
-        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        sock.settimeout(15.0)  # 15 second timeout
-        sock.connect(str(socket_path))
-
-        # Send command as JSON
-        message = json.dumps(payload) + "\n"
-        sock.sendall(message.encode("utf-8"))
-
-        # Receive response
-        response_data = b""
-        while True:
-            chunk = sock.recv(4096)
-            if not chunk:
-                break
-            response_data += chunk
-            # Check if we have a complete JSON response (ends with newline)
-            if b"\n" in response_data:
-                break
-
-        sock.close()
-
-        # Parse response
-        if not response_data:
-            return False, "No response from Music Minion"
-
-        response = json.loads(response_data.decode("utf-8").strip())
-        success = response.get("success", False)
-        message = response.get("message", "No message")
-
-        return success, message
+        with IPCClient(socket_path) as client:
+            return client.request(command, args)
 
     except socket.timeout:
         return False, "Music Minion not responding (timeout)"
@@ -84,7 +175,7 @@ def send_command(command: str, args: Optional[list[str]] = None) -> tuple[bool,
         return False, "Music Minion not running"
     except FileNotFoundError:
         return False, "Music Minion not running"
-    except json.JSONDecodeError as e:
-        return False, f"Invalid response from Music Minion: {e}"
+    except IPCError as e:
+        return False, str(e)
     except Exception as e:
         return False, f"Failed to send command: {e}"
@@ -1,4 +1,12 @@
-"""IPC server for receiving commands from external processes."""
+"""IPC server for receiving commands from external processes.
+
+Protocol: newline-delimited JSON over a Unix socket. Each request is
+{"command": str, "args": [...], "id": <optional>}; each response is
+{"success": bool, "message": str, "id": <echoed>}. Connections are
+persistent and requests may be pipelined - responses are correlated by the
+echoed id, not by order. The "status" command is answered by the server
+itself with request counts and latency percentiles.
+"""
 
 import socket
 import json
@@ -6,6 +14,10 @@ import os
 import threading
 import queue
 import asyncio
+import itertools
+import time
+from collections import deque
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Optional, Callable, Tuple, Any, Set
 
@@ -13,10 +25,22 @@ from loguru import logger
 
 from music_minion.context import AppContext
 from music_minion import actions, notifications
+from music_minion.core.output import notify_ui
 
 # WebSocket support (optional)
 WEBSOCKETS_AVAILABLE = False
 
+REQUEST_TIMEOUT_SECONDS = 15.0
+LATENCY_SAMPLES = 1000  # Rolling window for status percentiles
+MAX_LINE_BYTES = 1024 * 1024
+
+# Immediate notification messages for slow composite actions
+IMMEDIATE_MESSAGES = {
+    "like_and_add_dated": "👍 Liking and adding...",
+    "add_not_quite": "🤔 Adding to Not Quite...",
+    "add_not_interested_and_skip": "⏭️ Adding to Not Interested...",
+}
+
 # Builder WebSocket Messages:
 #
 # Add track:
@@ -56,8 +80,11 @@ def get_socket_path() -> Path:
 class IPCServer:
     """Unix socket server for IPC commands with WebSocket support for web control.
 
-    Runs in a background thread and processes commands from external clients.
-    Uses a queue to communicate with the main thread for thread-safe context updates.
+    Accepts clients in a background thread and serves each connection in its
+    own thread, so a slow or idle client never blocks a hotkey. Commands go to
+    the main thread through command_queue as (request_id, command, args); the
+    main thread answers on response_queue as (request_id, success, message),
+    and a dispatcher thread resolves the pending Future for that request_id.
     Also provides WebSocket server for web frontend control connections.
     """
 
@@ -75,6 +102,23 @@ class IPCServer:
         self.server_socket: Optional[socket.socket] = None
         self.running = False
         self.thread: Optional[threading.Thread] = None
+        self.dispatch_thread: Optional[threading.Thread] = None
+
+        # In-flight requests: request_id -> (future, submitted_at, command)
+        self._pending: dict[int, tuple[Future, float, str]] = {}
+        self._pending_lock = threading.Lock()
+        self._request_ids = itertools.count(1)
+        self._started_at = time.monotonic()
+        self._latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._counters = {
+            "connections_total": 0,
+            "connections_active": 0,
+            "requests_total": 0,
+            "completed": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "invalid": 0,
+        }
 
         # WebSocket support for web frontend connections
         self.websocket_server = None
@@ -100,8 +144,13 @@ class IPCServer:
                 pass
 
         self.running = True
+        self._started_at = time.monotonic()
         self.thread = threading.Thread(target=self._run_server, daemon=True)
         self.thread.start()
+        self.dispatch_thread = threading.Thread(
+            target=self._dispatch_responses, name="ipc-dispatch", daemon=True
+        )
+        self.dispatch_thread.start()
 
         # Start WebSocket server for web frontend connections
         self.websocket_thread = threading.Thread(
@@ -123,6 +172,8 @@ class IPCServer:
         # Wait for threads to finish
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2.0)
+        if self.dispatch_thread and self.dispatch_thread.is_alive():
+            self.dispatch_thread.join(timeout=2.0)
         if self.websocket_thread and self.websocket_thread.is_alive():
             self.websocket_thread.join(timeout=2.0)
 
@@ -135,19 +186,25 @@ class IPCServer:
 
     def _run_server(self) -> None:
         """Run the Unix socket server loop."""
+        threading.current_thread().silent_logging = True  # type: ignore
+
         try:
             # Create Unix socket
             self.server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             self.server_socket.bind(str(self.socket_path))
-            self.server_socket.listen(5)
+            self.server_socket.listen(64)
             self.server_socket.settimeout(1.0)  # Poll every second
 
             while self.running:
                 try:
                     # Accept connections with timeout
                     client_socket, _ = self.server_socket.accept()
-                    # Handle in same thread (simple, sequential processing)
-                    self._handle_client(client_socket)
+                    threading.Thread(
+                        target=self._handle_client,
+                        args=(client_socket,),
+                        name="ipc-client",
+                        daemon=True,
+                    ).start()
                 except socket.timeout:
                     # Timeout is normal, just check if we should continue
                     continue
@@ -218,6 +275,7 @@ class IPCServer:
                         if data.get("type") == "command":
                             # Web client sent a command - add to web command queue
                             self.web_command_sync_queue.put(data)
+                            notify_ui()
                         elif data.get("type") == "ping":
                             # Respond to ping
                             await websocket.send(json.dumps({"type": "pong"}))
@@ -323,88 +381,221 @@ class IPCServer:
             pass
         return commands
 
+    def _dispatch_responses(self) -> None:
+        """Resolve pending request futures from main-thread responses."""
+        threading.current_thread().silent_logging = True  # type: ignore
+
+        next_expiry_check = time.monotonic() + 1.0
+        while self.running:
+            try:
+                request_id, success, message = self.response_queue.get(timeout=1.0)
+                self._complete(request_id, {"success": success, "message": message})
+            except queue.Empty:
+                pass
+            except Exception as e:
+                logger.warning(f"Malformed IPC response: {e}")
+
+            if time.monotonic() >= next_expiry_check:
+                self._expire_requests()
+                next_expiry_check = time.monotonic() + 1.0
+
+    def _submit(self, command: str, args: list) -> Future:
+        """Queue a command for the main thread and return its response Future."""
+        request_id = next(self._request_ids)
+        future: Future = Future()
+        with self._pending_lock:
+            self._pending[request_id] = (future, time.monotonic(), command)
+            self._counters["requests_total"] += 1
+        self.command_queue.put((request_id, command, args))
+        notify_ui()
+        return future
+
+    def _complete(self, request_id: int, response: dict) -> None:
+        """Resolve a pending request. Late responses for expired requests are dropped."""
+        with self._pending_lock:
+            entry = self._pending.pop(request_id, None)
+            if entry is None:
+                return
+            future, submitted_at, _ = entry
+            self._latencies.append(time.monotonic() - submitted_at)
+            self._counters["completed" if response["success"] else "failed"] += 1
+        future.set_result(response)
+
+    def _expire_requests(self) -> None:
+        """Answer requests the main thread has not handled within the timeout."""
+        deadline = time.monotonic() - REQUEST_TIMEOUT_SECONDS
+        with self._pending_lock:
+            expired = [
+                (request_id, entry)
+                for request_id, entry in self._pending.items()
+                if entry[1] < deadline
+            ]
+            for request_id, _ in expired:
+                del self._pending[request_id]
+            self._counters["timed_out"] += len(expired)
+
+        for _, (future, _, command) in expired:
+            logger.warning(f"IPC command timed out: {command}")
+            future.set_result({"success": False, "message": "Command timed out"})
+
+    def get_metrics(self) -> dict:
+        """
+        Snapshot of server counters and request latency.
+
+        Returns:
+            Dict with uptime, connection and request counters, in-flight count
+            and latency percentiles (ms) over the last LATENCY_SAMPLES requests
+        """
+        with self._pending_lock:
+            counters = dict(self._counters)
+            in_flight = len(self._pending)
+            samples = sorted(self._latencies)
+
+        latency_ms = {
+            f"p{pct}": round(_percentile(samples, pct) * 1000, 2) for pct in (50, 95, 99)
+        }
+        latency_ms["max"] = round(samples[-1] * 1000, 2) if samples else 0.0
+        return {
+            "uptime_seconds": round(time.monotonic() - self._started_at, 1),
+            "in_flight": in_flight,
+            "samples": len(samples),
+            "latency_ms": latency_ms,
+            **counters,
+        }
+
+    def _status_response(self) -> dict:
+        metrics = self.get_metrics()
+        latency = metrics["latency_ms"]
+        message = (
+            f"IPC: {metrics['requests_total']} requests, {metrics['in_flight']} in flight, "
+            f"{metrics['connections_active']} clients connected, "
+            f"{metrics['timed_out']} timed out | "
+            f"latency p50 {latency['p50']}ms p95 {latency['p95']}ms "
+            f"p99 {latency['p99']}ms (last {metrics['samples']})"
+        )
+        return {"success": True, "message": message, "metrics": metrics}
+
+    def _handle_request(self, line: bytes) -> tuple[Any, Future]:
+        """
+        Parse one request line and start handling it.
+
+        Returns:
+            (client_id, future) - the future resolves to the response dict
+        """
+        try:
+            payload = json.loads(line.decode("utf-8"))
+            if not isinstance(payload, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:  # JSONDecodeError and UnicodeDecodeError included
+            with self._pending_lock:
+                self._counters["invalid"] += 1
+            future: Future = Future()
+            future.set_result({"success": False, "message": f"Invalid JSON: {e}"})
+            return None, future
+
+        client_id = payload.get("id")
+        command = payload.get("command", "")
+        args = payload.get("args", [])
+
+        if command == "status":
+            future = Future()
+            future.set_result(self._status_response())
+            return client_id, future
+
+        # Send immediate notification for composite actions
+        if command == "composite" and args and args[0] in IMMEDIATE_MESSAGES:
+            notifications.notify(
+                "Music Minion", IMMEDIATE_MESSAGES[args[0]], urgency="low"
+            )
+
+        return client_id, self._submit(command, args)
+
     def _handle_client(self, client_socket: socket.socket) -> None:
         """
-        Handle a client connection.
+        Serve one client connection until it closes.
+
+        Reads newline-delimited requests without waiting for earlier responses,
+        so clients can pipeline. Each response is written as soon as its
+        future resolves, tagged with the request's id. On EOF, outstanding
+        responses are still delivered before the socket is closed (clients may
+        shut down their write side after sending a batch).
 
         Args:
             client_socket: Connected client socket
         """
+        threading.current_thread().silent_logging = True  # type: ignore
+
+        # Guards the socket's write side and the set of unanswered requests
+        send_lock = threading.Condition()
+        outstanding: Set[Future] = set()
+        with self._pending_lock:
+            self._counters["connections_total"] += 1
+            self._counters["connections_active"] += 1
+
+        def send_response(client_id: Any, future: Future) -> None:
+            response = future.result()
+            if client_id is not None:
+                response = {**response, "id": client_id}
+            data = (json.dumps(response) + "\n").encode("utf-8")
+            with send_lock:
+                try:
+                    client_socket.sendall(data)
+                except OSError:
+                    pass  # Client went away; nothing to deliver to
+                outstanding.discard(future)
+                send_lock.notify_all()
+
         try:
-            # Receive data
-            data = b""
-            while True:
-                chunk = client_socket.recv(4096)
+            client_socket.settimeout(1.0)  # Poll so stop() is honoured
+            buffer = b""
+            while self.running:
+                try:
+                    chunk = client_socket.recv(65536)
+                except socket.timeout:
+                    continue
                 if not chunk:
                     break
-                data += chunk
-                # Check for newline (end of JSON message)
-                if b"\n" in data:
-                    break
-
-            if not data:
-                client_socket.close()
-                return
-
-            # Parse JSON command
-            payload = json.loads(data.decode("utf-8").strip())
-            command = payload.get("command", "")
-            args = payload.get("args", [])
-
-            # Send immediate notification for composite actions
-            if command == "composite" and args:
-                action_name = args[0]
-                # Map action names to immediate notification messages
-                immediate_messages = {
-                    "like_and_add_dated": "👍 Liking and adding...",
-                    "add_not_quite": "🤔 Adding to Not Quite...",
-                    "add_not_interested_and_skip": "⏭️ Adding to Not Interested...",
-                }
-                if action_name in immediate_messages:
-                    notifications.notify(
-                        "Music Minion", immediate_messages[action_name], urgency="low"
+                buffer += chunk
+
+                while b"\n" in buffer:
+                    line, buffer = buffer.split(b"\n", 1)
+                    if not line.strip():
+                        continue
+                    client_id, future = self._handle_request(line)
+                    with send_lock:
+                        outstanding.add(future)
+                    future.add_done_callback(
+                        lambda f, client_id=client_id: send_response(client_id, f)
                     )
 
-            # Put command in queue for main thread
-            request_id = id(payload)  # Unique ID for this request
-            self.command_queue.put((request_id, command, args))
+                if len(buffer) > MAX_LINE_BYTES:
+                    logger.warning("IPC request exceeds size limit, closing connection")
+                    break
 
-            # Wait for response from main thread (with timeout)
-            try:
-                response_id, success, message = self.response_queue.get(timeout=15.0)
-                if response_id == request_id:
-                    # Send response
-                    response = {"success": success, "message": message}
-                    response_json = json.dumps(response) + "\n"
-                    client_socket.sendall(response_json.encode("utf-8"))
-                else:
-                    # Mismatched response (shouldn't happen with sequential processing)
-                    error_response = {
-                        "success": False,
-                        "message": "Internal error: response mismatch",
-                    }
-                    client_socket.sendall(json.dumps(error_response).encode("utf-8"))
-            except queue.Empty:
-                # Timeout waiting for response
-                error_response = {"success": False, "message": "Command timed out"}
-                client_socket.sendall(json.dumps(error_response).encode("utf-8"))
-
-        except json.JSONDecodeError as e:
-            error_response = {"success": False, "message": f"Invalid JSON: {e}"}
-            client_socket.sendall(json.dumps(error_response).encode("utf-8"))
-        except Exception as e:
-            error_response = {
-                "success": False,
-                "message": f"Error processing command: {e}",
-            }
-            try:
-                client_socket.sendall(json.dumps(error_response).encode("utf-8"))
-            except Exception:
-                pass
+            # Deliver responses still owed to a half-closed client
+            with send_lock:
+                send_lock.wait_for(
+                    lambda: not outstanding, timeout=REQUEST_TIMEOUT_SECONDS + 2.0
+                )
+
+        except OSError:
+            pass  # Connection reset by client
+        except Exception:
+            logger.exception("IPC client handler error")
         finally:
+            with self._pending_lock:
+                self._counters["connections_active"] -= 1
             client_socket.close()
 
 
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))  # ceil
+    return sorted_values[int(rank) - 1]
+
+
 def process_ipc_command(
     ctx: AppContext,
     command: str,
@@ -432,6 +623,10 @@ def process_ipc_command(
     silent_commands = {"set-web-mode"}
     is_silent = command in silent_commands
 
+    # Round trip through the main loop only (used by the IPC load test)
+    if command == "ping":
+        return ctx, True, "pong"
+
     try:
         # Check if it's a web control command
         # web-winner and web-archive are context-aware - route through router
@@ -0,0 +1,48 @@
+"""
+Lazy package re-exports (PEP 562).
+
+Package ``__init__`` modules declare which submodule defines each public name
+instead of importing every submodule up front. The submodule is imported on
+first attribute access, so ``from music_minion.domain import playlists`` no
+longer pulls in requests, prompt_toolkit or scikit-learn until a function that
+needs them is actually used.
+"""
+
+import importlib
+import importlib.util
+import sys
+from typing import Any, Callable, Iterable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__``/``__dir__`` for a package with lazy re-exports.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Mapping of relative submodule (".crud") -> names it provides
+
+    Returns:
+        (__getattr__, __dir__) to assign at package module level. Resolved
+        names are cached in the package namespace, so each is looked up once.
+        Plain submodule access (``package.submodule``) also imports lazily.
+    """
+    name_to_module = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        namespace = sys.modules[package].__dict__
+        module_name = name_to_module.get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name, package), name)
+        elif not name.startswith("__") and importlib.util.find_spec(f"{package}.{name}"):
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(sys.modules[package].__dict__) | set(name_to_module))
+
+    return __getattr__, __dir__
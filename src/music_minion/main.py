@@ -11,7 +11,6 @@ from pathlib import Path
 from typing import Any, List
 
 from loguru import logger
-from rich.console import Console
 
 from music_minion.core import config
 from music_minion.core import database
@@ -21,12 +20,11 @@ from music_minion.domain import library
 from music_minion.domain import playback
 from music_minion import ui
 from music_minion.domain import sync
-from music_minion import command_palette
-from music_minion import router
-from music_minion import web_launcher
 from music_minion.helpers import (
     cleanup_web_processes_safe,
     cleanup_file_watcher_safe,
+    cleanup_library_watcher_safe,
+    cleanup_audio_analysis_safe,
 )
 from music_minion import helpers
 from music_minion.utils import parsers
@@ -40,12 +38,20 @@ current_config: config.Config = config.Config()
 file_watcher_observer = None
 file_watcher_handler = None
 
-# Global console for Rich output
-console = Console()
+# Global console for Rich output (created on first use; rich is slow to import)
+console = None
 
 
 def safe_print(message: str, style: str = None) -> None:
     """Print using Rich Console if available, otherwise fallback to regular print."""
+    global console
+    if console is None:
+        try:
+            from rich.console import Console
+
+            console = Console()
+        except ImportError:
+            console = False
     if console:
         if style:
             console.print(message, style=style)
@@ -75,6 +81,8 @@ def interactive_mode_with_dashboard() -> None:
     import os
     from rich.console import Console
 
+    from music_minion import command_palette, router
+
     global current_config
 
     # Run database migrations on startup
@@ -526,6 +534,8 @@ def setup_web_mode(current_config: config.Config) -> tuple[Any, Any] | None:
     if not web_mode:
         return None
 
+    from music_minion import web_launcher
+
     # Pre-flight checks with config
     success, error = web_launcher.check_web_prerequisites(current_config.web)
     if not success:
@@ -622,6 +632,10 @@ def run_simple_mode(
     file_watcher_observer: Any | None,
 ) -> None:
     """Run simple mode with Rich console interactive loop."""
+    from rich.console import Console
+
+    from music_minion import router
+
     console_instance = Console()
 
     # Create initial application context
@@ -712,6 +726,11 @@ def interactive_mode() -> None:
         # Run database migrations on startup
         database.init_database()
 
+        # Watch the library before the web backend starts, so this process owns it
+        from music_minion.domain.library.watcher import start_library_watcher
+
+        start_library_watcher(current_config)
+
         # Setup web mode
         web_processes = setup_web_mode(current_config)
 
@@ -724,6 +743,8 @@ def interactive_mode() -> None:
         def emergency_cleanup() -> None:
             cleanup_web_processes_safe(web_processes)
             cleanup_file_watcher_safe(file_watcher_observer)
+            cleanup_library_watcher_safe()
+            cleanup_audio_analysis_safe()
 
         atexit.register(emergency_cleanup)
 
@@ -755,3 +776,9 @@ def interactive_mode() -> None:
 
         # Clean up file watcher if enabled (isolated error handling)
         cleanup_file_watcher_safe(file_watcher_observer)
+
+        # Stop the library watcher (isolated error handling)
+        cleanup_library_watcher_safe()
+
+        # Stop a background audio analysis job (isolated error handling)
+        cleanup_audio_analysis_safe()
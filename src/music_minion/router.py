@@ -222,6 +222,7 @@ Playlist Commands:
   playlist rename "old" "new"     Rename playlist (use quotes)
   playlist show <name>            Show playlist tracks
   playlist analyze <name>         Show comprehensive analytics for playlist
+  playlist sort <name> [--arc=X]  Reorder for DJ mixing (keys, BPM; arc: none/rise/fall/peak)
   playlist active <name>          Set active playlist
   playlist active none            Clear active playlist
   playlist none                   Clear active playlist (shorthand)
@@ -234,6 +235,7 @@ Playlist Commands:
 AI Commands:
   ai setup <key>    Set up OpenAI API key for AI analysis
   ai analyze        Analyze current track with AI and add tags
+  ai batch [limit]  Tag all tracks with notes but no AI tags (concurrent, cached)
   ai review         Review and improve tags for current track (conversational)
   ai enhance prompt Improve tagging prompt based on accumulated learnings
   ai test           Test AI prompt with a random track and save report
@@ -428,6 +430,9 @@ def handle_command(
     elif command == "scan":
         return admin.handle_scan_command(ctx)
 
+    elif command == "analyze":
+        return admin.handle_analyze_command(ctx, args)
+
     elif command == "migrate":
         return admin.handle_migrate_command(ctx)
 
@@ -449,6 +454,8 @@ def handle_command(
             return playlist.handle_playlist_show_command(ctx, args[1:])
         elif args[0] == "analyze":
             return playlist.handle_playlist_analyze_command(ctx, args[1:])
+        elif args[0] == "sort":
+            return playlist.handle_playlist_sort_command(ctx, args[1:])
         elif args[0] == "active":
             return playlist.handle_playlist_active_command(ctx, args[1:])
         elif args[0] == "restart":
@@ -462,7 +469,7 @@ def handle_command(
         else:
             logger.warning(f"Unknown playlist subcommand: '{args[0]}'")
             log(
-                f"Unknown playlist subcommand: '{args[0]}'. Available: new, delete, rename, show, analyze, active, restart, import, export, convert",
+                f"Unknown playlist subcommand: '{args[0]}'. Available: new, delete, rename, show, analyze, sort, active, restart, import, export, convert",
                 level="error",
             )
             return ctx, True
@@ -479,7 +486,7 @@ def handle_command(
     elif command == "ai":
         if not args:
             log(
-                "Error: AI command requires a subcommand. Usage: ai <setup|analyze|review|enhance|test|usage>",
+                "Error: AI command requires a subcommand. Usage: ai <setup|analyze|batch|review|enhance|test|usage>",
                 level="error",
             )
             return ctx, True
@@ -487,6 +494,8 @@ def handle_command(
             return ai.handle_ai_setup_command(ctx, args[1:])
         elif args[0] == "analyze":
             return ai.handle_ai_analyze_command(ctx)
+        elif args[0] == "batch":
+            return ai.handle_ai_batch_command(ctx, args[1:])
         elif args[0] == "review":
             return ai.handle_ai_review_command(ctx)
         elif args[0] == "enhance":
@@ -498,7 +507,7 @@ def handle_command(
         else:
             logger.warning(f"Unknown AI subcommand: '{args[0]}'")
             log(
-                f"Unknown AI subcommand: '{args[0]}'. Available: setup, analyze, review, enhance, test, usage",
+                f"Unknown AI subcommand: '{args[0]}'. Available: setup, analyze, batch, review, enhance, test, usage",
                 level="error",
             )
             return ctx, True
@@ -1,11 +1,15 @@
 """Main event loop and entry point for blessed UI."""
 
 import dataclasses
+import os
 import queue
+import selectors
+import signal
 import sys
 import threading
 import time
 from pathlib import Path
+from typing import Any, Optional
 
 from blessed import Terminal
 from loguru import logger
@@ -18,6 +22,10 @@ from music_minion.core.output import (
     drain_pending_history_messages,
     set_blessed_mode,
 )
+from music_minion.domain.playback.listen_tracker import (
+    flush_listen_sessions,
+    get_listen_accounting_stats,
+)
 from music_minion.ipc import server as ipc_server
 from music_minion.ipc.server import process_ipc_command
 
@@ -38,15 +46,33 @@ from .components.track_viewer import render_track_viewer
 from .events.commands import execute_command
 from .events.keyboard import handle_key
 from .helpers import write_at
+from .helpers.screen import ScreenBuffer
+from .helpers.wakeup import WakeupPipe
 from .state import PlaylistInfo, UIState, add_history_line, update_track_info
 
-# Frame interval constants for background updates
-PLAYER_POLL_INTERVAL = 10  # Poll MPV every 10 frames (~1 second)
-SCAN_POLL_INTERVAL = 5  # Poll scan progress every 5 frames (~0.5 seconds)
-SYNC_POLL_INTERVAL = 5  # Poll sync progress every 5 frames (~0.5 seconds)
-CONVERSION_POLL_INTERVAL = 5  # Poll conversion progress every 5 frames (~0.5 seconds)
+# Event loop timing (seconds). The loop sleeps in select() until input, a
+# background notification, an MPV event, or the earliest of these deadlines.
+PLAYER_POLL_SECONDS = 1.0  # Poll player while playing (auto-advance, session tick)
+PLAYER_IDLE_POLL_SECONDS = 5.0  # Safety-net poll while paused/stopped
+BACKGROUND_MIN_INTERVAL = 0.1  # Coalesce bursts of background notifications
+BRACKET_FLUSH_SECONDS = 0.1  # Wait for 'O'/'I' after '[' (terminal focus events)
+HOT_RELOAD_CHECK_SECONDS = 0.5  # Only when the dev file watcher is running
 POSITION_UPDATE_THRESHOLD = 0.1  # Update display every ~3 Unicode blocks (100ms)
 
+# Dirty regions: FULL re-lays out and redraws everything; the others redraw
+# one region in place.
+DIRTY_FULL = "full"
+DIRTY_HISTORY = "history"
+DIRTY_INPUT = "input"  # Input bar plus the active overlay
+DIRTY_POSITION = "position"  # Time-sensitive dashboard elements
+
+
+def _hot_reload_enabled() -> bool:
+    """Whether the dev file watcher is running (needs periodic checks)."""
+    from ... import main
+
+    return main.file_watcher_handler is not None
+
 
 def _check_and_reload_files() -> None:
     """Check for pending file changes and reload if needed."""
@@ -694,6 +720,181 @@ def poll_player_state(ctx: AppContext, ui_state: UIState) -> tuple[AppContext, U
     return ctx, ui_state
 
 
+def _active_overlay(ui_state: UIState) -> Optional[str]:
+    """Name of the overlay that owns the bottom of the screen (None if none).
+
+    A change here changes the layout, so it forces a full redraw.
+    """
+    if ui_state.comparison.active:
+        return "comparison"
+    if ui_state.wizard_active:
+        return "wizard"
+    if ui_state.builder.active:
+        return "builder"
+    if ui_state.palette_visible:
+        return "palette"
+    if ui_state.track_viewer_visible:
+        return f"track_viewer:{ui_state.track_viewer_mode}"
+    if ui_state.rating_history_visible:
+        return "rating_history"
+    if ui_state.comparison_history_visible:
+        return "comparison_history"
+    if ui_state.analytics_viewer_visible:
+        return "analytics_viewer"
+    if ui_state.editor_visible:
+        return "editor"
+    if ui_state.export_selector_active:
+        return "export_selector"
+    return None
+
+
+def _dashboard_signature(ctx: AppContext, ui_state: UIState) -> int:
+    """Hash of the state the dashboard shows, excluding playback position.
+
+    Position is tracked separately for partial dashboard updates.
+    """
+    return hash(
+        (
+            ctx.player_state.current_track,
+            ctx.player_state.is_playing,
+            ctx.player_state.duration,
+            ui_state.feedback_message,
+            ui_state.scan_progress.is_scanning,
+            ui_state.scan_progress.files_scanned,
+            ui_state.scan_progress.phase,
+        )
+    )
+
+
+def _history_signature(ui_state: UIState) -> tuple[int, int]:
+    return (len(ui_state.history), ui_state.history_scroll)
+
+
+def _render_overlay(
+    term: Terminal, ctx: AppContext, ui_state: UIState, layout: dict[str, int]
+) -> None:
+    """Render the active overlay (palette, wizard, builder, viewers, comparison)."""
+    overlay = _active_overlay(ui_state)
+    if overlay == "comparison":
+        from music_minion.ui.blessed.components.comparison import (
+            render_comparison_overlay,
+        )
+
+        render_comparison_overlay(term, ui_state.comparison, ctx.player_state, layout)
+    elif overlay == "wizard":
+        render_smart_playlist_wizard(
+            term, ui_state, layout["palette_y"], layout["palette_height"]
+        )
+    elif overlay == "builder":
+        from music_minion.ui.blessed.components.playlist_builder import (
+            render_playlist_builder,
+        )
+
+        render_playlist_builder(
+            term, ui_state, layout["palette_y"], layout["palette_height"]
+        )
+    elif overlay == "palette":
+        render_palette(term, ui_state, layout["palette_y"], layout["palette_height"])
+    elif overlay and overlay.startswith("track_viewer"):
+        render_track_viewer(
+            term, ui_state, layout["track_viewer_y"], layout["track_viewer_height"]
+        )
+    elif overlay == "rating_history":
+        render_rating_history_viewer(
+            term, ui_state, layout["palette_y"], layout["palette_height"]
+        )
+    elif overlay == "comparison_history":
+        render_comparison_history_viewer(
+            term, ui_state, layout["palette_y"], layout["palette_height"]
+        )
+    elif overlay == "analytics_viewer":
+        render_analytics_viewer(
+            term,
+            ui_state,
+            layout["analytics_viewer_y"],
+            layout["analytics_viewer_height"],
+        )
+    elif overlay == "editor":
+        render_metadata_editor(
+            term, ui_state, layout["palette_y"], layout["palette_height"]
+        )
+    elif overlay == "export_selector":
+        render_export_selector(
+            term,
+            ui_state,
+            layout["export_selector_y"],
+            layout["export_selector_height"],
+        )
+
+
+def _apply_ui_update(ui_state: UIState, updates: dict[str, Any]) -> UIState:
+    """Apply a queued background UIState update.
+
+    Comparison updates from stale sessions, or that would replace loaded data
+    with a loading placeholder, are ignored.
+    """
+    if "comparison" in updates:
+        new_comparison = updates["comparison"]
+        current_comparison = ui_state.comparison
+        # Sessions are optional on comparison states
+        current_session = getattr(current_comparison, "session_id", None)
+        new_session = getattr(new_comparison, "session_id", None)
+
+        # Rule 1: Block updates from different sessions (only if current is active)
+        if (
+            current_comparison.active
+            and new_session
+            and current_session
+            and new_session != current_session
+        ):
+            logger.warning(
+                f"❌ Ignoring stale comparison update (different session): "
+                f"current_session={current_session}, update_session={new_session}"
+            )
+            return ui_state
+
+        # Rule 2: Never overwrite loaded state with loading state (same session)
+        if (
+            not current_comparison.loading
+            and new_comparison.loading
+            and current_session
+            and current_session == new_session
+        ):
+            logger.warning(
+                f"❌ Ignoring loading state update (already loaded): "
+                f"session_id={current_session}"
+            )
+            return ui_state
+
+    updates = dict(updates)
+    # Handle history_messages specially (add to history)
+    for text, color in updates.pop("history_messages", []):
+        ui_state = add_history_line(ui_state, text, color)
+
+    return dataclasses.replace(ui_state, **updates) if updates else ui_state
+
+
+def _sync_mpv_events(
+    selector: selectors.BaseSelector,
+    mpv_events: Optional[Any],
+    socket_path: Optional[str],
+) -> Optional[Any]:
+    """Keep the MPV event connection registered for the current MPV socket."""
+    from ...domain.playback import player
+
+    if mpv_events is not None:
+        if mpv_events[1] == socket_path:
+            return mpv_events
+        selector.unregister(mpv_events[0])
+        mpv_events[0].close()
+
+    sock = player.open_mpv_event_socket(socket_path)
+    if sock is None:
+        return None
+    selector.register(sock, selectors.EVENT_READ, "mpv")
+    return (sock, socket_path)
+
+
 def run_interactive_ui(ctx: AppContext) -> AppContext:
     """
     Run the main interactive UI event loop.
@@ -719,6 +920,11 @@ def main_loop(term: Terminal, ctx: AppContext) -> AppContext:
     """
     Main event loop - functional style.
 
+    Sleeps in select() on terminal input, a wakeup pipe (background threads,
+    log() messages, IPC commands) and the MPV event socket, waking otherwise
+    only for the next player poll or position tick. Each wake redraws only
+    the regions whose state changed.
+
     Args:
         term: blessed Terminal instance
         ctx: Application context
@@ -726,6 +932,8 @@ def main_loop(term: Terminal, ctx: AppContext) -> AppContext:
     Returns:
         Updated AppContext after loop exits
     """
+    from ...domain.playback import player
+
     # Create initial UI state (UI-only, not application state)
     # Load active library from database
     with database.get_db_connection() as conn:
@@ -735,71 +943,15 @@ def main_loop(term: Terminal, ctx: AppContext) -> AppContext:
 
     ui_state = UIState(active_library=active_library)
 
-    # Thread-safe UIState updater for background tasks
-    # Use RLock (reentrant lock) to allow same thread to acquire multiple times
-    # This prevents deadlock when executor calls log() which calls update_ui_state_safe
-    ui_state_lock = threading.RLock()
+    # Background threads never touch ui_state directly: updates are queued
+    # and applied by this loop, so rendering needs no lock.
+    wakeup = WakeupPipe()
+    pending_updates: queue.SimpleQueue = queue.SimpleQueue()
 
     def update_ui_state_safe(updates: dict):
         """Thread-safe UIState update from background threads."""
-        nonlocal ui_state
-        with ui_state_lock:
-            # Session ID validation for comparison updates
-            # Prevents race condition where old background thread overwrites new session
-            if "comparison" in updates:
-                new_comparison = updates["comparison"]
-                current_comparison = ui_state.comparison
-
-                logger.info(
-                    f"🔍 update_ui_state_safe: comparing sessions - "
-                    f"current(active={current_comparison.active}, session_id={current_comparison.session_id!r}, loading={current_comparison.loading}) vs "
-                    f"new(active={new_comparison.active}, session_id={new_comparison.session_id!r}, loading={new_comparison.loading}, tracks={len(new_comparison.filtered_tracks)})"
-                )
-
-                # Rule 1: Block updates from different sessions (only if current is active)
-                if (
-                    hasattr(current_comparison, "active")
-                    and current_comparison.active
-                    and hasattr(new_comparison, "session_id")
-                    and new_comparison.session_id
-                    and hasattr(current_comparison, "session_id")
-                    and current_comparison.session_id
-                    and new_comparison.session_id != current_comparison.session_id
-                ):
-                    logger.warning(
-                        f"❌ Ignoring stale comparison update (different session): "
-                        f"current_session={current_comparison.session_id}, "
-                        f"update_session={new_comparison.session_id}"
-                    )
-                    return  # Ignore this update
-
-                # Rule 2: Never overwrite loaded state with loading state (same session)
-                # This prevents executor from overwriting background thread's loaded data
-                if (
-                    hasattr(current_comparison, "loading")
-                    and not current_comparison.loading
-                    and hasattr(new_comparison, "loading")
-                    and new_comparison.loading
-                    and hasattr(current_comparison, "session_id")
-                    and current_comparison.session_id
-                    and hasattr(new_comparison, "session_id")
-                    and new_comparison.session_id
-                    and current_comparison.session_id == new_comparison.session_id
-                ):
-                    logger.warning(
-                        f"❌ Ignoring loading state update (already loaded): "
-                        f"session_id={current_comparison.session_id}"
-                    )
-                    return  # Ignore this update
-
-            # Handle history_messages specially (add to history)
-            if "history_messages" in updates:
-                messages = updates.pop("history_messages")
-                for text, color in messages:
-                    ui_state = add_history_line(ui_state, text, color)
-
-            # Replace state with updated fields
-            ui_state = dataclasses.replace(ui_state, **updates)
+        pending_updates.put(updates)
+        wakeup.notify()
 
     # Inject updater into context for background tasks
     ctx = dataclasses.replace(
@@ -807,7 +959,7 @@ def main_loop(term: Terminal, ctx: AppContext) -> AppContext:
     )
 
     # Enable blessed mode globally in log() function
-    set_blessed_mode(update_ui_state_safe)
+    set_blessed_mode(update_ui_state_safe, wakeup=wakeup.notify)
 
     # Initialize IPC server for external commands (hotkeys)
     command_queue = queue.Queue()
@@ -824,48 +976,46 @@ def main_loop(term: Terminal, ctx: AppContext) -> AppContext:
                 ui_state, f"⚠ IPC server failed to start: {e}", "yellow"
             )
 
+    selector = selectors.DefaultSelector()
+    selector.register(wakeup.fileno(), selectors.EVENT_READ, "wakeup")
+    keyboard_fd = getattr(term, "_keyboard_fd", None)
+    if keyboard_fd is not None:
+        selector.register(keyboard_fd, selectors.EVENT_READ, "keyboard")
+    mpv_events = None  # (socket, socket_path) while connected
+
+    # Terminal resizes re-lay out the whole screen
+    resized = threading.Event()
+    previous_winch_handler = None
+    if hasattr(signal, "SIGWINCH"):
+
+        def _on_resize(signum, frame):
+            resized.set()
+            wakeup.notify()
+
+        try:
+            previous_winch_handler = signal.signal(signal.SIGWINCH, _on_resize)
+        except ValueError:
+            pass  # Not on the main thread
+
+    hot_reload = _hot_reload_enabled()
+
+    # Set MUSIC_MINION_UI_RECORD=<file> to record frames for
+    # scripts/benchmark_ui_render.py
+    screen = ScreenBuffer(term, record_path=os.environ.get("MUSIC_MINION_UI_RECORD"))
+
     should_quit = False
-    frame_count = 0
-    last_state_hash = None
-    needs_full_redraw = True
-    last_input_text = ""
+    dirty = {DIRTY_FULL}
+    layout = None
+    last_dashboard_signature = None
+    last_history_signature = None
+    last_overlay = None
     # Focus event filter: tracks pending '[' that might be part of focus sequence
     pending_bracket_key = None
-    last_palette_state = (
-        False,  # palette_visible
-        0,  # palette_selected
-        False,  # confirmation_active
-        False,  # wizard_active
-        0,  # wizard_selected
-        False,  # builder.active
-        0,  # builder.selected_index
-        0,  # builder.scroll_offset
-        "view",  # builder.filter_editor_mode
-        0,  # builder.filter_editor_selected
-        False,  # builder.filter_editor_editing
-        0,  # builder.filter_editor_step
-        False,  # track_viewer_visible
-        0,  # track_viewer_selected
-        "main",  # track_viewer_mode
-        False,  # analytics_viewer_visible
-        0,  # analytics_viewer_scroll
-        False,  # editor_visible
-        0,  # editor_selected
-        "main",  # editor_mode
-        "",  # editor_input
-        0,  # search_selected
-        0,  # search_scroll
-        "search",  # search_mode
-        0,  # search_detail_scroll
-        0,  # search_detail_selection
-        False,  # comparison.active
-        "a",  # comparison.highlighted
-        None,  # comparison.track_a id
-        None,  # comparison.track_b id
-        False,  # export_selector_active
-        0,  # export_selector_selected
-    )
-    layout = None
+    pending_bracket_deadline = 0.0
+    background_due = True
+    next_background_poll = 0.0
+    next_player_poll = 0.0
+    next_hot_reload = 0.0
     last_position = (
         0.0  # Track position separately for partial updates (float for smooth updates)
     )
@@ -876,597 +1026,330 @@ def main_loop(term: Terminal, ctx: AppContext) -> AppContext:
     last_track_file = None  # Track previous track to detect changes
     startup_sync_started = False  # Track if we've started background sync
 
+    def run_command(command_line: str) -> None:
+        """Execute a command line from the keyboard and mark the screen dirty."""
+        nonlocal ctx, ui_state, should_quit, last_position, last_poll_time
+        ctx, ui_state, should_quit = execute_command(ctx, ui_state, command_line)
+        dirty.add(DIRTY_FULL)
+        # Reset interpolation baseline to new position (critical for seek commands)
+        last_position = ctx.player_state.current_position
+        last_poll_time = time.time()
+
+    def feed_key(key) -> None:
+        """Route one key through the keyboard handler."""
+        nonlocal ui_state
+        if key == "\x0c":  # Ctrl+L also repaints the terminal from scratch
+            screen.invalidate()
+            dirty.add(DIRTY_FULL)
+        palette_height = layout["palette_height"] if layout else 10
+        analytics_viewer_height = layout["analytics_viewer_height"] if layout else 30
+        ui_state, command_line = handle_key(
+            ui_state, key, palette_height, analytics_viewer_height
+        )
+        dirty.add(DIRTY_INPUT)
+        if command_line:
+            run_command(command_line)
+
     try:
         while not should_quit:
-            # Check for file changes if hot-reload is enabled
-            _check_and_reload_files()
-
-            # Drain any pending log() messages (from auto-advance, background events, etc.)
-            # This ensures messages appear even when not going through execute_command
-            for msg, color in drain_pending_history_messages():
-                ui_state = add_history_line(ui_state, msg, color)
-                needs_full_redraw = True
-
-            # Detect track changes (immediate poll for instant metadata)
-            current_track_file = ctx.player_state.current_track
-            track_changed = current_track_file != last_track_file
-            if track_changed:
-                last_track_file = current_track_file
+            # ---- Sleep until something happens or a deadline passes ----
+            now = time.monotonic()
+            is_playing = bool(ctx.player_state.current_track and ctx.player_state.is_playing)
+            deadlines = [next_player_poll]
+            if is_playing and layout:
+                deadlines.append(now + POSITION_UPDATE_THRESHOLD)
+            if pending_bracket_key is not None:
+                deadlines.append(pending_bracket_deadline)
+            if background_due:
+                deadlines.append(next_background_poll)
+            if hot_reload:
+                deadlines.append(next_hot_reload)
+
+            if dirty or getattr(term, "_keyboard_buf", None):
+                timeout = 0.0  # Work pending or keys already buffered by blessed
+            else:
+                timeout = max(0.0, min(deadlines) - now)
+
+            keys_ready = bool(getattr(term, "_keyboard_buf", None))
+            for selector_key, _ in selector.select(timeout):
+                source = selector_key.data
+                if source == "keyboard":
+                    keys_ready = True
+                elif source == "wakeup":
+                    wakeup.drain()
+                    background_due = True
+                elif source == "mpv":
+                    events = player.read_mpv_events(selector_key.fileobj)
+                    if events is None:
+                        # MPV went away - reconnect on the next player poll
+                        selector.unregister(selector_key.fileobj)
+                        selector_key.fileobj.close()
+                        mpv_events = None
+                    elif events:
+                        next_player_poll = 0.0
+
+            now = time.monotonic()
+
+            if resized.is_set():
+                resized.clear()
+                last_dashboard_height = None  # Forces a clear + full redraw
+                screen.invalidate()
+                dirty.add(DIRTY_FULL)
 
-            # Poll player state at configured interval OR immediately on track change
-            # For Spotify: poll every frame (uses internal cache, no API cost)
-            # For MPV: poll every PLAYER_POLL_INTERVAL frames
-            is_spotify = (
-                ctx.player_state.current_track
-                and ctx.player_state.current_track.startswith("spotify:")
-            )
-            should_poll_mpv = (frame_count % PLAYER_POLL_INTERVAL == 0) or track_changed
-            should_poll = is_spotify or should_poll_mpv
-            if should_poll:
-                ctx, ui_state = poll_player_state(ctx, ui_state)
-                # Update position tracking after poll for interpolation
-                last_position = ctx.player_state.current_position
-                last_poll_time = time.time()
+            # Check for file changes if hot-reload is enabled
+            if hot_reload and now >= next_hot_reload:
+                _check_and_reload_files()
+                next_hot_reload = now + HOT_RELOAD_CHECK_SECONDS
+
+            # ---- Terminal input ----
+            if keys_ready:
+                while True:
+                    key = term.inkey(timeout=0)
+                    if not key:
+                        break
+
+                    # Filter terminal focus event sequences (\x1b[I and \x1b[O)
+                    # These are sent by terminals like Kitty when the window gains/loses focus.
+                    # After blessed consumes the ESC byte, the remaining [O or [I appears as
+                    # separate printable characters that would pollute the input field.
+                    key_str = str(key)
+
+                    # If we have a pending '[' and this is 'O' or 'I', it's a focus event - discard both
+                    if pending_bracket_key is not None and key_str in ("O", "I"):
+                        pending_bracket_key = None
+                        continue
+
+                    # If previous key was '[' but this isn't O/I, process the bracket first
+                    if pending_bracket_key is not None:
+                        bracket, pending_bracket_key = pending_bracket_key, None
+                        feed_key(bracket)
+
+                    # Check if current key is '[' - might be start of focus sequence
+                    if key_str == "[" and key.isprintable():
+                        # Hold this key - wait to see if next is 'O' or 'I'
+                        pending_bracket_key = key
+                        pending_bracket_deadline = now + BRACKET_FLUSH_SECONDS
+                        continue
+
+                    feed_key(key)
+                    if should_quit:
+                        break
+
+            # Flush pending bracket once nothing followed it (user typed '[')
+            if pending_bracket_key is not None and now >= pending_bracket_deadline:
+                bracket, pending_bracket_key = pending_bracket_key, None
+                feed_key(bracket)
+
+            if should_quit:
+                break
+
+            # ---- Background notifications (coalesced) ----
+            if background_due and now >= next_background_poll:
+                background_due = False
+                next_background_poll = now + BACKGROUND_MIN_INTERVAL
+
+                # Queued UIState updates from background threads
+                while True:
+                    try:
+                        updates = pending_updates.get_nowait()
+                    except queue.Empty:
+                        break
+                    ui_state = _apply_ui_update(ui_state, updates)
+                    dirty.add(DIRTY_FULL)
+
+                # Drain any pending log() messages (from auto-advance, background events, etc.)
+                for msg, color in drain_pending_history_messages():
+                    ui_state = add_history_line(ui_state, msg, color)
 
-            # Poll scan state at configured interval for smoother progress updates
-            should_poll_scan = frame_count % SCAN_POLL_INTERVAL == 0
-            if should_poll_scan:
                 ui_state = poll_scan_state(ui_state)
-
-            # Poll sync state at configured interval for smoother progress updates
-            should_poll_sync = frame_count % SYNC_POLL_INTERVAL == 0
-            if should_poll_sync:
                 ui_state = poll_sync_state(ui_state)
-
-            # Poll conversion state at configured interval for smoother progress updates
-            should_poll_conversion = frame_count % CONVERSION_POLL_INTERVAL == 0
-            if should_poll_conversion:
                 ui_state = poll_conversion_state(ui_state)
 
-            # Process IPC commands from external clients (hotkeys)
-            try:
-                while not command_queue.empty():
-                    request_id, command, args = command_queue.get_nowait()
-
-                    # Helper to add to history
-                    def add_to_history(text):
-                        nonlocal ui_state
-                        # Use cyan color for IPC commands to distinguish them
-                        ui_state = add_history_line(ui_state, text, "cyan")
-
-                    # Process command
-                    ctx, success, message = process_ipc_command(
-                        ctx, command, args, add_to_history, ipc_srv
-                    )
-
-                    # Send response back to IPC server
-                    response_queue.put((request_id, success, message))
-
-                    # Force full redraw after IPC command
-                    needs_full_redraw = True
-            except queue.Empty:
-                pass
-            except Exception as e:
-                # Log IPC errors but don't crash UI
-                ui_state = add_history_line(ui_state, f"⚠ IPC error: {e}", "yellow")
-
-            # Process web commands from web frontend
-            if ipc_srv:
+                # Process IPC commands from external clients (hotkeys)
                 try:
-                    web_commands = ipc_srv.get_pending_web_commands()
-                    for command_data in web_commands:
-                        command = command_data.get("command", "")
-                        args = command_data.get("args", [])
+                    while not command_queue.empty():
+                        request_id, command, args = command_queue.get_nowait()
 
                         # Helper to add to history
                         def add_to_history(text):
                             nonlocal ui_state
-                            # Use magenta color for web commands to distinguish them
-                            ui_state = add_history_line(ui_state, text, "magenta")
+                            # Use cyan color for IPC commands to distinguish them
+                            ui_state = add_history_line(ui_state, text, "cyan")
 
-                        # Process command (web commands don't need responses)
+                        # Process command
                         ctx, success, message = process_ipc_command(
                             ctx, command, args, add_to_history, ipc_srv
                         )
 
-                        # Force full redraw after web command
-                        needs_full_redraw = True
-                except Exception as e:
-                    # Log web command errors but don't crash UI
-                    ui_state = add_history_line(
-                        ui_state, f"⚠ Web command error: {e}", "yellow"
-                    )
-
-            # Check if state changed (only redraw if needed)
-            # Only compute hash when we polled or when other state changes might have occurred
-            # For Spotify: don't recompute hash every frame (we poll every frame for position updates)
-            # Only recompute on MPV polls or scan polls
-            current_state_hash = None
-            should_recompute_hash = (
-                should_poll_mpv or should_poll_scan or last_state_hash is None
-            )
+                        # Send response back to IPC server
+                        response_queue.put((request_id, success, message))
 
-            if should_recompute_hash:
-                # Hash excludes current_position to avoid full redraws every second
-                # Position is tracked separately for partial dashboard updates
-                # Include scan state for progress updates
-                current_state_hash = hash(
-                    (
-                        ctx.player_state.current_track,
-                        ctx.player_state.is_playing,
-                        ctx.player_state.duration,
-                        len(ui_state.history),
-                        ui_state.feedback_message,
-                        ui_state.scan_progress.is_scanning,
-                        ui_state.scan_progress.files_scanned,
-                        ui_state.scan_progress.phase,
-                    )
-                )
+                        # Force full redraw after IPC command
+                        dirty.add(DIRTY_FULL)
+                except queue.Empty:
+                    pass
+                except Exception as e:
+                    # Log IPC errors but don't crash UI
+                    ui_state = add_history_line(ui_state, f"⚠ IPC error: {e}", "yellow")
+
+                # Process web commands from web frontend
+                if ipc_srv:
+                    try:
+                        web_commands = ipc_srv.get_pending_web_commands()
+                        for command_data in web_commands:
+                            command = command_data.get("command", "")
+                            args = command_data.get("args", [])
+
+                            # Helper to add to history
+                            def add_to_history(text):
+                                nonlocal ui_state
+                                # Use magenta color for web commands to distinguish them
+                                ui_state = add_history_line(ui_state, text, "magenta")
+
+                            # Process command (web commands don't need responses)
+                            ctx, success, message = process_ipc_command(
+                                ctx, command, args, add_to_history, ipc_srv
+                            )
 
-            # Check for input-only changes (no full redraw needed)
-            input_changed = ui_state.input_text != last_input_text
-            palette_state_changed = (
-                ui_state.palette_visible,
-                ui_state.palette_selected,
-                ui_state.confirmation_active,
-                ui_state.wizard_active,
-                ui_state.wizard_selected,
-                ui_state.builder.active,
-                ui_state.builder.selected_index,
-                ui_state.builder.scroll_offset,
-                ui_state.builder.filter_editor_mode,
-                ui_state.builder.filter_editor_selected,
-                ui_state.builder.filter_editor_editing,
-                ui_state.builder.filter_editor_step,
-                ui_state.track_viewer_visible,
-                ui_state.track_viewer_selected,
-                ui_state.track_viewer_mode,
-                ui_state.analytics_viewer_visible,
-                ui_state.analytics_viewer_scroll,
-                ui_state.editor_visible,
-                ui_state.editor_selected,
-                ui_state.editor_mode,
-                ui_state.editor_input,
-                ui_state.search_selected,
-                ui_state.search_scroll,
-                ui_state.search_mode,
-                ui_state.search_detail_scroll,
-                ui_state.search_detail_selection,
-                ui_state.comparison.active,
-                ui_state.comparison.highlighted,
-                ui_state.comparison.track_a.get("id")
-                if ui_state.comparison.track_a
-                else None,
-                ui_state.comparison.track_b.get("id")
-                if ui_state.comparison.track_b
-                else None,
-                ui_state.export_selector_active,
-                ui_state.export_selector_selected,
-            ) != last_palette_state
-
-            # Determine if we need a full redraw
-            needs_full_redraw = needs_full_redraw or (
-                current_state_hash is not None and current_state_hash != last_state_hash
-            )
+                            # Force full redraw after web command
+                            dirty.add(DIRTY_FULL)
+                    except Exception as e:
+                        # Log web command errors but don't crash UI
+                        ui_state = add_history_line(
+                            ui_state, f"⚠ Web command error: {e}", "yellow"
+                        )
 
-            if needs_full_redraw:
-                # Render dashboard first to check if height changed (lock for thread safety)
-                with ui_state_lock:
-                    dashboard_height, dashboard_line_mapping = render_dashboard(
-                        term,
-                        ctx.player_state,
-                        ui_state,
-                        0,  # Dashboard always starts at y=0
-                    )
+            # ---- Player ----
+            # Poll immediately on track change (instant metadata) or MPV event,
+            # otherwise on the playing/idle cadence. Spotify is polled at the
+            # position cadence while playing (uses internal cache, no API cost).
+            current_track_file = ctx.player_state.current_track
+            track_changed = current_track_file != last_track_file
+            if track_changed:
+                last_track_file = current_track_file
 
-                # Only clear screen if dashboard height changed or first render
-                height_changed = last_dashboard_height != dashboard_height
-                if height_changed or last_dashboard_height is None:
-                    # Clear screen and re-render everything
-                    print(term.clear)
+            if track_changed or now >= next_player_poll:
+                ctx, ui_state = poll_player_state(ctx, ui_state)
+                # Update position tracking after poll for interpolation
+                last_position = ctx.player_state.current_position
+                last_poll_time = time.time()
 
-                    # Re-render dashboard after clear
-                    dashboard_height, dashboard_line_mapping = render_dashboard(
-                        term, ctx.player_state, ui_state, 0
+                is_spotify = bool(
+                    ctx.player_state.current_track
+                    and ctx.player_state.current_track.startswith("spotify:")
+                )
+                if is_spotify and ctx.player_state.is_playing:
+                    next_player_poll = now + POSITION_UPDATE_THRESHOLD
+                elif ctx.player_state.is_playing:
+                    next_player_poll = now + PLAYER_POLL_SECONDS
+                else:
+                    next_player_poll = now + PLAYER_IDLE_POLL_SECONDS
+
+                if not is_spotify:
+                    mpv_events = _sync_mpv_events(
+                        selector, mpv_events, ctx.player_state.socket_path
                     )
 
-                # Update tracking variables
-                last_state_hash = current_state_hash
-                needs_full_redraw = False
-                last_dashboard_height = dashboard_height
-
-                # Calculate layout with actual dashboard height
-                layout = calculate_layout(term, ui_state, dashboard_height)
-
-                # Render remaining sections
-                render_history(
-                    term, ui_state, layout["history_y"], layout["history_height"]
-                )
+            # ---- Work out what is dirty ----
+            overlay = _active_overlay(ui_state)
+            if overlay != last_overlay:
+                dirty.add(DIRTY_FULL)
+            if _dashboard_signature(ctx, ui_state) != last_dashboard_signature:
+                dirty.add(DIRTY_FULL)
+            if _history_signature(ui_state) != last_history_signature:
+                dirty.add(DIRTY_HISTORY)
+
+            display_position = None
+            if (
+                ctx.player_state.current_track
+                and ctx.player_state.is_playing
+                and layout
+                and dashboard_line_mapping
+                and DIRTY_FULL not in dirty
+            ):
+                # Spotify: already interpolated by SpotifyPlayer (polled at position cadence)
+                # MPV: interpolated here for smooth updates between polls
+                if ctx.player_state.current_track.startswith("spotify:"):
+                    display_position = ctx.player_state.current_position
+                else:
+                    display_position = last_position + (time.time() - last_poll_time)
 
-                render_input(term, ui_state, layout["input_y"])
+                if (
+                    abs(display_position - last_rendered_position)
+                    >= POSITION_UPDATE_THRESHOLD
+                ):
+                    dirty.add(DIRTY_POSITION)
 
-                # Render palette, wizard, builder, track viewer, or comparison (mutually exclusive)
-                if ui_state.comparison.active:
-                    from music_minion.ui.blessed.components.comparison import (
-                        render_comparison_overlay,
-                    )
+            if not dirty:
+                continue
 
-                    render_comparison_overlay(
+            # ---- Render dirty regions ----
+            # Components draw into the virtual screen; only changed cells
+            # reach the terminal, in one write.
+            with screen.frame():
+                if DIRTY_FULL in dirty or layout is None:
+                    # Render dashboard first to check if height changed
+                    dashboard_height, dashboard_line_mapping = render_dashboard(
                         term,
-                        ui_state.comparison,
                         ctx.player_state,
-                        layout,
-                    )
-                elif ui_state.wizard_active:
-                    render_smart_playlist_wizard(
-                        term, ui_state, layout["palette_y"], layout["palette_height"]
-                    )
-                elif ui_state.builder.active:
-                    from music_minion.ui.blessed.components.playlist_builder import (
-                        render_playlist_builder,
-                    )
-
-                    render_playlist_builder(
-                        term, ui_state, layout["palette_y"], layout["palette_height"]
-                    )
-                elif ui_state.palette_visible:
-                    render_palette(
-                        term, ui_state, layout["palette_y"], layout["palette_height"]
-                    )
-                elif ui_state.track_viewer_visible:
-                    render_track_viewer(
-                        term,
                         ui_state,
-                        layout["track_viewer_y"],
-                        layout["track_viewer_height"],
-                    )
-                elif ui_state.rating_history_visible:
-                    render_rating_history_viewer(
-                        term,
-                        ui_state,
-                        layout["palette_y"],  # Use palette area
-                        layout["palette_height"],
-                    )
-                elif ui_state.comparison_history_visible:
-                    render_comparison_history_viewer(
-                        term,
-                        ui_state,
-                        layout["palette_y"],  # Use palette area
-                        layout["palette_height"],
-                    )
-                elif ui_state.analytics_viewer_visible:
-                    render_analytics_viewer(
-                        term,
-                        ui_state,
-                        layout["analytics_viewer_y"],
-                        layout["analytics_viewer_height"],
-                    )
-                elif ui_state.editor_visible:
-                    render_metadata_editor(
-                        term,
-                        ui_state,
-                        layout["palette_y"],  # Use palette area
-                        layout["palette_height"],
-                    )
-                elif ui_state.export_selector_active:
-                    render_export_selector(
-                        term,
-                        ui_state,
-                        layout["export_selector_y"],
-                        layout["export_selector_height"],
-                    )
-
-                # Flush output
-                sys.stdout.flush()
-
-                last_input_text = ui_state.input_text
-                last_palette_state = (
-                    ui_state.palette_visible,
-                    ui_state.palette_selected,
-                    ui_state.confirmation_active,
-                    ui_state.wizard_active,
-                    ui_state.wizard_selected,
-                    ui_state.builder.active,
-                    ui_state.builder.selected_index,
-                    ui_state.builder.scroll_offset,
-                    ui_state.builder.filter_editor_mode,
-                    ui_state.builder.filter_editor_selected,
-                    ui_state.builder.filter_editor_editing,
-                    ui_state.builder.filter_editor_step,
-                    ui_state.track_viewer_visible,
-                    ui_state.track_viewer_selected,
-                    ui_state.track_viewer_mode,
-                    ui_state.analytics_viewer_visible,
-                    ui_state.analytics_viewer_scroll,
-                    ui_state.editor_visible,
-                    ui_state.editor_selected,
-                    ui_state.editor_mode,
-                    ui_state.editor_input,
-                    ui_state.search_selected,
-                    ui_state.search_scroll,
-                    ui_state.search_mode,
-                    ui_state.search_detail_scroll,
-                    ui_state.search_detail_selection,
-                    ui_state.comparison.active,
-                    ui_state.comparison.highlighted,
-                    ui_state.comparison.track_a.get("id")
-                    if ui_state.comparison.track_a
-                    else None,
-                    ui_state.comparison.track_b.get("id")
-                    if ui_state.comparison.track_b
-                    else None,
-                    ui_state.export_selector_active,
-                    ui_state.export_selector_selected,
-                )
-
-                # Update rendered position for partial update threshold
-                last_rendered_position = ctx.player_state.current_position
-
-                # Start background sync after first render (instant UI)
-                if not startup_sync_started:
-                    startup_sync_started = True
-                    ui_state = add_history_line(
-                        ui_state, "🔄 Starting background sync...", "cyan"
+                        0,  # Dashboard always starts at y=0
                     )
-                    logger.info("Starting background sync after UI render")
-
-                    def _background_sync_worker():
-                        """Background thread for context-aware sync."""
-                        nonlocal ctx
 
-                        # Suppress stdout printing from log() calls (prevents UI interference)
-                        threading.current_thread().silent_logging = True
+                    # Only clear screen if dashboard height changed or first render
+                    if last_dashboard_height != dashboard_height:
+                        # Clear screen and re-render everything
+                        print(term.clear)
 
-                        try:
-                            from music_minion.commands import sync
-
-                            # Capture current player state before sync
-                            current_player_state = ctx.player_state
-                            current_spotify_player = ctx.spotify_player
-
-                            # Run sync (updates tracks but may lose player state)
-                            updated_ctx, _ = sync.handle_sync_command(ctx, None)
+                        # Re-render dashboard after clear
+                        dashboard_height, dashboard_line_mapping = render_dashboard(
+                            term, ctx.player_state, ui_state, 0
+                        )
+                    last_dashboard_height = dashboard_height
 
-                            # Preserve current player state (prevent clearing current track)
-                            ctx = dataclasses.replace(
-                                updated_ctx,
-                                player_state=current_player_state,
-                                spotify_player=current_spotify_player,
-                            )
+                    # Calculate layout with actual dashboard height
+                    layout = calculate_layout(term, ui_state, dashboard_height)
 
-                            # Update UI state from background thread
-                            if ctx.update_ui_state:
-                                ctx.update_ui_state(
-                                    {
-                                        "history_messages": [
-                                            ("✅ Auto-sync complete", "green")
-                                        ]
-                                    }
-                                )
-                        except Exception as e:
-                            logger.exception(f"Background sync failed: {e}")
-                            if ctx.update_ui_state:
-                                ctx.update_ui_state(
-                                    {
-                                        "history_messages": [
-                                            (f"⚠ Auto-sync failed: {e}", "yellow")
-                                        ]
-                                    }
-                                )
-                        finally:
-                            # Always clear the flag
-                            threading.current_thread().silent_logging = False
-
-                    # Start background thread
-                    sync_thread = threading.Thread(
-                        target=_background_sync_worker,
-                        daemon=True,
-                        name="StartupSyncThread",
+                    # Render remaining sections
+                    render_history(
+                        term, ui_state, layout["history_y"], layout["history_height"]
                     )
-                    sync_thread.start()
-
-            # Check if modal visibility changed (requires full redraw)
-            if palette_state_changed and (
-                ui_state.palette_visible != last_palette_state[0]
-                or ui_state.wizard_active != last_palette_state[3]
-                or ui_state.builder.active != last_palette_state[5]
-                or ui_state.track_viewer_visible != last_palette_state[12]
-                or ui_state.track_viewer_mode != last_palette_state[14]
-                or ui_state.analytics_viewer_visible != last_palette_state[15]
-                or ui_state.editor_visible != last_palette_state[17]
-                or ui_state.comparison.active != last_palette_state[26]
-                or ui_state.export_selector_active != last_palette_state[30]
-            ):
-                needs_full_redraw = True
-
-            if input_changed or palette_state_changed:
-                # Partial update - only input and palette changed
-                if layout and not needs_full_redraw:
-                    # Clear input area (3 lines: top border, input, bottom border)
-                    input_y = layout["input_y"]
-                    for i in range(3):
-                        write_at(term, 0, input_y + i, "")
-
-                    # Clear palette/wizard/builder/track viewer/analytics viewer/editor/comparison area if visible
-                    if (
-                        ui_state.palette_visible
-                        or ui_state.wizard_active
-                        or ui_state.builder.active
-                        or ui_state.track_viewer_visible
-                        or ui_state.analytics_viewer_visible
-                        or ui_state.editor_visible
-                        or ui_state.comparison.active
-                        or ui_state.export_selector_active
-                    ):
-                        overlay_y = layout[
-                            "palette_y"
-                        ]  # Same position for all overlays
-                        overlay_height = layout["palette_height"]
-                        for i in range(overlay_height):
-                            sys.stdout.write(
-                                term.move_xy(0, overlay_y + i) + term.clear_eol
-                            )
-
-                    # Re-render
                     render_input(term, ui_state, layout["input_y"])
-
-                    # Render palette, wizard, builder, track viewer, analytics viewer, or comparison (mutually exclusive)
-                    if ui_state.comparison.active:
-                        from music_minion.ui.blessed.components.comparison import (
-                            render_comparison_overlay,
+                    _render_overlay(term, ctx, ui_state, layout)
+
+                    # Update rendered position for partial update threshold
+                    last_rendered_position = ctx.player_state.current_position
+                else:
+                    if DIRTY_HISTORY in dirty:
+                        render_history(
+                            term, ui_state, layout["history_y"], layout["history_height"]
                         )
 
-                        render_comparison_overlay(
-                            term,
-                            ui_state.comparison,
-                            ctx.player_state,
-                            layout,
-                        )
-                    elif ui_state.wizard_active:
-                        render_smart_playlist_wizard(
-                            term,
-                            ui_state,
-                            layout["palette_y"],
-                            layout["palette_height"],
-                        )
-                    elif ui_state.builder.active:
-                        from music_minion.ui.blessed.components.playlist_builder import (
-                            render_playlist_builder,
-                        )
-
-                        render_playlist_builder(
-                            term,
-                            ui_state,
-                            layout["palette_y"],
-                            layout["palette_height"],
-                        )
-                    elif ui_state.palette_visible:
-                        render_palette(
-                            term,
-                            ui_state,
-                            layout["palette_y"],
-                            layout["palette_height"],
-                        )
-                    elif ui_state.track_viewer_visible:
-                        render_track_viewer(
-                            term,
-                            ui_state,
-                            layout["track_viewer_y"],
-                            layout["track_viewer_height"],
-                        )
-                    elif ui_state.rating_history_visible:
-                        render_rating_history_viewer(
-                            term,
-                            ui_state,
-                            layout["palette_y"],
-                            layout["palette_height"],
-                        )
-                    elif ui_state.comparison_history_visible:
-                        render_comparison_history_viewer(
-                            term,
-                            ui_state,
-                            layout["palette_y"],
-                            layout["palette_height"],
-                        )
-                    elif ui_state.analytics_viewer_visible:
-                        render_analytics_viewer(
-                            term,
-                            ui_state,
-                            layout["analytics_viewer_y"],
-                            layout["analytics_viewer_height"],
-                        )
-                    elif ui_state.editor_visible:
-                        render_metadata_editor(
-                            term,
-                            ui_state,
-                            layout["palette_y"],
-                            layout["palette_height"],
-                        )
-                    elif ui_state.export_selector_active:
-                        render_export_selector(
-                            term,
-                            ui_state,
-                            layout["export_selector_y"],
-                            layout["export_selector_height"],
-                        )
-
-                    # Flush output
-                    sys.stdout.flush()
-
-                    last_input_text = ui_state.input_text
-                    last_palette_state = (
-                        ui_state.palette_visible,
-                        ui_state.palette_selected,
-                        ui_state.confirmation_active,
-                        ui_state.wizard_active,
-                        ui_state.wizard_selected,
-                        ui_state.builder.active,
-                        ui_state.builder.selected_index,
-                        ui_state.builder.scroll_offset,
-                        ui_state.builder.filter_editor_mode,
-                        ui_state.builder.filter_editor_selected,
-                        ui_state.builder.filter_editor_editing,
-                        ui_state.builder.filter_editor_step,
-                        ui_state.track_viewer_visible,
-                        ui_state.track_viewer_selected,
-                        ui_state.track_viewer_mode,
-                        ui_state.analytics_viewer_visible,
-                        ui_state.analytics_viewer_scroll,
-                        ui_state.editor_visible,
-                        ui_state.editor_selected,
-                        ui_state.editor_mode,
-                        ui_state.editor_input,
-                        ui_state.search_selected,
-                        ui_state.search_scroll,
-                        ui_state.search_mode,
-                        ui_state.search_detail_scroll,
-                        ui_state.search_detail_selection,
-                        ui_state.comparison.active,
-                        ui_state.comparison.highlighted,
-                        ui_state.comparison.track_a.get("id")
-                        if ui_state.comparison.track_a
-                        else None,
-                        ui_state.comparison.track_b.get("id")
-                        if ui_state.comparison.track_b
-                        else None,
-                        ui_state.export_selector_active,
-                        ui_state.export_selector_selected,
-                    )
+                    if DIRTY_INPUT in dirty:
+                        # Clear input area (3 lines: top border, input, bottom border)
+                        input_y = layout["input_y"]
+                        for i in range(3):
+                            write_at(term, 0, input_y + i, "")
+
+                        # Clear overlay area if one is visible (same position for all overlays)
+                        if overlay:
+                            overlay_y = layout["palette_y"]
+                            for i in range(layout["palette_height"]):
+                                sys.stdout.write(
+                                    term.move_xy(0, overlay_y + i) + term.clear_eol
+                                )
 
-            else:
-                # Only check for position updates if we have a track and layout
-                if ctx.player_state.current_track and layout and dashboard_line_mapping:
-                    # Use position directly from player state
-                    # For Spotify: already interpolated by SpotifyPlayer (polled every frame)
-                    # For MPV: interpolated here for smooth updates between polls
-                    is_spotify_track = (
-                        ctx.player_state.current_track
-                        and ctx.player_state.current_track.startswith("spotify:")
-                    )
+                        render_input(term, ui_state, layout["input_y"])
+                        _render_overlay(term, ctx, ui_state, layout)
 
-                    if is_spotify_track:
-                        # Use SpotifyPlayer's cached position directly (already interpolated)
-                        current_position = ctx.player_state.current_position
-                    else:
-                        # For MPV: calculate interpolated position for smooth updates between polls
-                        time_since_poll = time.time() - last_poll_time
-                        current_position = last_position + time_since_poll
-
-                    # Check if position crossed threshold
-                    position_changed = (
-                        abs(current_position - last_rendered_position)
-                        >= POSITION_UPDATE_THRESHOLD
-                    )
-
-                    if position_changed:
+                    if DIRTY_POSITION in dirty and display_position is not None:
                         # Partial update - only update time-sensitive dashboard elements
                         from .components.dashboard import render_dashboard_partial
 
                         # Use current position for smooth visual updates
                         display_state = ctx.player_state._replace(
-                            current_position=current_position
+                            current_position=display_position
                         )
-
                         render_dashboard_partial(
                             term,
                             display_state,
@@ -1474,96 +1357,71 @@ def main_loop(term: Terminal, ctx: AppContext) -> AppContext:
                             layout["dashboard_y"],
                             dashboard_line_mapping,
                         )
+                        last_rendered_position = display_position
 
-                        sys.stdout.flush()
-                        last_rendered_position = current_position
-
-            # Wait for input (with timeout for background updates)
-            key = term.inkey(timeout=0.1)
+            dirty.clear()
+            last_overlay = overlay
+            last_dashboard_signature = _dashboard_signature(ctx, ui_state)
+            last_history_signature = _history_signature(ui_state)
 
-            # Flush pending bracket on timeout (user typed '[' but nothing followed)
-            if not key and pending_bracket_key is not None:
-                # No key received - flush the pending bracket as a normal key
-                palette_height = layout["palette_height"] if layout else 10
-                analytics_viewer_height = (
-                    layout["analytics_viewer_height"] if layout else 30
-                )
-                ui_state, command_line = handle_key(
-                    ui_state, pending_bracket_key, palette_height, analytics_viewer_height
+            # Start background sync after first render (instant UI)
+            if not startup_sync_started:
+                startup_sync_started = True
+                ui_state = add_history_line(
+                    ui_state, "🔄 Starting background sync...", "cyan"
                 )
-                pending_bracket_key = None
+                logger.info("Starting background sync after UI render")
 
-                if command_line:
-                    with ui_state_lock:
-                        ctx, ui_state, should_quit = execute_command(
-                            ctx, ui_state, command_line
-                        )
-                    needs_full_redraw = True
-                    last_position = ctx.player_state.current_position
-                    last_poll_time = time.time()
-
-            if key:
-                # Filter terminal focus event sequences (\x1b[I and \x1b[O)
-                # These are sent by terminals like Kitty when the window gains/loses focus.
-                # After blessed consumes the ESC byte, the remaining [O or [I appears as
-                # separate printable characters that would pollute the input field.
-                key_str = str(key)
-
-                # If we have a pending '[' and this is 'O' or 'I', it's a focus event - discard both
-                if pending_bracket_key is not None and key_str in ("O", "I"):
-                    pending_bracket_key = None
-                    # Skip processing this key entirely - it's the second half of focus event
-                    continue
-
-                # If previous key was '[' but this isn't O/I, process the bracket first
-                if pending_bracket_key is not None:
-                    # Process the pending bracket as a normal key
-                    palette_height = layout["palette_height"] if layout else 10
-                    analytics_viewer_height = (
-                        layout["analytics_viewer_height"] if layout else 30
-                    )
-                    ui_state, command_line = handle_key(
-                        ui_state, pending_bracket_key, palette_height, analytics_viewer_height
-                    )
-                    pending_bracket_key = None
+                def _background_sync_worker():
+                    """Background thread for context-aware sync."""
+                    nonlocal ctx
 
-                    if command_line:
-                        with ui_state_lock:
-                            ctx, ui_state, should_quit = execute_command(
-                                ctx, ui_state, command_line
-                            )
-                        needs_full_redraw = True
-                        last_position = ctx.player_state.current_position
-                        last_poll_time = time.time()
-
-                # Check if current key is '[' - might be start of focus sequence
-                if key_str == "[" and key.isprintable():
-                    # Hold this key - wait to see if next is 'O' or 'I'
-                    pending_bracket_key = key
-                    continue
-
-                # Handle keyboard input
-                palette_height = layout["palette_height"] if layout else 10
-                analytics_viewer_height = (
-                    layout["analytics_viewer_height"] if layout else 30
-                )
-                ui_state, command_line = handle_key(
-                    ui_state, key, palette_height, analytics_viewer_height
-                )
+                    # Suppress stdout printing from log() calls (prevents UI interference)
+                    threading.current_thread().silent_logging = True
+
+                    try:
+                        from music_minion.commands import sync
+
+                        # Capture current player state before sync
+                        current_player_state = ctx.player_state
+                        current_spotify_player = ctx.spotify_player
+
+                        # Run sync (updates tracks but may lose player state)
+                        updated_ctx, _ = sync.handle_sync_command(ctx, None)
 
-                # Execute command if one was triggered
-                if command_line:
-                    with ui_state_lock:
-                        ctx, ui_state, should_quit = execute_command(
-                            ctx, ui_state, command_line
+                        # Preserve current player state (prevent clearing current track)
+                        ctx = dataclasses.replace(
+                            updated_ctx,
+                            player_state=current_player_state,
+                            spotify_player=current_spotify_player,
                         )
-                    # Full redraw after command execution
-                    needs_full_redraw = True
-                    # Reset interpolation baseline to new position (critical for seek commands)
-                    last_position = ctx.player_state.current_position
-                    last_poll_time = time.time()
 
-            frame_count += 1
+                        # Update UI state from background thread
+                        if ctx.update_ui_state:
+                            ctx.update_ui_state(
+                                {"history_messages": [("✅ Auto-sync complete", "green")]}
+                            )
+                    except Exception as e:
+                        logger.exception(f"Background sync failed: {e}")
+                        if ctx.update_ui_state:
+                            ctx.update_ui_state(
+                                {
+                                    "history_messages": [
+                                        (f"⚠ Auto-sync failed: {e}", "yellow")
+                                    ]
+                                }
+                            )
+                    finally:
+                        # Always clear the flag
+                        threading.current_thread().silent_logging = False
+
+                # Start background thread
+                sync_thread = threading.Thread(
+                    target=_background_sync_worker,
+                    daemon=True,
+                    name="StartupSyncThread",
+                )
+                sync_thread.start()
     except KeyboardInterrupt:
         # Cleanup BEFORE propagating exception
         logger.info("Ctrl+C detected - cleaning up")
@@ -1575,6 +1433,15 @@ def main_loop(term: Terminal, ctx: AppContext) -> AppContext:
                 logger.exception(f"Failed to pause Spotify: {e}")
         # Re-raise to let outer handlers know we're exiting
         raise
+    finally:
+        if previous_winch_handler is not None:
+            signal.signal(signal.SIGWINCH, previous_winch_handler)
+        if mpv_events is not None:
+            mpv_events[0].close()
+        selector.close()
+        screen.close()
+        flush_listen_sessions()
+        logger.info(f"Listen accounting: {get_listen_accounting_stats()}")
 
     # Cleanup: Notify browser to stop playback before shutdown
     if ipc_srv:
@@ -1599,5 +1466,6 @@ def main_loop(term: Terminal, ctx: AppContext) -> AppContext:
 
     # Restore normal logging mode (CLI)
     clear_blessed_mode()
+    wakeup.close()
 
     return ctx
@@ -0,0 +1,242 @@
+"""Virtual screen buffer that turns component output into minimal terminal diffs.
+
+Components keep drawing with positioned writes (move_xy + clear_eol + text).
+Inside ScreenBuffer.frame() those writes are captured instead of reaching the
+terminal, applied to a back buffer of styled cells, and compared row by row
+with what is already on screen. Only changed cells are written, in a single
+write per frame.
+"""
+
+import io
+import json
+import re
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from wcwidth import wcwidth
+
+# (style, text): style is the SGR sequences active when the cell was drawn,
+# text is one character ("" for the trailing half of a wide character).
+Cell = tuple[str, str]
+Row = list[Cell]
+
+BLANK: Cell = ("", " ")
+RESET = "\x1b[m"
+
+_TOKEN_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]|\x1b[()][0-9A-Za-z]|\x1b.|[\r\n]|[^\x1b\r\n]+")
+_CUP_RE = re.compile(r"\x1b\[(?:(\d*)(?:;(\d*))?)?[Hf]$")
+
+
+def _is_simple_char(char: str) -> bool:
+    """Characters every terminal renders exactly one column wide.
+
+    Rows containing anything else (emoji, CJK, combining marks, symbols with
+    ambiguous width) are repainted from column 0 so terminal/wcwidth
+    disagreements cannot shift the cursor.
+    """
+    code = ord(char)
+    return 0x20 <= code < 0x2000 or 0x2500 <= code <= 0x259F
+
+
+class ScreenBuffer:
+    """Back/front cell buffers plus the row diff that reconciles them.
+
+    Args:
+        term: blessed Terminal (used for size and cursor movement)
+        stream: Real output stream (defaults to sys.stdout at flush time)
+        record_path: Optional JSON-lines file receiving every captured frame,
+            for replay with scripts/benchmark_ui_render.py
+    """
+
+    def __init__(self, term, stream=None, record_path: Optional[str] = None):
+        self.term = term
+        self._stream = stream
+        self.width = 0
+        self.height = 0
+        self._front: Optional[list[Row]] = None  # None = terminal contents unknown
+        self._back: list[Row] = []
+        self._complex: list[bool] = []  # Per back row: needs full-row repaint
+        self._front_complex: list[bool] = []
+        self._record = open(record_path, "a", encoding="utf-8") if record_path else None
+        self._record_start = time.monotonic()
+        self.bytes_written = 0
+        self.frames = 0
+
+    # ---- Frame lifecycle -------------------------------------------------
+
+    def invalidate(self) -> None:
+        """Forget what is on screen; the next frame repaints everything."""
+        self._front = None
+
+    @contextmanager
+    def frame(self) -> Iterator[None]:
+        """Capture stdout writes made by components and flush the diff."""
+        real_stdout = sys.stdout
+        capture = io.StringIO()
+        sys.stdout = capture
+        try:
+            yield
+        finally:
+            sys.stdout = real_stdout
+        self.apply(capture.getvalue())
+        self.flush(real_stdout if self._stream is None else self._stream)
+
+    def apply(self, raw: str) -> None:
+        """Draw captured component output into the back buffer."""
+        width, height = self.term.width, self.term.height
+        if (width, height) != (self.width, self.height) or self._front is None:
+            self._resize(width, height)
+
+        if self._record is not None:
+            self._record.write(
+                json.dumps(
+                    {
+                        "t": round(time.monotonic() - self._record_start, 4),
+                        "width": width,
+                        "height": height,
+                        "raw": raw,
+                    }
+                )
+                + "\n"
+            )
+            self._record.flush()
+
+        x = y = 0
+        style = ""
+        for token in _TOKEN_RE.findall(raw):
+            if token[0] == "\x1b":
+                cup = _CUP_RE.match(token)
+                if cup:
+                    y = int(cup.group(1) or 1) - 1
+                    x = int(cup.group(2) or 1) - 1
+                elif token == "\x1b[K" or token == "\x1b[0K":
+                    self._clear_to_eol(x, y)
+                elif token == "\x1b[2J":
+                    self._clear_all()
+                elif token.endswith("m") and token.startswith("\x1b["):
+                    params = token[2:-1]
+                    style = "" if params in ("", "0") else style + token
+                # Charset selection and other modes don't affect cell contents
+            elif token == "\n":
+                x, y = 0, y + 1
+            elif token == "\r":
+                x = 0
+            else:
+                x, y = self._put_text(x, y, token, style)
+
+    def flush(self, stream) -> int:
+        """Write the difference between back and front buffers; returns bytes."""
+        out = []
+        repaint_all = self._front is None
+        if repaint_all:
+            out.append(self.term.home + self.term.clear)
+            self._front = [[BLANK] * self.width for _ in range(self.height)]
+            self._front_complex = [False] * self.height
+
+        for y in range(self.height):
+            back, front = self._back[y], self._front[y]
+            if back == front:
+                continue
+            out.append(self._diff_row(y, front, back))
+            self._front[y] = list(back)
+            self._front_complex[y] = self._complex[y]
+
+        self.frames += 1
+        if not out:
+            return 0
+        data = "".join(out)
+        stream.write(data)
+        stream.flush()
+        written = len(data.encode("utf-8"))
+        self.bytes_written += written
+        return written
+
+    def close(self) -> None:
+        if self._record is not None:
+            self._record.close()
+            self._record = None
+
+    # ---- Back buffer drawing ----------------------------------------------
+
+    def _resize(self, width: int, height: int) -> None:
+        self.width, self.height = width, height
+        self._back = [[BLANK] * width for _ in range(height)]
+        self._complex = [False] * height
+        self._front = None
+
+    def _clear_all(self) -> None:
+        for y in range(self.height):
+            self._back[y] = [BLANK] * self.width
+            self._complex[y] = False
+
+    def _clear_to_eol(self, x: int, y: int) -> None:
+        if 0 <= y < self.height and x < self.width:
+            row = self._back[y]
+            row[max(x, 0) :] = [BLANK] * (self.width - max(x, 0))
+            if x <= 0:
+                self._complex[y] = False
+
+    def _put_text(self, x: int, y: int, text: str, style: str) -> tuple[int, int]:
+        for char in text:
+            char_width = wcwidth(char)
+            if char_width == 0 and 0 < x <= self.width and 0 <= y < self.height:
+                # Combining mark / variation selector joins the previous cell
+                prev_style, prev_text = self._back[y][x - 1]
+                self._back[y][x - 1] = (prev_style, prev_text + char)
+                self._complex[y] = True
+                continue
+            if char_width < 1:
+                continue  # Other control characters are not drawn
+            if x + char_width > self.width:
+                # Autowrap, as the terminal would
+                x, y = 0, y + 1
+            if not 0 <= y < self.height:
+                continue
+            row = self._back[y]
+            if not _is_simple_char(char):
+                self._complex[y] = True
+            # Overwriting either half of a wide character erases the other half
+            if row[x][1] == "" and x > 0:
+                row[x - 1] = BLANK
+            end = x + char_width
+            if end < self.width and row[end][1] == "":
+                row[end] = BLANK
+            row[x] = (style, char)
+            if char_width == 2:
+                row[x + 1] = (style, "")
+            x += char_width
+        return x, y
+
+    # ---- Diff ---------------------------------------------------------------
+
+    def _diff_row(self, y: int, front: Row, back: Row) -> str:
+        # Visible end of the new row (trailing blanks are cleared with EL)
+        end = self.width
+        while end > 0 and back[end - 1] == BLANK:
+            end -= 1
+
+        start, last = 0, self.width - 1
+        if not (self._complex[y] or self._front_complex[y]):
+            # Column math is exact: emit only the changed span
+            while start < self.width and front[start] == back[start]:
+                start += 1
+            while last > start and front[last] == back[last]:
+                last -= 1
+
+        parts = [self.term.move_xy(start, y)]
+        stop = min(last + 1, end)
+        current_style = ""
+        for style, text in back[start:stop]:
+            if text == "":
+                continue
+            if style != current_style:
+                parts.append(RESET + style)
+                current_style = style
+            parts.append(text)
+        if current_style:
+            parts.append(RESET)
+        if last + 1 > end:
+            parts.append(self.term.clear_eol)
+        return "".join(parts)
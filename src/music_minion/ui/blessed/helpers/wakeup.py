@@ -0,0 +1,53 @@
+"""Self-pipe used to wake the blessed event loop from other threads."""
+
+import os
+import threading
+
+
+class WakeupPipe:
+    """Non-blocking pipe whose read end is registered with the UI selector.
+
+    Background threads call notify(); the loop drains the pipe after select()
+    returns. Notifications coalesce: at most one byte is pending at a time.
+    """
+
+    def __init__(self) -> None:
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        os.set_blocking(self._write_fd, False)
+        self._pending = threading.Event()
+
+    def fileno(self) -> int:
+        """Read end for selector registration."""
+        return self._read_fd
+
+    def notify(self) -> None:
+        """Wake the loop (thread-safe, never blocks)."""
+        if self._pending.is_set():
+            return
+        self._pending.set()
+        try:
+            os.write(self._write_fd, b"\0")
+        except (BlockingIOError, OSError):
+            pass  # Pipe full or closed - the loop is awake or gone either way
+
+    def drain(self) -> None:
+        """Consume pending wakeups (call from the loop thread)."""
+        # Empty the pipe before clearing: clearing first lets a racing notify()
+        # write a byte the read loop then eats, leaving the flag set forever.
+        # A notify() coalesced before the clear is covered by the caller, which
+        # handles background work after draining.
+        try:
+            while os.read(self._read_fd, 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        self._pending.clear()
+
+    def close(self) -> None:
+        """Close both ends of the pipe."""
+        for fd in (self._read_fd, self._write_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
@@ -38,6 +38,8 @@ COMMAND_DEFINITIONS: list[tuple[str, str, str, str]] = [
     ("📚 Library", "search", "🔍", "Search all tracks"),
     ("📚 Library", "scan", "🔍", "Scan library for new tracks"),
     ("📚 Library", "stats", "📊", "Show library statistics"),
+    ("📚 Library", "analyze", "🎚️", "Analyze BPM, key, loudness and energy"),
+    ("📚 Library", "analyze status", "📈", "Show audio analysis progress"),
     ("📚 Library", "metadata", "🔧", "Edit track metadata"),
     # Library Providers - Switching
     ("📚 Library", "local", "💿", "Switch to local library"),
@@ -6,8 +6,15 @@ Contains:
 - parsers: Argument and command parsing
 """
 
-from .autocomplete import *
-from .parsers import *
+from music_minion.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".autocomplete": ("MusicMinionCompleter", "PlaylistCompleter"),
+        ".parsers": ("parse_quoted_args", "parse_command"),
+    },
+)
 
 __all__ = [
     # From autocomplete
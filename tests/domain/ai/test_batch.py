@@ -0,0 +1,267 @@
+"""
+Tests for batch AI tagging against a local stub of the OpenAI Responses API:
+tags and usage rows are written in batches and repeat runs hit the cache.
+"""
+
+import json
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from music_minion.core.database import get_db_connection
+from music_minion.domain.ai import batch
+
+
+class _StubResponsesHandler(BaseHTTPRequestHandler):
+    """Answers POST /v1/responses with a fixed tag:reasoning JSON body."""
+
+    hits = 0
+    inputs: list[str] = []
+    lock = threading.Lock()
+
+    def do_POST(self):  # noqa: N802 - http.server naming
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length))
+        with self.lock:
+            type(self).hits += 1
+            type(self).inputs.append(request["input"])
+
+        # Echo part of the input so each track gets distinct tags
+        title = request["input"].split("**Title**: ", 1)[1].split("\n", 1)[0]
+        output_text = json.dumps(
+            {"dark": "Minor key", f"{title.lower()}-vibe": "Named after the track", "140": "BPM"}
+        )
+        body = json.dumps(
+            {
+                "id": "resp_stub",
+                "object": "response",
+                "created_at": 0,
+                "status": "completed",
+                "model": request["model"],
+                "output": [
+                    {
+                        "type": "message",
+                        "id": "msg_stub",
+                        "role": "assistant",
+                        "status": "completed",
+                        "content": [
+                            {"type": "output_text", "text": output_text, "annotations": []}
+                        ],
+                    }
+                ],
+                "usage": {
+                    "input_tokens": 100,
+                    "output_tokens": 20,
+                    "total_tokens": 120,
+                    "input_tokens_details": {"cached_tokens": 0},
+                    "output_tokens_details": {"reasoning_tokens": 0},
+                },
+                "parallel_tool_calls": True,
+                "tool_choice": "auto",
+                "tools": [],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """Local Responses API stub; yields its base URL."""
+    _StubResponsesHandler.hits = 0
+    _StubResponsesHandler.inputs = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubResponsesHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def test_db():
+    """Temp DB with the tables batch tagging reads and writes."""
+    import music_minion.core.database as db_module
+
+    temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    temp_db_path = Path(temp_db.name)
+    temp_db.close()
+
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: temp_db_path
+
+    with get_db_connection() as conn:
+        conn.execute(
+            "CREATE TABLE tracks (id INTEGER PRIMARY KEY, local_path TEXT, title TEXT, artist TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE notes (id INTEGER PRIMARY KEY, track_id INTEGER, note_text TEXT, timestamp TEXT)"
+        )
+        conn.execute(
+            """
+            CREATE TABLE tags (
+                id INTEGER PRIMARY KEY,
+                track_id INTEGER,
+                tag_name TEXT,
+                source TEXT,
+                confidence REAL,
+                reasoning TEXT,
+                blacklisted BOOLEAN DEFAULT FALSE,
+                UNIQUE (track_id, tag_name)
+            )
+            """
+        )
+        conn.execute(
+            "CREATE TABLE ratings (id INTEGER PRIMARY KEY, track_id INTEGER, rating_type TEXT)"
+        )
+        conn.execute(
+            """
+            CREATE TABLE ai_requests (
+                id INTEGER PRIMARY KEY, track_id INTEGER, request_type TEXT,
+                model_name TEXT, prompt_tokens INTEGER, completion_tokens INTEGER,
+                total_tokens INTEGER, cost_estimate REAL, response_time_ms INTEGER,
+                success BOOLEAN, error_message TEXT
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE ai_response_cache (
+                input_hash TEXT PRIMARY KEY, model_name TEXT NOT NULL,
+                output_text TEXT NOT NULL, prompt_tokens INTEGER,
+                completion_tokens INTEGER, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.executemany(
+            "INSERT INTO tracks (id, local_path, title, artist) VALUES (?, ?, ?, ?)",
+            [(i, f"/music/{i}.mp3", f"Song{i}", "Artist") for i in range(1, 6)],
+        )
+        # Tracks 1-4 have notes; track 4 is archived; track 5 has no notes
+        conn.executemany(
+            "INSERT INTO notes (track_id, note_text, timestamp) VALUES (?, ?, ?)",
+            [(i, f"note {i}", f"2025-01-0{i}") for i in range(1, 5)],
+        )
+        conn.execute("INSERT INTO ratings (track_id, rating_type) VALUES (4, 'archive')")
+        conn.executemany(
+            "INSERT INTO tags (track_id, tag_name, source, blacklisted) VALUES (1, ?, 'user', ?)",
+            [("warm", False), ("wrong-genre", True)],
+        )
+        conn.commit()
+
+    try:
+        yield temp_db_path
+    finally:
+        db_module.get_database_path = original_get_db_path
+        if temp_db_path.exists():
+            temp_db_path.unlink()
+
+
+def _ai_tags() -> dict[int, set[str]]:
+    with get_db_connection() as conn:
+        rows = conn.execute("SELECT track_id, tag_name FROM tags WHERE source = 'ai'").fetchall()
+    result: dict[int, set[str]] = {}
+    for row in rows:
+        result.setdefault(row["track_id"], set()).add(row["tag_name"])
+    return result
+
+
+def test_batch_tags_tracks_and_logs_usage(test_db, stub_api):
+    """Each eligible track is analyzed once; redundant tags are filtered."""
+    summary = batch.analyze_tracks_batch(concurrency=3, base_url=stub_api)
+
+    assert _StubResponsesHandler.hits == 3
+    assert (summary["total"], summary["analyzed"], summary["failed"]) == (3, 3, 0)
+    assert summary["prompt_tokens"] == 300
+    assert _ai_tags() == {i: {"dark", f"song{i}-vibe"} for i in (1, 2, 3)}
+    # Blacklisted tags stay out of the prompt
+    (song1,) = [text for text in _StubResponsesHandler.inputs if "Song1" in text]
+    assert "warm" in song1 and "wrong-genre" not in song1
+
+    with get_db_connection() as conn:
+        logged = conn.execute(
+            "SELECT COUNT(*), SUM(total_tokens) FROM ai_requests WHERE success = 1"
+        ).fetchone()
+    assert tuple(logged) == (3, 360)
+
+
+def test_repeat_run_is_served_from_cache(test_db, stub_api):
+    """Unchanged inputs reuse cached responses instead of calling the API."""
+    batch.analyze_tracks_batch(base_url=stub_api)
+    with get_db_connection() as conn:
+        conn.execute("DELETE FROM tags WHERE source = 'ai'")
+        conn.commit()
+
+    summary = batch.analyze_tracks_batch(base_url=stub_api)
+
+    assert _StubResponsesHandler.hits == 3
+    assert (summary["cached"], summary["analyzed"], summary["cost"]) == (3, 0, 0.0)
+    assert set(_ai_tags()) == {1, 2, 3}
+
+
+def test_cost_ceiling_skips_remaining_tracks(test_db, stub_api):
+    """Once the spend ceiling is hit, unsent tracks are skipped."""
+    summary = batch.analyze_tracks_batch(concurrency=1, max_cost=1e-9, base_url=stub_api)
+
+    assert _StubResponsesHandler.hits == 1
+    assert (summary["analyzed"], summary["skipped"]) == (1, 2)
+
+
+def test_rate_budget_waits_for_window():
+    """Requests beyond the per-minute budget wait for the window to slide."""
+    now = [0.0]
+    budget = batch.RateBudget(
+        requests_per_minute=2,
+        tokens_per_minute=1000,
+        clock=lambda: now[0],
+        sleep=lambda seconds: now.__setitem__(0, now[0] + seconds),
+    )
+
+    budget.acquire(10)
+    budget.acquire(10)
+    assert now[0] == 0.0
+    budget.acquire(10)
+    assert now[0] >= 60.0
+
+
+def test_unexpected_errors_fail_only_their_track(test_db, stub_api, monkeypatch):
+    """Non-API errors count as failures and the rest of the batch is saved."""
+    request_tags = batch._request_tags
+    parse_output = batch._parse_output
+
+    def flaky_request(client, input_text, budget):
+        if "Song2" in input_text:
+            raise ValueError("malformed response")
+        return request_tags(client, input_text, budget)
+
+    def flaky_parse(output_text):
+        if "song3-vibe" in output_text:
+            raise KeyError("output")
+        return parse_output(output_text)
+
+    monkeypatch.setattr(batch, "_request_tags", flaky_request)
+    monkeypatch.setattr(batch, "_parse_output", flaky_parse)
+    summary = batch.analyze_tracks_batch(concurrency=1, base_url=stub_api)
+
+    assert (summary["analyzed"], summary["failed"]) == (1, 2)
+    assert set(_ai_tags()) == {1}
+    with get_db_connection() as conn:
+        failures = conn.execute(
+            "SELECT track_id, error_message FROM ai_requests WHERE success = 0 ORDER BY track_id"
+        ).fetchall()
+    assert [tuple(row) for row in failures] == [
+        (2, "ValueError: malformed response"),
+        (3, "'output'"),
+    ]
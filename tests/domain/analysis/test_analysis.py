@@ -0,0 +1,248 @@
+"""
+Audio analysis: streaming analyzers over decoded chunks, and the library
+run that only re-analyzes missing or stale results.
+"""
+
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import music_minion.core.database as db_module
+from music_minion.core.database import (
+    get_audio_features,
+    get_db_connection,
+    get_tracks_needing_audio_analysis,
+    migrate_database,
+)
+from music_minion.domain.analysis import service
+from music_minion.domain.analysis.analyzers import (
+    ANALYZERS,
+    Analyzer,
+    EnergyAnalyzer,
+    LoudnessAnalyzer,
+    TimbreAnalyzer,
+)
+from music_minion.domain.analysis.keys import parse_camelot
+
+SR = 44100
+
+
+def _sine(amplitude: float, seconds: float, freq: float = 997.0) -> np.ndarray:
+    t = np.arange(int(SR * seconds)) / SR
+    mono = (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+    return np.stack([mono, mono], axis=1)
+
+
+def _run(analyzer_cls, signal: np.ndarray, chunk: int = SR * 3 + 17) -> dict:
+    analyzer = analyzer_cls(SR)
+    for start in range(0, len(signal), chunk):  # Uneven chunks: carries must line up
+        analyzer.feed(signal[start : start + chunk])
+    return analyzer.result()
+
+
+@pytest.mark.parametrize("amplitude,lufs", [(1.0, 0.0), (0.1, -20.0)])
+def test_loudness_matches_bs1770_reference(amplitude, lufs):
+    # A 997 Hz sine at 0 dBFS in both channels reads 0 LUFS
+    result = _run(LoudnessAnalyzer, _sine(amplitude, 20))
+    assert result["lufs"] == pytest.approx(lufs, abs=0.05)
+    assert result["lra"] == pytest.approx(0.0, abs=0.1)
+
+
+def test_loudness_gates_silence_and_energy_levels():
+    tone = _sine(0.1, 10)
+    with_silence = np.concatenate([tone, np.zeros((SR * 30, 2), dtype=np.float32)])
+    assert _run(LoudnessAnalyzer, with_silence)["lufs"] == pytest.approx(-20.0, abs=0.1)
+    assert _run(LoudnessAnalyzer, np.zeros((SR * 5, 2), dtype=np.float32))["lufs"] is None
+
+    energy = _run(EnergyAnalyzer, _sine(1.0, 5, freq=100.0))
+    assert energy["rms_db"] == pytest.approx(-3.01, abs=0.01)
+    assert energy["peak_db"] == pytest.approx(0.0, abs=0.01)
+    assert energy["bass_ratio"] > 0.95
+    assert _run(EnergyAnalyzer, _sine(1.0, 5, freq=5000.0))["spectral_centroid"] == pytest.approx(
+        5000, rel=0.02
+    )
+
+
+def test_parse_camelot():
+    assert parse_camelot("8a") == (8, "A")
+    assert parse_camelot(" 12B ") == (12, "B")
+    assert parse_camelot("F#m") == (11, "A")
+    assert parse_camelot("C major") == (8, "B")
+    assert parse_camelot("A minor") == (8, "A")
+    assert parse_camelot("bm") == (10, "A")
+    assert parse_camelot("Bb") == (6, "B")
+    assert parse_camelot("eb min") == (2, "A")
+    assert parse_camelot("F♯ Minor") == (11, "A")
+    assert parse_camelot("H minor") is None
+    assert parse_camelot("13A") is None
+    assert parse_camelot("") is None
+
+
+@pytest.fixture
+def test_db():
+    temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    temp_db_path = Path(temp_db.name)
+    temp_db.close()
+
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: temp_db_path
+    with get_db_connection() as conn:
+        conn.execute(
+            """CREATE TABLE tracks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, local_path TEXT, title TEXT,
+                bpm REAL, key_signature TEXT, file_mtime REAL,
+                source TEXT DEFAULT 'local', updated_at TIMESTAMP
+            )"""
+        )
+        migrate_database(conn, 64)
+        conn.commit()
+    try:
+        yield temp_db_path
+    finally:
+        db_module.get_database_path = original_get_db_path
+        temp_db_path.unlink(missing_ok=True)
+
+
+class FakeBpmKey(Analyzer):
+    name = "bpm_key"
+    version = 1
+    strength = 0.9
+
+    def feed(self, chunk):
+        pass
+
+    def result(self):
+        return {"bpm": 128.0, "key": "8A", "key_strength": self.strength}
+
+
+@pytest.fixture
+def library(test_db, tmp_path):
+    paths = []
+    with get_db_connection() as conn:
+        for i, (bpm, key) in enumerate([(None, None), (124.0, "5A"), (None, None)]):
+            path = tmp_path / f"{i}.mp3"
+            path.write_bytes(b"x")
+            paths.append(str(path))
+            conn.execute(
+                "INSERT INTO tracks (local_path, bpm, key_signature, file_mtime) VALUES (?, ?, ?, 1.0)",
+                (str(path), bpm, key),
+            )
+        conn.execute("INSERT INTO tracks (local_path) VALUES (NULL)")  # Streaming track
+        conn.commit()
+    Path(paths[2]).unlink()  # Tracked but gone
+
+    def fake_decode(path):
+        yield _sine(0.1, 4)
+
+    with (
+        patch.object(service, "_make_executor", lambda workers: ThreadPoolExecutor(workers)),
+        patch.object(service, "decode_pcm", fake_decode),
+        patch.object(service, "ffmpeg_path", lambda: "/usr/bin/ffmpeg"),
+        patch.dict(ANALYZERS, {"bpm_key": FakeBpmKey}),
+    ):
+        yield paths
+
+
+def test_analysis_runs_once_per_version(library):
+    summary = service.analyze_library(workers=2)
+    assert summary["total"] == 3
+    assert summary["analyzed"] == 2 and summary["missing"] == 1
+    # Tags win: only the untagged track gets the detected BPM/key
+    assert summary["bpm_filled"] == 1 and summary["keys_filled"] == 1
+    with get_db_connection() as conn:
+        rows = conn.execute("SELECT bpm, key_signature FROM tracks ORDER BY id").fetchall()
+    assert [tuple(row) for row in rows[:2]] == [(128.0, "8A"), (124.0, "5A")]
+    assert get_audio_features("loudness")[1]["lufs"] == pytest.approx(-20.0, abs=0.1)
+
+    # Current results are not redone; the missing file is retried
+    assert [t["local_path"] for t in get_tracks_needing_audio_analysis(
+        {name: cls.version for name, cls in ANALYZERS.items()}
+    )] == [library[2]]
+
+    # Upgrading one analyzer re-runs just that analyzer
+    with patch.object(LoudnessAnalyzer, "version", 2):
+        stale = get_tracks_needing_audio_analysis(
+            {name: cls.version for name, cls in ANALYZERS.items()}
+        )
+        assert [(t["id"], t["analyzers"]) for t in stale[:2]] == [(1, ["loudness"]), (2, ["loudness"])]
+
+    # So does a changed file
+    with get_db_connection() as conn:
+        conn.execute("UPDATE tracks SET file_mtime = 2.0 WHERE id = 2")
+        conn.commit()
+    assert service.analyze_library(limit=1, force=False)["total"] == 1
+
+
+def test_failed_analysis_is_retried(library):
+    class FlakyBpmKey(FakeBpmKey):
+        def result(self):
+            raise RuntimeError("decoder hiccup")
+
+    with patch.dict(ANALYZERS, {"bpm_key": FlakyBpmKey}):
+        assert service.analyze_library(workers=1, analyzers=["bpm_key"])["failed"] == 2
+
+    # Errored rows carry the current version and mtime but still count as stale
+    stale = get_tracks_needing_audio_analysis({"bpm_key": FakeBpmKey.version})
+    assert [t["id"] for t in stale] == [1, 2, 3]
+    summary = service.analyze_library(workers=1, analyzers=["bpm_key"])
+    assert summary["analyzed"] == 2 and summary["failed"] == 0
+    assert [t["id"] for t in get_tracks_needing_audio_analysis({"bpm_key": 1})] == [3]
+
+
+def test_worker_crash_restarts_pool_and_keeps_results(library, tmp_path):
+    with get_db_connection() as conn:
+        for i in range(3, 6):
+            path = tmp_path / f"{i}.mp3"
+            path.write_bytes(b"x")
+            conn.execute(
+                "INSERT INTO tracks (local_path, file_mtime) VALUES (?, 1.0)", (str(path),)
+            )
+        conn.commit()
+
+    def crashing_decode(path):
+        if path == library[1]:
+            os._exit(1)  # Native crash: the worker process dies outright
+        yield _sine(0.1, 4)
+
+    fork = multiprocessing.get_context("fork")
+    with (
+        patch.object(service, "decode_pcm", crashing_decode),
+        patch.object(
+            service, "_make_executor", lambda workers: ProcessPoolExecutor(workers, mp_context=fork)
+        ),
+    ):
+        summary = service.analyze_library(workers=1, analyzers=["bpm_key"])
+
+    assert summary["total"] == 6 and summary["failed"] >= 1
+    # Tracks queued after the crash ran in a fresh pool and were saved
+    stale = [t["id"] for t in get_tracks_needing_audio_analysis({"bpm_key": 1})]
+    assert 2 in stale
+    assert not {5, 6, 7} & set(stale)
+
+
+def test_low_confidence_keys_are_not_written(library):
+    with patch.object(FakeBpmKey, "strength", 0.3):
+        summary = service.analyze_library(workers=1, analyzers=["bpm_key"])
+    assert summary["bpm_filled"] == 1 and summary["keys_filled"] == 0
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT key_signature FROM tracks WHERE id = 1").fetchone()[0] is None
+
+    with pytest.raises(ValueError):
+        service.analyze_library(analyzers=["tempo"])
+
+
+def test_timbre_separates_spectra_and_skips_silence():
+    low = _run(TimbreAnalyzer, _sine(0.3, 5, freq=200.0))
+    high = _run(TimbreAnalyzer, _sine(0.3, 5, freq=3000.0))
+    assert len(low["mfcc_mean"]) == len(low["mfcc_std"]) == 13
+    assert low["mfcc_mean"][1] > high["mfcc_mean"][1]  # More energy in the low bands
+
+    padded = np.concatenate([np.zeros((SR * 5, 2), dtype=np.float32), _sine(0.3, 5, freq=200.0)])
+    assert _run(TimbreAnalyzer, padded)["mfcc_mean"] == pytest.approx(low["mfcc_mean"], abs=1.0)
+    assert _run(TimbreAnalyzer, np.zeros((SR, 2), dtype=np.float32))["mfcc_mean"] is None
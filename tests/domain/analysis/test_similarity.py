@@ -0,0 +1,144 @@
+"""
+Similar-track index: feature vectors, exact and IVF search, and rebuilds
+when the source tables change.
+"""
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+import music_minion.core.database as db_module
+from music_minion.core.database import get_db_connection, migrate_database
+from music_minion.domain.analysis import similarity
+
+
+@pytest.fixture
+def test_db(tmp_path):
+    db_path = tmp_path / "test.db"
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: db_path
+    with get_db_connection() as conn:
+        conn.execute("CREATE TABLE tracks (id INTEGER PRIMARY KEY, bpm REAL, key_signature TEXT)")
+        conn.execute(
+            """CREATE TABLE tags (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, track_id INTEGER, tag_name TEXT,
+                source TEXT DEFAULT 'user', blacklisted BOOLEAN DEFAULT FALSE
+            )"""
+        )
+        migrate_database(conn, 63)
+        conn.commit()
+    similarity._index = None
+    try:
+        yield db_path
+    finally:
+        similarity._index = None
+        db_module.get_database_path = original_get_db_path
+
+
+def _add_track(conn, track_id, bpm=None, key=None, energy=None, mfcc=None, tags=()):
+    conn.execute(
+        "INSERT INTO tracks (id, bpm, key_signature) VALUES (?, ?, ?)", (track_id, bpm, key)
+    )
+    if energy is not None:
+        conn.execute(
+            "INSERT INTO track_analysis (track_id, analyzer, version, features) VALUES (?, 'energy', 1, ?)",
+            (track_id, json.dumps(energy)),
+        )
+    if mfcc is not None:
+        conn.execute(
+            "INSERT INTO track_analysis (track_id, analyzer, version, features) VALUES (?, 'timbre', 1, ?)",
+            (track_id, json.dumps({"mfcc_mean": mfcc[:13], "mfcc_std": mfcc[13:]})),
+        )
+    for tag in tags:
+        conn.execute("INSERT INTO tags (track_id, tag_name) VALUES (?, ?)", (track_id, tag))
+
+
+@pytest.fixture
+def library(test_db):
+    """Two styles: fast 8A techno and slow 3B ambient, plus an unanalyzed track."""
+    rng = np.random.default_rng(0)
+    techno = rng.normal(0, 5, 26)
+    ambient = rng.normal(0, 5, 26)
+    with get_db_connection() as conn:
+        for track_id in range(1, 11):
+            fast = track_id <= 5
+            _add_track(
+                conn,
+                track_id,
+                bpm=(130 if fast else 70) + track_id % 3,
+                key="8A" if fast else "3B",
+                energy={"rms_db": -8 if fast else -20, "bass_ratio": 0.5 if fast else 0.1},
+                mfcc=((techno if fast else ambient) + rng.normal(0, 0.5, 26)).tolist(),
+                tags=["techno", "dark"] if fast else ["ambient"],
+            )
+        _add_track(conn, 11)  # Nothing known about it
+        conn.commit()
+    return test_db
+
+
+def test_similar_tracks_ranks_same_style_first(library):
+    results = similarity.similar_tracks(1, k=4)
+    assert {track_id for track_id, _ in results} == {2, 3, 4, 5}
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+    assert similarity.similar_tracks(11) == []  # No features, not indexed
+    assert 11 not in similarity.get_similarity_index().ids
+    assert {t for t, _ in similarity.similar_tracks(1, k=20)} == set(range(2, 11))
+
+    # Exclusions and restrictions
+    assert {t for t, _ in similarity.similar_tracks(1, k=2, exclude=[2, 3])} == {4, 5}
+    assert [t for t, _ in similarity.similar_tracks(1, k=5, within=[7, 8, 4, 99])][0] == 4
+
+
+def test_index_is_memory_mapped_and_shared(library):
+    meta = similarity.build_similarity_index()
+    index = similarity.get_similarity_index()
+    assert isinstance(index.vectors, np.memmap)
+    assert index.meta["build"] == meta["build"]
+    assert np.allclose(np.linalg.norm(index.vectors, axis=1), 1.0, atol=1e-5)
+    assert (library.parent / "similarity" / "current").read_text() == meta["build"]
+
+
+def test_ivf_search_matches_exact_search(test_db):
+    rng = np.random.default_rng(1)
+    centres = rng.normal(0, 5, (20, 26))
+    with get_db_connection() as conn:
+        for track_id in range(1, 601):
+            mfcc = centres[track_id % 20] + rng.normal(0, 1, 26)
+            _add_track(conn, track_id, bpm=100 + track_id % 50, mfcc=mfcc.tolist())
+        conn.commit()
+
+    with patch.object(similarity, "EXACT_SEARCH_MAX", 0), patch.object(similarity, "NPROBE", 4):
+        meta = similarity.build_similarity_index()
+        index = similarity.get_similarity_index()
+    assert meta["lists"] == 24
+
+    hits = 0
+    for seed in range(1, 601, 20):
+        approximate = {t for t, _ in index.search(seed, 10)}
+        exact = {t for t, _ in index.search(seed, 10, within=index.ids)}
+        hits += len(approximate & exact)
+    assert hits / (30 * 10) >= 0.9
+
+    # Excluding most of the library widens the probe instead of coming up short
+    assert len(index.search(1, 10, exclude=range(2, 590))) == 10
+
+
+def test_changes_trigger_background_rebuild(library):
+    first = similarity.get_similarity_index()
+    with get_db_connection() as conn:
+        _add_track(conn, 12, bpm=131, key="8A", tags=["techno"])
+        conn.commit()
+
+    # Within the debounce interval the current build keeps serving
+    assert similarity.get_similarity_index() is first
+    with patch.object(similarity, "REBUILD_INTERVAL_SECONDS", 0):
+        assert similarity.get_similarity_index() is first
+        similarity._rebuild_thread.join(timeout=30)
+        rebuilt = similarity.get_similarity_index()
+    assert rebuilt is not first
+    assert 12 in rebuilt.ids
+    assert rebuilt.meta["versions"]["tags"] > first.meta["versions"]["tags"]
@@ -0,0 +1,158 @@
+"""
+Streaming SoundCloud likes ingestion: per-page writes, prefetching,
+incremental early stop, and resuming from the stored cursor.
+"""
+
+import threading
+
+import pytest
+import requests
+
+import music_minion.core.database as db_module
+from music_minion.core.database import get_db_connection, migrate_database
+from music_minion.domain.library.provider import ProviderConfig, ProviderState
+from music_minion.domain.library.providers.soundcloud import api
+
+FIRST_PAGE = f"{api.API_BASE_URL}/me/likes/tracks"
+
+
+def _liked(track_id: int) -> dict:
+    return {"kind": "track", "id": track_id, "title": f"Track {track_id}", "duration": 180000}
+
+
+class FakeLikes:
+    """Serves likes newest first, 3 per page; can fail a page once."""
+
+    def __init__(self, track_ids: list[int], fail_page: int = -1):
+        self.pages = [track_ids[i : i + 3] for i in range(0, len(track_ids), 3)]
+        self.fail_page = fail_page
+        self.requested: list[int] = []
+        self.threads: set[str] = set()
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        page = 0 if url == FIRST_PAGE else int(url.rsplit("=", 1)[1])
+        self.requested.append(page)
+        self.threads.add(threading.current_thread().name)
+        if page == self.fail_page:
+            self.fail_page = -1
+            raise requests.ConnectionError("connection reset")
+        next_page = page + 1
+        response = requests.Response()
+        response.status_code = 200
+        response._content = requests.compat.json.dumps(
+            {
+                "collection": [_liked(t) for t in self.pages[page]] + [{"kind": "playlist"}],
+                "next_href": f"{FIRST_PAGE}?cursor={next_page}"
+                if next_page < len(self.pages)
+                else None,
+            }
+        ).encode()
+        return response
+
+
+@pytest.fixture
+def test_db(tmp_path, monkeypatch):
+    """Temp DB with minimal tracks + ratings schema, migrated to v69."""
+    db_path = tmp_path / "test.db"
+    monkeypatch.setattr(db_module, "get_database_path", lambda: db_path)
+    monkeypatch.setattr(api.auth, "is_token_expired", lambda token_data: False)
+    with get_db_connection() as conn:
+        conn.execute(
+            """CREATE TABLE tracks (
+                id INTEGER PRIMARY KEY, title TEXT, artist TEXT, genre TEXT, duration REAL,
+                year INTEGER, bpm REAL, artwork_url TEXT, source TEXT, soundcloud_id TEXT,
+                soundcloud_synced_at TIMESTAMP
+            )"""
+        )
+        conn.execute(
+            "CREATE UNIQUE INDEX idx_tracks_soundcloud_id ON tracks (source, soundcloud_id) WHERE soundcloud_id IS NOT NULL"
+        )
+        conn.execute(
+            """CREATE TABLE ratings (
+                id INTEGER PRIMARY KEY, track_id INTEGER, rating_type TEXT, hour_of_day INTEGER,
+                day_of_week INTEGER, context TEXT, source TEXT
+            )"""
+        )
+        conn.commit()
+        migrate_database(conn, 68)
+    return db_path
+
+
+def _state() -> ProviderState:
+    return ProviderState(
+        ProviderConfig(name="soundcloud"),
+        authenticated=True,
+        cache={"token_data": {"access_token": "token"}},
+    )
+
+
+def _synced() -> tuple[list[str], int]:
+    with get_db_connection() as conn:
+        ids = [row[0] for row in conn.execute("SELECT soundcloud_id FROM tracks ORDER BY id")]
+        likes = conn.execute("SELECT COUNT(*) FROM ratings WHERE source = 'soundcloud'").fetchone()[0]
+    return ids, likes
+
+
+def test_pages_are_prefetched(monkeypatch):
+    fake = FakeLikes(list(range(1, 8)))
+    second_page_requested = threading.Event()
+
+    def get(url, **kwargs):
+        response = fake.get(url, **kwargs)
+        if fake.requested[-1] == 1:
+            second_page_requested.set()
+        return response
+
+    monkeypatch.setattr(api.requests, "get", get)
+    pages = api.iter_likes_pages("token")
+
+    tracks, next_href = next(pages)
+    assert [t for t, _ in tracks] == ["1", "2", "3"]
+    assert next_href.endswith("cursor=1")
+    # Page 1 downloads while the caller is still holding page 0
+    assert second_page_requested.wait(timeout=5)
+    assert [len(page) for page, _ in pages] == [3, 1]
+    assert fake.requested == [0, 1, 2]
+    assert all(name.startswith("sc-likes") for name in fake.threads)
+
+
+def test_ingest_writes_pages_and_stops_at_existing(test_db, monkeypatch):
+    progress = []
+    monkeypatch.setattr(api.requests, "get", FakeLikes(list(range(10, 0, -1))).get)
+    state, stats = api.ingest_library(
+        _state(), incremental=False, progress_callback=lambda event, data: progress.append(data)
+    )
+    assert state.authenticated
+    assert (stats["created"], stats["likes"], stats["pages"]) == (10, 10, 4)
+    assert [p["tracks_seen"] for p in progress] == [3, 6, 9, 10]
+
+    # Two new likes: incremental sync reads one page and writes only them
+    fake = FakeLikes([12, 11] + list(range(10, 0, -1)))
+    monkeypatch.setattr(api.requests, "get", fake.get)
+    _, stats = api.ingest_library(_state(), incremental=True)
+    assert (stats["created"], stats["skipped"], stats["likes"]) == (2, 1, 2)
+    ids, likes = _synced()
+    assert sorted(map(int, ids)) == list(range(1, 13))
+    assert likes == 12
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM provider_sync_cursors").fetchone()[0] == 0
+
+
+def test_interrupted_sync_resumes_from_cursor(test_db, monkeypatch):
+    fake = FakeLikes(list(range(9, 0, -1)), fail_page=2)
+    monkeypatch.setattr(api.requests, "get", fake.get)
+    _, stats = api.ingest_library(_state(), incremental=False)
+    assert stats["created"] == 6  # Pages 0 and 1 were written before the failure
+    with get_db_connection() as conn:
+        cursor = conn.execute("SELECT next_href, incremental FROM provider_sync_cursors").fetchone()
+    assert cursor["next_href"].endswith("cursor=2")
+    assert not cursor["incremental"]
+
+    # Resumes at page 2 in full mode, even though asked for incremental
+    fake.requested.clear()
+    _, stats = api.ingest_library(_state(), incremental=True)
+    assert fake.requested == [2]
+    assert stats["created"] == 3
+    ids, likes = _synced()
+    assert sorted(map(int, ids)) == list(range(1, 10))
+    assert likes == 9
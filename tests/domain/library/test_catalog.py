@@ -0,0 +1,176 @@
+"""
+Content fingerprints ignore tags, and the file catalog turns move, duplicate
+and format-twin detection into lookups.
+"""
+
+import os
+import random
+import struct
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import music_minion.core.database as db_module
+from music_minion.core.database import get_db_connection, migrate_database
+from music_minion.domain.library import catalog
+from music_minion.domain.library.fingerprint import SAMPLE_BYTES, content_fingerprint
+from music_minion.domain.sync.engine import detect_missing_and_moved_files
+
+
+def _synchsafe(n: int) -> bytes:
+    return bytes([(n >> 21) & 0x7F, (n >> 14) & 0x7F, (n >> 7) & 0x7F, n & 0x7F])
+
+
+def _mp3(audio: bytes, tags: bytes) -> bytes:
+    id3v2 = b"ID3\x04\x00\x00" + _synchsafe(len(tags)) + tags
+    return id3v2 + audio + b"TAG" + tags[:125].ljust(125, b"\0")
+
+
+def _flac(audio: bytes, tags: bytes) -> bytes:
+    streaminfo = b"\x00" + (34).to_bytes(3, "big") + b"\x11" * 34
+    comment = b"\x84" + len(tags).to_bytes(3, "big") + tags  # Last block
+    return b"fLaC" + streaminfo + comment + audio
+
+
+def _ogg_page(payload: bytes, granule: int, seq: int) -> bytes:
+    segments = [255] * (len(payload) // 255) + [len(payload) % 255]
+    header = b"OggS\x00\x00" + struct.pack("<qII", granule, 7, seq) + b"\0\0\0\0"
+    return header + bytes([len(segments)]) + bytes(segments) + payload
+
+
+def _ogg(audio: bytes, tags: bytes) -> bytes:
+    # Comment header split over as many pages as its size needs
+    packets = [b"OpusHead" + b"\x01" * 11]
+    comment = b"OpusTags" + tags
+    packets += [comment[i : i + 4000] for i in range(0, len(comment), 4000)]
+    packets += [audio[i : i + 4000] for i in range(0, len(audio), 4000)]
+    headers = 1 + -(-len(comment) // 4000)
+    return b"".join(
+        _ogg_page(packet, 0 if seq < headers else 960 * seq, seq)
+        for seq, packet in enumerate(packets)
+    )
+
+
+def _wav(audio: bytes, tags: bytes) -> bytes:
+    fmt = b"fmt " + struct.pack("<I", 16) + b"\x01" * 16
+    info = b"LIST" + struct.pack("<I", len(tags)) + tags + b"\0" * (len(tags) & 1)
+    data = b"data" + struct.pack("<I", len(audio)) + audio
+    body = b"WAVE" + fmt + info + data
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def _m4a(audio: bytes, tags: bytes) -> bytes:
+    def box(kind: bytes, payload: bytes) -> bytes:
+        return struct.pack(">I", 8 + len(payload)) + kind + payload
+
+    return box(b"ftyp", b"M4A \0\0\0\0") + box(b"moov", box(b"udta", tags)) + box(b"mdat", audio)
+
+
+@pytest.mark.parametrize("build", [_mp3, _flac, _ogg, _wav, _m4a])
+@pytest.mark.parametrize("audio_size", [5000, 5 * SAMPLE_BYTES + 123])
+def test_fingerprint_ignores_tags_but_not_audio(tmp_path, build, audio_size):
+    rng = random.Random(audio_size)
+    audio = rng.randbytes(audio_size)
+
+    def fingerprint(audio, tags):
+        path = tmp_path / "track"
+        path.write_bytes(build(audio, tags))
+        return content_fingerprint(str(path))
+
+    original = fingerprint(audio, b"TITLE=Song")
+    assert original == fingerprint(audio, b"TITLE=Song (Remix) " + rng.randbytes(20000))
+    changed = bytearray(audio)
+    changed[-10] ^= 0xFF
+    assert original != fingerprint(bytes(changed), b"TITLE=Song")
+
+
+@pytest.fixture
+def test_db():
+    temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    temp_db_path = Path(temp_db.name)
+    temp_db.close()
+
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: temp_db_path
+    with get_db_connection() as conn:
+        conn.execute(
+            """CREATE TABLE tracks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, local_path TEXT, title TEXT,
+                artist TEXT, file_mtime REAL, source TEXT DEFAULT 'local'
+            )"""
+        )
+        migrate_database(conn, 63)
+        conn.commit()
+    try:
+        yield temp_db_path
+    finally:
+        db_module.get_database_path = original_get_db_path
+        temp_db_path.unlink(missing_ok=True)
+
+
+def _write(path: Path, audio: bytes, tags: bytes = b"") -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(_mp3(audio, tags))
+    return str(path)
+
+
+def test_refresh_only_fingerprints_changed_files(test_db, tmp_path):
+    a = _write(tmp_path / "a.mp3", b"a" * 1000)
+    b = _write(tmp_path / "b.mp3", b"b" * 1000)
+    assert catalog.refresh_catalog([a, b])["hashed"] == 2
+    assert catalog.refresh_catalog([a, b])["unchanged"] == 2
+
+    # A rename keeps the inode: the old hash is reused, nothing is read
+    moved = str(tmp_path / "sub" / "a.mp3")
+    os.makedirs(tmp_path / "sub")
+    os.rename(a, moved)
+    assert catalog.refresh_catalog([moved]) == {"hashed": 0, "renamed": 1, "unchanged": 0, "failed": 0}
+
+    _write(tmp_path / "b.mp3", b"B" * 1000)
+    os.utime(b, (1, 1))
+    assert catalog.refresh_catalog([b])["hashed"] == 1
+
+
+def test_duplicates_twins_and_moves_are_lookups(test_db, tmp_path):
+    song = _write(tmp_path / "Album" / "Song.mp3", b"song" * 500, b"v1")
+    copy = _write(tmp_path / "Copies" / "Song (1).mp3", b"song" * 500, b"retagged")
+    opus = tmp_path / "Album" / "Song.opus"
+    opus.write_bytes(_ogg(b"transcoded" * 100, b""))
+    other = _write(tmp_path / "Album" / "Other.mp3", b"other" * 500)
+    catalog.refresh_catalog([song, copy, str(opus), other])
+
+    assert catalog.find_duplicate_files() == [sorted([song, copy])]
+    assert catalog.find_duplicate_files([str(tmp_path / "Album")]) == []
+    assert catalog.find_twins([str(opus)], ".mp3") == {str(opus): song}
+
+    renamed = str(tmp_path / "Elsewhere" / "track01.mp3")
+    os.makedirs(tmp_path / "Elsewhere")
+    os.rename(other, renamed)
+    catalog.refresh_catalog([renamed])
+    assert catalog.match_moved_files([other], [renamed, copy]) == {other: [renamed]}
+
+
+def test_cleanup_relocates_renamed_files_by_fingerprint(test_db, tmp_path):
+    old = _write(tmp_path / "Album" / "01 Song.mp3", b"song" * 500)
+    catalog.refresh_catalog([old])
+    with get_db_connection() as conn:
+        conn.execute("INSERT INTO tracks (local_path, title) VALUES (?, 'Song')", (old,))
+        conn.commit()
+
+    # Renamed and moved: the filename fallback could never match this
+    new = tmp_path / "Artist" / "Song [remastered].mp3"
+    new.parent.mkdir()
+    os.rename(old, new)
+
+    config = Mock()
+    config.music.library_paths = [str(tmp_path)]
+    config.music.supported_formats = [".mp3"]
+    result = detect_missing_and_moved_files(config)
+
+    assert result["relocated"] == 1 and result["deleted"] == 0
+    assert result["actions"][0]["reason"] == "fingerprint"
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT local_path FROM tracks").fetchone()[0] == str(new)
+        assert [row[0] for row in conn.execute("SELECT path FROM file_catalog")] == [str(new)]
@@ -0,0 +1,184 @@
+"""
+The library watcher applies debounced filesystem events as incremental
+upserts, relocations and deletions; reconciliation catches what it missed.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import music_minion.core.database as db_module
+from music_minion.core.config import Config
+from music_minion.core.database import get_db_connection, migrate_database
+from music_minion.domain.library import metadata, watcher
+from music_minion.domain.library.models import Track
+from music_minion.domain.library.watcher import ChangeQueue, FileChange, apply_changes
+
+
+@pytest.fixture
+def library(tmp_path):
+    temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    temp_db_path = Path(temp_db.name)
+    temp_db.close()
+
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: temp_db_path
+    with get_db_connection() as conn:
+        conn.execute(
+            """CREATE TABLE tracks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, local_path TEXT, title TEXT, artist TEXT,
+                remix_artist TEXT, album TEXT, genre TEXT, year INTEGER, duration REAL,
+                key_signature TEXT, bpm REAL, file_mtime REAL, source TEXT DEFAULT 'local',
+                updated_at TIMESTAMP
+            )"""
+        )
+        migrate_database(conn, 63)
+        conn.commit()
+
+    config = Config()
+    config.music.library_paths = [str(tmp_path)]
+    config.music.supported_formats = [".mp3", ".opus"]
+
+    def fake_extract(path):
+        return Track(local_path=path, title=Path(path).read_text() or Path(path).stem)
+
+    try:
+        with patch.object(metadata, "extract_track_metadata", fake_extract), patch(
+            "music_minion.domain.playlists.filters.refresh_all_smart_playlists"
+        ) as refresh:
+            yield tmp_path, config, refresh
+    finally:
+        db_module.get_database_path = original_get_db_path
+        temp_db_path.unlink(missing_ok=True)
+
+
+def _tracks():
+    with get_db_connection() as conn:
+        return {
+            row["local_path"]: (row["id"], row["title"])
+            for row in conn.execute("SELECT id, local_path, title FROM tracks")
+        }
+
+
+def _add(path: Path, title: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(title)
+
+
+def test_queue_debounces_and_keeps_order():
+    queue = ChangeQueue(debounce_seconds=2.0, max_delay_seconds=30.0)
+    queue.add(FileChange("upsert", "/m/a.mp3"), now=0.0)
+    queue.add(FileChange("upsert", "/m/a.mp3"), now=1.0)  # Collapsed
+    queue.add(FileChange("move", "/m/a.mp3", "/m/b.mp3"), now=1.5)
+    queue.add(FileChange("upsert", "/m/a.mp3"), now=1.9)
+
+    assert queue.pop_ready(now=3.0) == []  # Still settling
+    assert [(c.kind, c.path) for c in queue.pop_ready(now=4.0)] == [
+        ("upsert", "/m/a.mp3"),
+        ("move", "/m/a.mp3"),
+        ("upsert", "/m/a.mp3"),
+    ]
+
+    # A steady trickle of events is flushed once the batch is overdue
+    for second in range(31):
+        queue.add(FileChange("upsert", f"/m/{second}.mp3"), now=100.0 + second)
+        if second < 30:
+            assert queue.pop_ready(now=100.0 + second) == []
+    assert len(queue.pop_ready(now=130.0)) == 31
+
+
+def test_create_modify_delete(library):
+    root, config, refresh = library
+    _add(root / "a.mp3", "First")
+    _add(root / "notes.txt", "ignored")
+    apply_changes([FileChange("upsert", str(root / "a.mp3")), FileChange("upsert", str(root / "notes.txt"))], config)
+    assert {p: t for p, (_, t) in _tracks().items()} == {str(root / "a.mp3"): "First"}
+    refresh.assert_called_once()
+
+    (root / "a.mp3").write_text("Retagged")
+    assert apply_changes([FileChange("upsert", str(root / "a.mp3"))], config)["updated"] == 1
+    assert _tracks()[str(root / "a.mp3")][1] == "Retagged"
+
+    # Deleted then recreated before the batch ran: kept
+    stats = apply_changes([FileChange("delete", str(root / "a.mp3"))], config)
+    assert stats["deleted"] == 0 and str(root / "a.mp3") in _tracks()
+
+    (root / "a.mp3").unlink()
+    assert apply_changes([FileChange("delete", str(root / "a.mp3"))], config)["deleted"] == 1
+    assert _tracks() == {}
+
+
+def test_moves_keep_track_identity(library):
+    root, config, _ = library
+    for name in ("a.mp3", "b.mp3"):
+        _add(root / "album" / name)
+    apply_changes([FileChange("upsert", str(root / "album"), is_directory=True)], config)
+    ids = {Path(p).name: track_id for p, (track_id, _) in _tracks().items()}
+
+    (root / "album" / "a.mp3").rename(root / "renamed.mp3")
+    (root / "album").rename(root / "moved")
+    changes = [
+        FileChange("move", str(root / "album" / "a.mp3"), str(root / "renamed.mp3")),
+        FileChange("move", str(root / "album"), str(root / "moved"), is_directory=True),
+        # inotify also reports each file of a moved directory
+        FileChange("move", str(root / "album" / "b.mp3"), str(root / "moved" / "b.mp3")),
+    ]
+    with patch.object(watcher, "_upsert_files", wraps=watcher._upsert_files) as upsert:
+        stats = apply_changes(changes, config)
+
+    assert stats["relocated"] == 2 and stats["added"] == 0
+    upsert.assert_not_called()  # Nothing re-read
+    assert {p: track_id for p, (track_id, _) in _tracks().items()} == {
+        str(root / "renamed.mp3"): ids["a.mp3"],
+        str(root / "moved" / "b.mp3"): ids["b.mp3"],
+    }
+
+
+def test_atomic_save_and_rename_out_of_library_formats(library):
+    root, config, _ = library
+    _add(root / "a.mp3", "Old")
+    apply_changes([FileChange("upsert", str(root / "a.mp3"))], config)
+    track_id = _tracks()[str(root / "a.mp3")][0]
+
+    # Tagger writes a temp file and renames it over the original
+    _add(root / "a.mp3", "New")
+    apply_changes([FileChange("move", str(root / ".a.mp3.tmp"), str(root / "a.mp3"))], config)
+    assert _tracks()[str(root / "a.mp3")] == (track_id, "New")
+
+    (root / "a.mp3").rename(root / "a.mp3.bak")
+    apply_changes([FileChange("move", str(root / "a.mp3"), str(root / "a.mp3.bak"))], config)
+    assert _tracks() == {}
+
+
+def test_reconcile_catches_missed_changes(library):
+    root, config, refresh = library
+    _add(root / "old" / "moved.mp3", "Moved")
+    _add(root / "gone.mp3", "Gone")
+    apply_changes([FileChange("upsert", str(root), is_directory=True)], config)
+    moved_id = _tracks()[str(root / "old" / "moved.mp3")][0]
+
+    # Changes made while nothing was watching
+    _add(root / "new" / "moved.mp3", "Moved")
+    (root / "old" / "moved.mp3").unlink()
+    (root / "gone.mp3").unlink()
+    _add(root / "fresh.opus", "Fresh")
+    _add(root / "fresh.sync-conflict-20250101.opus", "Fresh")
+    refresh.reset_mock()
+
+    stats = watcher.reconcile_library(config)
+    assert stats == {"added": 1, "updated": 0, "relocated": 1, "deleted": 1}
+    assert set(_tracks()) == {str(root / "new" / "moved.mp3"), str(root / "fresh.opus")}
+    assert _tracks()[str(root / "new" / "moved.mp3")][0] == moved_id
+    refresh.assert_called_once()
+
+
+def test_reconcile_skips_unavailable_library(library):
+    root, config, _ = library
+    _add(root / "a.mp3")
+    apply_changes([FileChange("upsert", str(root / "a.mp3"))], config)
+    config.music.library_paths.append(str(root / "unmounted"))
+
+    assert not any(watcher.reconcile_library(config).values())
+    assert str(root / "a.mp3") in _tracks()
@@ -0,0 +1,150 @@
+"""Tests for buffered listen-session accounting (listen_tracker.py)."""
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from music_minion.core import database
+from music_minion.domain.playback.listen_tracker import ListenAccumulator
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make(flush_seconds: float = 15.0):
+    clock = FakeClock()
+    writes: list[dict[int, float]] = []
+    acc = ListenAccumulator(flush_seconds, clock=clock, writer=writes.append)
+    return acc, clock, writes
+
+
+def _play(acc: ListenAccumulator, clock: FakeClock, session_id: int, seconds: int, step: float = 1.0) -> None:
+    for _ in range(int(seconds / step)):
+        clock.now += step
+        acc.tick(session_id, True)
+
+
+def test_one_write_per_flush_interval_instead_of_per_second() -> None:
+    acc, clock, writes = _make(flush_seconds=15)
+    acc.tick(1, True)
+    _play(acc, clock, 1, 60)
+
+    assert len(writes) == 4
+    assert sum(w[1] for w in writes) == pytest.approx(60)
+    stats = acc.stats()
+    assert stats["playing_ticks"] == 60
+    assert stats["flushes"] == 4
+    assert stats["writes_saved"] == 56
+
+
+def test_elapsed_time_not_tick_count_is_recorded() -> None:
+    """Fast polling (e.g. 10 Hz for Spotify) must not inflate seconds_played."""
+    acc, clock, writes = _make()
+    acc.tick(1, True)
+    _play(acc, clock, 1, 10, step=0.1)
+    acc.flush()
+    assert sum(w[1] for w in writes) == pytest.approx(10)
+
+
+def test_pause_and_track_change_flush_immediately() -> None:
+    acc, clock, writes = _make()
+    acc.tick(1, True)
+    _play(acc, clock, 1, 3)
+    acc.tick(1, False)
+    assert writes == [{1: pytest.approx(3)}]
+
+    clock.now += 600  # Paused time is not counted
+    acc.tick(1, True)
+    _play(acc, clock, 1, 2)
+    acc.tick(2, True, started_at=clock.now - 1)
+    assert writes[-1] == {1: pytest.approx(2)}
+
+    acc.flush()
+    assert writes[-1] == {2: pytest.approx(1)}
+
+
+def test_long_gaps_are_ignored() -> None:
+    acc, clock, writes = _make()
+    acc.tick(1, True)
+    clock.now += 3600  # Laptop suspended mid-track
+    acc.tick(1, True)
+    acc.flush()
+    assert writes == []
+
+
+def test_failed_flush_keeps_time_for_retry() -> None:
+    clock = FakeClock()
+    calls: list[dict[int, float]] = []
+
+    def flaky(batch: dict[int, float]) -> None:
+        calls.append(dict(batch))
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+
+    acc = ListenAccumulator(clock=clock, writer=flaky)
+    acc.tick(1, True)
+    _play(acc, clock, 1, 4)
+    assert acc.flush() == 0
+    _play(acc, clock, 1, 1)
+    assert acc.flush() == 1
+    assert calls[-1] == {1: pytest.approx(5)}
+
+
+def test_add_listen_seconds_updates_sessions_in_one_transaction(tmp_path: Path) -> None:
+    db_path = tmp_path / "test.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """
+        CREATE TABLE track_listen_sessions (
+            session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            track_id INTEGER NOT NULL,
+            play_date DATE NOT NULL,
+            playlist_id INTEGER NULL,
+            seconds_played REAL NOT NULL DEFAULT 0
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE track_listen_daily (
+            play_date DATE NOT NULL,
+            track_id INTEGER NOT NULL,
+            playlist_id INTEGER NOT NULL DEFAULT 0,
+            sessions INTEGER NOT NULL DEFAULT 0,
+            seconds_played REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (play_date, track_id, playlist_id)
+        )
+        """
+    )
+    conn.executemany(
+        "INSERT INTO track_listen_sessions (track_id, play_date) VALUES (?, '2026-01-01')",
+        [(1,), (2,)],
+    )
+    conn.commit()
+    conn.close()
+
+    with patch.object(database, "get_database_path", return_value=db_path):
+        database.add_listen_seconds({1: 12.5, 2: 3.0})
+        database.add_listen_seconds({1: 2.5})
+        database.add_listen_seconds({})
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute(
+        "SELECT session_id, seconds_played FROM track_listen_sessions ORDER BY session_id"
+    ).fetchall()
+    conn.close()
+    assert rows == [(1, 15.0), (2, 3.0)]
+
+    conn = sqlite3.connect(db_path)
+    daily = conn.execute(
+        "SELECT track_id, seconds_played FROM track_listen_daily ORDER BY track_id"
+    ).fetchall()
+    conn.close()
+    assert daily == [(1, 15.0), (2, 3.0)]
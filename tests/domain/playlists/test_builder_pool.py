@@ -0,0 +1,145 @@
+"""
+Builder sessions draw candidates from a pool shuffled once at session start:
+the whole filtered library is sampled, add/skip consume it without
+re-running the candidate query, and filter edits reshuffle.
+"""
+
+import random
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import music_minion.core.database as db_module
+from music_minion.core.database import get_db_connection, migrate_database
+from music_minion.domain.playlists import builder
+
+SCHEMA = [
+    """CREATE TABLE tracks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, local_path TEXT, title TEXT, artist TEXT,
+        album TEXT, genre TEXT, year INTEGER, bpm REAL, key_signature TEXT
+    )""",
+    "CREATE TABLE track_emojis (track_id INTEGER, emoji_id TEXT)",
+    "CREATE TABLE ratings (id INTEGER PRIMARY KEY, track_id INTEGER, rating_type TEXT)",
+    "CREATE TABLE playlists (id INTEGER PRIMARY KEY, type TEXT, track_count INTEGER, updated_at TEXT)",
+    "CREATE TABLE playlist_tracks (playlist_id INTEGER, track_id INTEGER, position INTEGER)",
+    "CREATE TABLE playlist_builder_skipped (playlist_id INTEGER, track_id INTEGER, skipped_at TEXT, UNIQUE (playlist_id, track_id))",
+    """CREATE TABLE playlist_builder_filters (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, playlist_id INTEGER, field TEXT, operator TEXT,
+        value TEXT, conjunction TEXT DEFAULT 'AND'
+    )""",
+    """CREATE TABLE playlist_builder_sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, playlist_id INTEGER UNIQUE NOT NULL,
+        last_processed_track_id INTEGER, started_at TEXT, updated_at TEXT
+    )""",
+]
+PLAYLIST = 1
+
+
+@pytest.fixture
+def test_db():
+    temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    temp_db_path = Path(temp_db.name)
+    temp_db.close()
+
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: temp_db_path
+
+    with get_db_connection() as conn:
+        for statement in SCHEMA:
+            conn.execute(statement)
+        migrate_database(conn, 62)
+        conn.execute("INSERT INTO playlists (id, type, track_count) VALUES (?, 'manual', 0)", (PLAYLIST,))
+        conn.executemany(
+            "INSERT INTO tracks (local_path, artist, genre) VALUES (?, ?, ?)",
+            [
+                (f"/music/{n}.opus", f"Artist {n:03d}", "house" if n % 2 else "techno")
+                for n in range(1, 201)
+            ],
+        )
+        conn.commit()
+
+    try:
+        yield temp_db_path
+    finally:
+        builder.invalidate_candidate_pool(PLAYLIST)
+        db_module.get_database_path = original_get_db_path
+        temp_db_path.unlink(missing_ok=True)
+
+
+def _drain(limit=1000):
+    """Skip through the pool, returning candidates in the order handed out."""
+    seen = []
+    while len(seen) < limit:
+        candidate = builder.get_next_candidate(PLAYLIST, seen[-1] if seen else None)
+        if candidate is None:
+            break
+        seen.append(candidate["id"])
+        builder.skip_track(PLAYLIST, candidate["id"])
+    return seen
+
+
+def test_session_samples_whole_library_with_one_query(test_db):
+    random.seed(3)
+    with patch.object(builder, "match_filters", wraps=builder.match_filters) as match:
+        builder.start_builder_session(PLAYLIST)
+        seen = _drain()
+
+    assert sorted(seen) == list(range(1, 201))  # Every candidate, each once
+    assert seen != sorted(seen)  # Shuffled, not the alphabetical first page
+    # Built at session start; the final rebuild only confirms the pool is empty
+    assert match.call_count == 2
+
+
+def test_peek_matches_upcoming_order(test_db):
+    builder.start_builder_session(PLAYLIST)
+    current = builder.get_next_candidate(PLAYLIST)["id"]
+    upcoming = builder.peek_next_candidates(PLAYLIST, current, count=3)
+
+    handed_out = []
+    for _ in range(3):
+        builder.skip_track(PLAYLIST, current)
+        current = builder.get_next_candidate(PLAYLIST, current)["id"]
+        handed_out.append(current)
+    assert handed_out == upcoming
+
+
+def test_filter_edit_reshuffles_pool(test_db):
+    builder.start_builder_session(PLAYLIST)
+    builder.set_builder_filters(
+        PLAYLIST, [{"field": "genre", "operator": "equals", "value": "techno", "conjunction": "AND"}]
+    )
+    seen = _drain()
+    assert sorted(seen) == list(range(2, 201, 2))
+
+
+def test_tracks_taken_elsewhere_are_passed_over(test_db):
+    builder.start_builder_session(PLAYLIST)
+    upcoming = builder.peek_next_candidates(PLAYLIST, current_track_id=-1, count=2)
+    with get_db_connection() as conn:
+        # Another client adds the next candidate; it must not be offered
+        conn.execute("INSERT INTO playlist_tracks VALUES (?, ?, 0)", (PLAYLIST, upcoming[0]))
+        conn.commit()
+
+    assert builder.get_next_candidate(PLAYLIST)["id"] == upcoming[1]
+
+
+def test_more_like_this_picks_nearest_remaining_candidate(test_db):
+    def fake_similar(seed, k, within):
+        ranked = sorted((t for t in within if t != seed), key=lambda t: abs(t - seed))
+        return [(t, 1.0) for t in ranked[:k]]
+
+    builder.start_builder_session(PLAYLIST)
+    with patch("music_minion.domain.analysis.similar_tracks", fake_similar):
+        first = builder.get_next_candidate(PLAYLIST, like_track_id=50)["id"]
+        assert first in (49, 51)
+        builder.skip_track(PLAYLIST, first)
+        second = builder.get_next_candidate(PLAYLIST, first, like_track_id=50)["id"]
+        assert {first, second} == {49, 51}
+        assert set(builder.peek_next_candidates(PLAYLIST, second, count=2, like_track_id=50)) == {48, 52}
+
+    # A seed without features falls back to the shuffled pool order
+    with patch("music_minion.domain.analysis.similar_tracks", lambda seed, k, within: []):
+        upcoming = builder.peek_next_candidates(PLAYLIST, current_track_id=-1, count=1)
+        assert builder.get_next_candidate(PLAYLIST, like_track_id=50)["id"] == upcoming[0]
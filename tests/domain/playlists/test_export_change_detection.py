@@ -0,0 +1,143 @@
+"""
+Tests for change-detected auto-export: unchanged (playlist, format) outputs
+are skipped, changes rewrite atomically, and scheduled exports coalesce.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from music_minion.core.database import get_db_connection
+from music_minion.domain.playlists import exporters
+
+
+@pytest.fixture
+def test_db():
+    """Temp DB with the tables export reads and writes."""
+    import music_minion.core.database as db_module
+
+    temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    temp_db_path = Path(temp_db.name)
+    temp_db.close()
+
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: temp_db_path
+
+    with get_db_connection() as conn:
+        conn.execute(
+            "CREATE TABLE tracks (id INTEGER PRIMARY KEY, local_path TEXT, title TEXT, artist TEXT, duration REAL)"
+        )
+        conn.execute(
+            "CREATE TABLE playlists (id INTEGER PRIMARY KEY, name TEXT, type TEXT, description TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE playlist_tracks (playlist_id INTEGER, track_id INTEGER, position INTEGER, added_at TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE playlist_elo_ratings (playlist_id INTEGER, track_id INTEGER, rating REAL, comparison_count INTEGER, wins INTEGER)"
+        )
+        conn.execute(
+            """
+            CREATE TABLE playlist_exports (
+                playlist_id INTEGER NOT NULL,
+                format TEXT NOT NULL,
+                output_path TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                exported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (playlist_id, format)
+            )
+            """
+        )
+        conn.executemany(
+            "INSERT INTO tracks (id, local_path, title, artist, duration) VALUES (?, ?, ?, ?, ?)",
+            [
+                (1, "/music/EDM/a.mp3", "A", "Artist", 200),
+                (2, "/music/EDM/b.mp3", "B", "Artist", 180),
+            ],
+        )
+        conn.execute("INSERT INTO playlists (id, name, type) VALUES (1, 'Peak', 'manual')")
+        conn.execute("INSERT INTO playlist_tracks VALUES (1, 1, 0, NULL)")
+        conn.commit()
+
+    try:
+        yield temp_db_path
+    finally:
+        db_module.get_database_path = original_get_db_path
+        if temp_db_path.exists():
+            temp_db_path.unlink()
+
+
+def _auto_export(library_root: Path) -> list:
+    return exporters.auto_export_playlist(1, ["m3u8", "csv"], library_root)
+
+
+def test_unchanged_playlist_is_not_rewritten(test_db, tmp_path):
+    """Second auto-export with identical content skips every format."""
+    first = _auto_export(tmp_path)
+    assert [fmt for fmt, _, _ in first] == ["m3u8", "csv"]
+    m3u8_path = tmp_path / "playlists" / "Peak.m3u8"
+    assert "/music/EDM/a.mp3" in m3u8_path.read_text()
+
+    with patch.object(exporters, "_atomic_write_text") as write:
+        second = _auto_export(tmp_path)
+
+    write.assert_not_called()
+    assert second == first
+
+
+def test_changed_playlist_is_rewritten(test_db, tmp_path):
+    """Adding a track changes the content hash and rewrites the output."""
+    _auto_export(tmp_path)
+    with get_db_connection() as conn:
+        conn.execute("INSERT INTO playlist_tracks VALUES (1, 2, 1, NULL)")
+        conn.commit()
+
+    results = _auto_export(tmp_path)
+
+    assert results[0][2] == 2
+    assert "/music/EDM/b.mp3" in (tmp_path / "playlists" / "Peak.m3u8").read_text()
+    # Atomic writes leave no temp files behind
+    assert not list((tmp_path / "playlists").glob(".*.tmp"))
+
+
+def test_exports_follow_the_umask(test_db, tmp_path):
+    """Atomic writes don't leave exports with mkstemp's private 0600 mode."""
+    with patch.object(exporters, "_UMASK", 0o022):
+        _auto_export(tmp_path)
+    m3u8_path = tmp_path / "playlists" / "Peak.m3u8"
+    assert m3u8_path.stat().st_mode & 0o777 == 0o644
+
+
+def test_deleted_output_is_recreated(test_db, tmp_path):
+    """A stored hash does not suppress export when the file is gone."""
+    _auto_export(tmp_path)
+    m3u8_path = tmp_path / "playlists" / "Peak.m3u8"
+    m3u8_path.unlink()
+
+    _auto_export(tmp_path)
+
+    assert m3u8_path.exists()
+
+
+def test_scheduled_exports_coalesce():
+    """A burst of schedule calls for one playlist runs a single export."""
+    with (
+        patch.object(exporters, "EXPORT_DEBOUNCE_SECONDS", 0.05),
+        patch.object(exporters, "load_config"),
+        patch.object(exporters, "get_auto_export_options", return_value={}),
+        patch.object(exporters, "auto_export_playlist") as export,
+    ):
+        for _ in range(10):
+            exporters.schedule_auto_export(7)
+        exporters.schedule_auto_export(8)
+
+        deadline = time.monotonic() + 2
+        while export.call_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+    exported = sorted(call.kwargs["playlist_id"] for call in export.call_args_list)
+    assert exported == [7, 8]
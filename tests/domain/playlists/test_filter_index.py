@@ -0,0 +1,238 @@
+"""
+The bitmap filter index must return exactly what the SQL filter query did,
+for every field/operator, conjunction mix and builder sort order, and must
+notice writes made after it was built.
+"""
+
+import random
+import tempfile
+from pathlib import Path
+
+import pytest
+
+import music_minion.core.database as db_module
+from music_minion.core.database import get_db_connection, migrate_database
+from music_minion.domain.playlists import builder, filter_index
+from music_minion.domain.playlists.filters import build_filter_query, evaluate_filters
+
+SCHEMA = [
+    """CREATE TABLE tracks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, local_path TEXT, title TEXT, artist TEXT,
+        album TEXT, genre TEXT, year INTEGER, bpm REAL, key_signature TEXT
+    )""",
+    """CREATE TABLE track_emojis (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, track_id INTEGER NOT NULL, emoji_id TEXT NOT NULL
+    )""",
+    """CREATE TABLE ratings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, track_id INTEGER NOT NULL, rating_type TEXT NOT NULL
+    )""",
+    "CREATE TABLE playlist_tracks (playlist_id INTEGER, track_id INTEGER, position INTEGER)",
+    "CREATE TABLE playlist_builder_skipped (playlist_id INTEGER, track_id INTEGER)",
+    """CREATE TABLE playlist_builder_filters (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, playlist_id INTEGER, field TEXT, operator TEXT,
+        value TEXT, conjunction TEXT DEFAULT 'AND'
+    )""",
+    """CREATE TABLE playlist_filters (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, playlist_id INTEGER, field TEXT, operator TEXT,
+        value TEXT, conjunction TEXT DEFAULT 'AND'
+    )""",
+    "CREATE TABLE elo_ratings (track_id INTEGER PRIMARY KEY, rating REAL)",
+    """CREATE TABLE playlist_elo_ratings (
+        track_id INTEGER, playlist_id INTEGER, rating REAL, comparison_count INTEGER, wins INTEGER
+    )""",
+]
+
+GENRES = ["Dubstep", "dubstep", "Drum & Bass", "Übergang", "house_music", None]
+ARTISTS = ["Skrillex", "skream", "100% Pure", "Noisia", "Ëlan", None]
+PLAYLIST = 1
+
+
+@pytest.fixture
+def test_db():
+    temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    temp_db_path = Path(temp_db.name)
+    temp_db.close()
+
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: temp_db_path
+
+    rng = random.Random(41)
+    with get_db_connection() as conn:
+        for statement in SCHEMA:
+            conn.execute(statement)
+        migrate_database(conn, 62)
+        for n in range(1, 301):
+            conn.execute(
+                """
+                INSERT INTO tracks (local_path, title, artist, album, genre, year, bpm, key_signature)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    rng.choice([f"/music/{n}.opus", f"/music/{n}.mp3", "", None]),
+                    rng.choice([f"Track {n}", f"track_{n}", "50% Off", None]),
+                    rng.choice(ARTISTS),
+                    rng.choice([f"Album {n % 7}", None]),
+                    rng.choice(GENRES),
+                    rng.choice([2019, 2020, 2024, 2025, None]),
+                    rng.choice([127.9, 128.0, 128.5, 140, 174.25, None]),
+                    rng.choice(["8A", "8B", "11A", None]),
+                ),
+            )
+            for emoji in rng.sample(["🔥", "💤", "🎉"], rng.randint(0, 2)):
+                conn.execute(
+                    "INSERT INTO track_emojis (track_id, emoji_id) VALUES (?, ?)", (n, emoji)
+                )
+            if rng.random() < 0.1:
+                conn.execute(
+                    "INSERT INTO ratings (track_id, rating_type) VALUES (?, 'archive')", (n,)
+                )
+            if rng.random() < 0.2:
+                conn.execute(
+                    "INSERT INTO playlist_tracks VALUES (?, ?, ?)", (PLAYLIST, n, n)
+                )
+            elif rng.random() < 0.1:
+                conn.execute("INSERT INTO playlist_builder_skipped VALUES (?, ?)", (PLAYLIST, n))
+            if rng.random() < 0.5:
+                conn.execute(
+                    "INSERT INTO elo_ratings VALUES (?, ?)", (n, rng.choice([1400.0, 1500.0, 1620.5]))
+                )
+        conn.commit()
+
+    try:
+        yield temp_db_path
+    finally:
+        db_module.get_database_path = original_get_db_path
+        temp_db_path.unlink(missing_ok=True)
+
+
+def _sql_ids(filters):
+    where, params = build_filter_query(filters)
+    with get_db_connection() as conn:
+        rows = conn.execute(f"SELECT t.id FROM tracks t WHERE {where}", params).fetchall()
+    return {row[0] for row in rows}
+
+
+def _index_ids(filters):
+    return set(filter_index.bitmap_to_ids(filter_index.match_filters(filters)))
+
+
+SINGLE_FILTERS = [
+    ("genre", op, value)
+    for op in ("contains", "starts_with", "ends_with", "equals", "not_equals")
+    for value in ("step", "DUB", "dubstep", "ü", "e_m", "%", "Drum & Bass")
+] + [
+    ("artist", "contains", "100%"),
+    ("artist", "starts_with", "s"),
+    ("title", "contains", "_"),
+    ("title", "ends_with", "0"),
+    ("local_path", "ends_with", ".OPUS"),
+    ("key", "equals", "8A"),
+    ("key", "not_equals", "8A"),
+    ("album", "starts_with", "album 3"),
+] + [
+    (field, op, value)
+    for op in ("equals", "not_equals", "gt", "lt", "gte", "lte")
+    for field, value in (("year", "2020"), ("year", "2022"), ("bpm", "128"), ("bpm", "128.5"), ("bpm", "130"))
+] + [("emoji", "has", "🔥"), ("emoji", "not_has", "💤"), ("emoji", "has", "🐢")]
+
+
+@pytest.mark.parametrize("field,operator,value", SINGLE_FILTERS)
+def test_single_filter_matches_sql(test_db, field, operator, value):
+    filters = [{"field": field, "operator": operator, "value": value, "conjunction": "AND"}]
+    assert _index_ids(filters) == _sql_ids(filters)
+
+
+def test_conjunctions_follow_sql_precedence(test_db):
+    rng = random.Random(7)
+    for _ in range(40):
+        filters = [
+            {"field": field, "operator": op, "value": value, "conjunction": rng.choice(["AND", "OR"])}
+            for field, op, value in rng.sample(SINGLE_FILTERS, rng.randint(2, 4))
+        ]
+        assert _index_ids(filters) == _sql_ids(filters), filters
+
+
+def _reference_candidates(filters, order_column, direction):
+    """The builder's previous COUNT/page query."""
+    filter_where, params = build_filter_query(filters) if filters else ("", [])
+    if filter_where:
+        filter_where = f"({filter_where}) AND "
+    with get_db_connection() as conn:
+        rows = conn.execute(
+            f"""
+            SELECT t.id FROM tracks t
+            LEFT JOIN elo_ratings er ON er.track_id = t.id
+            WHERE {filter_where}
+                t.local_path IS NOT NULL AND t.local_path != ''
+                AND NOT EXISTS (SELECT 1 FROM playlist_tracks WHERE playlist_id = ? AND track_id = t.id)
+                AND NOT EXISTS (SELECT 1 FROM playlist_builder_skipped WHERE playlist_id = ? AND track_id = t.id)
+                AND NOT EXISTS (SELECT 1 FROM ratings WHERE rating_type = 'archive' AND track_id = t.id)
+            ORDER BY {order_column} {direction} NULLS LAST, t.id ASC
+            """,
+            (*params, PLAYLIST, PLAYLIST),
+        ).fetchall()
+    return [row[0] for row in rows]
+
+
+@pytest.mark.parametrize(
+    "sort_field", ["artist", "title", "year", "bpm", "genre", "key_signature", "elo_rating"]
+)
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_candidate_pages_match_sql(test_db, sort_field, direction):
+    filters = [
+        {"field": "genre", "operator": "contains", "value": "step", "conjunction": "OR"},
+        {"field": "bpm", "operator": "gte", "value": "140", "conjunction": "AND"},
+    ]
+    builder.set_builder_filters(PLAYLIST, filters)
+    order_column = "COALESCE(er.rating, 1500.0)" if sort_field == "elo_rating" else f"t.{sort_field}"
+    expected = _reference_candidates(filters, order_column, direction.upper())
+
+    pages = []
+    for offset in range(0, len(expected) + 20, 20):
+        tracks, total = builder.get_candidate_tracks(PLAYLIST, sort_field, direction, 20, offset)
+        assert total == len(expected)
+        pages.extend(track["id"] for track in tracks)
+    assert pages == expected
+
+
+def test_index_follows_writes(test_db):
+    filters = [{"field": "genre", "operator": "equals", "value": "Techno", "conjunction": "AND"}]
+    builder.set_builder_filters(PLAYLIST, filters)
+    assert builder.get_candidate_tracks(PLAYLIST)[1] == 0
+
+    with get_db_connection() as conn:
+        conn.execute("UPDATE tracks SET genre = 'Techno', local_path = '/m/a.mp3' WHERE id IN (1, 2, 3)")
+        conn.execute("DELETE FROM playlist_tracks WHERE track_id IN (1, 2, 3)")
+        conn.execute("DELETE FROM playlist_builder_skipped WHERE track_id IN (1, 2, 3)")
+        conn.execute("DELETE FROM ratings WHERE track_id IN (1, 2, 3)")
+        conn.commit()
+    assert builder.get_candidate_tracks(PLAYLIST)[1] == 3
+
+    with get_db_connection() as conn:
+        conn.execute("INSERT INTO playlist_tracks VALUES (?, 1, 999)", (PLAYLIST,))
+        conn.execute("INSERT INTO ratings (track_id, rating_type) VALUES (2, 'archive')")
+        conn.commit()
+    tracks, total = builder.get_candidate_tracks(PLAYLIST)
+    assert total == 1 and [t["id"] for t in tracks] == [3]
+
+
+def test_evaluate_filters_excludes_skipped_and_unplayable(test_db):
+    with get_db_connection() as conn:
+        conn.execute(
+            "INSERT INTO playlist_filters (playlist_id, field, operator, value) VALUES (?, 'emoji', 'has', '🔥')",
+            (PLAYLIST,),
+        )
+        conn.commit()
+        expected = {
+            row[0]
+            for row in conn.execute(
+                """
+                SELECT t.id FROM tracks t JOIN track_emojis te ON te.track_id = t.id
+                WHERE te.emoji_id = '🔥' AND t.local_path != ''
+                AND t.id NOT IN (SELECT track_id FROM playlist_builder_skipped WHERE playlist_id = ?)
+                """,
+                (PLAYLIST,),
+            )
+        }
+
+    assert {track["id"] for track in evaluate_filters(PLAYLIST)} == expected
@@ -0,0 +1,130 @@
+"""
+Tests for bulk playlist import resolution: path index lookups must resolve
+known tracks without touching the filesystem and insert in one batch.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from music_minion.core.database import get_db_connection
+from music_minion.domain.playlists import importers
+
+
+LIBRARY_ROOT = Path("/home/kevin/Music")
+
+
+@pytest.fixture
+def test_db():
+    """Temp DB with minimal tracks + playlists + playlist_tracks schema."""
+    import music_minion.core.database as db_module
+
+    temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    temp_db_path = Path(temp_db.name)
+    temp_db.close()
+
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: temp_db_path
+
+    with get_db_connection() as conn:
+        conn.execute("CREATE TABLE tracks (id INTEGER PRIMARY KEY, local_path TEXT)")
+        conn.execute(
+            """
+            CREATE TABLE playlists (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                type TEXT NOT NULL DEFAULT 'manual',
+                track_count INTEGER DEFAULT 0,
+                updated_at TEXT,
+                library TEXT NOT NULL DEFAULT 'local',
+                soundcloud_playlist_id TEXT
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE playlist_tracks (
+                playlist_id INTEGER NOT NULL,
+                track_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                UNIQUE (playlist_id, track_id)
+            )
+            """
+        )
+        conn.execute("CREATE TABLE active_library (id INTEGER PRIMARY KEY, provider TEXT)")
+        conn.executemany(
+            "INSERT INTO tracks (id, local_path) VALUES (?, ?)",
+            [
+                (1, "/home/kevin/Music/EDM/Artist - Song.mp3"),
+                (2, "/home/kevin/Music/House/Deep Cut.opus"),
+                (3, "/home/kevin/Music/Dubstep/Wobble #1.mp3"),
+            ],
+        )
+        conn.execute("INSERT INTO playlists (id, name) VALUES (1, 'imported')")
+        conn.commit()
+
+    try:
+        yield temp_db_path
+    finally:
+        db_module.get_database_path = original_get_db_path
+        if temp_db_path.exists():
+            temp_db_path.unlink()
+
+
+def _playlist_rows() -> list[tuple[int, int]]:
+    with get_db_connection() as conn:
+        cursor = conn.execute(
+            "SELECT track_id, position FROM playlist_tracks WHERE playlist_id = 1 ORDER BY position"
+        )
+        return [(row["track_id"], row["position"]) for row in cursor.fetchall()]
+
+
+def test_resolves_known_tracks_without_filesystem(test_db):
+    """Absolute, Serato drive-relative, URL-encoded and case-mismatched entries resolve in memory."""
+    entries = [
+        "/home/kevin/Music/EDM/Artist - Song.mp3",  # absolute
+        "Users/kevin/Music/House/Deep Cut.opus",  # Serato (Mac drive-relative)
+        "C:\\Users\\kevin\\Music\\Dubstep\\Wobble%20%231.mp3",  # Windows + URL-encoded
+        "edm/artist - song.MP3",  # case-folded library-relative (duplicate of 1)
+    ]
+
+    with patch.object(importers, "resolve_relative_path") as fs_resolve:
+        added, duplicates, unresolved = importers._add_tracks_from_paths(
+            1, LIBRARY_ROOT / "playlists" / "set.m3u8", entries, LIBRARY_ROOT
+        )
+
+    fs_resolve.assert_not_called()
+    assert (added, duplicates, unresolved) == (3, 1, [])
+    assert _playlist_rows() == [(1, 0), (2, 1), (3, 2)]
+
+
+def test_unknown_entries_fall_back_and_stay_unresolved(test_db):
+    """Entries missing from the index fall back to the filesystem resolver."""
+    with patch.object(importers, "resolve_relative_path", return_value=None) as fs_resolve:
+        added, duplicates, unresolved = importers._add_tracks_from_paths(
+            1, LIBRARY_ROOT / "set.m3u8", ["Missing/track.mp3", "EDM/Artist - Song.mp3"], LIBRARY_ROOT
+        )
+
+    fs_resolve.assert_called_once()
+    assert (added, duplicates, unresolved) == (1, 0, ["Missing/track.mp3"])
+
+
+def test_appends_after_existing_tracks(test_db):
+    """Bulk insert continues positions and skips tracks already in the playlist."""
+    with get_db_connection() as conn:
+        conn.execute("INSERT INTO playlist_tracks (playlist_id, track_id, position) VALUES (1, 2, 0)")
+        conn.commit()
+
+    added, duplicates, _ = importers._add_tracks_from_paths(
+        1,
+        LIBRARY_ROOT / "set.m3u8",
+        ["House/Deep Cut.opus", "EDM/Artist - Song.mp3"],
+        LIBRARY_ROOT,
+    )
+
+    assert (added, duplicates) == (1, 1)
+    assert _playlist_rows() == [(2, 0), (1, 1)]
+    with get_db_connection() as conn:
+        assert conn.execute("SELECT track_count FROM playlists WHERE id = 1").fetchone()[0] == 1
@@ -0,0 +1,120 @@
+"""
+Fractional playlist positions: single-row moves, minimal-write reorders,
+renumbering when gaps run out, and the v67 migration.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import music_minion.core.database as db_module
+from music_minion.core.database import get_db_connection, migrate_database
+from music_minion.domain.playlists import crud, ordering
+
+
+@pytest.fixture
+def test_db(tmp_path):
+    """Temp DB with minimal playlists + playlist_tracks schema, one 50-track playlist."""
+    db_path = tmp_path / "test.db"
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: db_path
+    with get_db_connection() as conn:
+        conn.execute("CREATE TABLE playlists (id INTEGER PRIMARY KEY, updated_at TEXT)")
+        conn.execute(
+            """CREATE TABLE playlist_tracks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                playlist_id INTEGER NOT NULL,
+                track_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                UNIQUE (playlist_id, track_id)
+            )"""
+        )
+        conn.execute("INSERT INTO playlists (id) VALUES (1)")
+        conn.executemany(
+            "INSERT INTO playlist_tracks (playlist_id, track_id, position) VALUES (1, ?, ?)",
+            [(track_id, track_id - 1) for track_id in range(1, 51)],
+        )
+        conn.commit()
+    try:
+        yield db_path
+    finally:
+        db_module.get_database_path = original_get_db_path
+
+
+def _order(conn) -> list[int]:
+    return [track_id for track_id, _ in ordering.get_order(conn, "playlist_tracks", 1)]
+
+
+def test_move_writes_one_row(test_db):
+    with get_db_connection() as conn:
+        before = conn.total_changes
+        assert ordering.move_track(conn, "playlist_tracks", 1, 40, 2)
+        assert conn.total_changes - before == 1
+        expected = list(range(1, 51))
+        expected.remove(40)
+        expected.insert(2, 40)
+        assert _order(conn) == expected
+
+        assert ordering.move_track(conn, "playlist_tracks", 1, 40, 0)
+        assert _order(conn)[0] == 40
+        assert ordering.move_track(conn, "playlist_tracks", 1, 40, 999)
+        assert _order(conn)[-1] == 40
+        assert not ordering.move_track(conn, "playlist_tracks", 1, 99, 0)
+
+
+def test_reorder_playlist_track_matches_list_semantics(test_db):
+    expected = list(range(1, 51))
+    for from_pos, to_pos in [(0, 49), (10, 3), (25, 26), (49, 0), (7, 7)]:
+        assert crud.reorder_playlist_track(1, from_pos, to_pos)
+        expected.insert(to_pos, expected.pop(from_pos))
+        with get_db_connection() as conn:
+            assert _order(conn) == expected
+    assert not crud.reorder_playlist_track(1, 50, 0)
+    assert not crud.reorder_playlist_track(1, 0, 50)
+
+
+def test_repeated_moves_into_one_gap_renumber(test_db):
+    with patch.object(ordering, "schedule_renumber") as schedule:
+        with get_db_connection() as conn:
+            # Always drop the last track between the first two: the gap halves each time
+            for _ in range(45):
+                last = _order(conn)[-1]
+                ordering.move_track(conn, "playlist_tracks", 1, last, 1)
+            order = _order(conn)
+            conn.commit()
+    assert schedule.called  # Queued well before the gap ran out
+    assert order == [1] + list(range(6, 51)) + [2, 3, 4, 5]
+
+    with get_db_connection() as conn:
+        ordering.renumber_positions(conn, "playlist_tracks", 1)
+        positions = [p for _, p in ordering.get_order(conn, "playlist_tracks", 1)]
+        assert positions == list(range(50))
+        assert _order(conn) == order
+
+
+def test_apply_order_writes_only_moved_rows(test_db):
+    with get_db_connection() as conn:
+        wanted = list(range(1, 51))
+        wanted.insert(10, wanted.pop(45))
+        assert ordering.apply_order(conn, "playlist_tracks", 1, wanted) == 1
+        assert _order(conn) == wanted
+
+        reversed_order = wanted[::-1]
+        assert ordering.apply_order(conn, "playlist_tracks", 1, reversed_order) == 49
+        assert _order(conn) == reversed_order
+
+        # Unlisted tracks keep their relative order at the end, unknown IDs are ignored
+        ordering.apply_order(conn, "playlist_tracks", 1, [5, 3, 999])
+        assert _order(conn)[:2] == [5, 3]
+        assert _order(conn)[2:] == [t for t in reversed_order if t not in (3, 5)]
+
+
+def test_migration_makes_positions_distinct(test_db):
+    with get_db_connection() as conn:
+        conn.execute("UPDATE playlist_tracks SET position = 7 WHERE track_id IN (3, 4, 5)")
+        conn.execute("UPDATE playlist_tracks SET position = position * 10 WHERE track_id > 5")
+        conn.commit()
+        order = _order(conn)
+        migrate_database(conn, 66)
+        assert [p for _, p in ordering.get_order(conn, "playlist_tracks", 1)] == list(range(50))
+        assert _order(conn) == order
@@ -0,0 +1,148 @@
+"""
+Provider playlist sync: change probes, rate-limited concurrent track-list
+fetches, minimal playlist diffs, and the sync run log.
+"""
+
+import threading
+
+import pytest
+
+import music_minion.core.database as db_module
+from music_minion.core.database import get_db_connection, migrate_database
+from music_minion.domain.ai.batch import RateBudget
+from music_minion.domain.library.provider import ProviderConfig, ProviderState
+from music_minion.domain.playlists import ordering, sync
+
+
+def test_track_list_requests_and_probe():
+    assert sync.track_list_requests("soundcloud", 950) == 1
+    assert sync.track_list_requests("spotify", 0) == 1
+    assert sync.track_list_requests("spotify", 250) == 3
+
+    existing = {"provider_last_modified": "snap-1", "provider_track_count": 12}
+    assert sync.playlist_unchanged({"last_modified": "snap-1", "track_count": 12}, existing)
+    # Opaque markers compare by equality, not ordering
+    assert not sync.playlist_unchanged({"last_modified": "snap-0", "track_count": 12}, existing)
+    assert not sync.playlist_unchanged({"last_modified": "snap-1", "track_count": 13}, existing)
+    assert not sync.playlist_unchanged({"last_modified": None, "track_count": 12}, existing)
+    assert not sync.playlist_unchanged({"last_modified": "snap-1", "track_count": 12}, None)
+    # Rows synced before provider_track_count existed trust the marker alone
+    assert sync.playlist_unchanged(
+        {"last_modified": "snap-1", "track_count": 5}, {"provider_last_modified": "snap-1"}
+    )
+
+
+class FakeProvider:
+    """Returns one track per playlist; records the threads it was called from."""
+
+    def __init__(self, fail_id=None):
+        self.fail_id = fail_id
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def get_playlist_tracks(self, state, playlist_id):
+        with self.lock:
+            self.threads.add(threading.current_thread().name)
+        if playlist_id == self.fail_id:
+            raise RuntimeError("boom")
+        return state, [(f"{playlist_id}-t", {"title": playlist_id})], "2024-01-01"
+
+
+def test_fetch_playlist_tracks_concurrently_within_budget():
+    clock = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    budget = RateBudget(5, 0, clock=lambda: clock[0], sleep=sleep)
+    provider = FakeProvider(fail_id="p3")
+    playlists = [{"id": f"p{i}", "track_count": 150} for i in range(4)]
+    state = ProviderState(ProviderConfig(name="spotify"), authenticated=True)
+
+    state, results, api_calls = sync.fetch_playlist_tracks(
+        provider, state, "spotify", playlists, workers=3, budget=budget
+    )
+    assert state.authenticated
+    assert api_calls == 8  # Two pages each
+    assert set(results) == {"p0", "p1", "p2"}  # p3 failed and is left out
+    assert results["p1"] == ([("p1-t", {"title": "p1"})], "2024-01-01")
+    assert sum(sleeps) >= 60.0  # 8 requests at 5/minute waited for the window
+    assert any(name.startswith("playlist-sync") for name in provider.threads)
+
+
+def test_fetch_stops_after_auth_failure():
+    class Expired(FakeProvider):
+        def get_playlist_tracks(self, state, playlist_id):
+            super().get_playlist_tracks(state, playlist_id)
+            return state.with_authenticated(False), [], None
+
+    provider = Expired()
+    state, results, _ = sync.fetch_playlist_tracks(
+        provider,
+        ProviderState(ProviderConfig(name="soundcloud"), authenticated=True),
+        "soundcloud",
+        [{"id": "a"}, {"id": "b"}],
+    )
+    assert not state.authenticated
+    assert list(results) == ["a"]
+
+
+@pytest.fixture
+def test_db(tmp_path):
+    """Temp DB with minimal playlists + playlist_tracks schema, migrated to v68."""
+    db_path = tmp_path / "test.db"
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: db_path
+    with get_db_connection() as conn:
+        conn.execute("CREATE TABLE playlists (id INTEGER PRIMARY KEY, updated_at TEXT)")
+        conn.execute(
+            """CREATE TABLE playlist_tracks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                playlist_id INTEGER NOT NULL,
+                track_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                UNIQUE (playlist_id, track_id)
+            )"""
+        )
+        conn.execute("INSERT INTO playlists (id) VALUES (1)")
+        conn.executemany(
+            "INSERT INTO playlist_tracks (playlist_id, track_id, position) VALUES (1, ?, ?)",
+            [(track_id, track_id - 1) for track_id in range(1, 21)],
+        )
+        conn.commit()
+        migrate_database(conn, 67)
+    try:
+        yield db_path
+    finally:
+        db_module.get_database_path = original_get_db_path
+
+
+def test_apply_playlist_diff_writes_only_changes(test_db):
+    wanted = [t for t in range(1, 21) if t != 7] + [21, 22]
+    wanted.insert(0, wanted.pop(10))
+    with get_db_connection() as conn:
+        before = conn.total_changes
+        assert sync.apply_playlist_diff(conn, 1, wanted + [21]) == (2, 1)
+        # 1 delete + 2 inserts + 1 moved row
+        assert conn.total_changes - before == 4
+        assert [t for t, _ in ordering.get_order(conn, "playlist_tracks", 1)] == wanted
+
+        before = conn.total_changes
+        assert sync.apply_playlist_diff(conn, 1, wanted) == (0, 0)
+        assert conn.total_changes == before
+
+
+def test_record_sync_run(test_db):
+    sync.record_sync_run(
+        "spotify",
+        1_700_000_000.0,
+        {"playlists_total": 40, "playlists_skipped": 37, "api_calls": 5, "api_calls_saved": 61},
+    )
+    with get_db_connection() as conn:
+        row = dict(conn.execute("SELECT * FROM playlist_sync_log").fetchone())
+    assert row["provider"] == "spotify"
+    assert (row["playlists_total"], row["playlists_skipped"], row["playlists_fetched"]) == (40, 37, 0)
+    assert (row["api_calls"], row["api_calls_saved"]) == (5, 61)
+    assert row["completed_at"] is not None and row["duration_seconds"] > 0
@@ -0,0 +1,188 @@
+"""
+Harmonic-mixing sequencer: Camelot/BPM transition costs, greedy + 2-opt
+ordering, energy arcs, and the playlist and radio entry points.
+"""
+
+import time
+from datetime import date
+
+import numpy as np
+import pytest
+
+import music_minion.core.database as db_module
+from music_minion.core.database import get_db_connection
+from music_minion.domain.library.models import Track
+from music_minion.domain.playlists import sequencer
+from music_minion.domain.playlists.crud import reorder_playlist_for_mixing
+from music_minion.domain.radio import timeline
+
+
+def _random_tracks(n: int, rng: np.random.Generator) -> list[dict]:
+    keys = [f"{number}{letter}" for number in range(1, 13) for letter in "AB"]
+    return [
+        {
+            "id": track_id,
+            "bpm": float(rng.uniform(118, 132)),
+            "key_signature": keys[rng.integers(len(keys))],
+            "lufs": float(rng.uniform(-14, -6)),
+        }
+        for track_id in range(1, n + 1)
+    ]
+
+
+def test_key_and_bpm_costs():
+    keys = sequencer.key_costs(["8A", "9A", "8B", "9B", "5A", None])
+    assert keys[0, 0] == 0.0
+    assert keys[0, 1] == keys[1, 0] == 0.1  # Adjacent on the wheel
+    assert keys[0, 2] == 0.2  # Relative major
+    assert keys[0, 3] == 0.5  # Diagonal
+    assert keys[0, 4] == 1.0  # Clash
+    assert keys[0, 5] == sequencer.UNKNOWN_COST
+
+    bpms = sequencer.bpm_costs([128, 129, 140, 64, None])
+    assert bpms[0, 1] < 0.1
+    assert bpms[0, 2] > sequencer.BPM_LIMIT_PENALTY  # 9% apart
+    assert bpms[0, 3] == pytest.approx(sequencer.HALF_DOUBLE_TIME_COST)
+    assert bpms[0, 4] == sequencer.UNKNOWN_COST
+
+
+def test_sequence_walks_the_camelot_wheel():
+    # Shuffled walk around the wheel at one tempo: the cheapest order is the walk
+    keys = [f"{number}A" for number in range(1, 9)]
+    tracks = [{"id": i, "bpm": 124.0, "key_signature": key} for i, key in enumerate(keys)]
+    rng = np.random.default_rng(3)
+    shuffled = [tracks[i] for i in rng.permutation(len(tracks))]
+
+    order = sequencer.sequence_tracks(shuffled, arc="none", start_track_id=0)
+    assert order == list(range(8))
+
+
+def test_two_opt_reaches_local_optimum():
+    rng = np.random.default_rng(7)
+    tracks = _random_tracks(60, rng)
+    energy = sequencer.energy_levels(tracks)
+    costs = sequencer.transition_costs(tracks, energy)
+    ids = [t["id"] for t in tracks]
+
+    for arc in ("none", "peak"):
+        order = [ids.index(i) for i in sequencer.sequence_tracks(tracks, arc=arc)]
+        best = sequencer.path_cost(order, costs, energy, arc)
+        assert best < sequencer.path_cost(list(range(60)), costs, energy, arc)
+        for a in range(60):
+            for b in range(a + 1, 60):
+                reversed_segment = order[:a] + order[a : b + 1][::-1] + order[b + 1 :]
+                assert sequencer.path_cost(reversed_segment, costs, energy, arc) >= best - 1e-9
+
+
+def test_energy_arc_shapes_the_set():
+    rng = np.random.default_rng(11)
+    tracks = _random_tracks(80, rng)
+    lufs = {t["id"]: t["lufs"] for t in tracks}
+
+    rise = [lufs[i] for i in sequencer.sequence_tracks(tracks, arc="rise")]
+    assert np.mean(rise[:20]) < np.mean(rise[-20:])
+    peak = [lufs[i] for i in sequencer.sequence_tracks(tracks, arc="peak")]
+    assert np.mean(peak[45:60]) > max(np.mean(peak[:15]), np.mean(peak[-10:]))
+
+    with pytest.raises(ValueError, match="Unknown energy arc"):
+        sequencer.sequence_tracks(tracks, arc="zigzag")
+
+
+@pytest.fixture
+def test_db(tmp_path):
+    """Temp DB with minimal tracks + playlists + playlist_tracks schema."""
+    db_path = tmp_path / "test.db"
+    original_get_db_path = db_module.get_database_path
+    db_module.get_database_path = lambda: db_path
+    with get_db_connection() as conn:
+        conn.execute("CREATE TABLE tracks (id INTEGER PRIMARY KEY, bpm REAL, key_signature TEXT)")
+        conn.execute(
+            """CREATE TABLE playlists (
+                id INTEGER PRIMARY KEY, name TEXT, type TEXT, updated_at TEXT
+            )"""
+        )
+        conn.execute(
+            "CREATE TABLE playlist_tracks (playlist_id INTEGER, track_id INTEGER, position INTEGER)"
+        )
+        conn.commit()
+    try:
+        yield db_path
+    finally:
+        db_module.get_database_path = original_get_db_path
+
+
+def test_reorder_playlist_for_mixing(test_db):
+    keys = ["3A", "8A", "4A", "9A", "5A", "10A"]
+    with get_db_connection() as conn:
+        conn.execute("INSERT INTO playlists (id, name, type) VALUES (1, 'set', 'manual')")
+        conn.execute("INSERT INTO playlists (id, name, type) VALUES (2, 'smart', 'smart')")
+        for position, key in enumerate(keys):
+            conn.execute(
+                "INSERT INTO tracks (id, bpm, key_signature) VALUES (?, 126, ?)",
+                (position + 1, key),
+            )
+            conn.execute(
+                "INSERT INTO playlist_tracks VALUES (1, ?, ?)", (position + 1, position)
+            )
+        conn.commit()
+
+    assert reorder_playlist_for_mixing(1, arc="none") is True
+    assert reorder_playlist_for_mixing(2) is False
+    with get_db_connection() as conn:
+        ordered = [
+            keys[row["track_id"] - 1]
+            for row in conn.execute(
+                "SELECT track_id FROM playlist_tracks WHERE playlist_id = 1 ORDER BY position"
+            )
+        ]
+        updated = conn.execute("SELECT updated_at FROM playlists WHERE id = 1").fetchone()[0]
+    # Two key runs, each walked step by step around the wheel
+    runs = sorted([ordered[:3], ordered[3:]])
+    assert [sorted(run) for run in runs] == [["10A", "8A", "9A"], ["3A", "4A", "5A"]]
+    assert all(run[1] in ("4A", "9A") for run in runs)
+    assert updated is not None
+
+
+def test_radio_mix_order_is_deterministic_per_day():
+    rng = np.random.default_rng(5)
+    tracks = [
+        Track(
+            local_path=f"/music/{t['id']}.mp3",
+            id=t["id"],
+            bpm=t["bpm"],
+            key=t["key_signature"],
+            duration=200.0,
+        )
+        for t in _random_tracks(30, rng)
+    ]
+    monday_date = date(2026, 1, 5)
+    timeline._mix_order_cache.clear()
+    shuffled = timeline.deterministic_shuffle(tracks, "1-2026-01-05")
+
+    timeline.precompute_mix_order(1, tracks, "1-2026-01-05")
+    monday = timeline._order_tracks(1, "mix", tracks, monday_date)
+    assert monday != shuffled
+    assert sorted(t.id for t in monday) == list(range(1, 31))
+    # The opener is the day's first shuffled track
+    assert monday[0].id == shuffled[0].id
+
+    timeline._mix_order_cache.clear()
+    timeline.precompute_mix_order(1, tracks, "1-2026-01-05")
+    assert timeline._order_tracks(1, "mix", tracks, monday_date) == monday
+
+    # Not precomputed: the shuffle plays, and keeps playing for that day even
+    # once an order is sequenced, so the timeline doesn't jump
+    tuesday_shuffle = timeline.deterministic_shuffle(tracks, "1-2026-01-06")
+    assert timeline._order_tracks(1, "mix", tracks, date(2026, 1, 6)) == tuesday_shuffle
+    timeline.precompute_mix_order(1, tracks, "1-2026-01-06")
+    assert timeline._order_tracks(1, "mix", tracks, date(2026, 1, 6)) == tuesday_shuffle
+
+    # The next day is sequenced in the background ahead of the rollover
+    timeline.schedule_mix_order(1, tracks, "1-2026-01-07")
+    key = (1, "1-2026-01-07", tuple(range(1, 31)))
+    deadline = time.monotonic() + 30
+    while key not in timeline._mix_order_cache and time.monotonic() < deadline:
+        time.sleep(0.01)
+    wednesday = timeline._order_tracks(1, "mix", tracks, date(2026, 1, 7))
+    assert wednesday != timeline.deterministic_shuffle(tracks, "1-2026-01-07")
+    assert [k[1] for k in timeline._mix_order_cache] == ["1-2026-01-06", "1-2026-01-07"]
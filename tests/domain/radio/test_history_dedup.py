@@ -94,7 +94,8 @@ def _make_conn(last_row) -> MagicMock:
     select_cursor.fetchone.return_value = last_row
     insert_cursor = MagicMock()
     insert_cursor.lastrowid = 999
-    conn.execute.side_effect = [select_cursor, insert_cursor]
+    rollup_cursor = MagicMock()
+    conn.execute.side_effect = [select_cursor, insert_cursor, rollup_cursor]
     # Context manager protocol for `with get_radio_db_connection() as conn:`
     cm = MagicMock()
     cm.__enter__.return_value = conn
@@ -111,8 +112,8 @@ def test_start_play_inserts_when_no_prior_play(mock_get_conn: MagicMock) -> None
 
     assert result == 999  # lastrowid from insert
     conn.commit.assert_called_once()
-    # Two execute calls: the SELECT for last play, then the INSERT.
-    assert conn.execute.call_count == 2
+    # SELECT for last play, the INSERT, then the daily rollup upsert.
+    assert conn.execute.call_count == 3
     assert "INSERT INTO radio_history" in conn.execute.call_args_list[1].args[0]
 
 
@@ -140,7 +141,7 @@ def test_start_play_inserts_after_window_expires(mock_get_conn: MagicMock) -> No
 
     assert result == 999  # new insert because outside window
     conn.commit.assert_called_once()
-    assert conn.execute.call_count == 2
+    assert conn.execute.call_count == 3
     assert "INSERT INTO radio_history" in conn.execute.call_args_list[1].args[0]
 
 
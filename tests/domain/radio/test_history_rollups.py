@@ -0,0 +1,153 @@
+"""Tests for the daily listening/radio rollups behind the stats queries."""
+
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from music_minion.core import database
+from music_minion.domain.radio import history
+
+SCHEMA = """
+CREATE TABLE tracks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    local_path TEXT,
+    title TEXT,
+    artist TEXT,
+    album TEXT,
+    duration REAL
+);
+CREATE TABLE radio_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    station_id INTEGER,
+    track_id INTEGER REFERENCES tracks(id) ON DELETE SET NULL,
+    source_type TEXT NOT NULL,
+    source_url TEXT,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    ended_at TIMESTAMP,
+    position_ms INTEGER DEFAULT 0,
+    end_reason TEXT
+);
+CREATE TABLE track_listen_sessions (
+    session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    track_id INTEGER NOT NULL,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    play_date DATE NOT NULL,
+    playlist_id INTEGER NULL,
+    seconds_played REAL NOT NULL DEFAULT 0
+);
+INSERT INTO tracks (title, artist) VALUES ('Xtal', 'Aphex Twin'), ('Avril 14th', 'Aphex Twin');
+"""
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    path = tmp_path / "music.db"
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO radio_history (track_id, source_type, started_at, position_ms) "
+        "VALUES (?, 'local', datetime('now', 'localtime', ?), ?)",
+        [(1, "-1 days", 60_000), (1, "-2 days", 30_000), (2, "-40 days", 90_000), (None, "-1 days", 5_000)],
+    )
+    conn.commit()
+    database.migrate_database(conn, 61)  # Creates and backfills the rollups
+    conn.close()
+    with patch.object(database, "get_database_path", return_value=path):
+        yield path
+
+
+def _query(path, sql, params=()):
+    conn = sqlite3.connect(path)
+    rows = conn.execute(sql, params).fetchall()
+    conn.close()
+    return rows
+
+
+def test_backfill_matches_raw_history(db_path):
+    stats = history.get_stats(days=30)
+    assert (stats.total_plays, stats.unique_tracks) == (3, 1)
+    assert stats.total_minutes == 1  # 95s of listening
+
+    top = history.get_most_played_tracks(days=30)
+    assert [(s.track.title, s.play_count, s.total_duration_seconds) for s in top] == [
+        ("Xtal", 2, 90)
+    ]
+    assert len(history.get_most_played_tracks(days=60)) == 2
+
+
+def test_incremental_writes_match_full_rebuild(db_path):
+    history_id = history.start_play(2, window_minutes=0)
+    history.end_play(history_id, duration_ms=45_000, reason="completed")
+    history.end_play(history_id, duration_ms=50_000, reason="completed")  # Re-close
+    history.end_play(9999, duration_ms=1_000)  # Missing row is ignored
+
+    stats = history.get_stats(days=30)
+    assert (stats.total_plays, stats.unique_tracks) == (4, 2)
+
+    incremental = _query(db_path, "SELECT * FROM radio_history_daily ORDER BY day, track_id")
+    conn = sqlite3.connect(db_path)
+    database.refresh_listening_rollups(conn)
+    conn.commit()
+    conn.close()
+    assert _query(db_path, "SELECT * FROM radio_history_daily ORDER BY day, track_id") == incremental
+
+
+def test_history_date_filter_uses_started_at_index(db_path):
+    yesterday = _query(db_path, "SELECT DATE('now', 'localtime', '-1 days')")[0][0]
+    entries = history.get_history_entries(start_date=yesterday, end_date=yesterday)
+    assert len(entries) == 2
+
+    plan = _query(
+        db_path,
+        "EXPLAIN QUERY PLAN SELECT * FROM radio_history "
+        "WHERE started_at >= ? AND started_at < ? ORDER BY started_at DESC",
+        (yesterday, "2999-01-01"),
+    )
+    assert any("idx_radio_history_started" in row[-1] for row in plan)
+
+
+def test_listen_sessions_feed_daily_rollup(db_path):
+    first = database.start_listen_session(1, playlist_id=7)
+    second = database.start_listen_session(1, playlist_id=7)
+    other = database.start_listen_session(2)
+    database.add_listen_seconds({first: 30.0, second: 12.5, other: 100.0})
+    database.add_listen_seconds({first: 7.5})
+
+    assert database.get_daily_listening_time() == 150.0
+    assert [(t["title"], t["total_seconds"]) for t in database.get_top_tracks_by_time()] == [
+        ("Avril 14th", 100.0),
+        ("Xtal", 50.0),
+    ]
+    assert database.get_playlist_listening_stats_grouped() == [
+        {"playlist_id": 7, "sessions": 2, "total_seconds": 50.0}
+    ]
+    assert database.get_playlist_listening_stats(7)["avg_session_length"] == 25.0
+
+
+def test_scheduler_records_history_on_track_change(db_path):
+    from music_minion.domain.library.models import Track
+    from music_minion.domain.radio import scheduler, stations
+    from music_minion.domain.radio.models import NowPlaying
+
+    track = Track(local_path="/music/avril.flac", id=2, title="Avril 14th", duration=120.0)
+    now_playing = NowPlaying(
+        track=track, position_ms=4_000, next_track=None, upcoming=[], station_id=1, source_type="local"
+    )
+    scheduler.reset_scheduler_state()
+    with (
+        patch.object(scheduler, "get_active_station", return_value=MagicMock(id=1)),
+        patch.object(scheduler, "calculate_now_playing", return_value=now_playing),
+        patch.object(scheduler, "_prefetch_upcoming") as prefetch,
+    ):
+        assert scheduler.get_next_track_path() == "/music/avril.flac"
+        assert scheduler.get_next_track_path() == "/music/avril.flac"  # Same track: no new row
+    prefetch.assert_called_once_with([])
+    scheduler.reset_scheduler_state()
+
+    stations.record_track_history(1, 2, position_ms=1_000)
+
+    rows = _query(db_path, "SELECT station_id, track_id, position_ms FROM radio_history WHERE track_id = 2 ORDER BY id")
+    assert rows[-2:] == [(1, 2, 4_000), (1, 2, 1_000)]
+    assert (history.get_stats(days=30).total_plays, history.get_stats(days=30).unique_tracks) == (5, 2)
@@ -0,0 +1,110 @@
+"""Tests for the cached, deduplicating stream URL resolver."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from music_minion.domain.radio import stream_resolver
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path):
+    path = tmp_path / "stream_cache.db"
+    with patch.object(stream_resolver, "_cache_path", return_value=path):
+        stream_resolver.clear_stream_cache()
+        yield path
+        stream_resolver.clear_stream_cache()
+
+
+def _counting_resolver(url: str):
+    calls = []
+
+    def resolve():
+        calls.append(1)
+        return url
+
+    return resolve, calls
+
+
+def test_cache_survives_restart():
+    resolve, calls = _counting_resolver("https://cdn.example/a.mp3")
+    assert stream_resolver.resolve_cached("sc:a", resolve) == "https://cdn.example/a.mp3"
+
+    stream_resolver._stream_cache.clear()  # Fresh process: only the disk cache remains
+    assert stream_resolver.resolve_cached("sc:a", resolve) == "https://cdn.example/a.mp3"
+    assert len(calls) == 1
+    assert stream_resolver.get_cache_stats()["valid_entries"] == 1
+
+
+def test_ttl_follows_url_expiry():
+    soon = int(time.time()) + 30  # Inside the safety margin: not worth caching
+    resolve, calls = _counting_resolver(f"https://cdn.example/b.mp3?Expires={soon}&Signature=x")
+    stream_resolver.resolve_cached("sc:b", resolve)
+    stream_resolver.resolve_cached("sc:b", resolve)
+    assert len(calls) == 2
+
+    later = int(time.time()) + 3600
+    resolve, calls = _counting_resolver(f"https://rr1.example/videoplayback?expire={later}")
+    stream_resolver.resolve_cached("yt:c", resolve)
+    _, expires_at = stream_resolver._stream_cache["yt:c"]
+    assert expires_at == later - stream_resolver.EXPIRY_MARGIN_SECONDS
+    # Entries close to expiry count as misses for callers asking for headroom
+    assert stream_resolver._cache_get("yt:c", min_ttl=7200) is None
+
+
+def test_concurrent_resolutions_are_deduplicated():
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow_resolve():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "https://cdn.example/slow.mp3"
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(stream_resolver.resolve_cached("sc:slow", slow_resolve))
+        )
+        for _ in range(4)
+    ]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == ["https://cdn.example/slow.mp3"] * 4
+
+
+def test_failures_propagate_and_are_not_cached():
+    def fail():
+        raise RuntimeError("upstream gone")
+
+    with pytest.raises(RuntimeError):
+        stream_resolver.resolve_cached("sc:gone", fail)
+    assert stream_resolver.resolve_cached("sc:gone", lambda: None) is None
+    assert stream_resolver.resolve_cached("sc:gone", lambda: "https://cdn.example/ok.mp3")
+
+
+def test_prefetch_warms_cache_for_playback():
+    urls = ["https://soundcloud.com/a/one", "https://soundcloud.com/a/two"]
+    with patch.object(
+        stream_resolver, "_extract_stream_url", side_effect=lambda url: f"{url}.mp3"
+    ) as extract:
+        assert stream_resolver.prefetch_stream_urls(urls + [None]) == 2
+        deadline = time.time() + 5
+        while stream_resolver.get_cache_stats()["valid_entries"] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert stream_resolver.resolve_stream_url(urls[0]) == f"{urls[0]}.mp3"
+        assert stream_resolver.prefetch_stream_urls(urls) == 0  # Already fresh
+        assert extract.call_count == 2
@@ -13,6 +13,17 @@ from music_minion.domain.sync.engine import (
 )
 
 
+@pytest.fixture(autouse=True)
+def no_file_catalog():
+    """The mocked connections below can't answer file catalog queries, so
+    these tests exercise the filename fallback with no fingerprint matches."""
+    catalog = "music_minion.domain.library.catalog"
+    with patch(f"{catalog}.refresh_catalog"), patch(
+        f"{catalog}.match_moved_files", return_value={}
+    ), patch(f"{catalog}.forget_paths"):
+        yield
+
+
 class TestPathSimilarity:
     """Tests for path_similarity function."""
 
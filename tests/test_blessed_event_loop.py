@@ -0,0 +1,126 @@
+"""Tests for the event-driven blessed loop: wakeup pipe, MPV events, queued UI updates."""
+
+import dataclasses
+import os
+import selectors
+import socket
+import threading
+
+from music_minion.core import output
+from music_minion.domain.playback import player
+from music_minion.ui.blessed.app import _active_overlay, _apply_ui_update
+from music_minion.ui.blessed.helpers.wakeup import WakeupPipe
+from music_minion.ui.blessed.state import UIState
+
+
+class TestWakeupPipe:
+    def test_notify_from_thread_wakes_selector(self):
+        pipe = WakeupPipe()
+        selector = selectors.DefaultSelector()
+        selector.register(pipe.fileno(), selectors.EVENT_READ)
+        try:
+            assert selector.select(0) == []
+            threading.Thread(target=pipe.notify).start()
+            assert len(selector.select(2.0)) == 1
+
+            pipe.drain()
+            assert selector.select(0) == []
+        finally:
+            selector.close()
+            pipe.close()
+
+    def test_notifications_coalesce_until_drained(self):
+        pipe = WakeupPipe()
+        try:
+            for _ in range(10_000):
+                pipe.notify()  # Would fill the pipe buffer if not coalesced
+            pipe.drain()
+            pipe.notify()
+            selector = selectors.DefaultSelector()
+            selector.register(pipe.fileno(), selectors.EVENT_READ)
+            assert len(selector.select(0)) == 1
+            selector.close()
+        finally:
+            pipe.close()
+
+    def test_notify_racing_with_drain_still_wakes_selector(self, monkeypatch):
+        pipe = WakeupPipe()
+        selector = selectors.DefaultSelector()
+        selector.register(pipe.fileno(), selectors.EVENT_READ)
+        real_read = os.read
+
+        def read_after_notify(fd, n):
+            pipe.notify()  # Another thread notifies mid-drain
+            return real_read(fd, n)
+
+        try:
+            pipe.notify()
+            monkeypatch.setattr(os, "read", read_after_notify)
+            pipe.drain()
+            monkeypatch.setattr(os, "read", real_read)
+
+            pipe.notify()
+            assert len(selector.select(0)) == 1
+            pipe.drain()
+            assert selector.select(0) == []
+        finally:
+            selector.close()
+            pipe.close()
+
+    def test_log_and_notify_ui_wake_blessed_loop(self):
+        calls = []
+        output.set_blessed_mode(lambda updates: None, wakeup=lambda: calls.append(1))
+        try:
+            output.log("hello")
+            output.notify_ui()
+            assert len(calls) == 2
+            assert output.drain_pending_history_messages() == [("hello", "white")]
+        finally:
+            output.clear_blessed_mode()
+
+        output.notify_ui()  # No-op outside blessed mode
+        assert len(calls) == 2
+
+
+def test_read_mpv_events_skips_replies_and_detects_close():
+    ours, mpv = socket.socketpair()
+    ours.setblocking(False)
+    try:
+        assert player.read_mpv_events(ours) == []
+        mpv.sendall(
+            b'{"error":"success","request_id":0}\n'
+            b'{"event":"property-change","id":1,"name":"pause","data":true}\n'
+            b'{"event":"end-file","reason":"eof"}\n'
+        )
+        assert player.read_mpv_events(ours) == ["property-change", "end-file"]
+
+        mpv.close()
+        assert player.read_mpv_events(ours) is None
+    finally:
+        ours.close()
+
+
+class TestApplyUiUpdate:
+    def test_history_messages_and_fields(self):
+        state = _apply_ui_update(
+            UIState(),
+            {"history_messages": [("✅ done", "green")], "feedback_message": "hi"},
+        )
+        assert state.history[-1] == ("✅ done", "green")
+        assert state.feedback_message == "hi"
+
+    def test_comparison_loading_update_does_not_clobber_loaded_session(self):
+        base = UIState()
+        loaded = dataclasses.replace(base.comparison, active=True, loading=False)
+        object.__setattr__(loaded, "session_id", "s1")
+        loading = dataclasses.replace(loaded, loading=True)
+        object.__setattr__(loading, "session_id", "s1")
+        state = dataclasses.replace(base, comparison=loaded)
+
+        assert _apply_ui_update(state, {"comparison": loading}) is state
+
+
+def test_active_overlay_changes_with_modal():
+    state = UIState()
+    assert _active_overlay(state) is None
+    assert _active_overlay(dataclasses.replace(state, palette_visible=True)) == "palette"
@@ -0,0 +1,208 @@
+"""Tests for change-log replication between two databases."""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+
+from music_minion.core import database, replication
+
+SCHEMA = """
+CREATE TABLE tracks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT,
+    soundcloud_id TEXT UNIQUE
+);
+CREATE TABLE ratings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    track_id INTEGER NOT NULL,
+    rating_type TEXT NOT NULL,
+    FOREIGN KEY (track_id) REFERENCES tracks (id) ON DELETE CASCADE
+);
+CREATE TABLE elo_ratings (
+    track_id INTEGER PRIMARY KEY,
+    rating REAL NOT NULL,
+    FOREIGN KEY (track_id) REFERENCES tracks (id) ON DELETE CASCADE
+);
+CREATE TABLE playback_state (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    position REAL
+);
+CREATE TABLE track_listen_sessions (
+    session_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    track_id INTEGER NOT NULL,
+    play_date DATE NOT NULL,
+    playlist_id INTEGER NULL,
+    seconds_played REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE radio_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    track_id INTEGER,
+    source_type TEXT NOT NULL,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    position_ms INTEGER DEFAULT 0
+);
+INSERT INTO tracks (title) VALUES ('Seed');
+"""
+
+
+class Peer:
+    """A database file that replication functions can be pointed at."""
+
+    def __init__(self, path):
+        self.path = path
+        conn = sqlite3.connect(path)
+        conn.executescript(SCHEMA)
+        database.migrate_database(conn, 60)
+        conn.close()
+        with self.active():
+            self.origin = replication.enable_replication()
+
+    @contextmanager
+    def active(self):
+        with patch.object(database, "get_database_path", return_value=self.path):
+            yield
+
+    def execute(self, sql: str, params=()) -> list[tuple]:
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA foreign_keys=ON")
+        rows = conn.execute(sql, params).fetchall()
+        conn.commit()
+        conn.close()
+        return rows
+
+    def export_to(self, other: "Peer") -> dict:
+        with self.active():
+            changeset = replication.export_changeset(other.origin)
+        # Round-trip through JSON like the CLI does
+        return json.loads(json.dumps(changeset))
+
+    def import_from(self, changeset: dict) -> dict:
+        with self.active():
+            return replication.import_changeset(changeset)
+
+
+def sync(a: Peer, b: Peer) -> tuple[dict, dict]:
+    stats_b = b.import_from(a.export_to(b))
+    stats_a = a.import_from(b.export_to(a))
+    return stats_b, stats_a
+
+
+@pytest.fixture
+def peers(tmp_path):
+    return Peer(tmp_path / "laptop.db"), Peer(tmp_path / "pi.db")
+
+
+def test_changes_ship_as_compacted_deltas(peers):
+    laptop, pi = peers
+    laptop.execute("INSERT INTO tracks (title) VALUES ('Windowlicker')")
+    for rating in (1000.0, 1016.0, 1032.0):
+        laptop.execute(
+            "INSERT INTO elo_ratings (track_id, rating) VALUES (2, ?) "
+            "ON CONFLICT (track_id) DO UPDATE SET rating = excluded.rating",
+            (rating,),
+        )
+    laptop.execute("UPDATE playback_state SET position = 1")  # Not replicated
+
+    changeset = laptop.export_to(pi)
+    assert changeset["logged_changes"] == 4
+    assert [(c["tbl"], c["op"]) for c in changeset["changes"]] == [
+        ("tracks", "I"),
+        ("elo_ratings", "I"),
+    ]
+    assert pi.import_from(changeset)["applied"] == 2
+    assert pi.execute("SELECT rating FROM elo_ratings WHERE track_id = 2") == [(1032.0,)]
+
+    # Nothing new: the next export from the acked watermark is empty
+    pi.import_from(laptop.export_to(pi))  # Re-import is a no-op
+    laptop.import_from(pi.export_to(laptop))  # Carries pi's ack back
+    assert laptop.export_to(pi)["changes"] == []
+    assert laptop.execute("SELECT COUNT(*) FROM change_log") == [(0,)]  # Pruned
+
+
+def test_applied_changes_are_not_echoed_back(peers):
+    laptop, pi = peers
+    laptop.execute("UPDATE tracks SET title = 'Renamed' WHERE id = 1")
+    pi.import_from(laptop.export_to(pi))
+    assert pi.execute("SELECT title FROM tracks WHERE id = 1") == [("Renamed",)]
+    assert pi.export_to(laptop)["changes"] == []
+
+
+def test_concurrent_edits_last_writer_wins(peers):
+    laptop, pi = peers
+    laptop.execute("UPDATE tracks SET title = 'Laptop edit' WHERE id = 1")
+    pi.execute("UPDATE tracks SET title = 'Pi edit' WHERE id = 1")
+    # Make the laptop's edit the later one regardless of test timing
+    laptop.execute("UPDATE change_log SET changed_at = '2999-01-01 00:00:00.000'")
+
+    stats_laptop, stats_pi = sync(pi, laptop)
+    assert stats_laptop["conflict"] == 1  # Keeps its newer edit
+    assert stats_pi["applied"] == 1
+    for peer in peers:
+        assert peer.execute("SELECT title FROM tracks WHERE id = 1") == [("Laptop edit",)]
+
+
+def test_concurrent_inserts_with_same_id_are_remapped(peers):
+    laptop, pi = peers
+    laptop.execute("INSERT INTO tracks (title) VALUES ('Laptop track')")
+    laptop.execute("INSERT INTO ratings (track_id, rating_type) VALUES (2, 'like')")
+    pi.execute("INSERT INTO tracks (title) VALUES ('Pi track')")
+    pi.execute("INSERT INTO ratings (track_id, rating_type) VALUES (2, 'love')")
+
+    stats_pi, stats_laptop = sync(laptop, pi)
+    assert stats_pi["remapped"] == 2
+    assert stats_laptop["remapped"] == 2
+
+    for peer in peers:
+        rows = peer.execute(
+            "SELECT t.title, r.rating_type FROM ratings r JOIN tracks t ON t.id = r.track_id "
+            "ORDER BY t.title"
+        )
+        assert rows == [("Laptop track", "like"), ("Pi track", "love")]
+
+    # Later edits to a remapped row reach the right row on the other side
+    pi_track_on_laptop = laptop.execute("SELECT id FROM tracks WHERE title = 'Pi track'")[0][0]
+    laptop.execute(
+        "UPDATE tracks SET title = 'Pi track (edited)' WHERE id = ?", (pi_track_on_laptop,)
+    )
+    sync(laptop, pi)
+    assert pi.execute("SELECT id FROM tracks WHERE title = 'Pi track (edited)'") == [(2,)]
+
+
+def test_same_row_created_on_both_sides_is_merged(peers):
+    laptop, pi = peers
+    laptop.execute("INSERT INTO tracks (title, soundcloud_id) VALUES ('Liked', 'sc-1')")
+    pi.execute("INSERT INTO tracks (title) VALUES ('Other')")
+    pi.execute("INSERT INTO tracks (title, soundcloud_id) VALUES ('Liked', 'sc-1')")
+
+    stats_pi, _ = sync(laptop, pi)
+    assert stats_pi["merged"] == 1
+    for peer in peers:
+        assert peer.execute("SELECT COUNT(*) FROM tracks WHERE soundcloud_id = 'sc-1'") == [(1,)]
+
+
+def test_delete_replicates_and_rejects_misaddressed_changesets(peers, tmp_path):
+    laptop, pi = peers
+    laptop.execute("DELETE FROM tracks WHERE id = 1")
+    changeset = laptop.export_to(pi)
+
+    stranger = Peer(tmp_path / "other.db")
+    with pytest.raises(replication.ReplicationError):
+        stranger.import_from(changeset)
+
+    pi.import_from(changeset)
+    assert pi.execute("SELECT COUNT(*) FROM tracks") == [(0,)]
+
+
+def test_replicated_history_refreshes_rollups(peers):
+    laptop, pi = peers
+    laptop.execute(
+        "INSERT INTO radio_history (track_id, source_type, position_ms) VALUES (1, 'local', 60000)"
+    )
+    sync(laptop, pi)
+    # Rollups are not replicated themselves; the receiver rebuilds them
+    assert pi.execute("SELECT track_id, plays, listened_ms FROM radio_history_daily") == [
+        (1, 1, 60000)
+    ]
@@ -0,0 +1,89 @@
+"""Startup import-graph budgets for the hotkey CLI and the TUI.
+
+Each check runs ``python -X importtime`` in a fresh interpreter so results are
+not affected by modules the test session already imported. Time budgets are
+deliberately generous (CI machines vary); scale them with
+MUSIC_MINION_IMPORT_BUDGET_SCALE. The forbidden-module checks are the real
+guard: they fail as soon as an eager import drags a heavy dependency back
+onto a startup path.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+BUDGET_SCALE = float(os.environ.get("MUSIC_MINION_IMPORT_BUDGET_SCALE", "1.0"))
+
+# Never needed before the first frame / IPC round trip
+HEAVY_MODULES = {"numpy", "sklearn", "yt_dlp", "pydub", "prompt_toolkit", "openai"}
+
+# `music-minion <ipc command>` only sends a message over the socket
+HOTKEY_FORBIDDEN = HEAVY_MODULES | {
+    "requests",
+    "rich",
+    "loguru",
+    "blessed",
+    "music_minion.core.database",
+    "music_minion.domain.library",
+    "music_minion.domain.playlists",
+}
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import module in a clean interpreter; return {module: cumulative_us}."""
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        cumulative = cumulative.strip()
+        if cumulative.isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def _top_level(times: dict[str, int]) -> set[str]:
+    return {name.split(".")[0] for name in times}
+
+
+@pytest.mark.parametrize(
+    ("module", "forbidden", "budget_ms"),
+    [
+        ("music_minion.cli", HOTKEY_FORBIDDEN, 150),
+        ("music_minion.main", HEAVY_MODULES | {"requests"}, 1500),
+        ("music_minion.ui.blessed.app", HEAVY_MODULES, 2000),
+    ],
+)
+def test_startup_import_graph(module, forbidden, budget_ms):
+    times = _import_times(module)
+    loaded = set(times) | _top_level(times)
+
+    assert not forbidden & loaded, f"{module} imports {sorted(forbidden & loaded)}"
+    assert times[module] / 1000 < budget_ms * BUDGET_SCALE, (
+        f"{module} took {times[module] / 1000:.0f}ms to import"
+    )
+
+
+def test_lazy_package_exports_resolve():
+    from music_minion.domain import playlists
+    from music_minion.domain.library import providers
+
+    assert callable(playlists.get_playlist_by_name)
+    assert "get_playlist_by_name" in dir(playlists)
+    assert providers.get_provider("local").__name__.endswith("providers.local")
+    with pytest.raises(AttributeError):
+        playlists.not_a_real_export
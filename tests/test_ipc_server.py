@@ -0,0 +1,108 @@
+"""Tests for the multiplexed IPC server and persistent client."""
+
+import queue
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+
+from music_minion.ipc import client as ipc_client
+from music_minion.ipc import server as ipc_server
+
+
+@pytest.fixture
+def server(monkeypatch):
+    # AF_UNIX paths are limited to ~100 chars, so avoid pytest's long tmp_path
+    with tempfile.TemporaryDirectory(prefix="mm-ipc-") as runtime_dir:
+        monkeypatch.setenv("XDG_RUNTIME_DIR", runtime_dir)
+        monkeypatch.setattr(ipc_server.IPCServer, "_run_websocket_server", lambda self: None)
+        srv = ipc_server.IPCServer(queue.Queue(), queue.Queue())
+        srv.start()
+        deadline = time.time() + 5
+        while not srv.socket_path.exists() and time.time() < deadline:
+            time.sleep(0.01)
+        yield srv
+        srv.stop()
+
+
+def run_main_loop(srv, handle, count):
+    """Stand-in for the blessed loop: take ``count`` commands, answer via ``handle``."""
+
+    def loop():
+        items = [srv.command_queue.get(timeout=5) for _ in range(count)]
+        for request_id, success, message in handle(items):
+            srv.response_queue.put((request_id, success, message))
+
+    thread = threading.Thread(target=loop, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_pipelined_responses_are_matched_by_id(server):
+    # The main loop answers in reverse order; the client still gets them in request order
+    run_main_loop(
+        server,
+        lambda items: [(rid, True, f"done {cmd} {args[0]}") for rid, cmd, args in reversed(items)],
+        3,
+    )
+    with ipc_client.IPCClient() as client:
+        results = client.pipeline([("add", ["a"]), ("add", ["b"]), ("add", ["c"])])
+
+    assert results == [(True, "done add a"), (True, "done add b"), (True, "done add c")]
+
+
+def test_idle_client_does_not_block_others(server):
+    idle = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    idle.connect(str(server.socket_path))
+    try:
+        run_main_loop(server, lambda items: [(rid, True, cmd) for rid, cmd, _ in items], 1)
+        assert ipc_client.send_command("like") == (True, "like")
+    finally:
+        idle.close()
+
+
+def test_legacy_request_without_id(server):
+    run_main_loop(server, lambda items: [(rid, False, "nope") for rid, _, _ in items], 1)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(5)
+        sock.connect(str(server.socket_path))
+        sock.sendall(b'{"command": "skip", "args": []}\n')
+        sock.shutdown(socket.SHUT_WR)  # Half-close: the response is still delivered
+        assert sock.recv(4096) == b'{"success": false, "message": "nope"}\n'
+
+
+def test_status_reports_counts_latency_and_timeouts(server, monkeypatch):
+    monkeypatch.setattr(ipc_server, "REQUEST_TIMEOUT_SECONDS", 0.2)
+    run_main_loop(server, lambda items: [(items[0][0], True, "ok")], 2)
+
+    with ipc_client.IPCClient() as client:
+        results = client.pipeline([("like", []), ("love", [])])
+        # The second command was never answered; a late answer is dropped
+        assert results == [(True, "ok"), (False, "Command timed out")]
+
+        metrics = client.status()
+
+    assert metrics["requests_total"] == 2
+    assert metrics["completed"] == 1
+    assert metrics["timed_out"] == 1
+    assert metrics["in_flight"] == 0
+    assert metrics["connections_active"] == 1
+    assert metrics["samples"] == 1
+    assert set(metrics["latency_ms"]) == {"p50", "p95", "p99", "max"}
+
+
+def test_invalid_json_gets_error_and_connection_survives(server):
+    run_main_loop(server, lambda items: [(rid, True, "ok") for rid, _, _ in items], 1)
+    with ipc_client.IPCClient() as client:
+        client.sock.sendall(b"not json\n")
+        assert client._read_response()["message"].startswith("Invalid JSON")
+        assert client.request("like") == (True, "ok")
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert ipc_server._percentile(values, 50) == 50.0
+    assert ipc_server._percentile(values, 99) == 99.0
+    assert ipc_server._percentile([], 95) == 0.0
@@ -0,0 +1,92 @@
+"""Tests for the diffing ScreenBuffer used by the blessed UI."""
+
+import io
+from types import SimpleNamespace
+
+from music_minion.ui.blessed.helpers.screen import ScreenBuffer
+
+
+def _term(width: int = 20, height: int = 4):
+    return SimpleNamespace(
+        width=width,
+        height=height,
+        home="\x1b[H",
+        clear="\x1b[2J",
+        clear_eol="\x1b[K",
+        move_xy=lambda x, y: f"\x1b[{y + 1};{x + 1}H",
+    )
+
+
+def _frame(screen: ScreenBuffer, raw: str) -> str:
+    out = io.StringIO()
+    screen.apply(raw)
+    screen.flush(out)
+    return out.getvalue()
+
+
+DASHBOARD = "\x1b[1;1H\x1b[KNow playing\x1b[2;1H\x1b[K\x1b[32m[####    ]\x1b[m 0:01"
+
+
+def test_first_frame_repaints_then_identical_frames_write_nothing():
+    screen = ScreenBuffer(_term())
+    first = _frame(screen, DASHBOARD)
+    assert first.startswith("\x1b[H\x1b[2J")
+    assert "Now playing" in first
+
+    assert _frame(screen, DASHBOARD) == ""
+    # Full clear followed by the same content is still a no-op on screen
+    assert _frame(screen, "\x1b[H\x1b[2J" + DASHBOARD) == ""
+
+
+def test_single_cell_change_emits_only_that_span():
+    screen = ScreenBuffer(_term())
+    _frame(screen, DASHBOARD)
+    diff = _frame(screen, DASHBOARD.replace("0:01", "0:02"))
+    assert diff == "\x1b[2;15H2"
+
+
+def test_shorter_line_clears_to_end_of_line():
+    screen = ScreenBuffer(_term())
+    _frame(screen, "\x1b[1;1H\x1b[KNow playing")
+    diff = _frame(screen, "\x1b[1;1H\x1b[KNow")
+    assert diff == "\x1b[1;5H\x1b[K"  # Column 4 onwards; the space was already blank
+
+
+def test_styles_are_reset_around_changed_cells():
+    screen = ScreenBuffer(_term())
+    _frame(screen, "\x1b[1;1Hab")
+    diff = _frame(screen, "\x1b[1;1Ha\x1b[31mb\x1b[m")
+    assert diff == "\x1b[1;2H\x1b[m\x1b[31mb\x1b[m"
+
+
+def test_rows_with_wide_characters_repaint_from_column_zero():
+    screen = ScreenBuffer(_term())
+    _frame(screen, "\x1b[1;1H🎵 one")
+    diff = _frame(screen, "\x1b[1;1H🎵 two")
+    assert diff.startswith("\x1b[1;1H🎵 two")
+
+
+def test_invalidate_and_resize_force_full_repaint():
+    term = _term()
+    screen = ScreenBuffer(term)
+    _frame(screen, DASHBOARD)
+
+    screen.invalidate()
+    assert _frame(screen, DASHBOARD).startswith("\x1b[H\x1b[2J")
+
+    term.width = 30
+    assert _frame(screen, DASHBOARD).startswith("\x1b[H\x1b[2J")
+
+
+def test_frame_captures_stdout_and_records(tmp_path):
+    record = tmp_path / "session.jsonl"
+    out = io.StringIO()
+    screen = ScreenBuffer(_term(), stream=out, record_path=str(record))
+    with screen.frame():
+        print("\x1b[1;1Hhello", end="")
+    screen.close()
+
+    assert "hello" in out.getvalue()
+    assert screen.frames == 1
+    assert screen.bytes_written == len(out.getvalue().encode("utf-8"))
+    assert '"raw": "\\u001b[1;1Hhello"' in record.read_text()
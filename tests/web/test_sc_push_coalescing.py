@@ -0,0 +1,158 @@
+"""Coalescing SC push worker against a local fake SoundCloud playlist API."""
+
+import json
+import re
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from music_minion.core.database import get_db_connection
+from music_minion.domain.library.provider import ProviderConfig, ProviderState
+from music_minion.domain.library.providers.soundcloud import api as sc_api
+from web.backend import sc_push_worker as worker
+
+SC_PLAYLIST = "9000"
+
+
+class FakeSoundCloud:
+    """Serves GET/PUT /playlists/soundcloud:playlists:<id> from an in-memory list."""
+
+    def __init__(self, tracks: list[str]) -> None:
+        self.tracks = list(tracks)
+        self.calls: list[str] = []
+        self.fail_next_put_with: int | None = None
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def _reply(self, status: int, body: dict) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:
+                fake.calls.append("GET")
+                self._reply(200, {"tracks": [{"id": int(t)} for t in fake.tracks]})
+
+            def do_PUT(self) -> None:
+                fake.calls.append("PUT")
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if fake.fail_next_put_with:
+                    status, fake.fail_next_put_with = fake.fail_next_put_with, None
+                    self._reply(status, {"error": "slow down"})
+                    return
+                urns = [t["urn"] for t in body["playlist"]["tracks"]]
+                fake.tracks = [re.sub(r"^soundcloud:tracks:", "", u) for u in urns]
+                self._reply(200, {})
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def fake_sc(monkeypatch: pytest.MonkeyPatch):
+    import music_minion.core.database as db_module
+
+    temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    temp_db_path = Path(temp_db.name)
+    temp_db.close()
+    monkeypatch.setattr(db_module, "get_database_path", lambda: temp_db_path)
+
+    with get_db_connection() as conn:
+        conn.execute("CREATE TABLE tracks (id INTEGER PRIMARY KEY, soundcloud_id TEXT)")
+        conn.execute(
+            "CREATE TABLE playlists (id INTEGER PRIMARY KEY, soundcloud_playlist_id TEXT)"
+        )
+        conn.execute(
+            "CREATE TABLE playlist_tracks (playlist_id INTEGER, track_id INTEGER, position INTEGER)"
+        )
+        # Local track N <-> SC track 1000+N; track 99 is local-only
+        conn.executemany(
+            "INSERT INTO tracks (id, soundcloud_id) VALUES (?, ?)",
+            [(i, str(1000 + i)) for i in range(1, 61)] + [(99, None)],
+        )
+        conn.execute("INSERT INTO playlists (id, soundcloud_playlist_id) VALUES (1, ?)", (SC_PLAYLIST,))
+        conn.commit()
+
+    fake = FakeSoundCloud(["1001", "1002"])
+    token = {"access_token": "t", "expires_at": (datetime.now() + timedelta(hours=1)).isoformat()}
+    state = ProviderState(
+        config=ProviderConfig(name="soundcloud"), authenticated=True, cache={"token_data": token}
+    )
+    monkeypatch.setattr(sc_api, "API_BASE_URL", fake.url)
+    monkeypatch.setattr(worker, "get_web_provider_state", lambda: state)
+    monkeypatch.setattr(worker, "COALESCE_IDLE_SECONDS", 0.2)
+    monkeypatch.setattr(worker.time, "sleep", lambda s: None)
+    for key in worker._stats:
+        worker._stats[key] = 0
+
+    yield fake
+
+    fake.server.shutdown()
+    temp_db_path.unlink(missing_ok=True)
+
+
+def test_burst_of_adds_and_removes_becomes_one_get_and_one_put(fake_sc: FakeSoundCloud) -> None:
+    for track_id in range(3, 53):
+        worker.enqueue_sc_push_add(1, track_id)
+    worker.enqueue_sc_push_remove(1, 1)
+    worker.enqueue_sc_push_add(1, 99)  # No SoundCloud ID: ignored
+    worker._queue.join()
+
+    assert fake_sc.calls == ["GET", "PUT"]
+    assert fake_sc.tracks == ["1002"] + [str(1000 + i) for i in range(3, 53)]
+    stats = worker.get_sc_push_stats()
+    assert stats["api_calls"] == 2
+    assert stats["calls_saved"] == 52 * 2 - 2
+
+
+def test_remote_edits_are_preserved_and_counted(fake_sc: FakeSoundCloud) -> None:
+    fake_sc.tracks = ["1001", "1002", "5555", "1003"]  # 5555 + 1003 added on SoundCloud
+
+    worker._process_tasks(
+        [worker.SCPushAdd(1, 3), worker.SCPushAdd(1, 4), worker.SCPushRemove(1, 5)]
+    )
+
+    assert fake_sc.tracks == ["1001", "1002", "5555", "1003", "1004"]
+    assert worker.get_sc_push_stats()["conflicts"] == 2  # 1003 already added, 1005 already gone
+
+
+def test_bulk_sync_uses_local_order_and_keeps_remote_only_tracks(fake_sc: FakeSoundCloud) -> None:
+    fake_sc.tracks = ["1001", "5555", "1002"]
+    with get_db_connection() as conn:
+        conn.executemany(
+            "INSERT INTO playlist_tracks (playlist_id, track_id, position) VALUES (1, ?, ?)",
+            [(3, 0), (2, 1), (1, 2)],
+        )
+        conn.commit()
+
+    worker._process_tasks([worker.SCPushAdd(1, 3), worker.SCPushBulkSync(1)])
+
+    assert fake_sc.calls == ["GET", "PUT"]
+    assert fake_sc.tracks == ["1003", "1002", "1001", "5555"]
+
+
+def test_noop_batch_skips_put(fake_sc: FakeSoundCloud) -> None:
+    worker._process_tasks([worker.SCPushAdd(1, 3), worker.SCPushRemove(1, 3)])
+
+    assert fake_sc.calls == ["GET"]
+    assert worker.get_sc_push_stats()["puts_skipped"] == 1
+
+
+def test_rate_limited_put_is_recomputed_from_fresh_remote_state(fake_sc: FakeSoundCloud) -> None:
+    fake_sc.fail_next_put_with = 429
+
+    worker._process_tasks([worker.SCPushAdd(1, 3)])
+
+    assert fake_sc.calls == ["GET", "PUT", "GET", "PUT"]
+    assert fake_sc.tracks == ["1001", "1002", "1003"]
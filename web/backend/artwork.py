@@ -0,0 +1,264 @@
+"""Artwork thumbnail cache for the web API.
+
+Cover art is extracted once per file version and stored content-addressed
+under the data directory: the original image as <digest>.<ext> and a JPEG
+thumbnail per size in ARTWORK_SIZES as <digest>-<size>.jpg. Covers shared by
+an album are stored once. A small per-track index records which digest
+belongs to which file version (path, mtime, artwork_url), so re-tagging a
+file invalidates its entry. The digest doubles as a strong ETag.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+from PIL import Image
+
+from music_minion.core.config import get_data_dir
+from music_minion.domain.library.artwork import download_artwork, read_embedded_art
+
+ARTWORK_SIZES = (64, 256, 640)
+THUMBNAIL_QUALITY = 85
+BACKFILL_BATCH_SIZE = 200
+
+_FORMAT_MEDIA_TYPES = {
+    "JPEG": ("jpg", "image/jpeg"),
+    "PNG": ("png", "image/png"),
+    "WEBP": ("webp", "image/webp"),
+    "GIF": ("gif", "image/gif"),
+}
+
+
+@dataclass(frozen=True)
+class CachedArtwork:
+    """A cached artwork variant ready to serve."""
+
+    path: Path
+    etag: str
+    media_type: str
+
+
+def get_artwork_cache_dir() -> Path:
+    """Get the directory for cached artwork files."""
+    cache_dir = get_data_dir() / "artwork"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def _index_path(track_id: int) -> Path:
+    return get_artwork_cache_dir() / "index" / f"{track_id}.json"
+
+
+def _fingerprint(local_path: Optional[str], artwork_url: Optional[str]) -> list:
+    """Identify the artwork sources of a track; any change invalidates the cache."""
+    mtime_ns = None
+    if local_path:
+        try:
+            mtime_ns = os.stat(local_path).st_mtime_ns
+        except OSError:
+            local_path = None
+    return [local_path, mtime_ns, artwork_url]
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def store_artwork(img_bytes: bytes) -> Optional[dict]:
+    """Store an image and its thumbnails under its content digest.
+
+    Returns:
+        {"digest", "ext", "media_type"}, or None if the bytes are not an image
+    """
+    try:
+        image = Image.open(io.BytesIO(img_bytes))
+        image.load()
+    except Exception as exc:
+        logger.warning(f"Unreadable artwork image: {exc}")
+        return None
+
+    ext, media_type = _FORMAT_MEDIA_TYPES.get(image.format, ("img", "application/octet-stream"))
+    digest = hashlib.sha256(img_bytes).hexdigest()[:32]
+    shard = get_artwork_cache_dir() / digest[:2]
+
+    original = shard / f"{digest}.{ext}"
+    if not original.exists():
+        _write_atomic(original, img_bytes)
+
+    for size in ARTWORK_SIZES:
+        thumb_path = shard / f"{digest}-{size}.jpg"
+        if thumb_path.exists():
+            continue
+        thumb = image.convert("RGB")
+        thumb.thumbnail((size, size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        thumb.save(buffer, "JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+        _write_atomic(thumb_path, buffer.getvalue())
+
+    return {"digest": digest, "ext": ext, "media_type": media_type}
+
+
+def _read_index(track_id: int) -> Optional[dict]:
+    try:
+        return json.loads(_index_path(track_id).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_index(track_id: int, entry: dict) -> None:
+    _write_atomic(_index_path(track_id), json.dumps(entry).encode())
+
+
+def _variant(entry: dict, size: Optional[int]) -> Optional[CachedArtwork]:
+    digest = entry["digest"]
+    shard = get_artwork_cache_dir() / digest[:2]
+    # Smallest thumbnail that covers the requested size; original beyond that
+    target = next((s for s in ARTWORK_SIZES if size and s >= size), None)
+    if target is None:
+        path = shard / f"{digest}.{entry['ext']}"
+        cached = CachedArtwork(path, f'"{digest}"', entry["media_type"])
+    else:
+        path = shard / f"{digest}-{target}.jpg"
+        cached = CachedArtwork(path, f'"{digest}-{target}"', "image/jpeg")
+    return cached if path.exists() else None
+
+
+def get_artwork(
+    track_id: int,
+    local_path: Optional[str],
+    artwork_url: Optional[str],
+    size: Optional[int] = None,
+    download: bool = False,
+) -> Optional[CachedArtwork]:
+    """Return cached artwork for a track, extracting it on first use.
+
+    Embedded art is extracted on a miss. Remote artwork_url images are only
+    downloaded when ``download`` is set (the backfill); request handlers
+    redirect to artwork_url instead.
+
+    Args:
+        track_id: Track ID
+        local_path: Track's local file, if any
+        artwork_url: Track's remote artwork URL, if any
+        size: Requested edge length in pixels; None for the original image
+        download: Fetch artwork_url when the file has no embedded art
+
+    Returns:
+        CachedArtwork to serve, or None if there is no cached artwork
+    """
+    fingerprint = _fingerprint(local_path, artwork_url)
+    entry = _read_index(track_id)
+
+    stale = entry is None or entry["fingerprint"] != fingerprint
+    # Entries written by request handlers never tried artwork_url
+    retry_download = (
+        not stale and download and artwork_url
+        and entry["digest"] is None and not entry["downloaded"]
+    )
+    if stale or retry_download:
+        stored = None
+        if fingerprint[0]:
+            img_bytes = read_embedded_art(fingerprint[0])
+            stored = store_artwork(img_bytes) if img_bytes else None
+        if stored is None and download and artwork_url:
+            img_bytes = download_artwork(artwork_url)
+            stored = store_artwork(img_bytes) if img_bytes else None
+        entry = {
+            "fingerprint": fingerprint,
+            "digest": None,
+            "downloaded": download,
+            **(stored or {}),
+        }
+        _write_index(track_id, entry)
+
+    if entry["digest"] is None:
+        return None
+    cached = _variant(entry, size)
+    if cached is None and not (stale or retry_download):
+        # Cache files were removed behind the index; rebuild once
+        _index_path(track_id).unlink(missing_ok=True)
+        return get_artwork(track_id, local_path, artwork_url, size, download)
+    return cached
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against a strong ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def backfill_artwork_cache(limit: Optional[int] = None) -> dict[str, int]:
+    """Extract and thumbnail artwork for every track not yet cached.
+
+    Embedded art is read from local files; tracks without it fall back to
+    downloading their SoundCloud artwork_url (500x500 when available).
+
+    Args:
+        limit: Process at most this many tracks (None for all)
+
+    Returns:
+        Counters: {"checked", "cached", "missing"}
+    """
+    from music_minion.core.database import get_db_connection
+
+    counters = {"checked": 0, "cached": 0, "missing": 0}
+    last_id = 0
+    while limit is None or counters["checked"] < limit:
+        with get_db_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, local_path, artwork_url FROM tracks
+                WHERE id > ? AND (local_path IS NOT NULL OR artwork_url IS NOT NULL)
+                ORDER BY id
+                LIMIT ?
+                """,
+                (last_id, BACKFILL_BATCH_SIZE),
+            ).fetchall()
+        if not rows:
+            break
+
+        for row in rows:
+            last_id = row["id"]
+            if limit is not None and counters["checked"] >= limit:
+                break
+            counters["checked"] += 1
+            try:
+                cached = get_artwork(
+                    row["id"], row["local_path"], row["artwork_url"], download=True
+                )
+            except Exception:
+                logger.exception(f"Artwork backfill failed for track {row['id']}")
+                cached = None
+            counters["cached" if cached else "missing"] += 1
+
+    logger.info(
+        f"Artwork backfill: {counters['checked']} checked, "
+        f"{counters['cached']} cached, {counters['missing']} without artwork"
+    )
+    return counters
+
+
+def start_artwork_backfill() -> threading.Thread:
+    """Run backfill_artwork_cache in a daemon thread. Called from FastAPI startup."""
+
+    def _run() -> None:
+        threading.current_thread().silent_logging = True  # type: ignore[attr-defined]
+        try:
+            backfill_artwork_cache()
+        except Exception:
+            logger.exception("Artwork backfill stopped")
+
+    thread = threading.Thread(target=_run, name="artwork-backfill", daemon=True)
+    thread.start()
+    return thread
@@ -52,6 +52,7 @@ app.add_middleware(
 
 # Include routers
 from .routers import (
+    analysis,
     artists,
     comparisons,
     tracks,
@@ -80,6 +81,7 @@ app.include_router(emojis.router, prefix="/api", tags=["emojis"])
 app.include_router(youtube.router, prefix="/api/youtube", tags=["youtube"])
 app.include_router(soundcloud.router, prefix="/api/soundcloud", tags=["soundcloud"])
 app.include_router(sync.router, prefix="/api", tags=["sync"])
+app.include_router(analysis.router, prefix="/api", tags=["analysis"])
 app.include_router(player.router, prefix="/api/player", tags=["player"])
 app.include_router(history.router, prefix="/api/history", tags=["history"])
 app.include_router(live.router, tags=["live"])
@@ -113,6 +115,16 @@ async def startup_event():
 
     start_feed_worker()
 
+    # Extract and thumbnail artwork ahead of the first grid render
+    from web.backend.artwork import start_artwork_backfill
+
+    start_artwork_backfill()
+
+    # Apply library file changes live (no-op if the TUI is already watching)
+    from music_minion.domain.library.watcher import start_library_watcher
+
+    start_library_watcher()
+
 
 @app.get("/health")
 async def health_check():
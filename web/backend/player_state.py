@@ -1,5 +1,6 @@
 """Centralized playback state management with immutability guarantees."""
 
+import asyncio
 import time
 from asyncio import Lock
 from typing import Callable, Optional
@@ -65,6 +66,7 @@ async def update_state(
     global _state
 
     async with _state_lock:
+        previous = _state
         if callable(update):
             _state = update(_state)
         else:
@@ -73,6 +75,9 @@ async def update_state(
                 update = {**update, "queue": tuple(update["queue"])}
             _state = _state.model_copy(update=update)
 
+        if _state.queue is not previous.queue or _state.queue_index != previous.queue_index:
+            _prefetch_streams(_state)
+
         if broadcast:
             from .sync_manager import sync_manager
             await sync_manager.broadcast("playback:state", get_state_dict())
@@ -80,6 +85,15 @@ async def update_state(
         return _state
 
 
+def _prefetch_streams(state: PlaybackState) -> None:
+    """Start resolving stream URLs for upcoming remote tracks in the background."""
+    from .services.stream_urls import prefetch_queue
+
+    asyncio.get_running_loop().run_in_executor(
+        None, prefetch_queue, state.queue, state.queue_index
+    )
+
+
 def reset_state() -> None:
     """Reset state to initial values. For testing only."""
     global _state
@@ -7,6 +7,7 @@ from typing import Any
 from loguru import logger
 
 from music_minion.core.database import get_db_connection
+from music_minion.domain.playlists import ordering
 from web.backend.sc_push_worker import (
     enqueue_sc_push_add,
     enqueue_sc_push_bulk_sync,
@@ -677,22 +678,13 @@ def reorder_bucket_tracks(bucket_id: str, track_ids: list[int]) -> bool:
         if not cursor.fetchone():
             return False
 
-        # Update positions using executemany
-        position_data = [
-            (position, bucket_id, track_id)
-            for position, track_id in enumerate(track_ids)
-        ]
-        conn.executemany(
-            """
-            UPDATE bucket_tracks
-            SET position = ?
-            WHERE bucket_id = ? AND track_id = ?
-            """,
-            position_data,
-        )
+        # Only tracks that moved relative to the rest are written
+        written = ordering.apply_order(conn, "bucket_tracks", bucket_id, track_ids)
         conn.commit()
 
-        logger.info(f"Reordered {len(track_ids)} tracks in bucket {bucket_id}")
+        logger.info(
+            f"Reordered {len(track_ids)} tracks in bucket {bucket_id} ({written} rows written)"
+        )
         return True
 
 
@@ -777,19 +769,8 @@ def apply_session(session_id: str) -> bool:
         # Combine: bucket tracks first, then unassigned
         all_track_ids = ordered_track_ids + unassigned_track_ids
 
-        # Update playlist_tracks positions
-        position_data = [
-            (position, playlist_id, track_id)
-            for position, track_id in enumerate(all_track_ids)
-        ]
-        conn.executemany(
-            """
-            UPDATE playlist_tracks
-            SET position = ?
-            WHERE playlist_id = ? AND track_id = ?
-            """,
-            position_data,
-        )
+        # Update playlist_tracks positions (tracks already in order keep theirs)
+        ordering.apply_order(conn, "playlist_tracks", playlist_id, all_track_ids)
 
         conn.commit()
 
@@ -12,6 +12,9 @@ from loguru import logger
 
 from .schemas import PlayContext
 
+# "More like this" queues draw from the seed's nearest neighbours
+SIMILAR_POOL_SIZE = 200
+
 
 # Public API Functions
 
@@ -450,6 +453,11 @@ def _get_random_track_from_playlist(
         elif context.type == "comparison" and context.track_ids:
             return _get_random_from_comparison(context.track_ids, exclusion_ids)
 
+        elif context.type == "similar" and context.track_ids:
+            return _get_random_from_comparison(
+                _resolve_context_to_track_ids(context, db_conn), exclusion_ids
+            )
+
         elif context.type == "organizer" and context.session_id:
             # Organizer shuffle mode
             from .queries.buckets import get_session_with_data
@@ -586,12 +594,17 @@ def _get_sorted_tracks_from_playlist(
             """
             cursor = db_conn.execute(query, (context.builder_id, limit, offset))
 
-        elif context.type == "comparison" and context.track_ids:
-            # Comparison context - fetch and sort in Python
-            if not context.track_ids:
+        elif context.type in ("comparison", "similar") and context.track_ids:
+            # Comparison/similar context - fetch and sort in Python
+            track_ids = (
+                context.track_ids
+                if context.type == "comparison"
+                else _resolve_context_to_track_ids(context, db_conn)
+            )
+            if not track_ids:
                 return []
 
-            placeholders = ",".join("?" * len(context.track_ids))
+            placeholders = ",".join("?" * len(track_ids))
             cursor = db_conn.execute(
                 f"""
                 SELECT tracks.id, {sql_field} as sort_value
@@ -599,7 +612,7 @@ def _get_sorted_tracks_from_playlist(
                 LEFT JOIN track_ratings ON tracks.id = track_ratings.track_id
                 WHERE tracks.id IN ({placeholders})
                 """,
-                context.track_ids
+                track_ids
             )
             rows = cursor.fetchall()
 
@@ -727,6 +740,13 @@ def _resolve_context_to_track_ids(
         elif context.type == "comparison" and context.track_ids:
             return context.track_ids
 
+        elif context.type == "similar" and context.track_ids:
+            # Seed first, then the tracks that sound most like it
+            from music_minion.domain.analysis import similar_tracks
+            seed = context.track_ids[0]
+            neighbours = [tid for tid, _ in similar_tracks(seed, SIMILAR_POOL_SIZE)]
+            return [seed] + _filter_unavailable(neighbours, db_conn)
+
         elif context.type == "organizer" and context.session_id:
             # Organizer context - return bucket tracks or unassigned tracks
             from .queries.buckets import get_session_with_data
@@ -771,6 +791,8 @@ def _get_context_id(context: "PlayContext") -> Optional[int]:
         return context.playlist_id
     elif context.type == "builder":
         return context.builder_id
+    elif context.type == "similar":
+        return context.track_ids[0] if context.track_ids else None
     else:
         return None
 
@@ -785,7 +807,7 @@ def _reconstruct_play_context(
 
     Args:
         context_type: Type of context (playlist/builder/comparison/organizer)
-        context_id: ID of playlist/builder
+        context_id: ID of playlist/builder (seed track for similar)
         shuffle: Shuffle enabled state
         context_session_id: Session ID for organizer context
 
@@ -811,6 +833,12 @@ def _reconstruct_play_context(
             track_ids=[],
             shuffle=shuffle
         )
+    elif context_type == "similar":
+        return PlayContext(
+            type="similar",
+            track_ids=[context_id] if context_id else [],
+            shuffle=shuffle
+        )
     elif context_type == "organizer":
         # Reconstruct organizer context with session_id from database
         # (requires context_session_id column added in task 00)
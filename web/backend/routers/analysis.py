@@ -0,0 +1,45 @@
+"""Audio analysis router: run BPM/key/loudness/energy analysis in the background."""
+
+from typing import Any, Optional
+
+from fastapi import APIRouter, HTTPException
+
+from music_minion.domain import analysis
+
+router = APIRouter()
+
+
+@router.post("/analysis")
+async def start_analysis(
+    limit: Optional[int] = None, force: bool = False, analyzer: Optional[str] = None
+) -> dict[str, Any]:
+    """Start analyzing tracks with missing or outdated audio analysis.
+
+    Runs in a worker pool in the background; poll /analysis/status.
+    """
+    options: dict[str, Any] = {"limit": limit, "force": force}
+    if analyzer:
+        if analyzer not in analysis.ANALYZERS:
+            raise HTTPException(status_code=400, detail=f"Unknown analyzer: {analyzer}")
+        options["analyzers"] = [analyzer]
+
+    if not analysis.start_analysis_job(**options):
+        return {"status": "skipped", "message": "Analysis already in progress"}
+    return {"status": "started", "message": "Analysis started in background"}
+
+
+@router.get("/analysis/status")
+async def get_analysis_status() -> dict[str, Any]:
+    """Progress of the running analysis, or the summary of the last one."""
+    status = analysis.get_analysis_job_status()
+    if status is None:
+        return {"running": False, "done": 0, "total": 0, "summary": None, "error": None}
+    return status
+
+
+@router.post("/analysis/stop")
+async def stop_analysis() -> dict[str, Any]:
+    """Stop the running analysis once the files in progress are saved."""
+    if analysis.stop_analysis_job():
+        return {"status": "stopping"}
+    return {"status": "idle"}
@@ -26,10 +26,12 @@ from ..schemas import (
 )
 
 from music_minion.domain.playlists import builder
+from music_minion.domain.playlists.exporters import schedule_auto_export
 from music_minion.core.database import get_db_connection
 from music_minion.ipc import send_command
 
 from ..queries.emojis import batch_fetch_track_emojis
+from ..services.candidate_warmup import warm_candidates
 
 
 router = APIRouter()
@@ -146,6 +148,8 @@ async def add_track_to_playlist(playlist_id: int, track_id: int):
         # Update last processed track
         if result["success"]:
             builder.update_last_processed_track(playlist_id, track_id)
+            # Debounced: a burst of adds produces one export
+            schedule_auto_export(playlist_id)
 
         return TrackActionResponse(success=result["success"])
 
@@ -182,7 +186,9 @@ async def skip_track(playlist_id: int, track_id: int):
 
 @router.get("/candidates/{playlist_id}/next")
 async def get_next_candidate(
-    playlist_id: int, exclude_track_id: Optional[int] = None
+    playlist_id: int,
+    exclude_track_id: Optional[int] = None,
+    like_track_id: Optional[int] = None,
 ):
     """Get next random candidate track.
 
@@ -191,13 +197,23 @@ async def get_next_candidate(
 
     Query params:
         exclude_track_id: Track ID to exclude (typically last processed)
+        like_track_id: "More like this" - the candidate that sounds most
+            like this track instead of the next random one
     """
     try:
         # Validate playlist
         _validate_manual_playlist(playlist_id)
 
         # Get next candidate
-        candidate = builder.get_next_candidate(playlist_id, exclude_track_id)
+        candidate = builder.get_next_candidate(playlist_id, exclude_track_id, like_track_id)
+
+        # Warm caches for the candidates after this one while it plays
+        if candidate:
+            warm_candidates(
+                builder.peek_next_candidates(
+                    playlist_id, candidate["id"], like_track_id=like_track_id
+                )
+            )
 
         return candidate  # Can be None
 
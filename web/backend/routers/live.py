@@ -14,8 +14,9 @@ async def sync_websocket(websocket: WebSocket):
     device_id = None
 
     try:
-        # Send current state immediately (stateful - includes comparison/radio)
-        await websocket.send_json({
+        # Send current state immediately (stateful - includes comparison/radio).
+        # Queued through the connection's writer so it stays ordered with broadcasts.
+        sync_manager.send_to(websocket, {
             "type": "sync:full",
             "data": sync_manager.get_current_state(),
         })
@@ -24,7 +25,7 @@ async def sync_websocket(websocket: WebSocket):
             try:
                 while True:
                     await asyncio.sleep(20)
-                    await websocket.send_json({"type": "ping"})
+                    sync_manager.send_to(websocket, {"type": "ping"})
             except Exception:
                 pass
 
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, HTTPException
 from typing import List, Optional, Tuple
 from pydantic import BaseModel
@@ -88,6 +90,7 @@ def get_playlist_tracks_with_ratings(
         "bpm": "bpm",
         "key": "key_signature",
         "rating": "rating",
+        "position": "pt.position",
     }
     column = field_mapping.get(sort_field, "artist")
     direction = "DESC" if sort_direction.lower() == "desc" else "ASC"
@@ -524,6 +527,34 @@ async def reorder_pinned_playlist_endpoint(playlist_id: int, request: ReorderPin
     return {"playlist": playlist}
 
 
+class SortPlaylistRequest(BaseModel):
+    arc: str = "peak"
+
+
+@router.post("/playlists/{playlist_id}/sort")
+async def sort_playlist_for_mixing_endpoint(playlist_id: int, request: SortPlaylistRequest):
+    """Reorder a manual playlist for DJ mixing (Camelot keys, BPM, energy arc)."""
+    from music_minion.domain.playlists import crud
+    from music_minion.domain.playlists.sequencer import ENERGY_ARCS
+
+    if request.arc not in ENERGY_ARCS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid arc '{request.arc}'. Valid: {', '.join(ENERGY_ARCS)}",
+        )
+    playlist = crud.get_playlist_by_id(playlist_id)
+    if not playlist:
+        raise HTTPException(status_code=404, detail="Playlist not found")
+    if playlist["type"] != "manual":
+        raise HTTPException(status_code=400, detail="Only manual playlists can be reordered")
+
+    # Sequencing takes seconds on large playlists: keep it off the event loop
+    await asyncio.to_thread(crud.reorder_playlist_for_mixing, playlist_id, request.arc)
+    for key in [k for k in _playlist_tracks_cache if k[0] == playlist_id]:
+        del _playlist_tracks_cache[key]
+    return {"playlist": crud.get_playlist_by_id(playlist_id)}
+
+
 @router.delete("/playlists/{playlist_id}")
 async def delete_playlist_endpoint(playlist_id: int):
     """Delete a playlist and all associated data."""
@@ -1,17 +1,34 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from pydantic import BaseModel
-from fastapi.responses import FileResponse, JSONResponse, RedirectResponse, Response
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from loguru import logger
+import asyncio
 import mimetypes
 import json
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Literal, Optional, Union
+from ..artwork import etag_matches, get_artwork
+from ..streaming import AudioFileResponse
+from ..transcode import TranscodeError, needs_transcode, stream_variant
 from ..waveform import has_cached_waveform, generate_waveform, get_waveform_path, get_waveform_cache_dir, fetch_soundcloud_waveform
 from ..deps import get_db, get_config
 from music_minion.core.config import Config
 
 router = APIRouter()
 
+# Artwork URLs are per track, so revalidate hourly (cheap 304) to pick up re-tags
+ARTWORK_CACHE_CONTROL = "public, max-age=3600"
+
+# "original" serves the file as stored; others are Opus variants (see transcode.py)
+StreamQuality = Literal["original", "high", "medium", "low"]
+
 AUDIO_MIME_TYPES: dict[str, str] = {
     ".opus": "audio/opus",
     ".mp3": "audio/mpeg",
@@ -80,10 +97,34 @@ def _mark_track_unavailable(db_conn, track_id: int, reason: str) -> None:
     logger.warning(f"Marked track {track_id} unavailable: {reason}")
 
 
+def select_stream_variant(
+    source: Path, quality: str, duration: Optional[float]
+) -> tuple[Union[Path, Iterator[bytes]], str]:
+    """Pick what to serve for a requested quality (blocking: may start a transcode).
+
+    Falls back to the original when it is already small enough or when
+    transcoding is unavailable.
+
+    Returns:
+        (path to serve, or the bytes of a transcode still in progress, variant name)
+    """
+    if quality == "original" or not needs_transcode(source, quality, duration):
+        return source, "original"
+    try:
+        return stream_variant(source, quality), quality
+    except TranscodeError as exc:
+        logger.warning(f"{exc}; serving original")
+        return source, "original"
+
+
 @router.get("/tracks/{track_id}/stream")
 async def stream_audio(
-    track_id: int, db=Depends(get_db), config: Config = Depends(get_config)
+    track_id: int,
+    quality: StreamQuality = "original",
+    db=Depends(get_db),
+    config: Config = Depends(get_config),
 ):
+    started_at = time.perf_counter()
     # Prioritize local file if it exists (even for SoundCloud tracks that were downloaded)
     file_path = get_track_path(track_id, db)
     if file_path and file_path.exists():
@@ -92,8 +133,26 @@ async def stream_audio(
 
         validated = validate_track_path(file_path, config.music)
         if validated:
-            logger.info(f"Streaming local file for track {track_id}: {validated.name}")
-            return FileResponse(validated, media_type=get_mime_type(validated))
+            duration = None
+            if quality != "original":
+                row = db.execute(
+                    "SELECT duration FROM tracks WHERE id = ?", (track_id,)
+                ).fetchone()
+                duration = row["duration"] if row else None
+            path, variant = await asyncio.to_thread(
+                select_stream_variant, validated, quality, duration
+            )
+            logger.info(f"Streaming local file for track {track_id}: {validated.name} ({variant})")
+            if not isinstance(path, Path):
+                # First play of this variant: relay ffmpeg's output as it's written
+                return StreamingResponse(path, media_type=AUDIO_MIME_TYPES[".opus"])
+            return AudioFileResponse(
+                path,
+                media_type=get_mime_type(path),
+                track_id=track_id,
+                variant=variant,
+                started_at=started_at,
+            )
         else:
             logger.warning(f"Blocked access outside library: {file_path}")
 
@@ -112,17 +171,19 @@ async def stream_audio(
         )
 
     if row and row["source"] == "soundcloud" and (row["soundcloud_id"] or row["source_url"]):
-        from web.backend.soundcloud_auth import get_web_provider_state
-        from music_minion.domain.library.providers.soundcloud.api import resolve_stream_url as sc_resolve
         from music_minion.domain.library.providers.soundcloud.exceptions import (
             TrackUnavailableError,
         )
+        from ..services.stream_urls import resolve_soundcloud_stream
 
-        state = get_web_provider_state()
-        if state and state.authenticated and row["soundcloud_id"]:
+        # Resolution blocks (network, or waiting on a prefetch of the same
+        # track), so keep it off the event loop. Usually a cache hit.
+        if row["soundcloud_id"]:
             try:
                 # Resolve to actual CDN URL for browser playback (~200ms)
-                stream_url = sc_resolve(state, row["soundcloud_id"])
+                stream_url = await asyncio.to_thread(
+                    resolve_soundcloud_stream, row["soundcloud_id"]
+                )
             except TrackUnavailableError as exc:
                 _mark_track_unavailable(db, track_id, "soundcloud_gone")
                 raise HTTPException(410, str(exc))
@@ -133,7 +194,7 @@ async def stream_audio(
         # Fallback: yt-dlp for unauthenticated or API failure (~2-3s)
         if row["source_url"]:
             from music_minion.domain.radio.stream_resolver import resolve_stream_url
-            stream_url = resolve_stream_url(row["source_url"])
+            stream_url = await asyncio.to_thread(resolve_stream_url, row["source_url"])
             if stream_url:
                 logger.info(f"Resolved stream via yt-dlp for track {track_id}")
                 return RedirectResponse(stream_url)
@@ -148,13 +209,21 @@ async def stream_audio(
 
 
 @router.get("/tracks/{track_id}/artwork")
-async def get_track_artwork(track_id: int, db=Depends(get_db)) -> Response:
-    """Return embedded artwork for a track.
+async def get_track_artwork(
+    track_id: int,
+    request: Request,
+    size: Optional[int] = Query(None, ge=1, le=4096),
+    db=Depends(get_db),
+) -> Response:
+    """Return artwork for a track, sized for display.
 
     Priority:
-    1. Embedded art from local file (via Mutagen)
+    1. Cached artwork (embedded art extracted once, or backfilled artwork_url),
+       as the smallest thumbnail covering ``size`` or the original if omitted
     2. Redirect to artwork_url stored in DB
     3. 404
+
+    Cached responses carry a strong ETag; a matching If-None-Match gets 304.
     """
     cursor = db.execute(
         "SELECT local_path, artwork_url FROM tracks WHERE id = ?", (track_id,)
@@ -163,58 +232,23 @@ async def get_track_artwork(track_id: int, db=Depends(get_db)) -> Response:
     if not row:
         raise HTTPException(404, "Track not found")
 
-    local_path = row["local_path"]
-    artwork_url = row["artwork_url"]
+    try:
+        # First request per file version reads tags and writes thumbnails
+        cached = await asyncio.to_thread(
+            get_artwork, track_id, row["local_path"], row["artwork_url"], size
+        )
+    except Exception:
+        logger.exception(f"Failed to read artwork for track {track_id}")
+        cached = None
 
-    if local_path and Path(local_path).exists():
-        try:
-            from mutagen import File as MutagenFile
-            import base64
-
-            audio = MutagenFile(local_path)
-            img_bytes: Optional[bytes] = None
-
-            if audio is not None:
-                suffix = Path(local_path).suffix.lower()
-
-                if suffix == ".mp3" and audio.tags:
-                    apic_list = audio.tags.getall("APIC")
-                    if apic_list:
-                        img_bytes = apic_list[0].data
-
-                elif suffix in (".opus", ".ogg"):
-                    raw = audio.get("metadata_block_picture")
-                    if raw:
-                        pic_data = base64.b64decode(raw[0])
-                        # FLAC Picture block: skip header bytes to get raw image
-                        # Format: 4-byte type, 4-byte mime_len, mime, 4-byte desc_len, desc,
-                        #         4-byte width, height, color_depth, color_count, 4-byte data_len, data
-                        offset = 4
-                        mime_len = int.from_bytes(pic_data[offset : offset + 4], "big")
-                        offset += 4 + mime_len
-                        desc_len = int.from_bytes(pic_data[offset : offset + 4], "big")
-                        offset += 4 + desc_len + 16  # desc + 4 ints (w/h/depth/count)
-                        data_len = int.from_bytes(pic_data[offset : offset + 4], "big")
-                        offset += 4
-                        img_bytes = pic_data[offset : offset + data_len]
-
-                elif suffix == ".m4a" and audio.tags:
-                    covr = audio.tags.get("covr")
-                    if covr:
-                        img_bytes = bytes(covr[0])
-
-                elif suffix == ".flac":
-                    pics = getattr(audio, "pictures", [])
-                    if pics:
-                        img_bytes = pics[0].data
-
-            if img_bytes:
-                return Response(content=img_bytes, media_type="image/jpeg")
-        except Exception:
-            logger.exception(f"Failed to read embedded art for track {track_id}")
-
-    if artwork_url:
-        return RedirectResponse(url=artwork_url)
+    if cached:
+        headers = {"ETag": cached.etag, "Cache-Control": ARTWORK_CACHE_CONTROL}
+        if etag_matches(request.headers.get("if-none-match"), cached.etag):
+            return Response(status_code=304, headers=headers)
+        return FileResponse(cached.path, media_type=cached.media_type, headers=headers)
+
+    if row["artwork_url"]:
+        return RedirectResponse(url=row["artwork_url"])
 
     raise HTTPException(404, "No artwork available")
 
@@ -300,6 +334,42 @@ async def purge_soundcloud_waveforms() -> dict[str, int]:
     return {"purged": count}
 
 
+@router.get("/tracks/{track_id}/similar")
+async def get_similar_tracks(
+    track_id: int, limit: int = Query(20, ge=1, le=200), db=Depends(get_db)
+) -> list[dict]:
+    """Tracks that sound most like this one (tempo, key, energy, timbre, tags).
+
+    Empty until the track has a BPM, key, audio analysis or tags.
+    Unavailable tracks are left out.
+
+    Returns:
+        List of dicts with id, title, artist, album, bpm, key_signature,
+        similarity (cosine, most similar first)
+    """
+    from music_minion.domain.analysis import similar_tracks
+
+    # First call builds the index (seconds on a large library)
+    found = await asyncio.to_thread(similar_tracks, track_id, limit + 20)
+    if not found:
+        return []
+    scores = dict(found)
+    placeholders = ",".join("?" * len(scores))
+    rows = db.execute(
+        f"""
+        SELECT id, title, artist, album, bpm, key_signature
+        FROM tracks
+        WHERE id IN ({placeholders}) AND unavailable_at IS NULL
+        """,
+        list(scores),
+    ).fetchall()
+    tracks = sorted(
+        ({**dict(row), "similarity": scores[row["id"]]} for row in rows),
+        key=lambda t: -t["similarity"],
+    )
+    return tracks[:limit]
+
+
 @router.post("/tracks/{track_id}/archive")
 async def archive_track(track_id: int):
     """Archive a track from comparisons."""
@@ -3,20 +3,25 @@
 Fire-and-forget queue that processes SC API calls in a daemon thread,
 keeping bucket assignment fast (local DB only) while SC sync happens async.
 Single thread serializes all SC mutations to avoid race conditions.
+
+Tasks arriving close together are coalesced per playlist: the worker GETs the
+remote track list once, applies every pending add/remove (or the local order
+for a bulk sync) to it, and writes the result with a single PUT. Assigning 50
+tracks to a bucket costs 2 API calls instead of 100.
 """
 
 import queue
 import threading
 import time
-from typing import Callable, NamedTuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, NamedTuple
 
 import requests
 from loguru import logger
 
 from music_minion.core.database import get_db_connection
 from music_minion.domain.library.providers.soundcloud.api import (
-    add_track_to_playlist,
-    remove_track_from_playlist,
+    get_playlist_track_ids,
     reorder_playlist,
 )
 from web.backend.soundcloud_auth import get_web_provider_state
@@ -24,6 +29,11 @@ from web.backend.soundcloud_auth import get_web_provider_state
 # Seconds to wait before the single bounded retry of a transient failure.
 RETRY_DELAY_SECONDS = 30
 
+# A coalescing window closes after this long without new tasks...
+COALESCE_IDLE_SECONDS = 0.5
+# ...or this long after its first task, whichever comes first.
+COALESCE_MAX_SECONDS = 3.0
+
 # Substrings in api error strings that indicate a PERMANENT failure (no retry).
 # The api returns (state, success, err) tuples; these err strings are not
 # resolvable by retrying (auth/validation/not-found/already-present).
@@ -56,10 +66,44 @@ class SCPushBulkSync(NamedTuple):
     playlist_id: int
 
 
+@dataclass
+class _PlaylistBatch:
+    """Coalesced mutations for one local playlist, in enqueue order."""
+
+    ops: list[tuple[str, int]] = field(default_factory=list)  # ("add"|"remove", track_id)
+    bulk_sync: bool = False
+
+
 _queue: queue.Queue = queue.Queue()
 _worker_thread: threading.Thread | None = None
 _worker_lock = threading.Lock()
 
+# Cumulative counters; "legacy_calls" is what one GET+PUT per add/remove
+# (and one PUT per bulk sync) would have cost.
+_stats: dict[str, int] = {
+    "tasks": 0,
+    "batches": 0,
+    "api_calls": 0,
+    "legacy_calls": 0,
+    "puts_skipped": 0,
+    "conflicts": 0,
+}
+_stats_lock = threading.Lock()
+
+
+def _count(**increments: int) -> None:
+    with _stats_lock:
+        for key, value in increments.items():
+            _stats[key] += value
+
+
+def get_sc_push_stats() -> dict[str, Any]:
+    """Coalescing metrics: API calls made vs. what per-task pushes would cost."""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["calls_saved"] = max(0, stats["legacy_calls"] - stats["api_calls"])
+    return stats
+
 
 def _is_transient_error(err: str | None) -> bool:
     """Classify an api error STRING as transient (retryable) vs permanent.
@@ -159,111 +203,184 @@ def enqueue_sc_push_bulk_sync(playlist_id: int) -> None:
 
 
 def _worker_loop() -> None:
-    """Process SC push tasks from the queue. Runs as daemon thread."""
+    """Process SC push tasks from the queue in coalesced windows. Runs as daemon thread."""
     threading.current_thread().silent_logging = True
     while True:
         try:
-            task = _queue.get()
+            tasks = _collect_window()
             try:
-                _dispatch(task)
+                _process_tasks(tasks)
             except Exception:
                 logger.exception("SC push worker error")
             finally:
-                _queue.task_done()
+                for _ in tasks:
+                    _queue.task_done()
         except Exception:
             logger.exception("SC push worker fatal error")
 
 
-def _dispatch(task: object) -> None:
-    """Route a queued task to its handler, wrapped in the single-retry helper."""
-    if isinstance(task, SCPushAdd):
-        _run_with_retry(lambda: _handle_add(task.playlist_id, task.track_id), "add")
-    elif isinstance(task, SCPushRemove):
-        _run_with_retry(lambda: _handle_remove(task.playlist_id, task.track_id), "remove")
-    elif isinstance(task, SCPushBulkSync):
-        _run_with_retry(lambda: _handle_bulk_sync(task.playlist_id), "bulk_sync")
+def _collect_window() -> list[object]:
+    """Block for one task, then gather everything enqueued shortly after it."""
+    tasks = [_queue.get()]
+    deadline = time.monotonic() + COALESCE_MAX_SECONDS
+    while True:
+        timeout = min(COALESCE_IDLE_SECONDS, deadline - time.monotonic())
+        if timeout <= 0:
+            break
+        try:
+            tasks.append(_queue.get(timeout=timeout))
+        except queue.Empty:
+            break
+    return tasks
+
+
+def _coalesce(tasks: list[object]) -> dict[int, _PlaylistBatch]:
+    """Group tasks by playlist, preserving per-playlist order."""
+    batches: dict[int, _PlaylistBatch] = {}
+    for task in tasks:
+        if isinstance(task, (SCPushAdd, SCPushRemove, SCPushBulkSync)):
+            batch = batches.setdefault(task.playlist_id, _PlaylistBatch())
+            if isinstance(task, SCPushAdd):
+                batch.ops.append(("add", task.track_id))
+            elif isinstance(task, SCPushRemove):
+                batch.ops.append(("remove", task.track_id))
+            else:
+                batch.bulk_sync = True
+    return batches
+
+
+def _process_tasks(tasks: list[object]) -> None:
+    """Push each playlist's coalesced batch, wrapped in the single-retry helper."""
+    batches = _coalesce(tasks)
+    legacy_calls = sum(
+        len(batch.ops) * 2 + (1 if batch.bulk_sync else 0) for batch in batches.values()
+    )
+    _count(tasks=len(tasks), batches=len(batches), legacy_calls=legacy_calls)
+
+    for playlist_id, batch in batches.items():
+        _run_with_retry(
+            lambda pid=playlist_id, b=batch: _push_playlist(pid, b),
+            f"playlist {playlist_id}",
+        )
 
 
-def _handle_add(playlist_id: int, track_id: int) -> tuple[bool, str | None]:
-    """Push a single track add to SoundCloud. Returns (success, err)."""
-    sc_playlist_id, sc_track_id = _resolve_sc_ids(playlist_id, track_id)
-    if sc_playlist_id is None or sc_track_id is None:
-        return True, None  # Not an SC track / playlist; nothing to push
-    state = get_web_provider_state()
-    if state is None:
-        return True, None  # No SC auth; nothing to retry
-    _, success, err = add_track_to_playlist(state, sc_playlist_id, sc_track_id)
-    if success:
-        logger.info(f"SC push: added track {sc_track_id} to playlist {sc_playlist_id}")
-    return success, err
+def compute_final_track_list(
+    remote: list[str],
+    ops: list[tuple[str, str]],
+    local_order: list[str] | None = None,
+) -> tuple[list[str], int]:
+    """Compute the track list to PUT from the current remote list.
 
+    Incremental ops are applied to the remote list as it is now, so tracks
+    added or removed on SoundCloud since our last push are kept. For a bulk
+    sync the local order wins, but remote-only tracks that this batch did
+    not remove are appended rather than deleted.
 
-def _handle_remove(playlist_id: int, track_id: int) -> tuple[bool, str | None]:
-    """Push a single track remove from SoundCloud. Returns (success, err)."""
-    sc_playlist_id, sc_track_id = _resolve_sc_ids(playlist_id, track_id)
-    if sc_playlist_id is None or sc_track_id is None:
-        return True, None
+    Args:
+        remote: SC track IDs currently in the playlist
+        ops: ("add"|"remove", sc_track_id) in enqueue order
+        local_order: Local SC track order for a bulk sync, else None
+
+    Returns:
+        (final_track_ids, conflicts) where conflicts counts ops that were
+        already satisfied remotely plus remote-only tracks preserved
+    """
+    conflicts = 0
+    if local_order is not None:
+        removed = {sc_id for op, sc_id in ops if op == "remove"}
+        local_set = set(local_order)
+        kept_remote = [t for t in remote if t not in local_set and t not in removed]
+        return list(local_order) + kept_remote, len(kept_remote)
+
+    final = list(remote)
+    for op, sc_id in ops:
+        if op == "add":
+            if sc_id in final:
+                conflicts += 1
+            else:
+                final.append(sc_id)
+        elif sc_id in final:
+            final.remove(sc_id)
+        else:
+            conflicts += 1
+    return final, conflicts
+
+
+def _push_playlist(playlist_id: int, batch: _PlaylistBatch) -> tuple[bool, str | None]:
+    """GET the remote list, apply the batch, PUT once if anything changed."""
+    sc_playlist_id, ops, local_order = _resolve_batch(playlist_id, batch)
+    if sc_playlist_id is None or (not ops and local_order is None):
+        return True, None  # Not an SC playlist / no SC tracks; nothing to push
     state = get_web_provider_state()
     if state is None:
+        return True, None  # No SC auth; nothing to retry
+
+    state, remote, err = get_playlist_track_ids(state, sc_playlist_id)
+    _count(api_calls=1)
+    if remote is None:
+        return False, err
+
+    final, conflicts = compute_final_track_list(remote, ops, local_order)
+    _count(conflicts=conflicts)
+    if conflicts:
+        logger.info(f"SC push: playlist {sc_playlist_id} had {conflicts} remote edits, merged")
+    if final == remote:
+        _count(puts_skipped=1)
+        logger.debug(f"SC push: playlist {sc_playlist_id} already up to date")
         return True, None
-    _, success, err = remove_track_from_playlist(state, sc_playlist_id, sc_track_id)
+
+    _, success, err = reorder_playlist(state, sc_playlist_id, final)
+    _count(api_calls=1)
     if success:
-        logger.info(f"SC push: removed track {sc_track_id} from playlist {sc_playlist_id}")
+        logger.info(
+            f"SC push: playlist {sc_playlist_id} updated ({len(ops)} ops"
+            f"{', bulk sync' if local_order is not None else ''}, {len(final)} tracks)"
+        )
     return success, err
 
 
-def _handle_bulk_sync(playlist_id: int) -> tuple[bool, str | None]:
-    """Push full playlist track list to SoundCloud. Returns (success, err)."""
+def _resolve_batch(
+    playlist_id: int, batch: _PlaylistBatch
+) -> tuple[str | None, list[tuple[str, str]], list[str] | None]:
+    """Translate a batch to SoundCloud IDs in one DB round trip.
+
+    Returns:
+        (sc_playlist_id, ops with SC track IDs, local SC order if bulk sync).
+        Ops on tracks without a SoundCloud ID are dropped.
+    """
     with get_db_connection() as conn:
-        cursor = conn.execute(
+        row = conn.execute(
             "SELECT soundcloud_playlist_id FROM playlists WHERE id = ?",
             (playlist_id,),
-        )
-        row = cursor.fetchone()
+        ).fetchone()
         if not row or not row["soundcloud_playlist_id"]:
-            return True, None  # Not an SC playlist; nothing to push
+            return None, [], None
         sc_playlist_id = row["soundcloud_playlist_id"]
 
-        tracks_cursor = conn.execute(
-            """
-            SELECT t.soundcloud_id
-            FROM playlist_tracks pt
-            JOIN tracks t ON pt.track_id = t.id
-            WHERE pt.playlist_id = ? AND t.soundcloud_id IS NOT NULL
-            ORDER BY pt.position ASC
-            """,
-            (playlist_id,),
-        )
-        sc_track_ids = [r["soundcloud_id"] for r in tracks_cursor.fetchall()]
-
-    if not sc_track_ids:
-        return True, None  # No SC tracks to sync
-    state = get_web_provider_state()
-    if state is None:
-        return True, None  # No SC auth; nothing to retry
-    _, success, err = reorder_playlist(state, sc_playlist_id, sc_track_ids)
-    if success:
-        logger.info(f"SC push: synced {len(sc_track_ids)} tracks to playlist {sc_playlist_id}")
-    return success, err
-
-
-def _resolve_sc_ids(
-    playlist_id: int, track_id: int
-) -> tuple[str | None, str | None]:
-    """Look up SoundCloud IDs for a playlist and track from the DB."""
-    with get_db_connection() as conn:
-        track_cursor = conn.execute(
-            "SELECT soundcloud_id FROM tracks WHERE id = ?",
-            (track_id,),
-        )
-        track_row = track_cursor.fetchone()
-        sc_track_id = track_row["soundcloud_id"] if track_row else None
-
-        playlist_cursor = conn.execute(
-            "SELECT soundcloud_playlist_id FROM playlists WHERE id = ?",
-            (playlist_id,),
-        )
-        playlist_row = playlist_cursor.fetchone()
-        sc_playlist_id = playlist_row["soundcloud_playlist_id"] if playlist_row else None
-
-    return sc_playlist_id, sc_track_id
+        track_ids = sorted({track_id for _, track_id in batch.ops})
+        sc_ids: dict[int, str] = {}
+        if track_ids:
+            placeholders = ",".join("?" * len(track_ids))
+            cursor = conn.execute(
+                f"SELECT id, soundcloud_id FROM tracks "
+                f"WHERE id IN ({placeholders}) AND soundcloud_id IS NOT NULL",
+                track_ids,
+            )
+            sc_ids = {r["id"]: str(r["soundcloud_id"]) for r in cursor.fetchall()}
+
+        local_order = None
+        if batch.bulk_sync:
+            tracks_cursor = conn.execute(
+                """
+                SELECT t.soundcloud_id
+                FROM playlist_tracks pt
+                JOIN tracks t ON pt.track_id = t.id
+                WHERE pt.playlist_id = ? AND t.soundcloud_id IS NOT NULL
+                ORDER BY pt.position ASC
+                """,
+                (playlist_id,),
+            )
+            local_order = [str(r["soundcloud_id"]) for r in tracks_cursor.fetchall()]
+
+    ops = [(op, sc_ids[track_id]) for op, track_id in batch.ops if track_id in sc_ids]
+    return sc_playlist_id, ops, local_order
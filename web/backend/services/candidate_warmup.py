@@ -0,0 +1,109 @@
+"""Cache warm-up for the playlist builder's upcoming candidates.
+
+While the user listens to the current candidate, the next few in the
+session's pool get their artwork thumbnails and waveform extracted and (for
+streaming-only tracks) their stream URLs resolved, so advancing to them
+doesn't wait on ffmpeg/pydub or the SoundCloud API.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+from loguru import logger
+
+from music_minion.core.database import get_db_connection
+
+WARMUP_WORKERS = 2
+
+_executor: Optional[ThreadPoolExecutor] = None
+_inflight: set[int] = set()
+_lock = threading.Lock()
+
+
+def _mark_silent() -> None:
+    threading.current_thread().silent_logging = True  # type: ignore[attr-defined]
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=WARMUP_WORKERS,
+                thread_name_prefix="candidate-warmup",
+                initializer=_mark_silent,
+            )
+        return _executor
+
+
+def _warm_waveform(track: dict) -> None:
+    from music_minion.core.config import load_config
+    from music_minion.core.path_security import validate_track_path
+
+    from ..waveform import fetch_soundcloud_waveform, generate_waveform, has_cached_waveform
+
+    track_id = track["id"]
+    if has_cached_waveform(track_id):
+        return
+    if track["local_path"] and track["local_path"].strip():
+        validated = validate_track_path(Path(track["local_path"]), load_config().music)
+        if validated and validated.exists():
+            generate_waveform(str(validated), track_id)
+            return
+    if track["soundcloud_id"]:
+        fetch_soundcloud_waveform(track["soundcloud_id"], track_id, track["duration"] or 0)
+
+
+def _warm_track(track: dict) -> None:
+    from ..artwork import get_artwork
+
+    track_id = track["id"]
+    try:
+        get_artwork(track_id, track["local_path"], track["artwork_url"])
+        _warm_waveform(track)
+        logger.debug(f"Warmed caches for builder candidate {track_id}")
+    except Exception as e:
+        logger.debug(f"Candidate warm-up failed for track {track_id}: {e}")
+    finally:
+        with _lock:
+            _inflight.discard(track_id)
+
+
+def warm_candidates(track_ids: Iterable[int]) -> int:
+    """Warm artwork, waveform and stream URL caches for upcoming candidates.
+
+    Returns immediately; the work runs on a small background pool. Tracks
+    already being warmed are skipped.
+
+    Args:
+        track_ids: Upcoming candidate IDs, in play order
+
+    Returns:
+        Number of tracks queued for warm-up
+    """
+    from .stream_urls import prefetch_queue
+
+    with _lock:
+        track_ids = [track_id for track_id in track_ids if track_id not in _inflight]
+        _inflight.update(track_ids)
+    if not track_ids:
+        return 0
+
+    placeholders = ",".join("?" * len(track_ids))
+    with get_db_connection() as conn:
+        rows = conn.execute(
+            f"SELECT * FROM tracks WHERE id IN ({placeholders})", track_ids
+        ).fetchall()
+    by_id = {row["id"]: dict(row) for row in rows}
+    tracks = [by_id[track_id] for track_id in track_ids if track_id in by_id]
+
+    with _lock:
+        _inflight.difference_update(set(track_ids) - by_id.keys())
+
+    executor = _get_executor()
+    for track in tracks:
+        executor.submit(_warm_track, track)
+    executor.submit(prefetch_queue, tracks, 0)
+    return len(tracks)
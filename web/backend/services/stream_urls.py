@@ -0,0 +1,87 @@
+"""Stream URL resolution for remote tracks in the web player.
+
+Both resolution paths go through the shared stream resolver cache, so the
+radio, the /stream endpoint and queue prefetching reuse each other's work:
+SoundCloud API CDN URLs are cached under "soundcloud:<id>", yt-dlp results
+under the track's permalink.
+"""
+
+from pathlib import Path
+from typing import Optional, Sequence
+
+from loguru import logger
+
+from music_minion.domain.radio.stream_resolver import (
+    PREFETCH_AHEAD,
+    prefetch,
+    prefetch_stream_urls,
+    resolve_cached,
+)
+
+
+def _api_state():
+    from web.backend.soundcloud_auth import get_web_provider_state
+
+    state = get_web_provider_state()
+    return state if state and state.authenticated else None
+
+
+def resolve_soundcloud_stream(soundcloud_id: str) -> Optional[str]:
+    """Resolve a SoundCloud track to its CDN URL via the API (~200ms uncached).
+
+    Returns:
+        CDN stream URL, or None if not authenticated or the API failed
+
+    Raises:
+        TrackUnavailableError: Track removed/private/geo-blocked on SoundCloud
+    """
+    from music_minion.domain.library.providers.soundcloud.api import resolve_stream_url
+
+    state = _api_state()
+    if state is None:
+        return None
+    return resolve_cached(
+        f"soundcloud:{soundcloud_id}", lambda: resolve_stream_url(state, soundcloud_id)
+    )
+
+
+def prefetch_queue(queue: Sequence[dict], queue_index: int) -> int:
+    """Resolve stream URLs for the current and next few queued remote tracks.
+
+    Blocking (token loading, file checks); run it off the event loop.
+
+    Args:
+        queue: Playback queue of track dicts (tracks table rows)
+        queue_index: Index of the current track
+
+    Returns:
+        Number of resolutions queued
+    """
+    from music_minion.domain.library.providers.soundcloud.api import resolve_stream_url
+
+    try:
+        upcoming = [
+            track
+            for track in queue[queue_index : queue_index + 1 + PREFETCH_AHEAD]
+            if track.get("source") == "soundcloud"
+            and not track.get("unavailable_at")
+            and not (track.get("local_path") and Path(track["local_path"]).exists())
+        ]
+        if not upcoming:
+            return 0
+
+        state = _api_state()
+        api_jobs = {}
+        source_urls = []
+        for track in upcoming:
+            sc_id = track.get("soundcloud_id")
+            if state is not None and sc_id:
+                api_jobs[f"soundcloud:{sc_id}"] = (
+                    lambda sc_id=sc_id: resolve_stream_url(state, sc_id)
+                )
+            elif track.get("source_url"):
+                source_urls.append(track["source_url"])
+        return prefetch(api_jobs) + prefetch_stream_urls(source_urls)
+    except Exception as e:
+        logger.debug(f"Queue stream prefetch failed: {e}")
+        return 0
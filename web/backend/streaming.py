@@ -0,0 +1,62 @@
+"""Instrumented file responses for audio streaming.
+
+Range requests, If-Range and multi-range responses are handled by Starlette's
+FileResponse. When the ASGI server offers the ``http.response.pathsend``
+extension (e.g. Granian) full-file responses are handed to it for zero-copy
+sending; otherwise the file is streamed in large chunks to keep thread
+round-trips per response low.
+"""
+
+import time
+from typing import Optional
+
+from loguru import logger
+from starlette.responses import FileResponse
+from starlette.types import Message, Receive, Scope, Send
+
+STREAM_CHUNK_SIZE = 256 * 1024
+
+
+class AudioFileResponse(FileResponse):
+    """FileResponse that logs time-to-first-byte and bytes served."""
+
+    chunk_size = STREAM_CHUNK_SIZE
+
+    def __init__(self, *args, track_id: int, variant: str, started_at: Optional[float] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.track_id = track_id
+        self.variant = variant
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        status = 0
+        first_byte_at: Optional[float] = None
+        bytes_sent = 0
+
+        async def instrumented_send(message: Message) -> None:
+            nonlocal status, first_byte_at, bytes_sent
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                if body and first_byte_at is None:
+                    first_byte_at = time.perf_counter()
+                bytes_sent += len(body)
+            elif message["type"] == "http.response.pathsend":
+                first_byte_at = time.perf_counter()
+                bytes_sent = int(self.headers.get("content-length", 0))
+            await send(message)
+
+        try:
+            await super().__call__(scope, receive, instrumented_send)
+        finally:
+            ttfb_ms = ((first_byte_at or time.perf_counter()) - self.started_at) * 1000
+            total_ms = (time.perf_counter() - self.started_at) * 1000
+            range_header = next(
+                (v.decode() for k, v in scope.get("headers", []) if k == b"range"), None
+            )
+            logger.info(
+                f"stream track={self.track_id} variant={self.variant} status={status} "
+                f"range={range_header or '-'} bytes={bytes_sent} "
+                f"ttfb_ms={ttfb_ms:.1f} total_ms={total_ms:.1f}"
+            )
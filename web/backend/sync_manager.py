@@ -1,7 +1,60 @@
 import asyncio
+import json
 import time
-from typing import Any
+from collections import deque
+from typing import Any, Optional
 from fastapi import WebSocket
+from loguru import logger
+
+# Events where only the newest copy matters: a queued, not-yet-sent copy is
+# replaced instead of making a slow client work through stale updates.
+LATEST_WINS_EVENTS = frozenset(
+    {"playback:state", "devices:updated", "discovery_sync_progress"}
+)
+
+# A client this many messages behind (after compaction) is disconnected;
+# it gets a fresh sync:full when it reconnects.
+MAX_PENDING_MESSAGES = 256
+
+
+class _Outgoing:
+    """A broadcast event, serialized once and shared by every client queue."""
+
+    __slots__ = ("event_type", "text")
+
+    def __init__(self, event_type: str, text: str):
+        self.event_type = event_type
+        self.text = text
+
+
+class _PlaybackUpdate(_Outgoing):
+    """A playback:state event with an optional delta against the previous one.
+
+    Clients that received seq - 1 get the small playback:delta (``text``);
+    clients that missed it (compacted, or just connected) get the full state,
+    serialized lazily at most once into ``full_text``.
+    """
+
+    __slots__ = ("seq", "message", "full_text")
+
+    def __init__(self, seq: int, message: dict, delta_text: Optional[str]):
+        super().__init__("playback:state", delta_text)
+        self.seq = seq
+        self.message = message
+        self.full_text: Optional[str] = None
+
+
+class _ClientChannel:
+    """Per-connection send queue drained by its own writer task."""
+
+    def __init__(self, ws: WebSocket):
+        self.ws = ws
+        self.pending: deque[_Outgoing] = deque()
+        self.ready = asyncio.Event()
+        self.sending = False
+        # Last playback seq delivered to this client (None = needs full state)
+        self.playback_seq: Optional[int] = None
+        self.writer: Optional[asyncio.Task] = None
 
 
 class SyncManager:
@@ -9,6 +62,10 @@ class SyncManager:
 
     Stores current state so reconnecting clients get immediate sync.
     Handles device registry with grace period for disconnects.
+
+    Broadcasts never wait on the network: each event is serialized once and
+    appended to every client's queue, and a writer task per client sends at
+    that client's pace. One slow phone therefore can't delay the others.
     """
 
     # Seconds a device may stay offline before eviction (overridable in tests)
@@ -16,6 +73,19 @@ class SyncManager:
 
     def __init__(self):
         self.connections: list[WebSocket] = []
+        self._channels: dict[WebSocket, _ClientChannel] = {}
+        # Last broadcast playback state, the base for the next delta
+        self._playback_seq = 0
+        self._last_playback: Optional[dict] = None
+        self.stats: dict[str, int] = {
+            "events": 0,
+            "serializations": 0,
+            "messages_sent": 0,
+            "deltas_sent": 0,
+            "full_states_sent": 0,
+            "compacted": 0,
+            "slow_disconnects": 0,
+        }
         # Device registry: {device_id: {id, name, connected_at, connections}}
         # `connections` is the set of live websockets for that device — one
         # machine can open several tabs/apps that all share the same persisted
@@ -28,11 +98,40 @@ class SyncManager:
         """Accept and store a new WebSocket connection."""
         await ws.accept()
         self.connections.append(ws)
+        channel = _ClientChannel(ws)
+        channel.writer = asyncio.create_task(self._writer(channel))
+        self._channels[ws] = channel
 
     def disconnect(self, ws: WebSocket) -> None:
         """Remove a WebSocket connection."""
         if ws in self.connections:
             self.connections.remove(ws)
+        channel = self._channels.pop(ws, None)
+        if channel is not None and channel.writer is not None:
+            channel.writer.cancel()
+
+    def send_to(self, ws: WebSocket, message: dict) -> None:
+        """Queue a message for one client, ordered with its broadcasts."""
+        channel = self._channels.get(ws)
+        if channel is None:
+            return
+        if message.get("type") == "sync:full":
+            # Carries its own playback snapshot; next playback event is sent in full
+            channel.playback_seq = None
+        self._enqueue(channel, _Outgoing(message.get("type", ""), self._serialize(message)))
+
+    async def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every client queue is drained (tests, benchmarks, shutdown).
+
+        Returns:
+            True if all queues drained within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while any(c.pending or c.sending for c in self._channels.values()):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.001)
+        return True
 
     async def broadcast_comparison_update(
         self, playlist_id: int, progress: dict
@@ -159,22 +258,110 @@ class SyncManager:
         await self.broadcast("devices:updated", devices)
 
     async def broadcast(self, event_type: str, data: dict) -> None:
-        """Send a message to all connected clients."""
+        """Send a message to all connected clients.
+
+        Returns once the message is queued; per-client writer tasks deliver it.
+        """
         message = {
             "type": event_type,
             "data": data,
             "ts": time.time(),
         }
-        dead_connections: list[WebSocket] = []
-
-        for conn in self.connections:
-            try:
-                await conn.send_json(message)
-            except Exception:
-                dead_connections.append(conn)
+        self.stats["events"] += 1
+
+        if event_type == "playback:state":
+            item: _Outgoing = self._playback_update(message)
+        else:
+            item = _Outgoing(event_type, self._serialize(message))
+
+        for channel in list(self._channels.values()):
+            self._enqueue(channel, item)
+
+    def _serialize(self, message: dict) -> str:
+        self.stats["serializations"] += 1
+        return json.dumps(message, separators=(",", ":"))
+
+    def _playback_update(self, message: dict) -> _PlaybackUpdate:
+        """Sequence a playback state and pre-serialize its delta."""
+        data = message["data"]
+        previous = self._last_playback
+        self._playback_seq += 1
+        self._last_playback = data
+
+        delta_text = None
+        if previous is not None and previous.keys() == data.keys():
+            changes = {k: v for k, v in data.items() if previous[k] != v}
+            delta_text = self._serialize(
+                {
+                    "type": "playback:delta",
+                    "data": changes,
+                    "ts": message["ts"],
+                    "seq": self._playback_seq,
+                    "base": self._playback_seq - 1,
+                }
+            )
+        return _PlaybackUpdate(self._playback_seq, message, delta_text)
+
+    def _enqueue(self, channel: _ClientChannel, item: _Outgoing) -> None:
+        """Append to a client queue, replacing a stale copy of latest-wins events."""
+        if item.event_type in LATEST_WINS_EVENTS:
+            for index, queued in enumerate(channel.pending):
+                if queued.event_type == item.event_type:
+                    del channel.pending[index]
+                    self.stats["compacted"] += 1
+                    break
+
+        if len(channel.pending) >= MAX_PENDING_MESSAGES:
+            logger.warning(
+                f"WebSocket client {MAX_PENDING_MESSAGES} messages behind, disconnecting"
+            )
+            self.stats["slow_disconnects"] += 1
+            self.disconnect(channel.ws)
+            asyncio.create_task(self._close_quietly(channel.ws))
+            return
 
-        for conn in dead_connections:
-            self.connections.remove(conn)
+        channel.pending.append(item)
+        channel.ready.set()
+
+    def _text_for(self, channel: _ClientChannel, item: _Outgoing) -> str:
+        """Pick delta or full payload depending on what this client already has."""
+        if not isinstance(item, _PlaybackUpdate):
+            return item.text
+        has_base = channel.playback_seq == item.seq - 1
+        channel.playback_seq = item.seq
+        if has_base and item.text is not None:
+            self.stats["deltas_sent"] += 1
+            return item.text
+        self.stats["full_states_sent"] += 1
+        if item.full_text is None:
+            item.full_text = self._serialize({**item.message, "seq": item.seq})
+        return item.full_text
+
+    async def _writer(self, channel: _ClientChannel) -> None:
+        """Drain one client's queue; a failed send drops the connection."""
+        try:
+            while True:
+                await channel.ready.wait()
+                while channel.pending:
+                    item = channel.pending.popleft()
+                    channel.sending = True
+                    try:
+                        await channel.ws.send_text(self._text_for(channel, item))
+                    finally:
+                        channel.sending = False
+                    self.stats["messages_sent"] += 1
+                channel.ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.disconnect(channel.ws)
+
+    @staticmethod
+    async def _close_quietly(ws: WebSocket) -> None:
+        try:
+            await ws.close(code=1013)  # Try again later
+        except Exception:
+            pass
 
 
 # Singleton instance
@@ -19,7 +19,7 @@ if str(web_dir) not in sys.path:
 @dataclass
 class MockPlayContext:
     """Mock PlayContext matching the Pydantic model structure."""
-    type: Literal["playlist", "track", "builder", "search", "comparison", "organizer"] = "playlist"
+    type: Literal["playlist", "track", "builder", "search", "comparison", "organizer", "similar"] = "playlist"
     playlist_id: Optional[int] = 1
     builder_id: Optional[int] = None
     track_ids: Optional[list[int]] = None
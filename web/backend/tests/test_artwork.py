@@ -0,0 +1,89 @@
+"""Tests for the artwork thumbnail cache and conditional artwork responses."""
+
+import io
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+
+from web.backend import artwork
+from web.backend.deps import get_db
+from web.backend.main import app
+
+
+def _png(size=(1000, 800), color=(200, 30, 30)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    with patch.object(artwork, "get_data_dir", return_value=tmp_path):
+        yield tmp_path / "artwork"
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "song.mp3"
+    path.write_bytes(b"not really audio")
+    return str(path)
+
+
+def test_extracts_once_and_serves_sized_variants(cache_dir, audio_file):
+    with patch.object(artwork, "read_embedded_art", return_value=_png()) as read_art:
+        thumb = artwork.get_artwork(1, audio_file, None, size=48)
+        original = artwork.get_artwork(1, audio_file, None)
+        large = artwork.get_artwork(1, audio_file, None, size=2000)
+
+    assert read_art.call_count == 1
+    assert thumb.path.name.endswith("-64.jpg") and thumb.media_type == "image/jpeg"
+    assert max(Image.open(thumb.path).size) == 64
+    assert original.media_type == "image/png" and large == original
+    assert thumb.etag != original.etag
+
+
+def test_identical_covers_share_files_and_retag_invalidates(cache_dir, audio_file, tmp_path):
+    other = tmp_path / "other.mp3"
+    other.write_bytes(b"")
+    with patch.object(artwork, "read_embedded_art", return_value=_png()):
+        first = artwork.get_artwork(1, audio_file, None, size=256)
+        second = artwork.get_artwork(2, str(other), None, size=256)
+    assert first.path == second.path
+
+    stat = os.stat(audio_file)
+    os.utime(audio_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    with patch.object(artwork, "read_embedded_art", return_value=_png(color=(0, 0, 255))):
+        retagged = artwork.get_artwork(1, audio_file, None, size=256)
+    assert retagged.etag != first.etag
+
+
+def test_remote_artwork_is_only_downloaded_by_backfill(cache_dir):
+    url = "https://i1.sndcdn.com/artworks-abc-large.jpg"
+    with patch.object(artwork, "download_artwork", return_value=_png()) as download:
+        assert artwork.get_artwork(3, None, url, size=64) is None
+        assert artwork.get_artwork(3, None, url, size=64, download=True) is not None
+        assert artwork.get_artwork(3, None, url, size=64) is not None
+    download.assert_called_once_with(url)
+
+
+def test_endpoint_sets_etag_and_answers_304(cache_dir, audio_file):
+    db = Mock()
+    db.execute.return_value.fetchone.return_value = {"local_path": audio_file, "artwork_url": None}
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        client = TestClient(app)
+        with patch.object(artwork, "read_embedded_art", return_value=_png()):
+            response = client.get("/api/tracks/1/artwork?size=256")
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "image/jpeg"
+            etag = response.headers["etag"]
+            assert "max-age" in response.headers["cache-control"]
+
+            cached = client.get("/api/tracks/1/artwork?size=256", headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.content == b""
+    finally:
+        app.dependency_overrides.pop(get_db, None)
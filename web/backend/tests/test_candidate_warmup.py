@@ -0,0 +1,47 @@
+"""Tests for warming caches of upcoming builder candidates."""
+
+import sqlite3
+import time
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from backend import artwork, waveform
+from backend.services import candidate_warmup, stream_urls
+
+
+@contextmanager
+def _db():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "CREATE TABLE tracks (id INTEGER PRIMARY KEY, local_path TEXT, artwork_url TEXT, "
+        "soundcloud_id TEXT, duration REAL, source TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO tracks VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (1, "", "https://i1.sndcdn.com/a-large.jpg", "901", 200.0, "soundcloud"),
+            (2, "", None, None, 180.0, "local"),
+        ],
+    )
+    yield conn
+    conn.close()
+
+
+def test_warm_candidates_fetches_artwork_and_waveforms_once():
+    with patch.object(candidate_warmup, "get_db_connection", _db), \
+            patch.object(artwork, "get_artwork") as get_artwork, \
+            patch.object(waveform, "has_cached_waveform", return_value=False), \
+            patch.object(waveform, "fetch_soundcloud_waveform") as fetch_waveform, \
+            patch.object(stream_urls, "prefetch_queue") as prefetch_queue:
+        assert candidate_warmup.warm_candidates([1, 2, 99]) == 2
+
+        deadline = time.time() + 5
+        while (candidate_warmup._inflight or not prefetch_queue.called) and time.time() < deadline:
+            time.sleep(0.01)
+        # Finished warm-ups can be queued again; unknown IDs were never held
+        assert candidate_warmup._inflight == set()
+
+    assert sorted(call.args[0] for call in get_artwork.call_args_list) == [1, 2]
+    fetch_waveform.assert_called_once_with("901", 1, 200.0)
+    assert [t["id"] for t in prefetch_queue.call_args.args[0]] == [1, 2]
@@ -442,6 +442,25 @@ def test_initialize_queue_comparison_context(test_db):
     assert all(tid in [1, 2, 3, 4, 5] for tid in queue)
 
 
+def test_similar_context_queues_seed_then_neighbours(test_db):
+    """Should start with the seed and draw the rest from its nearest available tracks."""
+    test_db.execute("ALTER TABLE tracks ADD COLUMN unavailable_at TIMESTAMP")
+    test_db.execute("UPDATE tracks SET unavailable_at = CURRENT_TIMESTAMP WHERE id = 12")
+    context = MockPlayContext(type="similar", track_ids=[7])
+    neighbours = [(12, 0.9), (3, 0.8), (40, 0.7)]
+
+    with mock.patch(
+        "music_minion.domain.analysis.similar_tracks", return_value=neighbours
+    ) as similar:
+        queue = queue_manager.initialize_queue(context, test_db, window_size=10, shuffle=False)
+        next_id = queue_manager.get_next_track(context, [7, 12, 3], test_db, shuffle=True)
+
+    assert queue == [7, 3, 40]
+    assert next_id == 40
+    assert similar.call_args.args == (7, queue_manager.SIMILAR_POOL_SIZE)
+    assert queue_manager._get_context_id(context) == 7
+
+
 def test_initialize_queue_builder_context(test_db):
     """Should handle builder context."""
     # Create builder playlist
@@ -0,0 +1,40 @@
+"""Tests for queue-driven stream URL prefetching."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from backend.services import stream_urls
+
+
+def _track(track_id, **fields):
+    return {"id": track_id, "source": "soundcloud", "soundcloud_id": None, "source_url": None,
+            "local_path": None, "unavailable_at": None, **fields}
+
+
+def test_prefetch_queue_resolves_upcoming_remote_tracks(tmp_path):
+    local_file = tmp_path / "downloaded.opus"
+    local_file.write_bytes(b"")
+    queue = (
+        _track(1, soundcloud_id="101"),  # Already playing, before the index
+        _track(2, soundcloud_id="102"),
+        _track(3, soundcloud_id="103", local_path=str(local_file)),
+        _track(4, source="local", local_path="/music/x.mp3"),
+        _track(5, soundcloud_id="105", unavailable_at="2026-01-01"),
+        _track(6, soundcloud_id="106"),
+    )
+    state = SimpleNamespace(authenticated=True)
+    with patch.object(stream_urls, "_api_state", return_value=state), \
+            patch.object(stream_urls, "prefetch", return_value=0) as prefetch, \
+            patch.object(stream_urls, "PREFETCH_AHEAD", 4):
+        stream_urls.prefetch_queue(queue, 1)
+
+    assert sorted(prefetch.call_args.args[0]) == ["soundcloud:102", "soundcloud:106"]
+
+
+def test_prefetch_queue_falls_back_to_ytdlp_without_api(tmp_path):
+    queue = (_track(1, soundcloud_id="101", source_url="https://soundcloud.com/a/b"),)
+    with patch.object(stream_urls, "_api_state", return_value=None), \
+            patch.object(stream_urls, "prefetch_stream_urls", return_value=1) as prefetch_urls:
+        assert stream_urls.prefetch_queue(queue, 0) == 1
+
+    prefetch_urls.assert_called_once_with(["https://soundcloud.com/a/b"])
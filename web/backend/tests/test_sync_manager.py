@@ -1,3 +1,6 @@
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock
 from web.backend.sync_manager import SyncManager
@@ -30,9 +33,10 @@ async def test_broadcast_sends_to_all_connections():
     await manager.connect(ws1)
     await manager.connect(ws2)
     await manager.broadcast("test:event", {"key": "value"})
-    ws1.send_json.assert_called_once()
-    ws2.send_json.assert_called_once()
-    call_arg = ws1.send_json.call_args[0][0]
+    await manager.flush()
+    ws1.send_text.assert_called_once()
+    ws2.send_text.assert_called_once()
+    call_arg = json.loads(ws1.send_text.call_args[0][0])
     assert call_arg["type"] == "test:event"
     assert call_arg["data"] == {"key": "value"}
     assert "ts" in call_arg
@@ -43,10 +47,11 @@ async def test_broadcast_removes_dead_connections():
     manager = SyncManager()
     ws_alive = AsyncMock()
     ws_dead = AsyncMock()
-    ws_dead.send_json.side_effect = Exception("Connection closed")
+    ws_dead.send_text.side_effect = Exception("Connection closed")
     await manager.connect(ws_alive)
     await manager.connect(ws_dead)
     await manager.broadcast("test:event", {})
+    await manager.flush()
     assert ws_alive in manager.connections
     assert ws_dead not in manager.connections
 
@@ -116,3 +121,94 @@ async def test_reconnect_during_grace_keeps_device():
 
     assert "dev" in manager.devices
     assert "dev" not in manager.disconnect_timers
+
+
+def _sent(ws: AsyncMock) -> list[dict]:
+    return [json.loads(call.args[0]) for call in ws.send_text.call_args_list]
+
+
+@pytest.mark.anyio
+async def test_broadcast_serializes_once_for_all_clients():
+    manager = SyncManager()
+    clients = [AsyncMock() for _ in range(10)]
+    for ws in clients:
+        await manager.connect(ws)
+
+    await manager.broadcast("track:emojis_updated", {"track_id": 1, "emojis": []})
+    await manager.flush()
+
+    assert manager.stats["serializations"] == 1
+    texts = {ws.send_text.call_args[0][0] for ws in clients}
+    assert len(texts) == 1
+
+
+@pytest.mark.anyio
+async def test_playback_updates_are_sent_as_deltas():
+    manager = SyncManager()
+    ws = AsyncMock()
+    await manager.connect(ws)
+
+    await manager.broadcast("playback:state", {"isPlaying": True, "positionMs": 0, "queueIndex": 0})
+    await manager.flush()
+    await manager.broadcast("playback:state", {"isPlaying": False, "positionMs": 0, "queueIndex": 0})
+    await manager.flush()
+
+    first, second = _sent(ws)
+    assert first["type"] == "playback:state"  # No base yet: full state
+    assert second == {
+        "type": "playback:delta",
+        "data": {"isPlaying": False},
+        "ts": second["ts"],
+        "seq": first["seq"] + 1,
+        "base": first["seq"],
+    }
+
+
+@pytest.mark.anyio
+async def test_sync_full_resets_playback_base():
+    manager = SyncManager()
+    early = AsyncMock()
+    await manager.connect(early)
+    await manager.broadcast("playback:state", {"isPlaying": True})
+    await manager.flush()
+
+    late = AsyncMock()
+    await manager.connect(late)
+    manager.send_to(late, {"type": "sync:full", "data": {"playback": {"isPlaying": True}}})
+    await manager.broadcast("playback:state", {"isPlaying": False})
+    await manager.flush()
+
+    assert [m["type"] for m in _sent(early)] == ["playback:state", "playback:delta"]
+    assert [m["type"] for m in _sent(late)] == ["sync:full", "playback:state"]
+
+
+@pytest.mark.anyio
+async def test_slow_client_gets_compacted_state_without_delaying_others():
+    manager = SyncManager()
+    release = asyncio.Event()
+
+    async def slow_send(text: str) -> None:
+        await release.wait()
+
+    slow, fast = AsyncMock(), AsyncMock()
+    slow.send_text.side_effect = slow_send
+    await manager.connect(slow)
+    await manager.connect(fast)
+
+    for position in range(20):
+        await manager.broadcast("playback:state", {"isPlaying": True, "positionMs": position})
+        await asyncio.sleep(0)
+
+    # Fast client got every update while the slow one is still stuck on its first
+    assert len(fast.send_text.call_args_list) == 20
+    assert slow.send_text.call_count == 1
+
+    release.set()
+    await manager.flush()
+
+    # Slow client skipped the stale updates and received the latest as a full state
+    last = json.loads(slow.send_text.call_args_list[-1].args[0])
+    assert slow.send_text.call_count == 2
+    assert last["type"] == "playback:state"
+    assert last["data"]["positionMs"] == 19
+    assert manager.stats["compacted"] == 18
@@ -0,0 +1,133 @@
+"""Tests for the transcode cache and instrumented audio responses."""
+
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from backend import transcode
+from backend.streaming import AudioFileResponse
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    with patch.object(transcode, "get_data_dir", return_value=tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture
+def flac(tmp_path):
+    path = tmp_path / "song.flac"
+    path.write_bytes(b"\0" * 4_000_000)  # ~1067 kbps over 30s
+    return path
+
+
+def test_needs_transcode_compares_average_bitrate(flac, tmp_path):
+    assert transcode.needs_transcode(flac, "medium", duration=30)
+    assert not transcode.needs_transcode(flac, "high", duration=600)  # ~53 kbps
+    opus = tmp_path / "song.opus"
+    opus.write_bytes(b"\0" * 100)
+    assert transcode.needs_transcode(flac, "low", duration=None)
+    assert not transcode.needs_transcode(opus, "low", duration=None)
+
+
+def test_concurrent_requests_share_one_transcode(data_dir, flac):
+    calls = []
+
+    def fake_ffmpeg(source, target, quality):
+        calls.append(quality)
+        time.sleep(0.1)
+        target.write_bytes(b"opus")
+
+    results = []
+    with patch.object(transcode, "_run_ffmpeg", side_effect=fake_ffmpeg):
+        threads = [
+            threading.Thread(target=lambda: results.append(transcode.get_variant(flac, "medium")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        # Later requests are plain cache hits
+        assert transcode.get_variant(flac, "medium") == results[0]
+
+    assert calls == ["medium"]
+    assert len(set(results)) == 1 and results[0].read_bytes() == b"opus"
+
+
+def test_cache_miss_streams_while_ffmpeg_writes(data_dir, flac):
+    release = threading.Event()
+
+    def slow_ffmpeg(source, target, quality):
+        partial = transcode._partial_path(target)
+        with open(partial, "wb") as out:
+            out.write(b"OggS-head")
+            out.flush()
+            assert release.wait(5)  # Still transcoding while the first bytes go out
+            out.write(b"-tail")
+        os.replace(partial, target)
+
+    with patch.object(transcode, "_run_ffmpeg", side_effect=slow_ffmpeg):
+        stream = transcode.stream_variant(flac, "low")
+        first = next(stream)
+        release.set()
+        body = first + b"".join(stream)
+
+        assert first == b"OggS-head"
+        assert body == b"OggS-head-tail"
+        # The finished transcode is the cache entry for later requests
+        for _ in range(100):
+            if not transcode._inflight:
+                break
+            time.sleep(0.01)
+        cached = transcode.stream_variant(flac, "low")
+        assert cached.read_bytes() == body
+
+
+def test_stream_variant_raises_when_ffmpeg_fails_early(data_dir, flac):
+    with patch.object(transcode.shutil, "which", return_value=None):
+        with pytest.raises(transcode.TranscodeError):
+            transcode.stream_variant(flac, "low")
+
+
+def test_eviction_removes_least_recently_used(data_dir):
+    cache_dir = transcode.get_transcode_cache_dir()
+    for age, name in enumerate(["newest", "middle", "oldest"]):
+        path = cache_dir / f"{name}-low.opus"
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (time.time() - age * 60, time.time() - age * 60))
+
+    assert transcode.evict_transcodes(max_bytes=150) == 2
+    assert [p.name for p in cache_dir.glob("*.opus")] == ["newest-low.opus"]
+
+
+def test_missing_ffmpeg_raises_transcode_error(data_dir, flac):
+    with patch.object(transcode.shutil, "which", return_value=None):
+        with pytest.raises(transcode.TranscodeError):
+            transcode.get_variant(flac, "low")
+
+
+def test_audio_response_serves_ranges_and_logs_bytes(flac):
+    app = FastAPI()
+
+    @app.get("/audio")
+    async def audio():
+        return AudioFileResponse(flac, media_type="audio/flac", track_id=7, variant="original")
+
+    messages = []
+    sink = logger.add(lambda message: messages.append(str(message)), level="INFO")
+    try:
+        response = TestClient(app).get("/audio", headers={"Range": "bytes=100-1099"})
+    finally:
+        logger.remove(sink)
+
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 100-1099/{flac.stat().st_size}"
+    assert len(response.content) == 1000
+    assert any("track=7" in m and "bytes=1000" in m and "ttfb_ms=" in m for m in messages)
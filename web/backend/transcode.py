@@ -0,0 +1,254 @@
+"""On-demand transcoding of local audio into bandwidth-appropriate variants.
+
+Lossless and high-bitrate originals are transcoded by ffmpeg into Ogg Opus
+at the requested quality and kept in a size-bounded LRU cache under the data
+directory. Cache entries are keyed by source path, mtime, size and quality,
+so re-tagged or replaced files get a fresh variant. Concurrent requests for
+the same variant share a single ffmpeg run.
+
+A cache miss doesn't hold playback for the whole transcode: stream_variant
+follows ffmpeg's output file as it grows, so the first bytes go out as soon
+as ffmpeg writes them, and the finished file becomes the cache entry.
+"""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from loguru import logger
+
+from music_minion.core.config import get_data_dir
+
+# quality -> Opus bitrate (kbps)
+QUALITY_BITRATES = {"high": 160, "medium": 96, "low": 48}
+TRANSCODE_CACHE_MAX_BYTES = 2 * 1024**3
+TRANSCODE_TIMEOUT_SECONDS = 300
+# Only transcode when the original averages this much more than the target
+MIN_BITRATE_RATIO = 1.25
+STREAM_CHUNK_BYTES = 64 * 1024
+STREAM_POLL_SECONDS = 0.05
+
+_inflight: dict[str, Future] = {}
+_lock = threading.Lock()
+
+
+class TranscodeError(Exception):
+    """ffmpeg is unavailable or failed to produce a variant."""
+
+
+def get_transcode_cache_dir() -> Path:
+    """Get the directory for cached transcodes."""
+    cache_dir = get_data_dir() / "transcodes"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def needs_transcode(source: Path, quality: str, duration: Optional[float]) -> bool:
+    """Decide whether a variant at ``quality`` would be meaningfully smaller.
+
+    Args:
+        source: Original audio file
+        quality: Key of QUALITY_BITRATES
+        duration: Track duration in seconds, if known
+
+    Returns:
+        True if the original's average bitrate exceeds the target bitrate
+        (lossless files always qualify when duration is unknown)
+    """
+    target_kbps = QUALITY_BITRATES[quality]
+    if not duration:
+        return source.suffix.lower() in (".flac", ".wav", ".aiff", ".aif")
+    average_kbps = source.stat().st_size * 8 / 1000 / duration
+    return average_kbps > target_kbps * MIN_BITRATE_RATIO
+
+
+def _variant_path(source: Path, quality: str) -> Path:
+    stat_result = source.stat()
+    key = f"{source.resolve()}|{stat_result.st_mtime_ns}|{stat_result.st_size}|{quality}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+    return get_transcode_cache_dir() / f"{digest}-{quality}.opus"
+
+
+def _partial_path(target: Path) -> Path:
+    """Where ffmpeg writes a variant until it is complete (one writer per key)."""
+    return target.with_name(f".{target.name}.part")
+
+
+def _run_ffmpeg(source: Path, target: Path, quality: str) -> None:
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        raise TranscodeError("ffmpeg not found. Install: apt install ffmpeg")
+
+    tmp_path = _partial_path(target)
+    command = [
+        ffmpeg, "-nostdin", "-v", "error", "-y",
+        "-i", str(source),
+        "-map", "0:a:0", "-map_metadata", "-1",
+        "-c:a", "libopus", "-b:a", f"{QUALITY_BITRATES[quality]}k",
+        "-f", "ogg", str(tmp_path),
+    ]
+    try:
+        result = subprocess.run(
+            command, capture_output=True, text=True, timeout=TRANSCODE_TIMEOUT_SECONDS
+        )
+        if result.returncode != 0:
+            raise TranscodeError(f"ffmpeg failed for {source.name}: {result.stderr.strip()[-500:]}")
+        os.replace(tmp_path, target)
+    except subprocess.TimeoutExpired as e:
+        raise TranscodeError(f"ffmpeg timed out for {source.name}") from e
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def evict_transcodes(max_bytes: int = TRANSCODE_CACHE_MAX_BYTES) -> int:
+    """Delete least recently used variants until the cache fits ``max_bytes``.
+
+    Returns:
+        Number of files removed
+    """
+    entries = []
+    for path in get_transcode_cache_dir().glob("*.opus"):
+        try:
+            stat_result = path.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat_result.st_mtime, stat_result.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    if removed:
+        logger.info(f"Evicted {removed} cached transcodes")
+    return removed
+
+
+def _claim(source: Path, quality: str) -> tuple[Path, Optional[Future], bool]:
+    """Look up a variant: (target, in-flight future or None on a hit, owner)."""
+    target = _variant_path(source, quality)
+    with _lock:
+        future = _inflight.get(target.name)
+        owner = future is None and not target.exists()
+        if owner:
+            future = Future()
+            _inflight[target.name] = future
+    return target, future, owner
+
+
+def _transcode(source: Path, target: Path, quality: str, future: Future) -> None:
+    """Produce a claimed variant and resolve its future."""
+    try:
+        logger.info(f"Transcoding {source.name} -> {quality} ({QUALITY_BITRATES[quality]}k opus)")
+        _run_ffmpeg(source, target, quality)
+        future.set_result(target)
+    except BaseException as e:
+        future.set_exception(e)
+    finally:
+        with _lock:
+            _inflight.pop(target.name, None)
+    if not future.exception():
+        evict_transcodes()
+
+
+def _touch(target: Path) -> bool:
+    try:
+        os.utime(target)  # Cache hit: mark as recently used
+        return True
+    except FileNotFoundError:
+        return False  # Evicted in between
+
+
+def get_variant(source: Path, quality: str) -> Path:
+    """Return a cached transcode of ``source``, producing it if needed.
+
+    Blocking until the whole variant exists; run it off the event loop. Hits
+    refresh the entry's mtime, which is what LRU eviction orders by.
+
+    Raises:
+        TranscodeError: ffmpeg missing or failed
+    """
+    target, future, owner = _claim(source, quality)
+    if future is None:
+        return target if _touch(target) else get_variant(source, quality)
+    if owner:
+        _transcode(source, target, quality, future)
+    else:
+        logger.debug(f"Waiting on in-flight transcode {target.name}")
+    return future.result()
+
+
+def _follow(target: Path, future: Future) -> Iterator[bytes]:
+    """Yield a variant's bytes as ffmpeg writes them, until the transcode ends."""
+    handle = None
+    while handle is None:
+        try:
+            handle = open(_partial_path(target), "rb")
+        except FileNotFoundError:
+            if future.done():
+                handle = open(future.result(), "rb")  # Finished before we looked
+            else:
+                time.sleep(STREAM_POLL_SECONDS)
+
+    # The open handle keeps reading after the partial file is renamed into place
+    with handle:
+        while True:
+            chunk = handle.read(STREAM_CHUNK_BYTES)
+            if chunk:
+                yield chunk
+            elif future.done():
+                future.result()  # Raise if ffmpeg failed mid-file
+                rest = handle.read()
+                if rest:
+                    yield rest
+                return
+            else:
+                time.sleep(STREAM_POLL_SECONDS)
+
+
+def stream_variant(source: Path, quality: str) -> Union[Path, Iterator[bytes]]:
+    """Return a cached variant's path, or stream one that is being transcoded.
+
+    On a miss the transcode runs in the background and the returned iterator
+    follows its output, so playback starts after ffmpeg's first chunk rather
+    than after the whole file. The stream has no length and can't serve
+    ranges; later requests get the cached file with full range support.
+    Blocks until the first chunk, so an early failure still raises here.
+
+    Raises:
+        TranscodeError: ffmpeg missing or failed before producing output
+    """
+    target, future, owner = _claim(source, quality)
+    if future is None:
+        return target if _touch(target) else stream_variant(source, quality)
+    if owner:
+        threading.Thread(
+            target=_transcode,
+            args=(source, target, quality, future),
+            name=f"transcode-{target.name}",
+            daemon=True,
+        ).start()
+
+    chunks = _follow(target, future)
+    try:
+        first = next(chunks)
+    except StopIteration:
+        first = b""
+
+    def stream() -> Iterator[bytes]:
+        yield first
+        try:
+            yield from chunks
+        except TranscodeError as e:
+            logger.warning(f"Transcode stream ended early: {e}")
+
+    return stream()
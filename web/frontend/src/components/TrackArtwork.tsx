@@ -9,7 +9,9 @@ interface TrackArtworkProps {
 export function TrackArtwork({ trackId, size = 48, className = '' }: TrackArtworkProps): JSX.Element {
   const [failed, setFailed] = useState(false);
 
-  const src = `/api/tracks/${trackId}/artwork`;
+  // Request a server-side thumbnail at display resolution instead of the full image
+  const pixels = Math.ceil(size * (window.devicePixelRatio || 1));
+  const src = `/api/tracks/${trackId}/artwork?size=${pixels}`;
 
   if (failed) {
     return (
@@ -16,7 +16,7 @@ function buildMetadata(track: Track): MediaMetadata {
     artist: track.artist || 'Unknown Artist',
     album: track.album || '',
     artwork: [
-      { src: `/api/tracks/${track.id}/artwork`, sizes: '512x512', type: 'image/jpeg' },
+      { src: `/api/tracks/${track.id}/artwork?size=640`, sizes: '640x640', type: 'image/jpeg' },
       { src: FALLBACK_ARTWORK, sizes: '512x512', type: 'image/svg+xml' },
     ],
   });
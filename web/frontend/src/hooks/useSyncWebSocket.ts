@@ -1,6 +1,9 @@
 import { useEffect, useRef, useCallback, useState } from 'react';
 import { useComparisonStore } from '../stores/comparisonStore';
 import { usePlayerStore } from '../stores/playerStore';
+import type { PlayerStore } from '../stores/playerStore';
+
+type SyncedPlayback = Parameters<PlayerStore['syncState']>[0];
 
 const WS_URL = import.meta.env.PROD
   ? `wss://${window.location.host}/ws/sync`
@@ -11,6 +14,8 @@ export function useSyncWebSocket() {
   const wsRef = useRef<WebSocket | null>(null);
   const reconnectTimeoutRef = useRef<number | null>(null);
   const reconnectAttemptsRef = useRef(0);
+  // Last full playback state; playback:delta messages are merged onto it
+  const playbackRef = useRef<SyncedPlayback | null>(null);
 
   const handleMessage = useCallback((event: MessageEvent) => {
     try {
@@ -28,6 +33,7 @@ export function useSyncWebSocket() {
           }
           // Sync playback state if present
           if (data.playback) {
+            playbackRef.current = data.playback;
             usePlayerStore.getState().syncState(data.playback);
           }
           // Sync device list if present
@@ -44,9 +50,18 @@ export function useSyncWebSocket() {
           break;
 
         case 'playback:state':
+          playbackRef.current = data;
           usePlayerStore.getState().syncState(data);
           break;
 
+        case 'playback:delta':
+          // Server only sends a delta against the state this connection last received
+          if (playbackRef.current) {
+            playbackRef.current = { ...playbackRef.current, ...data };
+            usePlayerStore.getState().syncState(playbackRef.current);
+          }
+          break;
+
         case 'devices:updated':
           usePlayerStore.getState().syncDevices(data);
           break;